@@ -12,6 +12,7 @@ from pandas import (
     Timestamp,
     date_range,
     period_range,
+    set_option,
 )
 import pandas.util.testing as tm
 
@@ -27,6 +28,7 @@ method_blacklist = {
         "mean",
         "max",
         "skew",
+        "kurt",
         "cumprod",
         "cummax",
         "rank",
@@ -37,6 +39,9 @@ method_blacklist = {
         "describe",
         "std",
         "quantile",
+        "idxmin",
+        "idxmax",
+        "diff",
     },
     "datetime": {
         "median",
@@ -46,6 +51,7 @@ method_blacklist = {
         "sum",
         "mean",
         "skew",
+        "kurt",
         "cumprod",
         "cummax",
         "pct_change",
@@ -101,6 +107,9 @@ class Apply:
     def time_copy_overhead_single_col(self, df):
         df.groupby("key").apply(self.df_copy_function)
 
+    def time_series_scalar_function(self, df):
+        df.groupby("key")["value1"].apply(lambda x: 1)
+
 
 class Groups:
 
@@ -206,6 +215,23 @@ class Int64:
         self.df.groupby(self.cols).max()
 
 
+class ManyStringKeys:
+    params = [True, False]
+    param_names = ["sort"]
+
+    def setup(self, sort):
+        N = 10 ** 5
+        keys = tm.makeStringIndex(10 ** 4)
+        self.cols = list("abcdefg")
+        self.df = DataFrame(
+            {col: keys.take(np.random.randint(0, len(keys), N)) for col in self.cols}
+        )
+        self.df["values"] = np.random.randn(N)
+
+    def time_groupby_sum(self, sort):
+        self.df.groupby(self.cols, sort=sort)["values"].sum()
+
+
 class CountMultiDtype:
     def setup_cache(self):
         n = 10000
@@ -287,6 +313,17 @@ class AggFunctions:
     def time_different_python_functions_singlecol(self, df):
         df.groupby("key1").agg([sum, min, max])
 
+    def time_weighted_mean(self, df):
+        df.groupby(["key1", "key2"]).weighted_mean("value3")
+
+    def time_multiple_reductions(self, df):
+        df.groupby(["key1", "key2"]).agg(
+            ["count", "sum", "mean", "std", "min", "max", "first", "last"]
+        )
+
+    def time_multiple_quantiles(self, df):
+        df.groupby(["key1", "key2"]).quantile([0.1, 0.25, 0.5, 0.75, 0.9])
+
 
 class GroupStrings:
     def setup(self):
@@ -374,9 +411,12 @@ class GroupByMethods:
             "cumprod",
             "cumsum",
             "describe",
+            "diff",
             "ffill",
             "first",
             "head",
+            "idxmax",
+            "idxmin",
             "last",
             "mad",
             "max",
@@ -392,6 +432,7 @@ class GroupByMethods:
             "shift",
             "size",
             "skew",
+            "kurt",
             "std",
             "sum",
             "tail",
@@ -439,6 +480,21 @@ class GroupByMethods:
         self.as_field_method()
 
 
+class WideTransforms:
+    param_names = ["method"]
+    params = ["shift", "diff", "pct_change", "ffill", "bfill"]
+
+    def setup(self, method):
+        N, K = 10 ** 4, 100
+        values = np.random.randn(N, K)
+        values[np.random.rand(N, K) < 0.1] = np.nan
+        self.df = DataFrame(values)
+        self.df["key"] = np.random.randint(0, 100, N)
+
+    def time_transform(self, method):
+        getattr(self.df.groupby("key"), method)()
+
+
 class RankWithTies:
     # GH 21237
     param_names = ["dtype", "tie_method"]
@@ -626,4 +682,48 @@ class TransformNaN:
         self.df_nans.groupby("key").transform("first")
 
 
+class NumThreads:
+
+    params = ([1, 4], ["sum", "mean", "var", "max", "cumsum"])
+    param_names = ["num_threads", "method"]
+
+    def setup(self, num_threads, method):
+        N = 10 ** 6
+        self.df = DataFrame(np.random.randn(N, 50))
+        self.key = np.random.randint(0, 1000, N)
+        set_option("compute.num_threads", num_threads)
+
+    def teardown(self, num_threads, method):
+        set_option("compute.num_threads", 1)
+
+    def time_method(self, num_threads, method):
+        getattr(self.df.groupby(self.key), method)()
+
+
+class SortedKeys:
+
+    params = (["int", "float", "datetime", "object"], [True, False])
+    param_names = ["dtype", "presorted"]
+
+    def setup(self, dtype, presorted):
+        N = 10 ** 6
+        keys = {
+            "int": np.arange(N // 10),
+            "float": np.arange(N // 10, dtype=float),
+            "datetime": date_range("2000-01-01", periods=N // 10, freq="s"),
+            "object": tm.makeStringIndex(N // 10).sort_values(),
+        }[dtype]
+        key = np.repeat(keys, 10)
+        if not presorted:
+            key = key[np.random.permutation(N)]
+        self.key = key
+        self.df = DataFrame({"a": np.random.randn(N), "b": np.random.randn(N)})
+
+    def time_sum(self, dtype, presorted):
+        self.df.groupby(self.key).sum()
+
+    def time_cumcount(self, dtype, presorted):
+        self.df.groupby(self.key).cumcount()
+
+
 from .pandas_vb_common import setup  # noqa: F401
@@ -35,4 +35,32 @@ class Excel:
         writer_write.save()
 
 
+class ExcelWriteOnly:
+
+    params = ["openpyxl", "xlsxwriter"]
+    param_names = ["engine"]
+    engine_kwargs = {
+        "openpyxl": {"write_only": True},
+        "xlsxwriter": {"options": {"constant_memory": True}},
+    }
+
+    def setup(self, engine):
+        N = 20000
+        C = 5
+        self.df = DataFrame(
+            np.random.randn(N, C),
+            columns=["float{}".format(i) for i in range(C)],
+            index=date_range("20000101", periods=N, freq="H"),
+        )
+        self.df["object"] = tm.makeStringIndex(N)
+
+    def time_write_excel(self, engine):
+        bio_write = BytesIO()
+        writer_write = ExcelWriter(
+            bio_write, engine=engine, **self.engine_kwargs[engine]
+        )
+        self.df.to_excel(writer_write, sheet_name="Sheet1")
+        writer_write.save()
+
+
 from ..pandas_vb_common import setup  # noqa: F401
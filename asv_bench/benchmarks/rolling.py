@@ -53,6 +53,39 @@ class EWMMethods:
         getattr(self.ewm, method)()
 
 
+class OnlineMethods:
+
+    params = (["rolling", "ewm"], ["mean", "std"])
+    param_names = ["window", "method"]
+
+    def setup(self, window, method):
+        N = 10 ** 6
+        df = pd.DataFrame(np.random.random((N, 10)))
+        kwargs = {"window": 100} if window == "rolling" else {"com": 100}
+        self.online = getattr(df, window)(**kwargs).online()
+        self.batch = pd.DataFrame(np.random.random((100, 10)))
+
+    def time_update(self, window, method):
+        getattr(self.online.update(self.batch), method)()
+
+
+class EWMTimesMethods:
+
+    params = (["DataFrame", "Series"], ["1min", "1h"], ["mean", "std"])
+    param_names = ["contructor", "halflife", "method"]
+
+    def setup(self, constructor, halflife, method):
+        N = 10 ** 5
+        arr = 100 * np.random.random(N)
+        times = pd.Timestamp("2000-01-01") + pd.to_timedelta(
+            np.cumsum(np.random.randint(1, 120, N)), unit="s"
+        )
+        self.ewm = getattr(pd, constructor)(arr).ewm(halflife=halflife, times=times)
+
+    def time_ewm_times(self, constructor, halflife, method):
+        getattr(self.ewm, method)()
+
+
 class VariableWindowMethods(Methods):
     params = (
         ["DataFrame", "Series"],
@@ -69,6 +102,118 @@ class VariableWindowMethods(Methods):
         self.roll = getattr(pd, constructor)(arr, index=index).rolling(window)
 
 
+class WideVariableWindowMethods:
+
+    params = (["mean", "std", "max", "count", "sum"], [1, 4])
+    param_names = ["method", "num_threads"]
+
+    def setup(self, method, num_threads):
+        N = 10 ** 4
+        index = pd.date_range("2017-01-01", periods=N, freq="5s")
+        self.roll = pd.DataFrame(np.random.randn(N, 500), index=index).rolling("5min")
+
+    def time_rolling(self, method, num_threads):
+        with pd.option_context("compute.num_threads", num_threads):
+            getattr(self.roll, method)()
+
+
+class WeightedMethods:
+
+    params = (["DataFrame", "Series"], [10, 100], ["sum", "mean", "std"])
+    param_names = ["constructor", "window", "method"]
+
+    def setup(self, constructor, window, method):
+        N = 10 ** 5
+        arr = np.random.random((N, 10))
+        if constructor == "Series":
+            arr = arr[:, 0]
+        weights = np.linspace(0, 1, window)
+        self.roll = getattr(pd, constructor)(arr).rolling(window, win_type=weights)
+
+    def time_rolling(self, constructor, window, method):
+        getattr(self.roll, method)()
+
+
+class GroupbyMethods:
+
+    params = (["rolling", "expanding"], ["sum", "mean", "max", "median"])
+    param_names = ["window", "method"]
+
+    def setup(self, window, method):
+        N = 10 ** 6
+        df = pd.DataFrame(
+            {"key": np.random.randint(0, 10 ** 5, N), "value": np.random.randn(N)},
+            index=pd.date_range("2000-01-01", periods=N, freq="s"),
+        )
+        if window == "rolling":
+            self.window = df.groupby("key")["value"].rolling(5)
+        else:
+            self.window = df.groupby("key")["value"].expanding()
+
+    def time_method(self, window, method):
+        getattr(self.window, method)()
+
+
+class GroupbyTimeWindow:
+    def setup(self):
+        N = 10 ** 6
+        self.df = pd.DataFrame(
+            {"key": np.random.randint(0, 10 ** 5, N), "value": np.random.randn(N)},
+            index=pd.date_range("2000-01-01", periods=N, freq="s"),
+        )
+
+    def time_mean(self):
+        self.df.groupby("key")["value"].rolling("30s").mean()
+
+
+class Apply:
+
+    params = (
+        ["DataFrame", "Series"],
+        [10, 1000],
+        ["cython", "numba"],
+        [np.sum, lambda x: np.sum(x) + 5],
+    )
+    param_names = ["constructor", "window", "engine", "function"]
+
+    def setup(self, constructor, window, engine, function):
+        if engine == "numba":
+            try:
+                import numba  # noqa: F401
+            except ImportError:
+                raise NotImplementedError
+        N = 10 ** 4
+        arr = np.random.random((N, 10))
+        if constructor == "Series":
+            arr = arr[:, 0]
+        self.roll = getattr(pd, constructor)(arr).rolling(window)
+        # compile the numba functions outside of the timings
+        self.roll.apply(function, raw=True, engine=engine)
+
+    def time_rolling(self, constructor, window, engine, function):
+        self.roll.apply(function, raw=True, engine=engine)
+
+
+class ApplyCompiled:
+    def setup(self):
+        try:
+            import numba
+        except ImportError:
+            raise NotImplementedError
+
+        @numba.jit(nopython=True)
+        def f(x):
+            return np.mean(x[~np.isnan(x)])
+
+        self.func = f
+        self.roll = pd.DataFrame(np.random.random((10 ** 5, 10))).rolling(100)
+        self.roll.apply(self.func, raw=True)
+
+    def time_detected(self):
+        # the numba engine is used for a function compiled by numba
+        self.roll.apply(self.func, raw=True)
+
+
 class Pairwise:
 
     params = ([10, 1000, None], ["corr", "cov"], [True, False])
@@ -87,6 +232,19 @@ class Pairwise:
         getattr(r, method)(self.df, pairwise=pairwise)
 
 
+class WidePairwise:
+
+    params = (["corr", "cov"], [False, True])
+    param_names = ["method", "as_array"]
+
+    def setup(self, method, as_array):
+        N = 10 ** 4
+        self.roll = pd.DataFrame(np.random.randn(N, 50)).rolling(100)
+
+    def time_pairwise(self, method, as_array):
+        getattr(self.roll, method)(as_array=as_array)
+
+
 class Quantile:
     params = (
         ["DataFrame", "Series"],
@@ -106,6 +264,36 @@ class Quantile:
         self.roll.quantile(percentile, interpolation=interpolation)
 
 
+class RankMethods:
+
+    params = (["DataFrame", "Series"], [10, 1000], ["rank", "argmax", "nunique"])
+    param_names = ["constructor", "window", "method"]
+
+    def setup(self, constructor, window, method):
+        N = 10 ** 5
+        arr = np.random.randint(0, 100, N).astype(float)
+        self.roll = getattr(pd, constructor)(arr).rolling(window)
+
+    def time_rolling(self, constructor, window, method):
+        getattr(self.roll, method)()
+
+
+class LargeWindowQuantile:
+
+    params = ([1000, 100000], ["median", "quantiles"])
+    param_names = ["window", "method"]
+
+    def setup(self, window, method):
+        N = 10 ** 6
+        self.roll = pd.Series(np.random.randn(N)).rolling(window)
+
+    def time_quantile(self, window, method):
+        if method == "median":
+            self.roll.median()
+        else:
+            self.roll.quantile([0.05, 0.25, 0.5, 0.75, 0.95])
+
+
 class PeakMemFixed:
     def setup(self):
         N = 10
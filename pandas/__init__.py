@@ -103,6 +103,7 @@ from pandas.core.api import (
     # misc
     np,
     Grouper,
+    GroupPlan,
     factorize,
     unique,
     value_counts,
@@ -2,6 +2,7 @@ import cython
 from cython import Py_ssize_t
 from cython cimport floating
 
+from libc.math cimport fabs
 from libc.stdlib cimport malloc, free
 
 import numpy as np
@@ -13,6 +14,9 @@ cnp.import_array()
 
 
 from pandas._libs.util cimport numeric, get_nat
+from pandas._libs.khash cimport (
+    kh_int64_t, kh_init_int64, kh_destroy_int64, kh_put_int64,
+    kh_exist_int64, khiter_t)
 
 from pandas._libs.algos cimport (swap, TiebreakEnumType, TIEBREAK_AVERAGE,
                                  TIEBREAK_MIN, TIEBREAK_MAX, TIEBREAK_FIRST,
@@ -308,18 +312,23 @@ def group_shift_indexer(int64_t[:] out, const int64_t[:] labels,
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
-def group_fillna_indexer(ndarray[int64_t] out, ndarray[int64_t] labels,
-                         ndarray[uint8_t] mask, object direction,
+def group_fillna_indexer(int64_t[:, :] out, ndarray[int64_t] labels,
+                         const uint8_t[:, :] mask, object direction,
                          int64_t limit):
     """Indexes how to fill values forwards or backwards within a group
 
+    The values are sorted by group once, and each column is then filled
+    from the same order.
+
     Parameters
     ----------
-    out : array of int64_t values which this method will write its results to
+    out : 2D array of int64_t values which this method will write its
+        results to, with a row for each column of the values.
         Missing values will be written to with a value of -1
     labels : array containing unique label for each group, with its ordering
         matching up to the corresponding record in `values`
-    mask : array of int64_t values where a 1 indicates a missing value
+    mask : 2D array of uint8_t values, shaped like `out`, where a 1
+        indicates a missing value
     direction : {'ffill', 'bfill'}
         Direction for fill to be applied (forwards or backwards, respectively)
     limit : Consecutive values to fill before stopping, or -1 for no limit
@@ -329,14 +338,15 @@ def group_fillna_indexer(ndarray[int64_t] out, ndarray[int64_t] labels,
     This method modifies the `out` parameter rather than returning an object
     """
     cdef:
-        Py_ssize_t i, N
+        Py_ssize_t i, j, N, K
         int64_t[:] sorted_labels
         int64_t idx, curr_fill_idx=-1, filled_vals=0
 
-    N = len(out)
+    K, N = out.shape[0], out.shape[1]
 
     # Make sure all arrays are the same size
-    assert N == len(labels) == len(mask)
+    assert N == len(labels) == mask.shape[1]
+    assert K == mask.shape[0]
 
     sorted_labels = np.argsort(labels, kind='mergesort').astype(
         np.int64, copy=False)
@@ -344,24 +354,110 @@ def group_fillna_indexer(ndarray[int64_t] out, ndarray[int64_t] labels,
         sorted_labels = sorted_labels[::-1]
 
     with nogil:
-        for i in range(N):
-            idx = sorted_labels[i]
-            if mask[idx] == 1:  # is missing
-                # Stop filling once we've hit the limit
-                if filled_vals >= limit and limit != -1:
+        for j in range(K):
+            curr_fill_idx = -1
+            filled_vals = 0
+            for i in range(N):
+                idx = sorted_labels[i]
+                if mask[j, idx] == 1:  # is missing
+                    # Stop filling once we've hit the limit
+                    if filled_vals >= limit and limit != -1:
+                        curr_fill_idx = -1
+                    filled_vals += 1
+                else:  # reset items when not missing
+                    filled_vals = 0
+                    curr_fill_idx = idx
+
+                out[j, idx] = curr_fill_idx
+
+                # If we move to the next group, reset
+                # the fill_idx and counter
+                if i == N - 1 or labels[idx] != labels[sorted_labels[i + 1]]:
                     curr_fill_idx = -1
-                filled_vals += 1
-            else:  # reset items when not missing
-                filled_vals = 0
-                curr_fill_idx = idx
+                    filled_vals = 0
 
-            out[idx] = curr_fill_idx
 
-            # If we move to the next group, reset
-            # the fill_idx and counter
-            if i == N - 1 or labels[idx] != labels[sorted_labels[i + 1]]:
-                curr_fill_idx = -1
-                filled_vals = 0
+ctypedef fused diff_t:
+    float64_t
+    float32_t
+    int64_t
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_diff(floating[:, :] out,
+               diff_t[:, :] values,
+               const int64_t[:] indexer):
+    """
+    Difference of each value with an earlier value of its group.
+
+    Parameters
+    ----------
+    out : 2D array of floating values which this method will write its
+        results to, shaped like `values`
+    values : 2D array with a row for each column
+    indexer : array containing the position of the value to subtract from
+        each value, or -1 where there is none, as computed by
+        group_shift_indexer
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object
+    """
+    cdef:
+        Py_ssize_t i, j, K, N
+        int64_t idx
+
+    K, N = values.shape[0], values.shape[1]
+    assert N == len(indexer)
+
+    with nogil:
+        for j in range(K):
+            for i in range(N):
+                idx = indexer[i]
+                if idx == -1:
+                    out[j, i] = NaN
+                else:
+                    out[j, i] = values[j, i] - values[j, idx]
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_pct_change(floating[:, :] out,
+                     floating[:, :] values,
+                     const int64_t[:] indexer):
+    """
+    Percentage change of each value from an earlier value of its group.
+
+    Parameters
+    ----------
+    out : 2D array of floating values which this method will write its
+        results to, shaped like `values`
+    values : 2D array with a row for each column
+    indexer : array containing the position of the value to compare with
+        each value, or -1 where there is none, as computed by
+        group_shift_indexer
+
+    Notes
+    -----
+    This method modifies the `out` parameter rather than returning an object
+    """
+    cdef:
+        Py_ssize_t i, j, K, N
+        int64_t idx
+
+    K, N = values.shape[0], values.shape[1]
+    assert N == len(indexer)
+
+    with nogil:
+        for j in range(K):
+            for i in range(N):
+                idx = indexer[i]
+                if idx == -1:
+                    out[j, i] = NaN
+                else:
+                    out[j, i] = values[j, i] / values[j, idx] - 1
 
 
 @cython.boundscheck(False)
@@ -630,6 +726,214 @@ group_mean_float32 = _group_mean['float']
 group_mean_float64 = _group_mean['double']
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def _group_weighted_mean(floating[:, :] out,
+                         int64_t[:] counts,
+                         floating[:, :] values,
+                         const int64_t[:] labels,
+                         Py_ssize_t min_count=-1,
+                         const float64_t[:] weights=None):
+    """
+    Mean of the values weighted by `weights`, skipping the rows where the
+    value or the weight is missing. NaN where the weights sum to zero.
+
+    Only aggregates on axis=0
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts = len(counts)
+        float64_t val, w
+        float64_t[:, :] sumx, sumw
+
+    assert min_count == -1, "'min_count' only used in add and prod"
+
+    if not len(values) == len(labels) == len(weights):
+        raise AssertionError("len(index) != len(labels)")
+
+    sumx = np.zeros((<object>out).shape, dtype=np.float64)
+    sumw = np.zeros((<object>out).shape, dtype=np.float64)
+
+    N, K = (<object>values).shape
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            w = weights[i]
+            if w != w:
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+                # not nan
+                if val == val:
+                    sumw[lab, j] += w
+                    sumx[lab, j] += w * val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if sumw[i, j] == 0:
+                    out[i, j] = NAN
+                else:
+                    out[i, j] = sumx[i, j] / sumw[i, j]
+
+
+group_weighted_mean_float32 = _group_weighted_mean['float']
+group_weighted_mean_float64 = _group_weighted_mean['double']
+
+
+cdef inline float64_t _zero_out_fperr(float64_t x) nogil:
+    # like nanops._zero_out_fperr
+    return 0 if fabs(x) < 1e-14 else x
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+cdef _group_central_moments(float64_t[:, :] nobs,
+                            float64_t[:, :] m2,
+                            float64_t[:, :] m3,
+                            float64_t[:, :] m4,
+                            int64_t[:] counts,
+                            float64_t[:, :] values,
+                            const int64_t[:] labels):
+    """
+    Sums of the 2nd, 3rd and 4th powers of the deviations from the mean of
+    each group, updated one value at a time (Terriberry's extension of
+    Welford's algorithm) so that they are not swamped by a large mean.
+    """
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val, n, n1, delta, delta_n, delta_n2, term
+        float64_t[:, :] mean
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    mean = np.zeros_like(nobs)
+    N, K = (<object>values).shape
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+                # not nan
+                if val != val:
+                    continue
+
+                n1 = nobs[lab, j]
+                n = n1 + 1
+                nobs[lab, j] = n
+
+                delta = val - mean[lab, j]
+                delta_n = delta / n
+                delta_n2 = delta_n * delta_n
+                term = delta * delta_n * n1
+
+                mean[lab, j] += delta_n
+                m4[lab, j] += (term * delta_n2 * (n * n - 3 * n + 3)
+                               + 6 * delta_n2 * m2[lab, j]
+                               - 4 * delta_n * m3[lab, j])
+                m3[lab, j] += term * delta_n * (n - 2) - 3 * delta_n * m2[lab, j]
+                m2[lab, j] += term
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_skew_float64(float64_t[:, :] out,
+                       int64_t[:] counts,
+                       float64_t[:, :] values,
+                       const int64_t[:] labels,
+                       Py_ssize_t min_count=-1):
+    """
+    Unbiased skewness of each group, as computed by nanops.nanskew.
+
+    Only aggregates on axis=0
+    """
+    cdef:
+        Py_ssize_t i, j, K
+        float64_t n, s2, s3
+        float64_t[:, :] nobs, m2, m3, m4
+
+    assert min_count == -1, "'min_count' only used in add and prod"
+
+    nobs = np.zeros((<object>out).shape, dtype=np.float64)
+    m2 = np.zeros_like(nobs)
+    m3 = np.zeros_like(nobs)
+    m4 = np.zeros_like(nobs)
+    _group_central_moments(nobs, m2, m3, m4, counts, values, labels)
+
+    K = out.shape[1]
+    with nogil:
+        for i in range(len(counts)):
+            for j in range(K):
+                n = nobs[i, j]
+                s2 = _zero_out_fperr(m2[i, j])
+                s3 = _zero_out_fperr(m3[i, j])
+                if n < 3:
+                    out[i, j] = NAN
+                elif s2 == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = ((n * (n - 1) ** 0.5 / (n - 2))
+                                 * (s3 / s2 ** 1.5))
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.cdivision(True)
+def group_kurt_float64(float64_t[:, :] out,
+                       int64_t[:] counts,
+                       float64_t[:, :] values,
+                       const int64_t[:] labels,
+                       Py_ssize_t min_count=-1):
+    """
+    Unbiased kurtosis (Fisher's definition) of each group, as computed by
+    nanops.nankurt.
+
+    Only aggregates on axis=0
+    """
+    cdef:
+        Py_ssize_t i, j, K
+        float64_t n, numer, denom, adj
+        float64_t[:, :] nobs, m2, m3, m4
+
+    assert min_count == -1, "'min_count' only used in add and prod"
+
+    nobs = np.zeros((<object>out).shape, dtype=np.float64)
+    m2 = np.zeros_like(nobs)
+    m3 = np.zeros_like(nobs)
+    m4 = np.zeros_like(nobs)
+    _group_central_moments(nobs, m2, m3, m4, counts, values, labels)
+
+    K = out.shape[1]
+    with nogil:
+        for i in range(len(counts)):
+            for j in range(K):
+                n = nobs[i, j]
+                if n < 4:
+                    out[i, j] = NAN
+                    continue
+
+                adj = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+                numer = _zero_out_fperr(n * (n + 1) * (n - 1) * m4[i, j])
+                denom = _zero_out_fperr((n - 2) * (n - 3) * m2[i, j] ** 2)
+                if denom == 0:
+                    out[i, j] = 0
+                else:
+                    out[i, j] = numer / denom - adj
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def _group_ohlc(floating[:, :] out,
@@ -685,25 +989,29 @@ group_ohlc_float64 = _group_ohlc['double']
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def group_quantile(ndarray[float64_t] out,
+def group_quantile(float64_t[:, :] out,
                    ndarray[int64_t] labels,
                    numeric[:] values,
                    ndarray[uint8_t] mask,
-                   float64_t q,
+                   const float64_t[:] qs,
                    object interpolation):
     """
-    Calculate the quantile per group.
+    Calculate the quantiles per group.
+
+    The values are sorted once, all the quantiles are then read from the
+    sorted values of each group.
 
     Parameters
     ----------
     out : ndarray
-        Array of aggregated values that will be written to.
+        Array of shape (ngroups, len(qs)) of aggregated values that will be
+        written to.
     labels : ndarray
         Array containing the unique group labels.
     values : ndarray
         Array containing the values to apply the function against.
-    q : float
-        The quantile value to search for.
+    qs : ndarray
+        The quantile values to search for, between 0 and 1.
 
     Notes
     -----
@@ -711,11 +1019,11 @@ def group_quantile(ndarray[float64_t] out,
     provided `out` parameter.
     """
     cdef:
-        Py_ssize_t i, N=len(labels), ngroups, grp_sz, non_na_sz
+        Py_ssize_t i, j, N=len(labels), ngroups, nqs, grp_sz, non_na_sz
         Py_ssize_t grp_start=0, idx=0
         int64_t lab
         uint8_t interp
-        float64_t q_idx, frac, val, next_val
+        float64_t q, q_idx, frac, val, next_val
         ndarray[int64_t] counts, non_na_counts, sort_arr
 
     assert values.shape[0] == N
@@ -728,14 +1036,19 @@ def group_quantile(ndarray[float64_t] out,
     }
     interp = inter_methods[interpolation]
 
-    counts = np.zeros_like(out, dtype=np.int64)
-    non_na_counts = np.zeros_like(out, dtype=np.int64)
-    ngroups = len(counts)
+    ngroups, nqs = out.shape[0], out.shape[1]
+    assert len(qs) == nqs
+    counts = np.zeros(ngroups, dtype=np.int64)
+    non_na_counts = np.zeros(ngroups, dtype=np.int64)
 
     # First figure out the size of every group
     with nogil:
         for i in range(N):
             lab = labels[i]
+            if lab < 0:
+                # rows without a group sort first, skip them
+                grp_start += 1
+                continue
             counts[lab] += 1
             if not mask[i]:
                 non_na_counts[lab] += 1
@@ -750,9 +1063,12 @@ def group_quantile(ndarray[float64_t] out,
             grp_sz = counts[i]
             non_na_sz = non_na_counts[i]
 
-            if non_na_sz == 0:
-                out[i] = NaN
-            else:
+            for j in range(nqs):
+                if non_na_sz == 0:
+                    out[i, j] = NaN
+                    continue
+
+                q = qs[j]
                 # Calculate where to retrieve the desired value
                 # Casting to int will intentionaly truncate result
                 idx = grp_start + <int64_t>(q * <float64_t>(non_na_sz - 1))
@@ -764,24 +1080,172 @@ def group_quantile(ndarray[float64_t] out,
                 frac = q_idx % 1
 
                 if frac == 0.0 or interp == INTERPOLATION_LOWER:
-                    out[i] = val
+                    out[i, j] = val
                 else:
                     next_val = values[sort_arr[idx + 1]]
                     if interp == INTERPOLATION_LINEAR:
-                        out[i] = val + (next_val - val) * frac
+                        out[i, j] = val + (next_val - val) * frac
                     elif interp == INTERPOLATION_HIGHER:
-                        out[i] = next_val
+                        out[i, j] = next_val
                     elif interp == INTERPOLATION_MIDPOINT:
-                        out[i] = (val + next_val) / 2.0
+                        out[i, j] = (val + next_val) / 2.0
                     elif interp == INTERPOLATION_NEAREST:
                         if frac > .5 or (frac == .5 and q > .5):  # Always OK?
-                            out[i] = next_val
+                            out[i, j] = next_val
                         else:
-                            out[i] = val
+                            out[i, j] = val
 
             # Increment the index reference in sorted_arr for the next group
             grp_start += grp_sz
 
 
+# ----------------------------------------------------------------------
+# group_nunique, group_value_counts
+# ----------------------------------------------------------------------
+
+# The (group, value) pairs are marked or counted in a table of all the pairs
+# if it is at most this many times as long as the values, else in a hash
+# table of the pairs seen
+cdef int64_t _DENSE_PAIRS_FACTOR = 4
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nunique(int64_t[:] out,
+                  const int64_t[:] labels,
+                  const int64_t[:] codes,
+                  Py_ssize_t nvalues,
+                  bint dropna=True):
+    """
+    Count the distinct values of each group.
+
+    Parameters
+    ----------
+    out : array of int64_t
+        Zeroed array the counts are added to, one per group.
+    labels : array of int64_t
+        Group label of each value, -1 for values in no group.
+    codes : array of int64_t
+        The values factorized to ``range(nvalues)``, -1 for missing values.
+    nvalues : int
+        Number of distinct values.
+    dropna : bool, default True
+        Whether to leave missing values out of the counts.
+    """
+    cdef:
+        Py_ssize_t i, N = len(labels), ngroups = len(out)
+        int64_t lab, key, width = nvalues + 1
+        int ret = 0
+        uint8_t[:] seen
+        kh_int64_t *table
+
+    if len(codes) != N:
+        raise AssertionError("len(codes) != len(labels)")
+
+    if ngroups * width <= _DENSE_PAIRS_FACTOR * N:
+        seen = np.zeros(ngroups * width, dtype=np.uint8)
+        with nogil:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0 or (dropna and codes[i] < 0):
+                    continue
+                key = lab * width + codes[i] + 1
+                if not seen[key]:
+                    seen[key] = 1
+                    out[lab] += 1
+    else:
+        table = kh_init_int64()
+        with nogil:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0 or (dropna and codes[i] < 0):
+                    continue
+                key = lab * width + codes[i] + 1
+                kh_put_int64(table, key, &ret)
+                if ret != 0:
+                    out[lab] += 1
+            kh_destroy_int64(table)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_value_counts(const int64_t[:] labels,
+                       const int64_t[:] codes,
+                       Py_ssize_t nvalues,
+                       Py_ssize_t ngroups):
+    """
+    Count the occurrences of each (group, value) pair.
+
+    Parameters
+    ----------
+    labels : array of int64_t
+        Group label of each value, -1 for values in no group.
+    codes : array of int64_t
+        The values factorized to ``range(nvalues)``, -1 for missing values.
+    nvalues : int
+        Number of distinct values.
+    ngroups : int
+        Number of groups.
+
+    Returns
+    -------
+    keys : ndarray[int64]
+        The pairs that occur, as ``label * (nvalues + 1) + code + 1``,
+        in increasing order.
+    counts : ndarray[int64]
+        The number of occurrences of each pair.
+    """
+    cdef:
+        Py_ssize_t i, j, N = len(labels)
+        int64_t lab, width = nvalues + 1
+        int ret = 0
+        khiter_t k
+        int64_t[:] dense, keys_view, counts_view
+        ndarray[int64_t] keys, counts
+        kh_int64_t *table
+
+    if len(codes) != N:
+        raise AssertionError("len(codes) != len(labels)")
+
+    if ngroups * width <= _DENSE_PAIRS_FACTOR * N:
+        dense = np.zeros(ngroups * width, dtype=np.int64)
+        with nogil:
+            for i in range(N):
+                lab = labels[i]
+                if lab >= 0:
+                    dense[lab * width + codes[i] + 1] += 1
+        keys = np.flatnonzero(dense).astype(np.int64, copy=False)
+        return keys, np.asarray(dense).take(keys)
+
+    table = kh_init_int64()
+    try:
+        with nogil:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+                k = kh_put_int64(table, lab * width + codes[i] + 1, &ret)
+                if ret != 0:
+                    table.vals[k] = 0
+                table.vals[k] += 1
+
+        keys = np.empty(table.size, dtype=np.int64)
+        counts = np.empty(table.size, dtype=np.int64)
+        keys_view = keys
+        counts_view = counts
+        j = 0
+        with nogil:
+            for k in range(table.n_buckets):
+                if kh_exist_int64(table, k):
+                    keys_view[j] = table.keys[k]
+                    counts_view[j] = table.vals[k]
+                    j += 1
+    finally:
+        kh_destroy_int64(table)
+
+    order = keys.argsort()
+    return keys.take(order), counts.take(order)
+
+
 # generated from template
 include "groupby_helper.pxi"
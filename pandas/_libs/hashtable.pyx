@@ -3,7 +3,7 @@ cimport cython
 from cpython cimport (PyObject, Py_INCREF,
                       PyMem_Malloc, PyMem_Realloc, PyMem_Free)
 
-from libc.stdlib cimport malloc, free
+from libc.stdlib cimport malloc, realloc, free
 
 import numpy as np
 cimport numpy as cnp
@@ -171,3 +171,129 @@ def unique_label_indices(const int64_t[:] labels):
     arr = arr[np.asarray(labels)[arr].argsort()]
 
     return arr[1:] if arr.size != 0 and labels[arr[0]] == -1 else arr
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_rows(list keys):
+    """
+    Number the distinct combinations of the codes of several keys, in the
+    order in which they first appear.
+
+    The codes at each location are hashed together into a single table,
+    combinations whose hashes collide are told apart by comparing their
+    codes. Locations with a -1 code get the -1 label.
+
+    Parameters
+    ----------
+    keys : list of ndarray[int64_t]
+        The codes of each key, contiguous and of the same length.
+
+    Returns
+    -------
+    labels : ndarray[int64_t]
+        The group number at each location.
+    first : ndarray[int64_t]
+        The location of the first value of each group.
+    """
+    cdef:
+        Py_ssize_t i, j, n, nkeys = len(keys)
+        int64_t code, group, ngroups = 0
+        uint64_t h
+        bint is_null, equal, out_of_memory = False
+        int ret = 0
+        khiter_t k
+        kh_uint64_t *table
+        int64_t **codes
+        # the codes of each group, side by side, to compare the codes at a
+        # location with without reading the keys at random locations
+        int64_t *group_codes
+        int64_t *new_group_codes
+        Py_ssize_t capacity = 1024
+        ndarray[int64_t] key, labels, first, next_group
+
+    n = len(keys[0]) if nkeys else 0
+    labels = np.empty(n, dtype=np.int64)
+    first = np.empty(n, dtype=np.int64)
+    # the next group whose codes have the same hash, -1 at the end
+    next_group = np.empty(n, dtype=np.int64)
+
+    codes = <int64_t **>malloc(nkeys * sizeof(int64_t *))
+    if codes is NULL:
+        raise MemoryError()
+    for j in range(nkeys):
+        key = keys[j]
+        if len(key) != n or not key.flags.c_contiguous:
+            free(codes)
+            raise ValueError("keys must be contiguous and of the same length")
+        codes[j] = <int64_t *>key.data
+
+    group_codes = <int64_t *>malloc(capacity * nkeys * sizeof(int64_t))
+    if group_codes is NULL:
+        free(codes)
+        raise MemoryError()
+
+    table = kh_init_uint64()
+    kh_resize_uint64(table, min(n, _SIZE_HINT_LIMIT))
+
+    with nogil:
+        for i in range(n):
+            h = 0
+            is_null = False
+            for j in range(nkeys):
+                code = codes[j][i]
+                if code == -1:
+                    is_null = True
+                    break
+                h ^= (<uint64_t>code + <uint64_t>0x9e3779b97f4a7c15ULL
+                      + (h << 6) + (h >> 2))
+
+            if is_null:
+                labels[i] = -1
+                continue
+
+            k = kh_put_uint64(table, h, &ret)
+            if ret == 0:
+                # look for a group with the same codes among those with
+                # the same hash
+                group = table.vals[k]
+                while True:
+                    equal = True
+                    for j in range(nkeys):
+                        if group_codes[group * nkeys + j] != codes[j][i]:
+                            equal = False
+                            break
+                    if equal or next_group[group] == -1:
+                        break
+                    group = next_group[group]
+
+                if equal:
+                    labels[i] = group
+                    continue
+                next_group[group] = ngroups
+            else:
+                table.vals[k] = ngroups
+
+            if ngroups == capacity:
+                capacity *= 2
+                new_group_codes = <int64_t *>realloc(
+                    group_codes, capacity * nkeys * sizeof(int64_t))
+                if new_group_codes is NULL:
+                    out_of_memory = True
+                    break
+                group_codes = new_group_codes
+            for j in range(nkeys):
+                group_codes[ngroups * nkeys + j] = codes[j][i]
+
+            first[ngroups] = i
+            next_group[ngroups] = -1
+            labels[i] = ngroups
+            ngroups += 1
+
+    kh_destroy_uint64(table)
+    free(codes)
+    free(group_codes)
+    if out_of_memory:
+        raise MemoryError()
+
+    return labels, first[:ngroups].copy()
@@ -1,4 +1,5 @@
 from distutils.version import LooseVersion
+import sys
 
 from cython import Py_ssize_t
 from cpython cimport Py_INCREF
@@ -15,7 +16,8 @@ from numpy cimport (ndarray,
 cnp.import_array()
 
 cimport pandas._libs.util as util
-from pandas._libs.lib import maybe_convert_objects, values_from_object
+from pandas._libs.lib import (is_scalar, maybe_convert_objects,
+                              values_from_object)
 
 
 cdef _get_result_array(object obj, Py_ssize_t size, Py_ssize_t cnt):
@@ -558,6 +560,82 @@ def apply_frame_axis0(object frame, object f, object names,
     return results, mutated
 
 
+def series_refcounts(object series):
+    """
+    The counts of references to a Series and to its internals, which grow
+    when a function applied to the Series keeps a reference to any of them.
+    """
+    mgr = series._data
+    index = series.index
+    return [sys.getrefcount(obj) for obj in
+            [series, mgr, mgr._block, mgr._block.values, index,
+             index._index_data]]
+
+
+def apply_series_axis0(object series, object f, object names,
+                       const int64_t[:] starts, const int64_t[:] ends):
+    """
+    Apply f to the slices of a series, for a function that returns scalars.
+
+    f is passed the same Series for every slice, with its values and index
+    pointing at each slice in turn, and the results are stored in a list
+    allocated up front. This is only valid as long as f returns a scalar
+    other than None and keeps no reference to the Series, its index or
+    their values, which would change with the next slice. The loop stops
+    at the first slice where this does not hold, or where f raises or
+    changes the internals of the Series, and the results of the slices
+    before it are returned, for f to be applied to the others by the
+    caller.
+    """
+    cdef:
+        Slider vslider, islider
+        Py_ssize_t i, n = len(starts)
+        list results, refcounts
+        object chunk, mgr, block, index, vbuf, ibuf, piece
+
+    chunk = series[:0]
+    mgr = chunk._data
+    block = mgr._block
+    index = chunk.index
+    vbuf = block.values
+    ibuf = index._index_data
+
+    results = [None] * n
+
+    vslider = Slider(series._values, vbuf)
+    islider = Slider(series.index._index_data, ibuf)
+    try:
+        for i in range(n):
+            vslider.move(starts[i], ends[i])
+            islider.move(starts[i], ends[i])
+            index._reset_cache()
+            object.__setattr__(chunk, 'name', names[i])
+
+            refcounts = series_refcounts(chunk)
+            try:
+                piece = f(chunk)
+            except:
+                return results[:i], True
+
+            # the caches of the index may refer to its values
+            index._reset_cache()
+            if (piece is None or not is_scalar(piece)
+                    or chunk._data is not mgr or mgr._block is not block
+                    or block.values is not vbuf or chunk.index is not index
+                    or index._index_data is not ibuf
+                    or series_refcounts(chunk) != refcounts):
+                return results[:i], True
+
+            results[i] = piece
+    finally:
+        vslider.reset()
+        islider.reset()
+
+    # like the pieces of the python loop, scalars are not indexed like
+    # the groups
+    return results, True
+
+
 cdef class BlockSlider:
     """
     Only capable of sliding on axis=0
@@ -5,6 +5,9 @@ from cython import Py_ssize_t
 from libcpp.deque cimport deque
 
 from libc.stdlib cimport malloc, free
+from libc.string cimport memset
+from libcpp.algorithm cimport sort
+from libcpp.utility cimport pair
 
 import numpy as np
 cimport numpy as cnp
@@ -17,14 +20,11 @@ cdef extern from "src/headers/cmath" namespace "std":
     bint notnan(float64_t) nogil
     int signbit(float64_t) nogil
     float64_t sqrt(float64_t x) nogil
+    float64_t pow(float64_t x, float64_t y) nogil
 
 cimport pandas._libs.util as util
 from pandas._libs.util cimport numeric
 
-from pandas._libs.skiplist cimport (
-    skiplist_t, skiplist_init, skiplist_destroy, skiplist_get, skiplist_insert,
-    skiplist_remove)
-
 cdef:
     float32_t MINfloat32 = np.NINF
     float64_t MINfloat64 = np.NINF
@@ -123,8 +123,8 @@ cdef class MockFixedWindowIndexer(WindowIndexer):
 
     Parameters
     ----------
-    values: ndarray
-        values data array
+    N: int64_t
+        number of values
     win: int64_t
         window size
     minp: int64_t
@@ -139,13 +139,13 @@ cdef class MockFixedWindowIndexer(WindowIndexer):
         right endpoint closedness
 
     """
-    def __init__(self, ndarray values, int64_t win, int64_t minp,
+    def __init__(self, int64_t N, int64_t win, int64_t minp,
                  bint left_closed, bint right_closed,
                  object index=None, object floor=None):
 
         assert index is None
         self.is_variable = 0
-        self.N = len(values)
+        self.N = N
         self.minp = _check_minp(win, minp, self.N, floor=floor)
         self.start = np.empty(0, dtype='int64')
         self.end = np.empty(0, dtype='int64')
@@ -161,8 +161,8 @@ cdef class FixedWindowIndexer(WindowIndexer):
 
     Parameters
     ----------
-    values: ndarray
-        values data array
+    N: int64_t
+        number of values
     win: int64_t
         window size
     minp: int64_t
@@ -177,14 +177,14 @@ cdef class FixedWindowIndexer(WindowIndexer):
         right endpoint closedness
 
     """
-    def __init__(self, ndarray values, int64_t win, int64_t minp,
+    def __init__(self, int64_t N, int64_t win, int64_t minp,
                  bint left_closed, bint right_closed,
                  object index=None, object floor=None):
         cdef ndarray start_s, start_e, end_s, end_e
 
         assert index is None
         self.is_variable = 0
-        self.N = len(values)
+        self.N = N
         self.minp = _check_minp(win, minp, self.N, floor=floor)
 
         start_s = np.zeros(win, dtype='int64')
@@ -206,8 +206,8 @@ cdef class VariableWindowIndexer(WindowIndexer):
 
     Parameters
     ----------
-    values: ndarray
-        values data array
+    N: int64_t
+        number of values
     win: int64_t
         window size
     minp: int64_t
@@ -223,7 +223,7 @@ cdef class VariableWindowIndexer(WindowIndexer):
     floor: optional
         unit for flooring the unit
     """
-    def __init__(self, ndarray values, int64_t win, int64_t minp,
+    def __init__(self, int64_t N, int64_t win, int64_t minp,
                  bint left_closed, bint right_closed, ndarray index,
                  object floor=None):
 
@@ -246,63 +246,78 @@ cdef class VariableWindowIndexer(WindowIndexer):
               bint right_closed):
 
         cdef:
-            ndarray[int64_t] start, end
-            int64_t start_bound, end_bound, N
-            Py_ssize_t i, j
+            int64_t[:] start, end
 
         start = self.start
         end = self.end
-        N = self.N
 
-        start[0] = 0
+        with nogil:
+            _variable_window_bounds(index, 0, self.N, win, left_closed,
+                                    right_closed, start, end)
 
-        # right endpoint is closed
-        if right_closed:
-            end[0] = 1
-        # right endpoint is open
-        else:
-            end[0] = 0
 
-        with nogil:
+cdef void _variable_window_bounds(const int64_t[:] index, int64_t lo,
+                                  int64_t hi, int64_t win, bint left_closed,
+                                  bint right_closed, int64_t[:] start,
+                                  int64_t[:] end) nogil:
+    """
+    Fill the offsets of the windows spanning win over the monotonic index
+    of the rows in [lo, hi).
+    """
+    cdef:
+        int64_t start_bound, end_bound
+        Py_ssize_t i, j
 
-            # start is start of slice interval (including)
-            # end is end of slice interval (not including)
-            for i in range(1, N):
-                end_bound = index[i]
-                start_bound = index[i] - win
-
-                # left endpoint is closed
-                if left_closed:
-                    start_bound -= 1
-
-                # advance the start bound until we are
-                # within the constraint
-                start[i] = i
-                for j in range(start[i - 1], i):
-                    if index[j] > start_bound:
-                        start[i] = j
-                        break
-
-                # end bound is previous end
-                # or current index
-                if index[end[i - 1]] <= end_bound:
-                    end[i] = i + 1
-                else:
-                    end[i] = end[i - 1]
+    if hi <= lo:
+        return
+
+    start[lo] = lo
+
+    # right endpoint is closed
+    if right_closed:
+        end[lo] = lo + 1
+    # right endpoint is open
+    else:
+        end[lo] = lo
+
+    # start is start of slice interval (including)
+    # end is end of slice interval (not including)
+    for i in range(lo + 1, hi):
+        end_bound = index[i]
+        start_bound = index[i] - win
+
+        # left endpoint is closed
+        if left_closed:
+            start_bound -= 1
+
+        # advance the start bound until we are
+        # within the constraint
+        start[i] = i
+        for j in range(start[i - 1], i):
+            if index[j] > start_bound:
+                start[i] = j
+                break
+
+        # end bound is previous end
+        # or current index
+        if index[end[i - 1]] <= end_bound:
+            end[i] = i + 1
+        else:
+            end[i] = end[i - 1]
 
-                # right endpoint is open
-                if not right_closed:
-                    end[i] -= 1
+        # right endpoint is open
+        if not right_closed:
+            end[i] -= 1
 
 
-def get_window_indexer(values, win, minp, index, closed,
+def get_window_indexer(N, win, minp, index, closed,
                        floor=None, use_mock=True):
     """
     return the correct window indexer for the computation
 
     Parameters
     ----------
-    values: 1d ndarray
+    N: integer, number of values
     win: integer, window size
     minp: integer, minimum periods
     index: 1d ndarray, optional
@@ -324,6 +339,11 @@ def get_window_indexer(values, win, minp, index, closed,
     -------
     tuple of 1d int64 ndarrays of the offsets & data about the window
 
+    Notes
+    -----
+    The offsets only depend on the index, so they are computed once and
+    shared by all the columns which are rolled over it.
+
     """
 
     cdef:
@@ -343,68 +363,155 @@ def get_window_indexer(values, win, minp, index, closed,
         left_closed = True
 
     if index is not None:
-        indexer = VariableWindowIndexer(values, win, minp, left_closed,
+        indexer = VariableWindowIndexer(N, win, minp, left_closed,
                                         right_closed, index, floor)
     elif use_mock:
-        indexer = MockFixedWindowIndexer(values, win, minp, left_closed,
+        indexer = MockFixedWindowIndexer(N, win, minp, left_closed,
                                          right_closed, index, floor)
     else:
-        indexer = FixedWindowIndexer(values, win, minp, left_closed,
+        indexer = FixedWindowIndexer(N, win, minp, left_closed,
                                      right_closed, index, floor)
     return indexer.get_data()
 
 
+def get_group_window_bounds(const int64_t[:] group_starts, int64_t win, minp,
+                            index, closed):
+    """
+    Return the offsets of the windows over the rows of groups which follow
+    each other, the windows of a row only covering the rows of its group.
+
+    Parameters
+    ----------
+    group_starts: ndarray[int64_t]
+        position of the first row of each group, followed by the number of
+        rows
+    win: integer, window size, or time span for a variable window
+    minp: integer, minimum periods
+    index: 1d ndarray, optional
+        index to the values array, monotonic in each group, for variable
+        windows
+    closed: string, default None
+        {'right', 'left', 'both', 'neither'}
+        window endpoint closedness, see get_window_indexer
+
+    Returns
+    -------
+    tuple of the start & end offsets of the windows, the largest window
+    size and the minimum number of periods
+    """
+    cdef:
+        Py_ssize_t g, i, G, N
+        int64_t lo, hi
+        bint left_closed = False
+        bint right_closed = False
+        int64_t[:] start, end
+        const int64_t[:] index_values
+
+    assert closed is None or closed in ['right', 'left', 'both', 'neither']
+
+    if closed is None:
+        closed = 'right' if index is not None else 'both'
+    if closed in ['right', 'both']:
+        right_closed = True
+    if closed in ['left', 'both']:
+        left_closed = True
+
+    G = group_starts.shape[0] - 1
+    N = group_starts[G]
+    minp = _check_minp(win, minp, N, floor=0)
+    start_array = np.empty(N, dtype=np.int64)
+    end_array = np.empty(N, dtype=np.int64)
+    start = start_array
+    end = end_array
+
+    if index is None:
+        with nogil:
+            for g in range(G):
+                lo, hi = group_starts[g], group_starts[g + 1]
+                for i in range(lo, hi):
+                    start[i] = max(lo, i - win + 1)
+                    end[i] = i + 1
+    else:
+        index_values = index
+        with nogil:
+            for g in range(G):
+                _variable_window_bounds(index_values, group_starts[g],
+                                        group_starts[g + 1], win, left_closed,
+                                        right_closed, start, end)
+        if N:
+            win = (end_array - start_array).max()
+
+    return start_array, end_array, win, minp
+
+
+# ----------------------------------------------------------------------
+# The rolling kernels take a 2D block of values of shape (columns, rows),
+# and the offsets & data about the window from get_window_indexer, or from a
+# custom indexer, which are computed once and shared by all the columns. The
+# start & end offsets are empty for fixed windows, and must not decrease
+# otherwise.
+
+
+cdef tuple _fixed_window_bounds(int64_t N, int64_t win, int64_t minp):
+    """
+    Return the start & end offsets of fixed windows, for the kernels which
+    always iterate over windows with bounds.
+    """
+    start, end, _, _, _, _ = FixedWindowIndexer(N, win, minp, 0, 0).get_data()
+    return start, end
+
+
 # ----------------------------------------------------------------------
 # Rolling count
 # this is only an impl for index not None, IOW, freq aware
 
 
-def roll_count(ndarray[float64_t] values, int64_t win, int64_t minp,
-               object index, object closed):
+def roll_count(const float64_t[:, :] values, const int64_t[:] start,
+               const int64_t[:] end, int64_t win, int64_t minp):
     cdef:
         float64_t val, count_x = 0.0
-        int64_t s, e, nobs, N
-        Py_ssize_t i, j
-        ndarray[int64_t] start, end
-        ndarray[float64_t] output
+        Py_ssize_t i, j, k, K, N
+        int64_t s, e
+        ndarray[float64_t, ndim=2] output
 
-    start, end, N, win, minp, _ = get_window_indexer(values, win,
-                                                     minp, index, closed)
-    output = np.empty(N, dtype=float)
+    K, N = values.shape[0], values.shape[1]
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
 
     with nogil:
 
-        for i in range(0, N):
-            s = start[i]
-            e = end[i]
+        for k in range(K):
+            for i in range(0, N):
+                s = start[i]
+                e = end[i]
 
-            if i == 0:
+                if i == 0:
 
-                # setup
-                count_x = 0.0
-                for j in range(s, e):
-                    val = values[j]
-                    if notnan(val):
-                        count_x += 1.0
+                    # setup
+                    count_x = 0.0
+                    for j in range(s, e):
+                        val = values[k, j]
+                        if notnan(val):
+                            count_x += 1.0
 
-            else:
+                else:
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
-                    val = values[j]
-                    if notnan(val):
-                        count_x -= 1.0
+                    # calculate deletes
+                    for j in range(start[i - 1], s):
+                        val = values[k, j]
+                        if notnan(val):
+                            count_x -= 1.0
 
-                # calculate adds
-                for j in range(end[i - 1], e):
-                    val = values[j]
-                    if notnan(val):
-                        count_x += 1.0
+                    # calculate adds
+                    for j in range(end[i - 1], e):
+                        val = values[k, j]
+                        if notnan(val):
+                            count_x += 1.0
 
-            if count_x >= minp:
-                output[i] = count_x
-            else:
-                output[i] = NaN
+                if count_x >= minp:
+                    output[k, i] = count_x
+                else:
+                    output[k, i] = NaN
 
     return output
 
@@ -444,21 +551,19 @@ cdef inline void remove_sum(float64_t val,
         sum_x[0] = sum_x[0] - val
 
 
-def roll_sum(ndarray[float64_t] values, int64_t win, int64_t minp,
-             object index, object closed):
+def roll_sum(const float64_t[:, :] values, const int64_t[:] start,
+             const int64_t[:] end, int64_t win, int64_t minp):
     cdef:
         float64_t val, prev_x, sum_x = 0
         int64_t s, e, range_endpoint
-        int64_t nobs = 0, i, j, N
+        int64_t nobs = 0
+        Py_ssize_t i, j, k, K, N
         bint is_variable
-        ndarray[int64_t] start, end
-        ndarray[float64_t] output
+        ndarray[float64_t, ndim=2] output
 
-    start, end, N, win, minp, is_variable = get_window_indexer(values, win,
-                                                               minp, index,
-                                                               closed,
-                                                               floor=0)
-    output = np.empty(N, dtype=float)
+    K, N = values.shape[0], values.shape[1]
+    is_variable = start.shape[0] > 0
+    output = np.empty((K, N), dtype=float)
 
     # for performance we are going to iterate
     # fixed windows separately, makes the code more complex as we have 2 paths
@@ -469,29 +574,30 @@ def roll_sum(ndarray[float64_t] values, int64_t win, int64_t minp,
         # variable window
         with nogil:
 
-            for i in range(0, N):
-                s = start[i]
-                e = end[i]
+            for k in range(K):
+                for i in range(0, N):
+                    s = start[i]
+                    e = end[i]
 
-                if i == 0:
+                    if i == 0:
 
-                    # setup
-                    sum_x = 0.0
-                    nobs = 0
-                    for j in range(s, e):
-                        add_sum(values[j], &nobs, &sum_x)
+                        # setup
+                        sum_x = 0.0
+                        nobs = 0
+                        for j in range(s, e):
+                            add_sum(values[k, j], &nobs, &sum_x)
 
-                else:
+                    else:
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        remove_sum(values[j], &nobs, &sum_x)
+                        # calculate deletes
+                        for j in range(start[i - 1], s):
+                            remove_sum(values[k, j], &nobs, &sum_x)
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        add_sum(values[j], &nobs, &sum_x)
+                        # calculate adds
+                        for j in range(end[i - 1], e):
+                            add_sum(values[k, j], &nobs, &sum_x)
 
-                output[i] = calc_sum(minp, nobs, sum_x)
+                    output[k, i] = calc_sum(minp, nobs, sum_x)
 
     else:
 
@@ -501,19 +607,23 @@ def roll_sum(ndarray[float64_t] values, int64_t win, int64_t minp,
 
         with nogil:
 
-            for i in range(0, range_endpoint):
-                add_sum(values[i], &nobs, &sum_x)
-                output[i] = NaN
+            for k in range(K):
+                sum_x = 0.0
+                nobs = 0
+
+                for i in range(0, range_endpoint):
+                    add_sum(values[k, i], &nobs, &sum_x)
+                    output[k, i] = NaN
 
-            for i in range(range_endpoint, N):
-                val = values[i]
-                add_sum(val, &nobs, &sum_x)
+                for i in range(range_endpoint, N):
+                    val = values[k, i]
+                    add_sum(val, &nobs, &sum_x)
 
-                if i > win - 1:
-                    prev_x = values[i - win]
-                    remove_sum(prev_x, &nobs, &sum_x)
+                    if i > win - 1:
+                        prev_x = values[k, i - win]
+                        remove_sum(prev_x, &nobs, &sum_x)
 
-                output[i] = calc_sum(minp, nobs, sum_x)
+                    output[k, i] = calc_sum(minp, nobs, sum_x)
 
     return output
 
@@ -565,20 +675,19 @@ cdef inline void remove_mean(float64_t val, Py_ssize_t *nobs, float64_t *sum_x,
             neg_ct[0] = neg_ct[0] - 1
 
 
-def roll_mean(ndarray[float64_t] values, int64_t win, int64_t minp,
-              object index, object closed):
+def roll_mean(const float64_t[:, :] values, const int64_t[:] start,
+              const int64_t[:] end, int64_t win, int64_t minp):
     cdef:
         float64_t val, prev_x, result, sum_x = 0
         int64_t s, e
         bint is_variable
-        Py_ssize_t nobs = 0, i, j, neg_ct = 0, N
-        ndarray[int64_t] start, end
-        ndarray[float64_t] output
+        Py_ssize_t nobs = 0, i, j, k, neg_ct = 0, K, N
+        ndarray[float64_t, ndim=2] output
 
-    start, end, N, win, minp, is_variable = get_window_indexer(values, win,
-                                                               minp, index,
-                                                               closed)
-    output = np.empty(N, dtype=float)
+    K, N = values.shape[0], values.shape[1]
+    is_variable = start.shape[0] > 0
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
 
     # for performance we are going to iterate
     # fixed windows separately, makes the code more complex as we have 2 paths
@@ -588,50 +697,58 @@ def roll_mean(ndarray[float64_t] values, int64_t win, int64_t minp,
 
         with nogil:
 
-            for i in range(0, N):
-                s = start[i]
-                e = end[i]
+            for k in range(K):
+                neg_ct = 0
+                for i in range(0, N):
+                    s = start[i]
+                    e = end[i]
 
-                if i == 0:
+                    if i == 0:
 
-                    # setup
-                    sum_x = 0.0
-                    nobs = 0
-                    for j in range(s, e):
-                        val = values[j]
-                        add_mean(val, &nobs, &sum_x, &neg_ct)
+                        # setup
+                        sum_x = 0.0
+                        nobs = 0
+                        for j in range(s, e):
+                            val = values[k, j]
+                            add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                else:
+                    else:
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        val = values[j]
-                        remove_mean(val, &nobs, &sum_x, &neg_ct)
+                        # calculate deletes
+                        for j in range(start[i - 1], s):
+                            val = values[k, j]
+                            remove_mean(val, &nobs, &sum_x, &neg_ct)
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        val = values[j]
-                        add_mean(val, &nobs, &sum_x, &neg_ct)
+                        # calculate adds
+                        for j in range(end[i - 1], e):
+                            val = values[k, j]
+                            add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
+                    output[k, i] = calc_mean(minp, nobs, neg_ct, sum_x)
 
     else:
 
         with nogil:
-            for i in range(minp - 1):
-                val = values[i]
-                add_mean(val, &nobs, &sum_x, &neg_ct)
-                output[i] = NaN
 
-            for i in range(minp - 1, N):
-                val = values[i]
-                add_mean(val, &nobs, &sum_x, &neg_ct)
+            for k in range(K):
+                sum_x = 0.0
+                nobs = 0
+                neg_ct = 0
+
+                for i in range(minp - 1):
+                    val = values[k, i]
+                    add_mean(val, &nobs, &sum_x, &neg_ct)
+                    output[k, i] = NaN
+
+                for i in range(minp - 1, N):
+                    val = values[k, i]
+                    add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                if i > win - 1:
-                    prev_x = values[i - win]
-                    remove_mean(prev_x, &nobs, &sum_x, &neg_ct)
+                    if i > win - 1:
+                        prev_x = values[k, i - win]
+                        remove_mean(prev_x, &nobs, &sum_x, &neg_ct)
 
-                output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
+                    output[k, i] = calc_mean(minp, nobs, neg_ct, sum_x)
 
     return output
 
@@ -698,8 +815,8 @@ cdef inline void remove_var(float64_t val, float64_t *nobs, float64_t *mean_x,
             ssqdm_x[0] = 0
 
 
-def roll_var(ndarray[float64_t] values, int64_t win, int64_t minp,
-             object index, object closed, int ddof=1):
+def roll_var(const float64_t[:, :] values, const int64_t[:] start,
+             const int64_t[:] end, int64_t win, int64_t minp, int ddof=1):
     """
     Numerically stable implementation using Welford's method.
     """
@@ -708,14 +825,13 @@ def roll_var(ndarray[float64_t] values, int64_t win, int64_t minp,
         float64_t val, prev, delta, mean_x_old
         int64_t s, e
         bint is_variable
-        Py_ssize_t i, j, N
-        ndarray[int64_t] start, end
-        ndarray[float64_t] output
+        Py_ssize_t i, j, k, K, N
+        ndarray[float64_t, ndim=2] output
 
-    start, end, N, win, minp, is_variable = get_window_indexer(values, win,
-                                                               minp, index,
-                                                               closed)
-    output = np.empty(N, dtype=float)
+    K, N = values.shape[0], values.shape[1]
+    is_variable = start.shape[0] > 0
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
 
     # Check for windows larger than array, addresses #7297
     win = min(win, N)
@@ -728,70 +844,247 @@ def roll_var(ndarray[float64_t] values, int64_t win, int64_t minp,
 
         with nogil:
 
-            for i in range(0, N):
+            for k in range(K):
+                mean_x = ssqdm_x = nobs = 0
 
-                s = start[i]
-                e = end[i]
+                for i in range(0, N):
 
-                # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                    s = start[i]
+                    e = end[i]
 
-                    for j in range(s, e):
-                        add_var(values[j], &nobs, &mean_x, &ssqdm_x)
+                    # Over the first window, observations can only be added
+                    # never removed
+                    if i == 0:
 
-                else:
+                        for j in range(s, e):
+                            add_var(values[k, j], &nobs, &mean_x, &ssqdm_x)
 
-                    # After the first window, observations can both be added
-                    # and removed
+                    else:
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        add_var(values[j], &nobs, &mean_x, &ssqdm_x)
+                        # After the first window, observations can both be
+                        # added and removed
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        remove_var(values[j], &nobs, &mean_x, &ssqdm_x)
+                        # calculate adds
+                        for j in range(end[i - 1], e):
+                            add_var(values[k, j], &nobs, &mean_x, &ssqdm_x)
+
+                        # calculate deletes
+                        for j in range(start[i - 1], s):
+                            remove_var(values[k, j], &nobs, &mean_x, &ssqdm_x)
 
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+                    output[k, i] = calc_var(minp, ddof, nobs, ssqdm_x)
 
     else:
 
         with nogil:
 
-            # Over the first window, observations can only be added, never
-            # removed
-            for i in range(win):
-                add_var(values[i], &nobs, &mean_x, &ssqdm_x)
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+            for k in range(K):
+                mean_x = ssqdm_x = nobs = 0
 
-            # a part of Welford's method for the online variance-calculation
-            # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+                # Over the first window, observations can only be added, never
+                # removed
+                for i in range(win):
+                    add_var(values[k, i], &nobs, &mean_x, &ssqdm_x)
+                    output[k, i] = calc_var(minp, ddof, nobs, ssqdm_x)
+
+                # a part of Welford's method for the online variance-calculation
+                # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+
+                # After the first window, observations can both be added and
+                # removed
+                for i in range(win, N):
+                    val = values[k, i]
+                    prev = values[k, i - win]
+
+                    if notnan(val):
+                        if prev == prev:
+
+                            # Adding one observation and removing another one
+                            delta = val - prev
+                            mean_x_old = mean_x
+
+                            mean_x += delta / nobs
+                            ssqdm_x += ((nobs - 1) * val
+                                        + (nobs + 1) * prev
+                                        - 2 * nobs * mean_x_old) * delta / nobs
+
+                        else:
+                            add_var(val, &nobs, &mean_x, &ssqdm_x)
+                    elif prev == prev:
+                        remove_var(prev, &nobs, &mean_x, &ssqdm_x)
+
+                    output[k, i] = calc_var(minp, ddof, nobs, ssqdm_x)
+
+    return output
+
+
+# ----------------------------------------------------------------------
+# Rolling covariance & correlation
+
+
+cdef inline float64_t calc_cov(int64_t minp, int ddof, int64_t nobs,
+                               float64_t sxy, float64_t sxx, float64_t syy,
+                               int64_t same_x, int64_t same_y,
+                               bint corr) nogil:
+    cdef:
+        float64_t result
+
+    # the co-moments of a window of equal values are exactly 0, whatever is
+    # left of the values removed from them
+    if same_x >= nobs:
+        sxy = sxx = 0
+    if same_y >= nobs:
+        sxy = syy = 0
+
+    if nobs < minp:
+        result = NaN
+    elif corr:
+        # the correlation of constant values is 0 / 0
+        if nobs > 1 and sxx > 0 and syy > 0:
+            result = sxy / sqrt(sxx * syy)
+        else:
+            result = NaN
+    elif nobs > ddof:
+        result = sxy / (nobs - ddof)
+    else:
+        result = NaN
+
+    return result
+
+
+cdef inline void add_cov(float64_t x, float64_t y, int64_t *nobs,
+                         float64_t *mean_x, float64_t *mean_y,
+                         float64_t *sxy, float64_t *sxx, float64_t *syy,
+                         float64_t *prev_x, float64_t *prev_y,
+                         int64_t *same_x, int64_t *same_y) nogil:
+    """ add a pair of values to the co-moments, if both are observed """
+    cdef:
+        float64_t dx, dy
+
+    if isnan(x) or isnan(y):
+        return
 
-            # After the first window, observations can both be added and
-            # removed
-            for i in range(win, N):
-                val = values[i]
-                prev = values[i - win]
+    # the bivariate form of Welford's method
+    nobs[0] = nobs[0] + 1
+    dx = x - mean_x[0]
+    dy = y - mean_y[0]
+    mean_x[0] = mean_x[0] + dx / nobs[0]
+    mean_y[0] = mean_y[0] + dy / nobs[0]
+    sxy[0] = sxy[0] + dx * (y - mean_y[0])
+    sxx[0] = sxx[0] + dx * (x - mean_x[0])
+    syy[0] = syy[0] + dy * (y - mean_y[0])
+
+    # the length of the run of equal values ending with the last one
+    same_x[0] = same_x[0] + 1 if x == prev_x[0] else 1
+    same_y[0] = same_y[0] + 1 if y == prev_y[0] else 1
+    prev_x[0] = x
+    prev_y[0] = y
+
+
+cdef inline void remove_cov(float64_t x, float64_t y, int64_t *nobs,
+                            float64_t *mean_x, float64_t *mean_y,
+                            float64_t *sxy, float64_t *sxx,
+                            float64_t *syy) nogil:
+    """ remove a pair of values from the co-moments, if both are observed """
+    cdef:
+        float64_t dx, dy
+
+    if isnan(x) or isnan(y):
+        return
+
+    nobs[0] = nobs[0] - 1
+    if nobs[0]:
+        dx = x - mean_x[0]
+        dy = y - mean_y[0]
+        mean_x[0] = mean_x[0] - dx / nobs[0]
+        mean_y[0] = mean_y[0] - dy / nobs[0]
+        sxy[0] = sxy[0] - (x - mean_x[0]) * dy
+        sxx[0] = sxx[0] - (x - mean_x[0]) * dx
+        syy[0] = syy[0] - (y - mean_y[0]) * dy
+    else:
+        mean_x[0] = mean_y[0] = 0
+        sxy[0] = sxx[0] = syy[0] = 0
+
+
+def roll_cov(const float64_t[:, :] x, const float64_t[:, :] y,
+             const int64_t[:] start, const int64_t[:] end, int64_t win,
+             int64_t minp, int ddof=1, bint corr=False, bint symmetric=False):
+    """
+    Rolling covariance, or correlation, of every column of x with every
+    column of y, keeping the running co-moments of each pair of columns
+    over the rows where both are observed.
+
+    Parameters
+    ----------
+    x : ndarray (float64 type), shape (columns of x, rows)
+    y : ndarray (float64 type), shape (columns of y, rows)
+    ddof : int
+        the divisor of the covariance is ``nobs - ddof``
+    corr : bool
+        return the correlation instead of the covariance
+    symmetric : bool
+        x and y are the same values, only compute each pair once
+
+    Returns
+    -------
+    y : ndarray, shape (columns of x, columns of y, rows)
+    """
+    cdef:
+        Py_ssize_t i, j, a, b, b0, K1, K2, N
+        int64_t nobs, s, e, same_x, same_y
+        float64_t mean_x, mean_y, sxy, sxx, syy, prev_x, prev_y
+        ndarray[float64_t, ndim=3] output
+        float64_t[:, :, :] out
+
+    K1, K2, N = x.shape[0], y.shape[0], x.shape[1]
+    if y.shape[1] != N:
+        raise ValueError("arrays are of different lengths "
+                         "({N} and {len_y})".format(N=N, len_y=y.shape[1]))
+    if symmetric and K1 != K2:
+        raise ValueError("symmetric values must have as many columns")
 
-                if notnan(val):
-                    if prev == prev:
+    minp = max(minp, 1)
+    output = np.empty((K1, K2, N), dtype=float)
+    out = output
 
-                        # Adding one observation and removing another one
-                        delta = val - prev
-                        mean_x_old = mean_x
+    if win == 0 or N == 0:
+        output[:] = NaN
+        return output
 
-                        mean_x += delta / nobs
-                        ssqdm_x += ((nobs - 1) * val
-                                    + (nobs + 1) * prev
-                                    - 2 * nobs * mean_x_old) * delta / nobs
+    if start.shape[0] == 0:
+        start, end = _fixed_window_bounds(N, win, minp)
 
+    with nogil:
+        for a in range(K1):
+            b0 = a if symmetric else 0
+            for b in range(b0, K2):
+                nobs = same_x = same_y = 0
+                mean_x = mean_y = sxy = sxx = syy = 0
+                prev_x = prev_y = NaN
+
+                for i in range(N):
+                    s = start[i]
+                    e = end[i]
+
+                    if i == 0:
+                        for j in range(s, e):
+                            add_cov(x[a, j], y[b, j], &nobs, &mean_x, &mean_y,
+                                    &sxy, &sxx, &syy, &prev_x, &prev_y,
+                                    &same_x, &same_y)
                     else:
-                        add_var(val, &nobs, &mean_x, &ssqdm_x)
-                elif prev == prev:
-                    remove_var(prev, &nobs, &mean_x, &ssqdm_x)
+                        for j in range(end[i - 1], e):
+                            add_cov(x[a, j], y[b, j], &nobs, &mean_x, &mean_y,
+                                    &sxy, &sxx, &syy, &prev_x, &prev_y,
+                                    &same_x, &same_y)
+                        for j in range(start[i - 1], s):
+                            remove_cov(x[a, j], y[b, j], &nobs, &mean_x,
+                                       &mean_y, &sxy, &sxx, &syy)
+
+                    out[a, b, i] = calc_cov(minp, ddof, nobs, sxy, sxx, syy,
+                                            same_x, same_y, corr)
 
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+                if b != a and symmetric:
+                    out[b, a, :] = out[a, b, :]
 
     return output
 
@@ -863,73 +1156,82 @@ cdef inline void remove_skew(float64_t val, int64_t *nobs,
         xxx[0] = xxx[0] - val * val * val
 
 
-def roll_skew(ndarray[float64_t] values, int64_t win, int64_t minp,
-              object index, object closed):
+def roll_skew(const float64_t[:, :] values, const int64_t[:] start,
+              const int64_t[:] end, int64_t win, int64_t minp):
     cdef:
         float64_t val, prev
         float64_t x = 0, xx = 0, xxx = 0
-        int64_t nobs = 0, i, j, N
+        int64_t nobs = 0
         int64_t s, e
+        Py_ssize_t i, j, k, K, N
         bint is_variable
-        ndarray[int64_t] start, end
-        ndarray[float64_t] output
+        ndarray[float64_t, ndim=2] output
 
-    start, end, N, win, minp, is_variable = get_window_indexer(values, win,
-                                                               minp, index,
-                                                               closed)
-    output = np.empty(N, dtype=float)
+    K, N = values.shape[0], values.shape[1]
+    is_variable = start.shape[0] > 0
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
 
     if is_variable:
 
         with nogil:
 
-            for i in range(0, N):
+            for k in range(K):
+                x = xx = xxx = 0
+                nobs = 0
 
-                s = start[i]
-                e = end[i]
+                for i in range(0, N):
 
-                # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                    s = start[i]
+                    e = end[i]
 
-                    for j in range(s, e):
-                        val = values[j]
-                        add_skew(val, &nobs, &x, &xx, &xxx)
+                    # Over the first window, observations can only be added
+                    # never removed
+                    if i == 0:
 
-                else:
+                        for j in range(s, e):
+                            val = values[k, j]
+                            add_skew(val, &nobs, &x, &xx, &xxx)
 
-                    # After the first window, observations can both be added
-                    # and removed
+                    else:
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        val = values[j]
-                        add_skew(val, &nobs, &x, &xx, &xxx)
+                        # After the first window, observations can both be
+                        # added and removed
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        val = values[j]
-                        remove_skew(val, &nobs, &x, &xx, &xxx)
+                        # calculate adds
+                        for j in range(end[i - 1], e):
+                            val = values[k, j]
+                            add_skew(val, &nobs, &x, &xx, &xxx)
+
+                        # calculate deletes
+                        for j in range(start[i - 1], s):
+                            val = values[k, j]
+                            remove_skew(val, &nobs, &x, &xx, &xxx)
 
-                output[i] = calc_skew(minp, nobs, x, xx, xxx)
+                    output[k, i] = calc_skew(minp, nobs, x, xx, xxx)
 
     else:
 
         with nogil:
-            for i in range(minp - 1):
-                val = values[i]
-                add_skew(val, &nobs, &x, &xx, &xxx)
-                output[i] = NaN
 
-            for i in range(minp - 1, N):
-                val = values[i]
-                add_skew(val, &nobs, &x, &xx, &xxx)
+            for k in range(K):
+                x = xx = xxx = 0
+                nobs = 0
+
+                for i in range(minp - 1):
+                    val = values[k, i]
+                    add_skew(val, &nobs, &x, &xx, &xxx)
+                    output[k, i] = NaN
 
-                if i > win - 1:
-                    prev = values[i - win]
-                    remove_skew(prev, &nobs, &x, &xx, &xxx)
+                for i in range(minp - 1, N):
+                    val = values[k, i]
+                    add_skew(val, &nobs, &x, &xx, &xxx)
 
-                output[i] = calc_skew(minp, nobs, x, xx, xxx)
+                    if i > win - 1:
+                        prev = values[k, i - win]
+                        remove_skew(prev, &nobs, &x, &xx, &xxx)
+
+                    output[k, i] = calc_skew(minp, nobs, x, xx, xxx)
 
     return output
 
@@ -1007,69 +1309,78 @@ cdef inline void remove_kurt(float64_t val, int64_t *nobs,
         xxxx[0] = xxxx[0] - val * val * val * val
 
 
-def roll_kurt(ndarray[float64_t] values, int64_t win, int64_t minp,
-              object index, object closed):
+def roll_kurt(const float64_t[:, :] values, const int64_t[:] start,
+              const int64_t[:] end, int64_t win, int64_t minp):
     cdef:
         float64_t val, prev
         float64_t x = 0, xx = 0, xxx = 0, xxxx = 0
-        int64_t nobs = 0, i, j, N
+        int64_t nobs = 0
         int64_t s, e
+        Py_ssize_t i, j, k, K, N
         bint is_variable
-        ndarray[int64_t] start, end
-        ndarray[float64_t] output
+        ndarray[float64_t, ndim=2] output
 
-    start, end, N, win, minp, is_variable = get_window_indexer(values, win,
-                                                               minp, index,
-                                                               closed)
-    output = np.empty(N, dtype=float)
+    K, N = values.shape[0], values.shape[1]
+    is_variable = start.shape[0] > 0
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
 
     if is_variable:
 
         with nogil:
 
-            for i in range(0, N):
+            for k in range(K):
+                x = xx = xxx = xxxx = 0
+                nobs = 0
 
-                s = start[i]
-                e = end[i]
+                for i in range(0, N):
 
-                # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                    s = start[i]
+                    e = end[i]
 
-                    for j in range(s, e):
-                        add_kurt(values[j], &nobs, &x, &xx, &xxx, &xxxx)
+                    # Over the first window, observations can only be added
+                    # never removed
+                    if i == 0:
 
-                else:
+                        for j in range(s, e):
+                            add_kurt(values[k, j], &nobs, &x, &xx, &xxx, &xxxx)
 
-                    # After the first window, observations can both be added
-                    # and removed
+                    else:
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        add_kurt(values[j], &nobs, &x, &xx, &xxx, &xxxx)
+                        # After the first window, observations can both be
+                        # added and removed
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        remove_kurt(values[j], &nobs, &x, &xx, &xxx, &xxxx)
+                        # calculate adds
+                        for j in range(end[i - 1], e):
+                            add_kurt(values[k, j], &nobs, &x, &xx, &xxx, &xxxx)
+
+                        # calculate deletes
+                        for j in range(start[i - 1], s):
+                            remove_kurt(values[k, j], &nobs,
+                                        &x, &xx, &xxx, &xxxx)
 
-                output[i] = calc_kurt(minp, nobs, x, xx, xxx, xxxx)
+                    output[k, i] = calc_kurt(minp, nobs, x, xx, xxx, xxxx)
 
     else:
 
         with nogil:
 
-            for i in range(minp - 1):
-                add_kurt(values[i], &nobs, &x, &xx, &xxx, &xxxx)
-                output[i] = NaN
+            for k in range(K):
+                x = xx = xxx = xxxx = 0
+                nobs = 0
 
-            for i in range(minp - 1, N):
-                add_kurt(values[i], &nobs, &x, &xx, &xxx, &xxxx)
+                for i in range(minp - 1):
+                    add_kurt(values[k, i], &nobs, &x, &xx, &xxx, &xxxx)
+                    output[k, i] = NaN
 
-                if i > win - 1:
-                    prev = values[i - win]
-                    remove_kurt(prev, &nobs, &x, &xx, &xxx, &xxxx)
+                for i in range(minp - 1, N):
+                    add_kurt(values[k, i], &nobs, &x, &xx, &xxx, &xxxx)
 
-                output[i] = calc_kurt(minp, nobs, x, xx, xxx, xxxx)
+                    if i > win - 1:
+                        prev = values[k, i - win]
+                        remove_kurt(prev, &nobs, &x, &xx, &xxx, &xxxx)
+
+                    output[k, i] = calc_kurt(minp, nobs, x, xx, xxx, xxxx)
 
     return output
 
@@ -1077,87 +1388,136 @@ def roll_kurt(ndarray[float64_t] values, int64_t win, int64_t minp,
 # ----------------------------------------------------------------------
 # Rolling median, min, max
 
+# The rolling median and quantiles count the values in the window by their
+# rank, in a Fenwick tree (binary indexed tree) over the ranks. The rows are
+# processed by chunks of a few window lengths, whose values are ranked by one
+# sort, after which adding or removing a value and finding the k-th smallest
+# value in the window each take O(log(window)) steps over a small flat array,
+# without the allocation of a node per value and the pointer chasing of a
+# skiplist.
+
 
-def roll_median_c(ndarray[float64_t] values, int64_t win, int64_t minp,
-                  object index, object closed):
+cdef inline void _fenwick_add(int64_t *tree, int64_t size, int64_t rank,
+                              int64_t delta) nogil:
     cdef:
-        float64_t val, res, prev
-        bint err = 0, is_variable
-        int ret = 0
-        skiplist_t *sl
-        Py_ssize_t i, j
-        int64_t nobs = 0, N, s, e
-        int midpoint
-        ndarray[int64_t] start, end
-        ndarray[float64_t] output
+        int64_t i = rank + 1
 
-    # we use the Fixed/Variable Indexer here as the
-    # actual skiplist ops outweigh any window computation costs
-    start, end, N, win, minp, is_variable = get_window_indexer(
-        values, win,
-        minp, index, closed,
-        use_mock=False)
-    output = np.empty(N, dtype=float)
+    while i <= size:
+        tree[i] += delta
+        i += i & -i
 
-    if win == 0:
-        output[:] = NaN
-        return output
 
-    sl = skiplist_init(<int>win)
-    if sl == NULL:
-        raise MemoryError("skiplist_init failed")
+cdef inline int64_t _fenwick_kth(int64_t *tree, int64_t size, int64_t top,
+                                 int64_t k) nogil:
+    # the rank of the k-th (from 0) smallest value counted in the tree, top
+    # being the largest power of two not above size
+    cdef:
+        int64_t pos = 0, nxt
+
+    while top:
+        nxt = pos + top
+        if nxt <= size and tree[nxt] <= k:
+            pos = nxt
+            k -= tree[nxt]
+        top >>= 1
+    return pos
+
+
+cdef inline int64_t _fenwick_move(int64_t *tree, int64_t size, int64_t *ranks,
+                                  int64_t offset, int64_t prev_start,
+                                  int64_t prev_end, int64_t start,
+                                  int64_t end) nogil:
+    # move the window counted in the tree from [prev_start, prev_end) to
+    # [start, end), the rank of the value j being ranks[j - offset], returning
+    # the change in the number of values counted; the NaN are ranked size
+    cdef:
+        int64_t j, nobs = 0
+
+    for j in range(prev_end, end):
+        if ranks[j - offset] < size:
+            _fenwick_add(tree, size, ranks[j - offset], 1)
+            nobs += 1
+    for j in range(prev_start, start):
+        if ranks[j - offset] < size:
+            _fenwick_add(tree, size, ranks[j - offset], -1)
+            nobs -= 1
+    return nobs
+
+
+cdef inline int64_t _rank_values(const float64_t[:] values, int64_t lo,
+                                 int64_t hi, pair[float64_t, int64_t] *pairs,
+                                 int64_t *ranks, float64_t *sorted_values) nogil:
+    # rank the values in [lo, hi) into ranks[j - lo] and sort them into
+    # sorted_values, returning the number of values that are not NaN, which
+    # is the rank of the NaN
+    cdef:
+        int64_t j, r, size = 0
 
-    with nogil:
+    for j in range(lo, hi):
+        if notnan(values[j]):
+            pairs[size].first = values[j]
+            pairs[size].second = j
+            size += 1
+        else:
+            ranks[j - lo] = -1
+    sort(pairs, pairs + size)
+    for r in range(size):
+        ranks[pairs[r].second - lo] = r
+        sorted_values[r] = pairs[r].first
+    for j in range(lo, hi):
+        if ranks[j - lo] == -1:
+            ranks[j - lo] = size
+    return size
+
+
+cdef inline int64_t _fenwick_sum(int64_t *tree, int64_t rank) nogil:
+    # the number of values counted in the tree with a rank below rank
+    cdef:
+        int64_t i = rank, total = 0
 
-        for i in range(0, N):
-            s = start[i]
-            e = end[i]
+    while i > 0:
+        total += tree[i]
+        i -= i & -i
+    return total
 
-            if i == 0:
 
-                # setup
-                for j in range(s, e):
-                    val = values[j]
-                    if notnan(val):
-                        nobs += 1
-                        err = skiplist_insert(sl, val) != 1
-                        if err:
-                            break
+cdef inline void _tie_bounds(float64_t *sorted_values, int64_t size,
+                             int64_t *first, int64_t *last) nogil:
+    # the first and last ranks of the values equal to the value of each rank
+    cdef:
+        int64_t r
 
-            else:
+    for r in range(size):
+        if r > 0 and sorted_values[r] == sorted_values[r - 1]:
+            first[r] = first[r - 1]
+        else:
+            first[r] = r
+    for r in range(size - 1, -1, -1):
+        if r < size - 1 and sorted_values[r] == sorted_values[r + 1]:
+            last[r] = last[r + 1]
+        else:
+            last[r] = r
 
-                # calculate adds
-                for j in range(end[i - 1], e):
-                    val = values[j]
-                    if notnan(val):
-                        nobs += 1
-                        err = skiplist_insert(sl, val) != 1
-                        if err:
-                            break
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
-                    val = values[j]
-                    if notnan(val):
-                        skiplist_remove(sl, val)
-                        nobs -= 1
+cdef int64_t _rank_buffer_size(const int64_t[:] start, const int64_t[:] end,
+                               int64_t N, int64_t chunk):
+    # the largest number of values in the windows of a chunk of rows
+    cdef:
+        int64_t c0 = 0, c1, buffer_size = 0
 
-            if nobs >= minp:
-                midpoint = <int>(nobs / 2)
-                if nobs % 2:
-                    res = skiplist_get(sl, midpoint, &ret)
-                else:
-                    res = (skiplist_get(sl, midpoint, &ret) +
-                           skiplist_get(sl, (midpoint - 1), &ret)) / 2
-            else:
-                res = NaN
+    while c0 < N:
+        c1 = min(c0 + chunk, N)
+        buffer_size = max(buffer_size, end[c1 - 1] - start[c0])
+        c0 = c1
+    return buffer_size
 
-            output[i] = res
 
-    skiplist_destroy(sl)
-    if err:
-        raise MemoryError("skiplist_insert failed")
-    return output
+def roll_median_c(const float64_t[:, :] values, const int64_t[:] start,
+                  const int64_t[:] end, int64_t win, int64_t minp):
+    # the median is the 0.5 quantile with midpoint interpolation, the mean of
+    # the two middle values of an even number of values
+    return roll_quantile(values, start, end, win, minp,
+                         np.array([0.5]), 'midpoint')[:, 0]
 
 
 # ----------------------------------------------------------------------
@@ -1211,93 +1571,100 @@ cdef inline numeric calc_mm(int64_t minp, Py_ssize_t nobs,
     return result
 
 
-def roll_max(ndarray[numeric] values, int64_t win, int64_t minp,
-             object index, object closed):
+def roll_max(numeric[:, :] values, const int64_t[:] start,
+             const int64_t[:] end, int64_t win, int64_t minp):
     """
-    Moving max of 1d array of any numeric type along axis=0 ignoring NaNs.
+    Moving max of 2d array of any numeric type along axis=1 ignoring NaNs.
 
     Parameters
     ----------
     values: numpy array
+    start, end: ndarray[int64_t]
+       offsets of the variable windows, empty for fixed windows
     window: int, size of rolling window
     minp: if number of observations in window
           is below this, output a NaN
-    index: ndarray, optional
-       index for window computation
-    closed: 'right', 'left', 'both', 'neither'
-            make the interval closed on the right, left,
-            both or neither endpoints
     """
-    return _roll_min_max(values, win, minp, index, closed=closed, is_max=1)
+    return _roll_min_max(values, start, end, win, minp, is_max=1)
 
 
-def roll_min(ndarray[numeric] values, int64_t win, int64_t minp,
-             object index, object closed):
+def roll_min(numeric[:, :] values, const int64_t[:] start,
+             const int64_t[:] end, int64_t win, int64_t minp):
     """
-    Moving max of 1d array of any numeric type along axis=0 ignoring NaNs.
+    Moving min of 2d array of any numeric type along axis=1 ignoring NaNs.
 
     Parameters
     ----------
     values: numpy array
+    start, end: ndarray[int64_t]
+       offsets of the variable windows, empty for fixed windows
     window: int, size of rolling window
     minp: if number of observations in window
           is below this, output a NaN
-    index: ndarray, optional
-       index for window computation
     """
-    return _roll_min_max(values, win, minp, index, is_max=0, closed=closed)
+    return _roll_min_max(values, start, end, win, minp, is_max=0)
 
 
-cdef _roll_min_max(ndarray[numeric] values, int64_t win, int64_t minp,
-                   object index, object closed, bint is_max):
+cdef _roll_min_max(numeric[:, :] values, const int64_t[:] starti,
+                   const int64_t[:] endi, int64_t win, int64_t minp,
+                   bint is_max):
     """
-    Moving min/max of 1d array of any numeric type along axis=0
+    Moving min/max of 2d array of any numeric type along axis=1
     ignoring NaNs.
     """
     cdef:
-        ndarray[int64_t] starti, endi
-        int64_t N
-        bint is_variable
+        Py_ssize_t k, K, N
+        float64_t[:, :] output
 
-    starti, endi, N, win, minp, is_variable = get_window_indexer(
-        values, win,
-        minp, index, closed)
+    K, N = values.shape[0], values.shape[1]
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
 
-    if is_variable:
-        return _roll_min_max_variable(values, starti, endi, N, win, minp,
-                                      is_max)
+    if starti.shape[0] > 0:
+        with nogil:
+            for k in range(K):
+                _roll_min_max_variable(values[k], starti, endi, N, minp,
+                                       is_max, output[k])
     else:
-        return _roll_min_max_fixed(values, N, win, minp, is_max)
+        for k in range(K):
+            _roll_min_max_fixed(values[k], N, win, minp, is_max, output[k])
+
+    return np.asarray(output)
 
 
-cdef _roll_min_max_variable(ndarray[numeric] values,
-                            ndarray[int64_t] starti,
-                            ndarray[int64_t] endi,
-                            int64_t N,
-                            int64_t win,
-                            int64_t minp,
-                            bint is_max):
+cdef void _roll_min_max_variable(numeric[:] values,
+                                 const int64_t[:] starti,
+                                 const int64_t[:] endi,
+                                 int64_t N,
+                                 int64_t minp,
+                                 bint is_max,
+                                 float64_t[:] output) nogil:
     cdef:
         numeric ai
-        int64_t i, close_offset, curr_win_size
+        int64_t i, j, s, e
         Py_ssize_t nobs = 0
         deque Q[int64_t]  # min/max always the front
         deque W[int64_t]  # track the whole window for nobs compute
-        ndarray[float64_t, ndim=1] output
 
-    output = np.empty(N, dtype=float)
     Q = deque[int64_t]()
     W = deque[int64_t]()
 
-    with nogil:
+    # This is using a modified version of the C++ code in this
+    # SO post: http://bit.ly/2nOoHlY
+    # The original impl didn't deal with variable window sizes
+    # So the code was optimized for that
 
-        # This is using a modified version of the C++ code in this
-        # SO post: http://bit.ly/2nOoHlY
-        # The original impl didn't deal with variable window sizes
-        # So the code was optimized for that
+    # the windows can have any non-decreasing bounds: the values entering
+    # each window are added at the back, those that left it are removed from
+    # the front
+    e = starti[0]
+    for i in range(N):
+        s = starti[i]
+        if e < s:
+            e = s
 
-        for i from starti[0] <= i < endi[0]:
-            ai = init_mm(values[i], &nobs, is_max)
+        for j in range(e, endi[i]):
+            ai = init_mm(values[j], &nobs, is_max)
 
             # Discard previous entries if we find new min or max
             if is_max:
@@ -1308,57 +1675,30 @@ cdef _roll_min_max_variable(ndarray[numeric] values,
                 while not Q.empty() and ((ai <= values[Q.back()]) or
                                          values[Q.back()] != values[Q.back()]):
                     Q.pop_back()
-            Q.push_back(i)
-            W.push_back(i)
-
-        # if right is open then the first window is empty
-        close_offset = 0 if endi[0] > starti[0] else 1
-        # first window's size
-        curr_win_size = endi[0] - starti[0]
-
-        for i in range(endi[0], endi[N-1]):
-            if not Q.empty() and curr_win_size > 0:
-                output[i-1+close_offset] = calc_mm(
-                    minp, nobs, values[Q.front()])
-            else:
-                output[i-1+close_offset] = NaN
-
-            ai = init_mm(values[i], &nobs, is_max)
-
-            # Discard previous entries if we find new min or max
-            if is_max:
-                while not Q.empty() and ((ai >= values[Q.back()]) or
-                                         values[Q.back()] != values[Q.back()]):
-                    Q.pop_back()
-            else:
-                while not Q.empty() and ((ai <= values[Q.back()]) or
-                                         values[Q.back()] != values[Q.back()]):
-                    Q.pop_back()
-
-            # Maintain window/nobs retention
-            curr_win_size = endi[i + close_offset] - starti[i + close_offset]
-            while not Q.empty() and Q.front() <= i - curr_win_size:
-                Q.pop_front()
-            while not W.empty() and W.front() <= i - curr_win_size:
-                remove_mm(values[W.front()], &nobs)
-                W.pop_front()
-
-            Q.push_back(i)
-            W.push_back(i)
-
-        if not Q.empty() and curr_win_size > 0:
-            output[N-1] = calc_mm(minp, nobs, values[Q.front()])
+            Q.push_back(j)
+            W.push_back(j)
+        if endi[i] > e:
+            e = endi[i]
+
+        # Maintain window/nobs retention
+        while not Q.empty() and Q.front() < s:
+            Q.pop_front()
+        while not W.empty() and W.front() < s:
+            remove_mm(values[W.front()], &nobs)
+            W.pop_front()
+
+        if not Q.empty() and endi[i] > s:
+            output[i] = calc_mm(minp, nobs, values[Q.front()])
         else:
-            output[N-1] = NaN
-
-    return output
+            output[i] = NaN
 
 
-cdef _roll_min_max_fixed(ndarray[numeric] values,
+cdef _roll_min_max_fixed(numeric[:] values,
                          int64_t N,
                          int64_t win,
                          int64_t minp,
-                         bint is_max):
+                         bint is_max,
+                         float64_t[:] output):
     cdef:
         numeric ai
         bint should_replace
@@ -1369,9 +1709,7 @@ cdef _roll_min_max_fixed(ndarray[numeric] values,
         numeric* minvalue
         numeric* end
         numeric* last
-        ndarray[float64_t, ndim=1] output
 
-    output = np.empty(N, dtype=float)
     # setup the rings of death!
     ring = <numeric *>malloc(win * sizeof(numeric))
     death = <int64_t *>malloc(win * sizeof(int64_t))
@@ -1439,6 +1777,79 @@ cdef _roll_min_max_fixed(ndarray[numeric] values,
         free(ring)
         free(death)
 
+
+def roll_argmax(const float64_t[:, :] values, const int64_t[:] start,
+                const int64_t[:] end, int64_t win, int64_t minp):
+    """
+    Position of the maximum in each window, from the start of the window,
+    ignoring NaNs; the first of tied maxima.
+    """
+    return _roll_arg_min_max(values, start, end, win, minp, is_max=1)
+
+
+def roll_argmin(const float64_t[:, :] values, const int64_t[:] start,
+                const int64_t[:] end, int64_t win, int64_t minp):
+    """
+    Position of the minimum in each window, from the start of the window,
+    ignoring NaNs; the first of tied minima.
+    """
+    return _roll_arg_min_max(values, start, end, win, minp, is_max=0)
+
+
+cdef _roll_arg_min_max(const float64_t[:, :] values, const int64_t[:] start,
+                       const int64_t[:] end, int64_t win, int64_t minp,
+                       bint is_max):
+    cdef:
+        Py_ssize_t i, k, K, N
+        int64_t j, prev_start, prev_end, nobs
+        float64_t ai
+        deque Q[int64_t]  # position of the min/max always the front
+        ndarray[float64_t, ndim=2] output
+
+    K, N = values.shape[0], values.shape[1]
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
+
+    if win == 0 or N == 0:
+        output[:] = NaN
+        return output
+
+    if start.shape[0] == 0:
+        start, end = _fixed_window_bounds(N, win, minp)
+
+    with nogil:
+        for k in range(K):
+            Q.clear()
+            nobs = 0
+            prev_start = prev_end = start[0]
+            for i in range(N):
+                # the deque keeps the values entering the window that are
+                # strictly above (below) those after them, the first of tied
+                # values stays in front of the others
+                for j in range(prev_end, end[i]):
+                    ai = values[k, j]
+                    if ai != ai:
+                        continue
+                    nobs += 1
+                    if is_max:
+                        while not Q.empty() and values[k, Q.back()] < ai:
+                            Q.pop_back()
+                    else:
+                        while not Q.empty() and values[k, Q.back()] > ai:
+                            Q.pop_back()
+                    Q.push_back(j)
+                for j in range(prev_start, start[i]):
+                    if notnan(values[k, j]):
+                        nobs -= 1
+                while not Q.empty() and Q.front() < start[i]:
+                    Q.pop_front()
+                prev_start, prev_end = start[i], end[i]
+
+                if nobs >= minp and not Q.empty():
+                    output[k, i] = Q.front() - start[i]
+                else:
+                    output[k, i] = NaN
+
     return output
 
 
@@ -1459,26 +1870,65 @@ interpolation_types = {
 }
 
 
-def roll_quantile(ndarray[float64_t, cast=True] values, int64_t win,
-                  int64_t minp, object index, object closed,
-                  float64_t quantile, str interpolation):
+cdef inline float64_t _calc_quantile(int64_t *tree, int64_t size, int64_t top,
+                                     float64_t *sorted_values, int64_t nobs,
+                                     float64_t quantile,
+                                     InterpolationType interpolation_type) nogil:
+    cdef:
+        float64_t idx_with_fraction, vlow, vhigh
+        int64_t idx
+
+    idx_with_fraction = quantile * (nobs - 1)
+    idx = <int64_t>idx_with_fraction
+    vlow = sorted_values[_fenwick_kth(tree, size, top, idx)]
+
+    if idx_with_fraction == idx or interpolation_type == LOWER:
+        # no need to interpolate
+        return vlow
+
+    vhigh = sorted_values[_fenwick_kth(tree, size, top, idx + 1)]
+    if interpolation_type == LINEAR:
+        return vlow + (vhigh - vlow) * (idx_with_fraction - idx)
+    elif interpolation_type == HIGHER:
+        return vhigh
+    elif interpolation_type == NEAREST:
+        # the same behaviour as round()
+        if idx_with_fraction - idx == 0.5:
+            return vlow if idx % 2 == 0 else vhigh
+        elif idx_with_fraction - idx < 0.5:
+            return vlow
+        return vhigh
+    else:
+        # MIDPOINT
+        return <float64_t>(vlow + vhigh) / 2
+
+
+def roll_quantile(const float64_t[:, :] values, const int64_t[:] start,
+                  const int64_t[:] end, int64_t win, int64_t minp,
+                  const float64_t[:] quantiles, str interpolation):
     """
-    O(N log(window)) implementation using skip list
+    O(N log(window)) implementation using a Fenwick tree over the ranks of
+    the values, computing all the ``quantiles`` in one pass over the windows.
+
+    Returns
+    -------
+    y : ndarray, shape (columns, quantiles, rows)
     """
     cdef:
-        float64_t val, prev, midpoint, idx_with_fraction
-        skiplist_t *skiplist
-        int64_t nobs = 0, i, j, s, e, N
-        Py_ssize_t idx
-        bint is_variable
-        ndarray[int64_t] start, end
-        ndarray[float64_t] output
-        float64_t vlow, vhigh
+        Py_ssize_t i, k, q, K, N, Q
+        int64_t nobs, size, top, prev_start, prev_end, lo, hi
+        int64_t chunk, c0, c1, buffer_size
+        int64_t *tree = NULL
+        int64_t *ranks = NULL
+        float64_t *sorted_values = NULL
+        pair[float64_t, int64_t] *pairs = NULL
+        ndarray[float64_t, ndim=3] output
         InterpolationType interpolation_type
-        int ret = 0
 
-    if quantile <= 0.0 or quantile >= 1.0:
-        raise ValueError("quantile value {0} not in [0, 1]".format(quantile))
+    for q in range(quantiles.shape[0]):
+        if not 0.0 <= quantiles[q] <= 1.0:
+            raise ValueError("quantile value {0} not in [0, 1]"
+                             .format(quantiles[q]))
 
     try:
         interpolation_type = interpolation_types[interpolation]
@@ -1486,101 +1936,304 @@ def roll_quantile(ndarray[float64_t, cast=True] values, int64_t win,
         raise ValueError("Interpolation '{interp}' is not supported"
                          .format(interp=interpolation))
 
-    # we use the Fixed/Variable Indexer here as the
-    # actual skiplist ops outweigh any window computation costs
-    start, end, N, win, minp, is_variable = get_window_indexer(
-        values, win,
-        minp, index, closed,
-        use_mock=False)
-    output = np.empty(N, dtype=float)
+    K, N, Q = values.shape[0], values.shape[1], quantiles.shape[0]
+    minp = max(minp, 1)
+    output = np.empty((K, Q, N), dtype=float)
 
-    if win == 0:
+    if win == 0 or N == 0:
         output[:] = NaN
         return output
 
-    skiplist = skiplist_init(<int>win)
-    if skiplist == NULL:
-        raise MemoryError("skiplist_init failed")
+    # we use the Fixed/Variable Indexer here as the
+    # actual tree ops outweigh any window computation costs
+    if start.shape[0] == 0:
+        start, end = _fixed_window_bounds(N, win, minp)
+
+    # each chunk of rows ranks the values in their windows, a chunk of a few
+    # windows spreads the cost of filling its first window
+    chunk = max(4 * win, 256)
+    buffer_size = _rank_buffer_size(start, end, N, chunk)
+
+    tree = <int64_t *>malloc((buffer_size + 1) * sizeof(int64_t))
+    ranks = <int64_t *>malloc(buffer_size * sizeof(int64_t))
+    sorted_values = <float64_t *>malloc(buffer_size * sizeof(float64_t))
+    pairs = <pair[float64_t, int64_t] *>malloc(
+        buffer_size * sizeof(pair[float64_t, int64_t]))
+    if (tree == NULL or ranks == NULL or sorted_values == NULL or
+            pairs == NULL):
+        free(tree)
+        free(ranks)
+        free(sorted_values)
+        free(pairs)
+        raise MemoryError("unable to allocate the rank tree")
 
     with nogil:
-        for i in range(0, N):
-            s = start[i]
-            e = end[i]
+        for k in range(K):
+            c0 = 0
+            while c0 < N:
+                c1 = min(c0 + chunk, N)
+                lo, hi = start[c0], end[c1 - 1]
+                size = _rank_values(values[k], lo, hi, pairs, ranks,
+                                    sorted_values)
+                memset(tree, 0, (size + 1) * sizeof(int64_t))
+                top = 1
+                while top * 2 <= size:
+                    top *= 2
+
+                nobs = 0
+                prev_start = prev_end = lo
+                for i in range(c0, c1):
+                    nobs += _fenwick_move(tree, size, ranks, lo, prev_start,
+                                          prev_end, start[i], end[i])
+                    prev_start, prev_end = start[i], end[i]
+
+                    for q in range(Q):
+                        if nobs >= minp:
+                            output[k, q, i] = _calc_quantile(
+                                tree, size, top, sorted_values, nobs,
+                                quantiles[q], interpolation_type)
+                        else:
+                            output[k, q, i] = NaN
+                c0 = c1
 
-            if i == 0:
+    free(tree)
+    free(ranks)
+    free(sorted_values)
+    free(pairs)
+    return output
 
-                # setup
-                for j in range(s, e):
-                    val = values[j]
-                    if notnan(val):
-                        nobs += 1
-                        skiplist_insert(skiplist, val)
 
-            else:
+cdef enum RankType:
+    RANK_AVERAGE,
+    RANK_MIN,
+    RANK_MAX
 
-                # calculate adds
-                for j in range(end[i - 1], e):
-                    val = values[j]
-                    if notnan(val):
-                        nobs += 1
-                        skiplist_insert(skiplist, val)
 
-                # calculate deletes
-                for j in range(start[i - 1], s):
-                    val = values[j]
-                    if notnan(val):
-                        skiplist_remove(skiplist, val)
-                        nobs -= 1
+rank_types = {
+    'average': RANK_AVERAGE,
+    'min': RANK_MIN,
+    'max': RANK_MAX,
+}
 
-            if nobs >= minp:
-                if nobs == 1:
-                    # Single value in skip list
-                    output[i] = skiplist_get(skiplist, 0, &ret)
-                else:
-                    idx_with_fraction = quantile * (nobs - 1)
-                    idx = <int>idx_with_fraction
 
-                    if idx_with_fraction == idx:
-                        # no need to interpolate
-                        output[i] = skiplist_get(skiplist, idx, &ret)
+def roll_rank(const float64_t[:, :] values, const int64_t[:] start,
+              const int64_t[:] end, int64_t win, int64_t minp,
+              str method='average', bint ascending=True, bint pct=False):
+    """
+    Rank of the last value of each window among the values of the window,
+    counting the values below and equal to it in a Fenwick tree over the
+    ranks of the values.
+
+    Parameters
+    ----------
+    method : {'average', 'min', 'max'}
+        rank given to tied values
+    ascending : bool
+        rank the smallest value 1, otherwise the largest
+    pct : bool
+        divide the rank by the number of values in the window
+    """
+    cdef:
+        Py_ssize_t i, k, K, N
+        int64_t nobs, size, prev_start, prev_end, lo, hi, r
+        int64_t chunk, c0, c1, buffer_size
+        float64_t rank_min, rank_max, rank
+        int64_t *tree = NULL
+        int64_t *ranks = NULL
+        int64_t *first = NULL
+        int64_t *last = NULL
+        float64_t *sorted_values = NULL
+        pair[float64_t, int64_t] *pairs = NULL
+        ndarray[float64_t, ndim=2] output
+        RankType rank_type
+
+    try:
+        rank_type = rank_types[method]
+    except KeyError:
+        raise ValueError("method '{method}' is not supported, use 'average', "
+                         "'min' or 'max'".format(method=method))
+
+    K, N = values.shape[0], values.shape[1]
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
+
+    if win == 0 or N == 0:
+        output[:] = NaN
+        return output
+
+    if start.shape[0] == 0:
+        start, end = _fixed_window_bounds(N, win, minp)
+
+    chunk = max(4 * win, 256)
+    buffer_size = _rank_buffer_size(start, end, N, chunk)
+
+    tree = <int64_t *>malloc((buffer_size + 1) * sizeof(int64_t))
+    ranks = <int64_t *>malloc(buffer_size * sizeof(int64_t))
+    first = <int64_t *>malloc(buffer_size * sizeof(int64_t))
+    last = <int64_t *>malloc(buffer_size * sizeof(int64_t))
+    sorted_values = <float64_t *>malloc(buffer_size * sizeof(float64_t))
+    pairs = <pair[float64_t, int64_t] *>malloc(
+        buffer_size * sizeof(pair[float64_t, int64_t]))
+    if (tree == NULL or ranks == NULL or first == NULL or last == NULL or
+            sorted_values == NULL or pairs == NULL):
+        free(tree)
+        free(ranks)
+        free(first)
+        free(last)
+        free(sorted_values)
+        free(pairs)
+        raise MemoryError("unable to allocate the rank tree")
+
+    with nogil:
+        for k in range(K):
+            c0 = 0
+            while c0 < N:
+                c1 = min(c0 + chunk, N)
+                lo, hi = start[c0], end[c1 - 1]
+                size = _rank_values(values[k], lo, hi, pairs, ranks,
+                                    sorted_values)
+                _tie_bounds(sorted_values, size, first, last)
+                memset(tree, 0, (size + 1) * sizeof(int64_t))
+
+                nobs = 0
+                prev_start = prev_end = lo
+                for i in range(c0, c1):
+                    nobs += _fenwick_move(tree, size, ranks, lo, prev_start,
+                                          prev_end, start[i], end[i])
+                    prev_start, prev_end = start[i], end[i]
+
+                    if end[i] <= start[i] or nobs < minp:
+                        output[k, i] = NaN
+                        continue
+                    r = ranks[end[i] - 1 - lo]
+                    if r == size:
+                        # the last value is NaN
+                        output[k, i] = NaN
                         continue
 
-                    if interpolation_type == LINEAR:
-                        vlow = skiplist_get(skiplist, idx, &ret)
-                        vhigh = skiplist_get(skiplist, idx + 1, &ret)
-                        output[i] = ((vlow + (vhigh - vlow) *
-                                      (idx_with_fraction - idx)))
-                    elif interpolation_type == LOWER:
-                        output[i] = skiplist_get(skiplist, idx, &ret)
-                    elif interpolation_type == HIGHER:
-                        output[i] = skiplist_get(skiplist, idx + 1, &ret)
-                    elif interpolation_type == NEAREST:
-                        # the same behaviour as round()
-                        if idx_with_fraction - idx == 0.5:
-                            if idx % 2 == 0:
-                                output[i] = skiplist_get(skiplist, idx, &ret)
-                            else:
-                                output[i] = skiplist_get(
-                                    skiplist, idx + 1, &ret)
-                        elif idx_with_fraction - idx < 0.5:
-                            output[i] = skiplist_get(skiplist, idx, &ret)
-                        else:
-                            output[i] = skiplist_get(skiplist, idx + 1, &ret)
-                    elif interpolation_type == MIDPOINT:
-                        vlow = skiplist_get(skiplist, idx, &ret)
-                        vhigh = skiplist_get(skiplist, idx + 1, &ret)
-                        output[i] = <float64_t>(vlow + vhigh) / 2
-            else:
-                output[i] = NaN
+                    # the values below the last value rank before it, those
+                    # equal to it tie with it
+                    rank_min = _fenwick_sum(tree, first[r]) + 1
+                    rank_max = _fenwick_sum(tree, last[r] + 1)
+                    if not ascending:
+                        rank_min, rank_max = (nobs - rank_max + 1,
+                                              nobs - rank_min + 1)
+                    if rank_type == RANK_MIN:
+                        rank = rank_min
+                    elif rank_type == RANK_MAX:
+                        rank = rank_max
+                    else:
+                        rank = (rank_min + rank_max) / 2
+                    if pct:
+                        rank /= nobs
+                    output[k, i] = rank
+                c0 = c1
+
+    free(tree)
+    free(ranks)
+    free(first)
+    free(last)
+    free(sorted_values)
+    free(pairs)
+    return output
 
-    skiplist_destroy(skiplist)
 
+def roll_nunique(const float64_t[:, :] values, const int64_t[:] start,
+                 const int64_t[:] end, int64_t win, int64_t minp):
+    """
+    Number of distinct values in each window, ignoring NaN, counting the
+    values in the window by the first rank of their ties.
+    """
+    cdef:
+        Py_ssize_t i, k, K, N
+        int64_t nobs, distinct, size, prev_start, prev_end, lo, hi, j, r
+        int64_t chunk, c0, c1, buffer_size
+        int64_t *counts = NULL
+        int64_t *ranks = NULL
+        int64_t *first = NULL
+        int64_t *last = NULL
+        float64_t *sorted_values = NULL
+        pair[float64_t, int64_t] *pairs = NULL
+        ndarray[float64_t, ndim=2] output
+
+    K, N = values.shape[0], values.shape[1]
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
+
+    if win == 0 or N == 0:
+        output[:] = NaN
+        return output
+
+    if start.shape[0] == 0:
+        start, end = _fixed_window_bounds(N, win, minp)
+
+    chunk = max(4 * win, 256)
+    buffer_size = _rank_buffer_size(start, end, N, chunk)
+
+    counts = <int64_t *>malloc(buffer_size * sizeof(int64_t))
+    ranks = <int64_t *>malloc(buffer_size * sizeof(int64_t))
+    first = <int64_t *>malloc(buffer_size * sizeof(int64_t))
+    last = <int64_t *>malloc(buffer_size * sizeof(int64_t))
+    sorted_values = <float64_t *>malloc(buffer_size * sizeof(float64_t))
+    pairs = <pair[float64_t, int64_t] *>malloc(
+        buffer_size * sizeof(pair[float64_t, int64_t]))
+    if (counts == NULL or ranks == NULL or first == NULL or last == NULL or
+            sorted_values == NULL or pairs == NULL):
+        free(counts)
+        free(ranks)
+        free(first)
+        free(last)
+        free(sorted_values)
+        free(pairs)
+        raise MemoryError("unable to allocate the value counts")
+
+    with nogil:
+        for k in range(K):
+            c0 = 0
+            while c0 < N:
+                c1 = min(c0 + chunk, N)
+                lo, hi = start[c0], end[c1 - 1]
+                size = _rank_values(values[k], lo, hi, pairs, ranks,
+                                    sorted_values)
+                _tie_bounds(sorted_values, size, first, last)
+                memset(counts, 0, size * sizeof(int64_t))
+
+                nobs = distinct = 0
+                prev_start = prev_end = lo
+                for i in range(c0, c1):
+                    for j in range(prev_end, end[i]):
+                        r = ranks[j - lo]
+                        if r < size:
+                            nobs += 1
+                            counts[first[r]] += 1
+                            if counts[first[r]] == 1:
+                                distinct += 1
+                    for j in range(prev_start, start[i]):
+                        r = ranks[j - lo]
+                        if r < size:
+                            nobs -= 1
+                            counts[first[r]] -= 1
+                            if counts[first[r]] == 0:
+                                distinct -= 1
+                    prev_start, prev_end = start[i], end[i]
+
+                    if nobs >= minp:
+                        output[k, i] = distinct
+                    else:
+                        output[k, i] = NaN
+                c0 = c1
+
+    free(counts)
+    free(ranks)
+    free(first)
+    free(last)
+    free(sorted_values)
+    free(pairs)
     return output
 
 
-def roll_generic(object obj,
-                 int64_t win, int64_t minp, object index, object closed,
-                 int offset, object func, bint raw,
+def roll_generic(object obj, const int64_t[:] start, const int64_t[:] end,
+                 int64_t win, int64_t minp, int offset, object func, bint raw,
                  object args, object kwargs):
     cdef:
         ndarray[float64_t] output, counts, bufarr
@@ -1589,10 +2242,9 @@ def roll_generic(object obj,
         float64_t *oldbuf
         int64_t nobs = 0, i, j, s, e, N
         bint is_variable
-        ndarray[int64_t] start, end
 
-    n = len(obj)
-    if n == 0:
+    N = len(obj)
+    if N == 0:
         return obj
 
     arr = np.asarray(obj)
@@ -1602,23 +2254,18 @@ def roll_generic(object obj,
         if not arr.flags.c_contiguous:
             arr = arr.copy('C')
 
-    counts = roll_sum(np.concatenate([np.isfinite(arr).astype(float),
-                                      np.array([0.] * offset)]),
-                      win, minp, index, closed)[offset:]
+    is_variable = start.shape[0] > 0
+    if is_variable and offset != 0:
+        raise ValueError("unable to roll_generic with a non-zero offset")
 
-    start, end, N, win, minp, is_variable = get_window_indexer(arr, win,
-                                                               minp, index,
-                                                               closed,
-                                                               floor=0)
+    finite = np.concatenate([np.isfinite(arr).astype(float),
+                             np.array([0.] * offset)])
+    counts = roll_sum(finite.reshape(1, -1), start, end, win, minp)[0, offset:]
 
     output = np.empty(N, dtype=float)
 
     if is_variable:
         # variable window arr or series
-
-        if offset != 0:
-            raise ValueError("unable to roll_generic with a non-zero offset")
-
         for i in range(0, N):
             s = start[i]
             e = end[i]
@@ -1675,100 +2322,233 @@ def roll_generic(object obj,
     return output
 
 
-def roll_window(ndarray[float64_t, ndim=1, cast=True] values,
-                ndarray[float64_t, ndim=1, cast=True] weights,
-                int minp, bint avg=True):
+# ----------------------------------------------------------------------
+# Rolling weighted windows
+
+
+cdef enum WeightedType:
+    WEIGHTED_SUM,
+    WEIGHTED_MEAN,
+    WEIGHTED_VAR,
+    WEIGHTED_STD
+
+
+weighted_types = {
+    'sum': WEIGHTED_SUM,
+    'mean': WEIGHTED_MEAN,
+    'var': WEIGHTED_VAR,
+    'std': WEIGHTED_STD,
+}
+
+
+cdef inline float64_t _interpolate_weight(const float64_t[:] weights,
+                                          Py_ssize_t M, float64_t pos) nogil:
     """
-    Assume len(weights) << len(values)
+    The weight at ``pos`` in [0, 1], interpolated linearly between the
+    weights spread evenly over [0, 1].
     """
     cdef:
-        float64_t[:] output, tot_wgt, counts
-        Py_ssize_t in_i, win_i, win_n, in_n
-        float64_t val_in, val_win, c, w
-
-    in_n = len(values)
-    win_n = len(weights)
-    output = np.zeros(in_n, dtype=float)
-    counts = np.zeros(in_n, dtype=float)
-    if avg:
-        tot_wgt = np.zeros(in_n, dtype=float)
-
-    minp = _check_minp(len(weights), minp, in_n)
-
-    if avg:
-        for win_i in range(win_n):
-            val_win = weights[win_i]
-            if val_win != val_win:
-                continue
-
-            for in_i from 0 <= in_i < in_n - (win_n - win_i) + 1:
-                val_in = values[in_i]
-                if val_in == val_in:
-                    output[in_i + (win_n - win_i) - 1] += val_in * val_win
-                    counts[in_i + (win_n - win_i) - 1] += 1
-                    tot_wgt[in_i + (win_n - win_i) - 1] += val_win
-
-        for in_i in range(in_n):
-            c = counts[in_i]
-            if c < minp:
-                output[in_i] = NaN
-            else:
-                w = tot_wgt[in_i]
-                if w == 0:
-                    output[in_i] = NaN
-                else:
-                    output[in_i] /= tot_wgt[in_i]
+        Py_ssize_t k
+        float64_t frac
+
+    if pos <= 0 or M == 1:
+        return weights[0]
+    if pos >= 1:
+        return weights[M - 1]
+    pos = pos * (M - 1)
+    k = <Py_ssize_t>pos
+    frac = pos - k
+    if frac == 0:
+        return weights[k]
+    return weights[k] + frac * (weights[k + 1] - weights[k])
+
+
+def roll_weighted(const float64_t[:, :] values, const int64_t[:] start,
+                  const int64_t[:] end, int64_t win, int64_t minp,
+                  const float64_t[:] weights, const int64_t[:] index=None,
+                  int64_t period=0, str how='mean', int ddof=1):
+    """
+    Weighted sum, mean, variance or standard deviation of each window.
 
+    The weights of a fixed window are those of its len(weights) rows, from
+    the oldest to the newest. With the bounds of windows over a time
+    period, the weights are spread over the ``period`` ending at the
+    ``index`` of each row: a value is weighted by the weights interpolated
+    linearly at its position in the period.
+
+    The variance is the reliability weighted variance of the values, updated
+    one value at a time with West's algorithm, whose divisor is the sum of
+    the weights times ``(nobs - ddof) / nobs``.
+
+    Parameters
+    ----------
+    weights : ndarray (float64 type)
+        NaN weights leave out the values they weigh
+    index : ndarray (int64 type), optional
+        the time of each row, with the bounds of variable windows
+    period : int64
+        the length of the time period of the windows
+    how : {'sum', 'mean', 'var', 'std'}
+    ddof : int
+        delta degrees of freedom of the variance
+    """
+    cdef:
+        Py_ssize_t i, j, k, K, N, M, s, e, size = 0
+        int64_t nobs
+        float64_t val, w, sum_w, sum_wx, mean_x, delta, r, t, result
+        float64_t *wbuf = NULL
+        bint is_variable
+        WeightedType how_type
+        ndarray[float64_t, ndim=2] output
+
+    try:
+        how_type = weighted_types[how]
+    except KeyError:
+        raise ValueError("how '{how}' is not supported, use 'sum', 'mean', "
+                         "'var' or 'std'".format(how=how))
+
+    K, N = values.shape[0], values.shape[1]
+    M = weights.shape[0]
+    minp = max(minp, 1)
+    output = np.empty((K, N), dtype=float)
+
+    if M == 0 or N == 0:
+        output[:] = NaN
+        return output
+
+    is_variable = start.shape[0] > 0
+    if is_variable:
+        if index is None or index.shape[0] != N or period <= 0:
+            raise ValueError("variable windows need the index of each row and "
+                             "a positive period")
     else:
-        for win_i in range(win_n):
-            val_win = weights[win_i]
-            if val_win != val_win:
-                continue
+        start, end = _fixed_window_bounds(N, M, minp)
 
-            for in_i from 0 <= in_i < in_n - (win_n - win_i) + 1:
-                val_in = values[in_i]
+    for i in range(N):
+        size = max(size, end[i] - start[i])
+    wbuf = <float64_t *>malloc(max(size, 1) * sizeof(float64_t))
+    if wbuf == NULL:
+        raise MemoryError()
 
-                if val_in == val_in:
-                    output[in_i + (win_n - win_i) - 1] += val_in * val_win
-                    counts[in_i + (win_n - win_i) - 1] += 1
+    try:
+        with nogil:
+            for i in range(N):
+                s = start[i]
+                e = end[i]
+
+                # the weights of the values of the window
+                if is_variable:
+                    for j in range(s, e):
+                        wbuf[j - s] = _interpolate_weight(
+                            weights, M,
+                            <float64_t>(index[j] - index[i] + period) / period)
+                else:
+                    for j in range(s, e):
+                        wbuf[j - s] = weights[j - i + M - 1]
+
+                for k in range(K):
+                    nobs = 0
+                    sum_w = sum_wx = mean_x = t = 0
+
+                    for j in range(s, e):
+                        val = values[k, j]
+                        w = wbuf[j - s]
+                        if isnan(val) or isnan(w):
+                            continue
+                        nobs += 1
+
+                        if how_type == WEIGHTED_SUM or how_type == WEIGHTED_MEAN:
+                            sum_w += w
+                            sum_wx += w * val
+                        elif w != 0:
+                            # West, D. H. D. (1979). Updating mean and variance
+                            # estimates: an improved method.
+                            sum_w += w
+                            delta = val - mean_x
+                            r = delta * w / sum_w
+                            mean_x += r
+                            t += (sum_w - w) * delta * r
+
+                    if nobs < minp:
+                        result = NaN
+                    elif how_type == WEIGHTED_SUM:
+                        result = sum_wx
+                    elif sum_w == 0:
+                        result = NaN
+                    elif how_type == WEIGHTED_MEAN:
+                        result = sum_wx / sum_w
+                    elif nobs <= ddof:
+                        result = NaN
+                    else:
+                        if nobs == 1:
+                            result = 0
+                        else:
+                            result = t / sum_w * nobs / (nobs - ddof)
+                            if result < 0:
+                                result = 0
+                        if how_type == WEIGHTED_STD:
+                            result = sqrt(result)
 
-        for in_i in range(in_n):
-            c = counts[in_i]
-            if c < minp:
-                output[in_i] = NaN
+                    output[k, i] = result
+    finally:
+        free(wbuf)
 
     return output
 
 # ----------------------------------------------------------------------
 # Exponentially weighted moving average
 
+# The ewm kernels take the float64 values of a block as a 2D (columns, rows)
+# array and return the (columns, rows) result. The weight of past
+# observations decays by ``1 - alpha`` from one row to the next, or by
+# ``(1 - alpha) ** deltas[i]`` from the previous row to row i when ``deltas``
+# is not empty, e.g. for observations at irregular times.
+#
+# The kernels can continue from the ``state`` of each column after earlier
+# rows, which they update in place, so that rows arriving in batches are
+# processed once. A row of NaN is the state before any row. The state of
+# ewmcov is (mean_x, old_wt, nobs, mean_y, cov, sum_wt, sum_wt2), the first
+# three of which are the state of ewma when ``input_y`` is ``input_x``.
+
 
-def ewma(float64_t[:] vals, float64_t com,
-         int adjust, int ignore_na, int minp):
+def ewma(const float64_t[:, :] vals, float64_t com,
+         int adjust, int ignore_na, int64_t minp,
+         const float64_t[:] deltas, float64_t[:, :] state=None):
     """
     Compute exponentially-weighted moving average using center-of-mass.
 
     Parameters
     ----------
-    vals : ndarray (float64 type)
+    vals : ndarray (float64 type), shape (columns, rows)
     com : float64
     adjust: int
     ignore_na: int
-    minp: int
+    minp: int64
+    deltas : ndarray (float64 type)
+        The number of decay periods before each row, empty if the rows are
+        one period apart.
+    state : ndarray (float64 type), shape (columns, 3), optional
+        The (weighted_avg, old_wt, nobs) of each column to continue from,
+        updated in place.
 
     Returns
     -------
-    y : ndarray
+    y : ndarray, shape (columns, rows)
     """
 
     cdef:
-        Py_ssize_t N = len(vals)
-        ndarray[float64_t] output = np.empty(N, dtype=float)
+        Py_ssize_t K = vals.shape[0], N = vals.shape[1]
+        ndarray[float64_t, ndim=2] output = np.empty((K, N), dtype=float)
+        float64_t[:, :] out = output
         float64_t alpha, old_wt_factor, new_wt, weighted_avg, old_wt, cur
-        Py_ssize_t i, nobs
+        Py_ssize_t i, j, nobs
+        bint is_observation, use_deltas = deltas.shape[0] > 0
+        bint use_state = state is not None
 
-    if N == 0:
-        return output
+    if use_deltas and deltas.shape[0] != N:
+        raise ValueError("deltas must have one element per row")
+    if use_state and (state.shape[0] != K or state.shape[1] != 3):
+        raise ValueError("state must have one row of 3 elements per column")
 
     minp = max(minp, 1)
 
@@ -1776,35 +2556,48 @@ def ewma(float64_t[:] vals, float64_t com,
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    weighted_avg = vals[0]
-    is_observation = (weighted_avg == weighted_avg)
-    nobs = int(is_observation)
-    output[0] = weighted_avg if (nobs >= minp) else NaN
-    old_wt = 1.
-
-    for i in range(1, N):
-        cur = vals[i]
-        is_observation = (cur == cur)
-        nobs += int(is_observation)
-        if weighted_avg == weighted_avg:
-
-            if is_observation or (not ignore_na):
-
-                old_wt *= old_wt_factor
-                if is_observation:
-
-                    # avoid numerical errors on constant series
-                    if weighted_avg != cur:
-                        weighted_avg = ((old_wt * weighted_avg) +
-                                        (new_wt * cur)) / (old_wt + new_wt)
-                    if adjust:
-                        old_wt += new_wt
-                    else:
-                        old_wt = 1.
-        elif is_observation:
-            weighted_avg = cur
+    with nogil:
+        for j in range(K):
+            if use_state and state[j, 2] == state[j, 2]:
+                weighted_avg = state[j, 0]
+                old_wt = state[j, 1]
+                nobs = <Py_ssize_t>state[j, 2]
+            else:
+                weighted_avg = NaN
+                old_wt = 1.
+                nobs = 0
 
-        output[i] = weighted_avg if (nobs >= minp) else NaN
+            for i in range(N):
+                cur = vals[j, i]
+                is_observation = (cur == cur)
+                nobs += is_observation
+                if weighted_avg == weighted_avg:
+
+                    if is_observation or (not ignore_na):
+
+                        if use_deltas:
+                            old_wt *= pow(old_wt_factor, deltas[i])
+                        else:
+                            old_wt *= old_wt_factor
+                        if is_observation:
+
+                            # avoid numerical errors on constant series
+                            if weighted_avg != cur:
+                                weighted_avg = ((old_wt * weighted_avg) +
+                                                (new_wt * cur)) / (old_wt + new_wt)
+                            if adjust:
+                                old_wt += new_wt
+                            else:
+                                old_wt = 1.
+                elif is_observation:
+                    weighted_avg = cur
+
+                out[j, i] = weighted_avg if (nobs >= minp) else NaN
+
+            if use_state:
+                state[j, 0] = weighted_avg
+                state[j, 1] = old_wt
+                state[j, 2] = nobs
 
     return output
 
@@ -1813,40 +2606,54 @@ def ewma(float64_t[:] vals, float64_t com,
 # Exponentially weighted moving covariance
 
 
-def ewmcov(float64_t[:] input_x, float64_t[:] input_y,
-           float64_t com, int adjust, int ignore_na, int minp, int bias):
+def ewmcov(const float64_t[:, :] input_x, const float64_t[:, :] input_y,
+           float64_t com, int adjust, int ignore_na, int64_t minp, int bias,
+           const float64_t[:] deltas, float64_t[:, :] state=None):
     """
     Compute exponentially-weighted moving variance using center-of-mass.
 
     Parameters
     ----------
-    input_x : ndarray (float64 type)
-    input_y : ndarray (float64 type)
+    input_x : ndarray (float64 type), shape (columns, rows)
+    input_y : ndarray (float64 type), shape (columns, rows)
     com : float64
     adjust: int
     ignore_na: int
-    minp: int
+    minp: int64
     bias: int
+    deltas : ndarray (float64 type)
+        The number of decay periods before each row, empty if the rows are
+        one period apart.
+    state : ndarray (float64 type), shape (columns, 7), optional
+        The (mean_x, old_wt, nobs, mean_y, cov, sum_wt, sum_wt2) of each
+        column to continue from, updated in place.
 
     Returns
     -------
-    y : ndarray
+    y : ndarray, shape (columns, rows)
     """
 
     cdef:
-        Py_ssize_t N = len(input_x)
+        Py_ssize_t K = input_x.shape[0], N = input_x.shape[1]
         float64_t alpha, old_wt_factor, new_wt, mean_x, mean_y, cov
         float64_t sum_wt, sum_wt2, old_wt, cur_x, cur_y, old_mean_x, old_mean_y
-        Py_ssize_t i, nobs
-        ndarray[float64_t] output
-
-    if <Py_ssize_t>len(input_y) != N:
+        float64_t wt_factor, numerator, denominator
+        Py_ssize_t i, j, nobs
+        bint is_observation, use_deltas = deltas.shape[0] > 0
+        bint use_state = state is not None
+        ndarray[float64_t, ndim=2] output
+        float64_t[:, :] out
+
+    if input_y.shape[0] != K or input_y.shape[1] != N:
         raise ValueError("arrays are of different lengths "
-                         "({N} and {len_y})".format(N=N, len_y=len(input_y)))
+                         "({N} and {len_y})".format(N=N, len_y=input_y.shape[1]))
+    if use_deltas and deltas.shape[0] != N:
+        raise ValueError("deltas must have one element per row")
+    if use_state and (state.shape[0] != K or state.shape[1] != 7):
+        raise ValueError("state must have one row of 7 elements per column")
 
-    output = np.empty(N, dtype=float)
-    if N == 0:
-        return output
+    output = np.empty((K, N), dtype=float)
+    out = output
 
     minp = max(minp, 1)
 
@@ -1854,68 +2661,87 @@ def ewmcov(float64_t[:] input_x, float64_t[:] input_y,
     old_wt_factor = 1. - alpha
     new_wt = 1. if adjust else alpha
 
-    mean_x = input_x[0]
-    mean_y = input_y[0]
-    is_observation = ((mean_x == mean_x) and (mean_y == mean_y))
-    nobs = int(is_observation)
-    if not is_observation:
-        mean_x = NaN
-        mean_y = NaN
-    output[0] = (0. if bias else NaN) if (nobs >= minp) else NaN
-    cov = 0.
-    sum_wt = 1.
-    sum_wt2 = 1.
-    old_wt = 1.
-
-    for i in range(1, N):
-        cur_x = input_x[i]
-        cur_y = input_y[i]
-        is_observation = ((cur_x == cur_x) and (cur_y == cur_y))
-        nobs += int(is_observation)
-        if mean_x == mean_x:
-            if is_observation or (not ignore_na):
-                sum_wt *= old_wt_factor
-                sum_wt2 *= (old_wt_factor * old_wt_factor)
-                old_wt *= old_wt_factor
-                if is_observation:
-                    old_mean_x = mean_x
-                    old_mean_y = mean_y
-
-                    # avoid numerical errors on constant series
-                    if mean_x != cur_x:
-                        mean_x = ((old_wt * old_mean_x) +
-                                  (new_wt * cur_x)) / (old_wt + new_wt)
-
-                    # avoid numerical errors on constant series
-                    if mean_y != cur_y:
-                        mean_y = ((old_wt * old_mean_y) +
-                                  (new_wt * cur_y)) / (old_wt + new_wt)
-                    cov = ((old_wt * (cov + ((old_mean_x - mean_x) *
-                                             (old_mean_y - mean_y)))) +
-                           (new_wt * ((cur_x - mean_x) *
-                                      (cur_y - mean_y)))) / (old_wt + new_wt)
-                    sum_wt += new_wt
-                    sum_wt2 += (new_wt * new_wt)
-                    old_wt += new_wt
-                    if not adjust:
-                        sum_wt /= old_wt
-                        sum_wt2 /= (old_wt * old_wt)
-                        old_wt = 1.
-        elif is_observation:
-            mean_x = cur_x
-            mean_y = cur_y
-
-        if nobs >= minp:
-            if not bias:
-                numerator = sum_wt * sum_wt
-                denominator = numerator - sum_wt2
-                if (denominator > 0.):
-                    output[i] = ((numerator / denominator) * cov)
-                else:
-                    output[i] = NaN
+    with nogil:
+        for j in range(K):
+            if use_state and state[j, 2] == state[j, 2]:
+                mean_x = state[j, 0]
+                old_wt = state[j, 1]
+                nobs = <Py_ssize_t>state[j, 2]
+                mean_y = state[j, 3]
+                cov = state[j, 4]
+                sum_wt = state[j, 5]
+                sum_wt2 = state[j, 6]
             else:
-                output[i] = cov
-        else:
-            output[i] = NaN
+                mean_x = NaN
+                old_wt = 1.
+                nobs = 0
+                mean_y = NaN
+                cov = 0.
+                sum_wt = 1.
+                sum_wt2 = 1.
+
+            for i in range(N):
+                cur_x = input_x[j, i]
+                cur_y = input_y[j, i]
+                is_observation = ((cur_x == cur_x) and (cur_y == cur_y))
+                nobs += is_observation
+                if mean_x == mean_x:
+                    if is_observation or (not ignore_na):
+                        if use_deltas:
+                            wt_factor = pow(old_wt_factor, deltas[i])
+                        else:
+                            wt_factor = old_wt_factor
+                        sum_wt *= wt_factor
+                        sum_wt2 *= (wt_factor * wt_factor)
+                        old_wt *= wt_factor
+                        if is_observation:
+                            old_mean_x = mean_x
+                            old_mean_y = mean_y
+
+                            # avoid numerical errors on constant series
+                            if mean_x != cur_x:
+                                mean_x = ((old_wt * old_mean_x) +
+                                          (new_wt * cur_x)) / (old_wt + new_wt)
+
+                            # avoid numerical errors on constant series
+                            if mean_y != cur_y:
+                                mean_y = ((old_wt * old_mean_y) +
+                                          (new_wt * cur_y)) / (old_wt + new_wt)
+                            cov = ((old_wt * (cov + ((old_mean_x - mean_x) *
+                                                     (old_mean_y - mean_y)))) +
+                                   (new_wt * ((cur_x - mean_x) *
+                                              (cur_y - mean_y)))) / (old_wt + new_wt)
+                            sum_wt += new_wt
+                            sum_wt2 += (new_wt * new_wt)
+                            old_wt += new_wt
+                            if not adjust:
+                                sum_wt /= old_wt
+                                sum_wt2 /= (old_wt * old_wt)
+                                old_wt = 1.
+                elif is_observation:
+                    mean_x = cur_x
+                    mean_y = cur_y
+
+                if nobs >= minp:
+                    if not bias:
+                        numerator = sum_wt * sum_wt
+                        denominator = numerator - sum_wt2
+                        if (denominator > 0.):
+                            out[j, i] = ((numerator / denominator) * cov)
+                        else:
+                            out[j, i] = NaN
+                    else:
+                        out[j, i] = cov
+                else:
+                    out[j, i] = NaN
+
+            if use_state:
+                state[j, 0] = mean_x
+                state[j, 1] = old_wt
+                state[j, 2] = nobs
+                state[j, 3] = mean_y
+                state[j, 4] = cov
+                state[j, 5] = sum_wt
+                state[j, 6] = sum_wt2
 
     return output
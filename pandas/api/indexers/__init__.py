@@ -0,0 +1,2 @@
+"""Public API for rolling window indexers."""
+from pandas.core.window import BaseIndexer  # noqa: F401
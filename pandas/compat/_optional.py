@@ -12,6 +12,7 @@ VERSIONS = {
     "gcsfs": "0.2.2",
     "lxml.etree": "3.8.0",
     "matplotlib": "2.2.2",
+    "numba": "0.49.0",
     "numexpr": "2.6.2",
     "odfpy": "1.3.0",
     "openpyxl": "2.4.8",
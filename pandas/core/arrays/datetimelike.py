@@ -324,6 +324,41 @@ default 'raise'
         return self._round(freq, RoundTo.PLUS_INFTY, ambiguous, nonexistent)
 
 
+def _view_as(values, dtype):
+    return values.view(dtype)
+
+
+class _Int64PickleView:
+    """
+    Pickle a datetime64 or timedelta64 ndarray as an int64 view.
+
+    numpy pickles datetimelike data in-band only, whereas the data of an
+    int64 view can be sent out-of-band with pickle protocol 5.
+    """
+
+    __slots__ = ["values"]
+
+    def __init__(self, values):
+        self.values = values
+
+    def __reduce__(self):
+        return _view_as, (self.values.view("i8"), self.values.dtype)
+
+
+def maybe_pickle_int64_view(values, protocol):
+    """
+    Wrap a datetime64 or timedelta64 ndarray so that, with pickle protocol 5
+    and up, its data can be pickled out-of-band.
+    """
+    if (
+        protocol >= 5
+        and isinstance(values, np.ndarray)
+        and values.dtype.kind in ["M", "m"]
+    ):
+        return _Int64PickleView(values)
+    return values
+
+
 class DatetimeLikeArrayMixin(ExtensionOpsMixin, AttributesMixin, ExtensionArray):
     """
     Shared Base/Mixin class for DatetimeArray, TimedeltaArray, PeriodArray
@@ -352,6 +387,14 @@ class DatetimeLikeArrayMixin(ExtensionOpsMixin, AttributesMixin, ExtensionArray)
     def __iter__(self):
         return (self._box_func(v) for v in self.asi8)
 
+    def __reduce_ex__(self, protocol):
+        reduced = super().__reduce_ex__(protocol)
+        if protocol >= 5:
+            state = dict(reduced[2])
+            state["_data"] = maybe_pickle_int64_view(state["_data"], protocol)
+            reduced = reduced[:2] + (state,) + reduced[3:]
+        return reduced
+
     @property
     def asi8(self) -> np.ndarray:
         """
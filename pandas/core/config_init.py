@@ -51,7 +51,16 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+num_threads_doc = """
+: int
+    The number of threads that groupby aggregations and transforms, and
+    rolling and expanding windows run their cython kernels on, for numeric
+    data of several columns. The columns are split into ranges processed in
+    parallel, the default is 1
+"""
+
 with cf.config_prefix("compute"):
+    cf.register_option("num_threads", 1, num_threads_doc, validator=is_int)
     cf.register_option(
         "use_bottleneck",
         True,
@@ -575,6 +584,18 @@ with cf.config_prefix("io.parquet"):
         validator=is_one_of_factory(["auto", "pyarrow", "fastparquet"]),
     )
 
+# Set up the io read-ahead configuration.
+prefetch_blocks_doc = """
+: int
+    The number of blocks that read_csv and read_json read ahead, on a
+    background thread, from URLs, S3 and GCS files, so that slow reads
+    overlap with parsing. File handles passed in are not read ahead. The
+    default 0 reads in the calling thread.
+"""
+
+with cf.config_prefix("io"):
+    cf.register_option("prefetch_blocks", 0, prefetch_blocks_doc, validator=is_int)
+
 # --------
 # Plotting
 # ---------
@@ -2713,7 +2713,13 @@ class NDFrame(PandasObject, SelectionMixin):
             method=method,
         )
 
-    def to_pickle(self, path, compression="infer", protocol=pickle.HIGHEST_PROTOCOL):
+    def to_pickle(
+        self,
+        path,
+        compression="infer",
+        protocol=pickle.HIGHEST_PROTOCOL,
+        compression_threads=None,
+    ):
         """
         Pickle (serialize) object to file.
 
@@ -2735,6 +2741,14 @@ class NDFrame(PandasObject, SelectionMixin):
 
             .. [1] https://docs.python.org/3/library/pickle.html
             .. versionadded:: 0.21.0
+        compression_threads : int, optional
+            Number of threads compressing the output in parallel, for 'gzip',
+            'bz2' and 'xz' compression. The output is then written as a
+            sequence of independently compressed blocks, which any reader of
+            the format decompresses as a whole. By default compress in a
+            single thread.
+
+            .. versionadded:: 0.25.1
 
         See Also
         --------
@@ -2769,7 +2783,13 @@ class NDFrame(PandasObject, SelectionMixin):
         """
         from pandas.io.pickle import to_pickle
 
-        to_pickle(self, path, compression=compression, protocol=protocol)
+        to_pickle(
+            self,
+            path,
+            compression=compression,
+            protocol=protocol,
+            compression_threads=compression_threads,
+        )
 
     def to_clipboard(self, excel=True, sep=None, **kwargs):
         r"""
@@ -10793,6 +10813,7 @@ class NDFrame(PandasObject, SelectionMixin):
             adjust=True,
             ignore_na=False,
             axis=0,
+            times=None,
         ):
             axis = self._get_axis_number(axis)
             return rwindow.ewm(
@@ -10805,6 +10826,7 @@ class NDFrame(PandasObject, SelectionMixin):
                 adjust=adjust,
                 ignore_na=ignore_na,
                 axis=axis,
+                times=times,
             )
 
         cls.ewm = ewm
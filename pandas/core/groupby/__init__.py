@@ -4,4 +4,4 @@ from pandas.core.groupby.generic import (  # noqa: F401
     SeriesGroupBy,
 )
 from pandas.core.groupby.groupby import GroupBy  # noqa: F401
-from pandas.core.groupby.grouper import Grouper  # noqa: F401
+from pandas.core.groupby.grouper import GroupPlan, Grouper  # noqa: F401
@@ -76,6 +76,7 @@ common_apply_whitelist = (
             "idxmin",
             "tshift",
             "skew",
+            "kurt",
             "corr",
             "cov",
             "diff",
@@ -101,3 +102,17 @@ dataframe_apply_whitelist = common_apply_whitelist | frozenset(["dtypes", "corrw
 cython_transforms = frozenset(["cumprod", "cumsum", "shift", "cummin", "cummax"])
 
 cython_cast_blacklist = frozenset(["rank", "count", "size", "idxmin", "idxmax"])
+
+# GroupBy methods that BaseGrouper.aggregate_reductions computes together,
+# mapped to the reduction each of them is derived from
+cython_reductions = {
+    "count": "count",
+    "sum": "add",
+    "mean": "mean",
+    "var": "var",
+    "std": "var",
+    "min": "min",
+    "max": "max",
+    "first": "first",
+    "last": "last",
+}
@@ -17,6 +17,7 @@ import warnings
 import numpy as np
 
 from pandas._libs import Timestamp, lib
+import pandas._libs.groupby as libgroupby
 from pandas.compat import PY36
 from pandas.errors import AbstractMethodError
 from pandas.util._decorators import Appender, Substitution
@@ -29,7 +30,6 @@ from pandas.core.dtypes.common import (
     is_datetimelike,
     is_dict_like,
     is_integer_dtype,
-    is_interval_dtype,
     is_list_like,
     is_numeric_dtype,
     is_object_dtype,
@@ -912,6 +912,9 @@ class SeriesGroupBy(GroupBy):
 
             arg = zip(columns, arg)
 
+        arg = list(arg)
+        reductions = self._aggregate_reductions(arg)
+
         results = OrderedDict()
         for name, func in arg:
             obj = self
@@ -921,6 +924,10 @@ class SeriesGroupBy(GroupBy):
                     "{}".format(name)
                 )
 
+            if name in reductions:
+                results[name] = reductions[name]
+                continue
+
             # reset the cache so that we
             # only include the named selection
             if name in self._selected_obj:
@@ -936,6 +943,56 @@ class SeriesGroupBy(GroupBy):
 
         return DataFrame(results, columns=columns)
 
+    def _aggregate_reductions(self, arg):
+        """
+        Compute the standard reductions among the functions of ``arg`` in
+        one pass over the values.
+
+        Parameters
+        ----------
+        arg : list of (name, func) tuples
+
+        Returns
+        -------
+        dict
+            The result of each function that was computed by name, empty
+            unless at least two of the functions could be computed together.
+        """
+        hows = OrderedDict()
+        for name, func in arg:
+            if not isinstance(func, str):
+                func = self._is_cython_func(func)
+            if func in base.cython_reductions and name not in self._selected_obj:
+                hows[name] = func
+        if len(set(hows.values())) < 2:
+            return {}
+
+        obj = self._selected_obj
+        try:
+            values = self.grouper.aggregate_reductions(
+                obj.values, {base.cython_reductions[how] for how in hows.values()}
+            )
+        except NotImplementedError:
+            return {}
+
+        results = {}
+        for name, how in hows.items():
+            result = values[base.cython_reductions[how]]
+            if how == "count":
+                results[name] = Series(
+                    result,
+                    index=self.grouper.result_index,
+                    name=self._selection_name,
+                    dtype="int64",
+                )
+                continue
+
+            output = {self._selection_name: self._try_cast(result, obj)}
+            results[name] = self._wrap_aggregated_output(output)
+            if how == "std":
+                results[name] = np.sqrt(results[name])
+        return results
+
     def _wrap_output(self, output, index, names=None):
         """ common agg/transform wrapping logic """
         output = output[self._selection_name]
@@ -1126,56 +1183,16 @@ class SeriesGroupBy(GroupBy):
         Series
             Number of unique values within each group.
         """
-        ids, _, _ = self.grouper.group_info
-
-        val = self.obj._internal_get_values()
-
-        try:
-            sorter = np.lexsort((val, ids))
-        except TypeError:  # catches object dtypes
-            msg = "val.dtype must be object, got {}".format(val.dtype)
-            assert val.dtype == object, msg
-            val, _ = algorithms.factorize(val, sort=False)
-            sorter = np.lexsort((val, ids))
-            _isna = lambda a: a == -1
-        else:
-            _isna = isna
-
-        ids, val = ids[sorter], val[sorter]
-
-        # group boundaries are where group ids change
-        # unique observations are where sorted values change
-        idx = np.r_[0, 1 + np.nonzero(ids[1:] != ids[:-1])[0]]
-        inc = np.r_[1, val[1:] != val[:-1]]
-
-        # 1st item of each group is a new unique observation
-        mask = _isna(val)
-        if dropna:
-            inc[idx] = 1
-            inc[mask] = 0
-        else:
-            inc[mask & np.r_[False, mask[:-1]]] = 0
-            inc[idx] = 1
-
-        out = np.add.reduceat(inc, idx).astype("int64", copy=False)
-        if len(ids):
-            # NaN/NaT group exists if the head of ids is -1,
-            # so remove it from res and exclude its index from idx
-            if ids[0] == -1:
-                res = out[1:]
-                idx = idx[np.flatnonzero(idx)]
-            else:
-                res = out
-        else:
-            res = out[1:]
+        ids, _, ngroups = self.grouper.group_info
         ri = self.grouper.result_index
 
-        # we might have duplications among the bins
-        if len(res) != len(ri):
-            res, out = np.zeros(len(ri), dtype=out.dtype), res
-            res[ids[idx]] = out
+        codes, uniques = algorithms.factorize(self.obj._values, sort=False)
+
+        # distinct (group, value) pairs counted by group
+        res = np.zeros(max(ngroups, len(ri)), dtype=np.int64)
+        libgroupby.group_nunique(res, ids, codes, len(uniques), dropna)
 
-        return Series(res, index=ri, name=self._selection_name)
+        return Series(res[: len(ri)], index=ri, name=self._selection_name)
 
     @Appender(Series.describe.__doc__)
     def describe(self, **kwargs):
@@ -1202,29 +1219,51 @@ class SeriesGroupBy(GroupBy):
                 bins=bins,
             )
 
-        ids, _, _ = self.grouper.group_info
+        ids, _, ngroups = self.grouper.group_info
         val = self.obj._internal_get_values()
 
+        if bins is None:
+            codes, lev = algorithms.factorize(val, sort=True)
+
+            # occurrences of the (group, value) pairs, by group then value
+            keys, out = libgroupby.group_value_counts(ids, codes, len(lev), ngroups)
+            cat, codes = np.divmod(keys, len(lev) + 1)
+            codes -= 1
+
+            if dropna:
+                mask = codes != -1
+                out, cat, codes = out[mask], cat[mask], codes[mask]
+
+            if normalize:
+                out = out / np.bincount(cat, weights=out, minlength=ngroups)[cat]
+
+            if sort:
+                sorter = np.lexsort((out if ascending else -out, cat))
+                out, cat, codes = out[sorter], cat[sorter], codes[sorter]
+
+            labels = [lab[cat] for lab in self.grouper.recons_labels] + [codes]
+            levels = [ping.group_index for ping in self.grouper.groupings] + [lev]
+            names = self.grouper.names + [self._selection_name]
+            mi = MultiIndex(
+                levels=levels, codes=labels, names=names, verify_integrity=False
+            )
+
+            if is_integer_dtype(out):
+                out = ensure_int64(out)
+            return Series(out, index=mi, name=self._selection_name)
+
         # groupby removes null keys from groupings
         mask = ids != -1
         ids, val = ids[mask], val[mask]
 
-        if bins is None:
-            lab, lev = algorithms.factorize(val, sort=True)
-            llab = lambda lab, inc: lab[inc]
-        else:
+        # lab is a Categorical with categories an IntervalIndex
+        lab = cut(Series(val), bins, include_lowest=True)
+        lev = lab.cat.categories
+        lab = lev.take(lab.cat.codes)
+        llab = lambda lab, inc: lab[inc]._multiindex.codes[-1]
 
-            # lab is a Categorical with categories an IntervalIndex
-            lab = cut(Series(val), bins, include_lowest=True)
-            lev = lab.cat.categories
-            lab = lev.take(lab.cat.codes)
-            llab = lambda lab, inc: lab[inc]._multiindex.codes[-1]
-
-        if is_interval_dtype(lab):
-            # TODO: should we do this inside II?
-            sorter = np.lexsort((lab.left, lab.right, ids))
-        else:
-            sorter = np.lexsort((lab, ids))
+        # TODO: should we do this inside II?
+        sorter = np.lexsort((lab.left, lab.right, ids))
 
         ids, lab = ids[sorter], lab[sorter]
 
@@ -1263,20 +1302,6 @@ class SeriesGroupBy(GroupBy):
                 acc = rep(d)
             out /= acc
 
-        if sort and bins is None:
-            cat = ids[inc][mask] if dropna else ids[inc]
-            sorter = np.lexsort((out if ascending else -out, cat))
-            out, labels[-1] = out[sorter], labels[-1][sorter]
-
-        if bins is None:
-            mi = MultiIndex(
-                levels=levels, codes=labels, names=names, verify_integrity=False
-            )
-
-            if is_integer_dtype(out):
-                out = ensure_int64(out)
-            return Series(out, index=mi, name=self._selection_name)
-
         # for compat. with libgroupby.value_counts need to ensure every
         # bin is present at every index level, null filled with zeros
         diff = np.zeros(len(out), dtype="bool")
@@ -1343,11 +1368,7 @@ class SeriesGroupBy(GroupBy):
                     periods=periods, fill_method=fill_method, limit=limit, freq=freq
                 )
             )
-        filled = getattr(self, fill_method)(limit=limit)
-        fill_grp = filled.groupby(self.grouper.labels)
-        shifted = fill_grp.shift(periods=periods, freq=freq)
-
-        return (filled / shifted) - 1
+        return self._pct_change(periods=periods, fill_method=fill_method, limit=limit)
 
 
 class DataFrameGroupBy(NDFrameGroupBy):
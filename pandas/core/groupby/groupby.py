@@ -26,13 +26,20 @@ from pandas.errors import AbstractMethodError
 from pandas.util._decorators import Appender, Substitution, cache_readonly
 from pandas.util._validators import validate_kwargs
 
-from pandas.core.dtypes.cast import maybe_downcast_to_dtype
+from pandas.core.dtypes.cast import maybe_downcast_to_dtype, maybe_promote
 from pandas.core.dtypes.common import (
     ensure_float,
+    ensure_float64,
+    ensure_int64,
+    is_categorical_dtype,
+    is_complex_dtype,
+    is_datetime64_any_dtype,
     is_datetime64tz_dtype,
     is_extension_array_dtype,
+    is_hashable,
     is_numeric_dtype,
     is_scalar,
+    is_timedelta64_dtype,
 )
 from pandas.core.dtypes.missing import isna, notna
 
@@ -51,8 +58,9 @@ from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
 from pandas.core.groupby import base
 from pandas.core.index import CategoricalIndex, Index, MultiIndex
+from pandas.core.internals import BlockManager
 from pandas.core.series import Series
-from pandas.core.sorting import get_group_index_sorter
+from pandas.core.util import parallel
 
 _common_see_also = """
         See Also
@@ -301,6 +309,20 @@ Examples
 """
 
 
+def _take_rows(values, indexer):
+    """
+    Take from each row of the 2D values with the matching row of indexer,
+    -1 in indexer giving missing values.
+    """
+    result = values[np.arange(len(values))[:, None], indexer]
+    mask = indexer == -1
+    if mask.any():
+        dtype, fill_value = maybe_promote(values.dtype)
+        result = result.astype(dtype, copy=False)
+        result[mask] = fill_value
+    return result
+
+
 class GroupByPlot(PandasObject):
     """
     Class implementing the .plot attribute for groupby objects.
@@ -379,7 +401,7 @@ class _GroupBy(PandasObject, SelectionMixin):
         self.mutated = kwargs.pop("mutated", False)
 
         if grouper is None:
-            from pandas.core.groupby.grouper import _get_grouper
+            from pandas.core.groupby.grouper import GroupPlan, _get_grouper
 
             grouper, exclusions, obj = _get_grouper(
                 obj,
@@ -390,6 +412,9 @@ class _GroupBy(PandasObject, SelectionMixin):
                 observed=observed,
                 mutated=self.mutated,
             )
+            if isinstance(keys, GroupPlan):
+                self.sort = keys.sort
+                self.observed = keys.observed
 
         self.obj = obj
         self.axis = obj._get_axis_number(axis)
@@ -764,7 +789,7 @@ b  2""",
         (though the default is sort=True) for groupby in general
         """
         ids, _, ngroups = self.grouper.group_info
-        sorter = get_group_index_sorter(ids, ngroups)
+        sorter = self.grouper._sort_idx
         ids, count = ids[sorter], len(ids)
 
         if count == 0:
@@ -1320,6 +1345,167 @@ class GroupBy(_GroupBy):
         """
         return self.std(ddof=ddof) / np.sqrt(self.count())
 
+    @Substitution(name="groupby")
+    @Appender(_common_see_also)
+    def skew(self, axis=None, skipna=None, numeric_only=None, **kwargs):
+        """
+        Compute unbiased skewness of groups, excluding missing values.
+
+        Normalized by N-1, as in :meth:`DataFrame.skew`.
+
+        Parameters
+        ----------
+        axis : {0 or 'index', 1 or 'columns'}, optional
+            For DataFrame groups, the axis to use, as in
+            :meth:`DataFrame.skew`.
+        skipna : bool, default True
+            Exclude NA/null values when computing the result.
+        numeric_only : bool, default None
+            Include only float, int, boolean columns, as in
+            :meth:`DataFrame.skew`.
+        **kwargs
+            Additional keyword arguments to be passed to the function.
+
+        Returns
+        -------
+        Series or DataFrame
+            Skewness of values within each group.
+        """
+        return self._moment_agg(
+            "skew", axis=axis, skipna=skipna, numeric_only=numeric_only, **kwargs
+        )
+
+    @Substitution(name="groupby")
+    @Appender(_common_see_also)
+    def kurt(self, axis=None, skipna=None, numeric_only=None, **kwargs):
+        """
+        Compute unbiased kurtosis of groups, excluding missing values.
+
+        Kurtosis obtained using Fisher's definition of kurtosis (kurtosis of
+        normal == 0.0), normalized by N-1, as in :meth:`DataFrame.kurt`.
+
+        Parameters
+        ----------
+        axis : {0 or 'index', 1 or 'columns'}, optional
+            For DataFrame groups, the axis to use, as in
+            :meth:`DataFrame.kurt`.
+        skipna : bool, default True
+            Exclude NA/null values when computing the result.
+        numeric_only : bool, default None
+            Include only float, int, boolean columns, as in
+            :meth:`DataFrame.kurt`.
+        **kwargs
+            Additional keyword arguments to be passed to the function.
+
+        Returns
+        -------
+        Series or DataFrame
+            Kurtosis of values within each group.
+        """
+        return self._moment_agg(
+            "kurt", axis=axis, skipna=skipna, numeric_only=numeric_only, **kwargs
+        )
+
+    def _moment_agg(self, how, axis=None, skipna=None, numeric_only=None, **kwargs):
+        # the cython kernels skip the missing values of real numbers, other
+        # cases are applied to each group
+        def supported(obj):
+            dtype = obj.dtype
+            return (
+                obj.ndim == 1
+                and is_numeric_dtype(dtype)
+                and not is_extension_array_dtype(dtype)
+                and not is_complex_dtype(dtype)
+            )
+
+        slices = list(self._iterate_slices())
+        if (
+            axis not in [None, 0, "index"]
+            or self.axis != 0
+            or skipna not in [None, True]
+            or kwargs
+            or not self.as_index
+            or not slices
+            or not all(supported(obj) for _, obj in slices)
+        ):
+            return self._make_wrapper(how)(
+                axis=axis, skipna=skipna, numeric_only=numeric_only, **kwargs
+            )
+
+        output = collections.OrderedDict()
+        for name, obj in slices:
+            output[name], _ = self.grouper.aggregate(obj.values, how)
+        return self._wrap_aggregated_output(output)
+
+    @Substitution(name="groupby")
+    @Appender(_common_see_also)
+    def weighted_mean(self, weights):
+        """
+        Compute the weighted mean of groups, excluding missing values.
+
+        The rows where the value or the weight is missing are skipped, and
+        the mean of a group whose weights sum to zero is NA.
+
+        .. versionadded:: 0.25.1
+
+        Parameters
+        ----------
+        weights : str, array-like or Series
+            The weight of each row. For DataFrame groups, the label of the
+            column holding the weights, which is then not averaged. A Series
+            is aligned on the index of the grouped object.
+
+        Returns
+        -------
+        Series or DataFrame
+            Weighted mean of values within each group.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'A': [1, 1, 2, 2],
+        ...                    'B': [1., 3., 5., np.nan],
+        ...                    'W': [3, 1, 1, 1]})
+        >>> df.groupby('A').weighted_mean('W')
+             B
+        A
+        1  1.5
+        2  5.0
+        """
+        if self.axis != 0:
+            raise NotImplementedError("weighted_mean is only implemented for axis=0")
+
+        weights_name = None
+        if (
+            isinstance(self.obj, DataFrame)
+            and is_hashable(weights)
+            and weights in self.obj.columns
+        ):
+            weights_name = weights
+            weights = self.obj[weights]
+        elif isinstance(weights, Series) and not weights.index.equals(self.obj.index):
+            weights = weights.reindex(self.obj.index)
+
+        weights = ensure_float64(np.asarray(weights))
+        if weights.ndim != 1 or len(weights) != len(self.obj):
+            raise ValueError("weights must have the same length as the object")
+
+        output = collections.OrderedDict()
+        for name, obj in self._iterate_slices():
+            if name == weights_name or not is_numeric_dtype(obj.dtype):
+                continue
+
+            values = obj.values
+            if is_extension_array_dtype(obj.dtype):
+                values = values.astype("float64")
+            output[name], _ = self.grouper.aggregate(
+                values, "weighted_mean", weights=weights
+            )
+
+        if len(output) == 0:
+            raise DataError("No numeric types to aggregate")
+
+        return self._wrap_aggregated_output(output)
+
     @Substitution(name="groupby")
     @Appender(_common_see_also)
     def size(self):
@@ -1439,6 +1625,85 @@ class GroupBy(_GroupBy):
 
         return self._apply_to_column_groupbys(lambda x: x._cython_agg_general("ohlc"))
 
+    @Substitution(name="groupby")
+    @Appender(_common_see_also)
+    def idxmin(self, axis=None, skipna=True):
+        """
+        Return index of first occurrence of minimum within each group.
+
+        Parameters
+        ----------
+        axis : {0 or 'index', 1 or 'columns'}, optional
+            For DataFrame groups, the axis to use, as in
+            :meth:`DataFrame.idxmin`.
+        skipna : bool, default True
+            Exclude NA/null values. If a whole group is NA, or with
+            ``skipna=False`` has an NA, the result is NA.
+
+        Returns
+        -------
+        Series or DataFrame
+            Index label of the first minimum within each group.
+        """
+        return self._idxmin_idxmax("argmin", axis=axis, skipna=skipna)
+
+    @Substitution(name="groupby")
+    @Appender(_common_see_also)
+    def idxmax(self, axis=None, skipna=True):
+        """
+        Return index of first occurrence of maximum within each group.
+
+        Parameters
+        ----------
+        axis : {0 or 'index', 1 or 'columns'}, optional
+            For DataFrame groups, the axis to use, as in
+            :meth:`DataFrame.idxmax`.
+        skipna : bool, default True
+            Exclude NA/null values. If a whole group is NA, or with
+            ``skipna=False`` has an NA, the result is NA.
+
+        Returns
+        -------
+        Series or DataFrame
+            Index label of the first maximum within each group.
+        """
+        return self._idxmin_idxmax("argmax", axis=axis, skipna=skipna)
+
+    def _idxmin_idxmax(self, how, axis=None, skipna=True):
+        # the cython kernels find the positions of the extremes of numeric
+        # and datetimelike values, other cases are applied to each group
+        def supported(obj):
+            dtype = obj.dtype
+            if obj.ndim != 1 or is_categorical_dtype(dtype):
+                return False
+            # the kernels have no uint64 or complex signature, and uint64
+            # values would lose precision as float64
+            if is_complex_dtype(dtype) or dtype == np.uint64:
+                return False
+            return (
+                (is_numeric_dtype(dtype) and not is_extension_array_dtype(dtype))
+                or is_datetime64_any_dtype(dtype)
+                or is_timedelta64_dtype(dtype)
+            )
+
+        slices = list(self._iterate_slices())
+        if (
+            axis not in [None, 0, "index"]
+            or self.axis != 0
+            or not self.as_index
+            or not slices
+            or not all(supported(obj) for _, obj in slices)
+        ):
+            name = "idx" + how[3:]
+            return self._make_wrapper(name)(axis=axis, skipna=skipna)
+
+        labels = self.obj.index._values
+        output = collections.OrderedDict()
+        for name, obj in slices:
+            pos, _ = self.grouper.aggregate(obj.values, how, skipna=skipna)
+            output[name] = algorithms.take(labels, pos, allow_fill=True)
+        return self._wrap_aggregated_output(output)
+
     @Appender(DataFrame.describe.__doc__)
     def describe(self, **kwargs):
         with _group_selection_context(self):
@@ -1605,14 +1870,25 @@ class GroupBy(_GroupBy):
         if limit is None:
             limit = -1
 
-        return self._get_cythonized_result(
-            "group_fillna_indexer",
-            self.grouper,
-            needs_mask=True,
-            cython_dtype=np.int64,
-            result_is_index=True,
-            direction=direction,
-            limit=limit,
+        labels, _, _ = self.grouper.group_info
+
+        def fill_indexer(mask):
+            indexer = np.empty(mask.shape, dtype=np.int64)
+            libgroupby.group_fillna_indexer(
+                indexer, labels, mask.view(np.uint8), direction, limit
+            )
+            return indexer
+
+        def fill_slices():
+            output = collections.OrderedDict()
+            for name, obj in self._iterate_slices():
+                indexer = fill_indexer(isna(obj._values).reshape(1, -1))[0]
+                output[name] = algorithms.take_nd(obj._values, indexer)
+            return self._wrap_transformed_output(output)
+
+        return self._transform_blocks(
+            lambda values: _take_rows(values, fill_indexer(isna(values))),
+            fallback=fill_slices,
         )
 
     @Substitution(name="groupby")
@@ -1667,6 +1943,64 @@ class GroupBy(_GroupBy):
 
     bfill = backfill
 
+    @Substitution(name="groupby")
+    @Appender(_common_see_also)
+    def fillna(
+        self,
+        value=None,
+        method=None,
+        axis=None,
+        inplace=False,
+        limit=None,
+        downcast=None,
+    ):
+        """
+        Fill NA/NaN values within each group.
+
+        Filling with a method fills the values of each column from the
+        other values of their group, like :meth:`pad` and :meth:`backfill`.
+
+        Parameters
+        ----------
+        value : scalar, dict, Series, or DataFrame
+            Value to use to fill holes.
+        method : {'backfill', 'bfill', 'pad', 'ffill', None}, default None
+            Method to use for filling holes within each group.
+        axis : {0 or 'index', 1 or 'columns'}
+            Axis along which to fill missing values.
+        inplace : bool, default False
+            Fill each group in-place.
+        limit : int, default None
+            Maximum number of consecutive NaN values to fill.
+        downcast : dict, default is None
+            A dict of item->dtype of what to downcast if possible.
+
+        Returns
+        -------
+        Series or DataFrame
+            Object with missing values filled.
+        """
+        labels, _, _ = self.grouper.group_info
+        if (
+            value is None
+            and method in ("pad", "ffill", "backfill", "bfill")
+            and axis in (None, 0, "index")
+            and not inplace
+            and downcast is None
+            and not (labels == -1).any()
+        ):
+            direction = "ffill" if method in ("pad", "ffill") else "bfill"
+            return self._fill(direction, limit=limit)
+
+        return self._make_wrapper("fillna")(
+            value=value,
+            method=method,
+            axis=axis,
+            inplace=inplace,
+            limit=limit,
+            downcast=downcast,
+        )
+
     @Substitution(name="groupby")
     @Substitution(see_also=_common_see_also)
     def nth(self, n: Union[int, List[int]], dropna: Optional[str] = None) -> DataFrame:
@@ -1867,6 +2201,16 @@ class GroupBy(_GroupBy):
         key
         a    2.0
         b    3.0
+
+        Several quantiles give one row per group and quantile:
+
+        >>> df.groupby('key').quantile([0.25, 0.75])
+                  val
+        key
+        a   0.25  1.5
+            0.75  2.5
+        b   0.25  2.0
+            0.75  4.0
         """
 
         def pre_processor(vals: np.ndarray) -> Tuple[np.ndarray, Optional[Type]]:
@@ -1895,18 +2239,58 @@ class GroupBy(_GroupBy):
 
             return vals
 
-        return self._get_cythonized_result(
-            "group_quantile",
-            self.grouper,
-            aggregate=True,
-            needs_values=True,
-            needs_mask=True,
-            cython_dtype=np.float64,
-            pre_processing=pre_processor,
-            post_processing=post_processor,
-            q=q,
-            interpolation=interpolation,
+        qs = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if qs.ndim != 1:
+            raise ValueError("q must be a scalar or 1d array-like")
+        if ((qs < 0) | (qs > 1)).any():
+            raise ValueError("q must be between 0 and 1")
+
+        labels, _, ngroups = self.grouper.group_info
+        slices = []
+        for name, obj in self._iterate_slices():
+            vals, inference = pre_processor(obj.values)
+            mask = isna(obj.values).view(np.uint8)
+            slices.append((name, vals, mask, inference))
+
+        results = np.zeros((len(slices), ngroups, len(qs)), dtype=np.float64)
+
+        def quantile_columns(slc):
+            for i in range(*slc.indices(len(slices))):
+                _, vals, mask, _ = slices[i]
+                libgroupby.group_quantile(
+                    results[i], labels, vals, mask, qs, interpolation
+                )
+
+        # the kernels release the GIL, run ranges of columns in parallel
+        column_slices = parallel.split_columns(len(labels), len(slices))
+        parallel.run(quantile_columns, [(slc,) for slc in column_slices])
+
+        outputs = []
+        for j in range(len(qs)):
+            output = collections.OrderedDict()
+            for (name, _, _, inference), result in zip(slices, results):
+                output[name] = post_processor(result[:, j], inference)
+            outputs.append(self._wrap_aggregated_output(output))
+
+        if is_scalar(q):
+            return outputs[0]
+
+        from pandas.core.reshape.concat import concat
+
+        # the quantiles are the inner level of the result, within each group
+        result = concat(outputs, axis=0, keys=qs)
+        # move the quantile level last by position, as the names of the
+        # levels may be None or repeated
+        index = result.index
+        order = list(range(1, index.nlevels)) + [0]
+        result.index = MultiIndex(
+            levels=[index.levels[i] for i in order],
+            codes=[index.codes[i] for i in order],
+            names=[index.names[i] for i in order],
+            verify_integrity=False,
         )
+        indices = np.arange(len(result)).reshape(len(qs), -1).T.ravel()
+        return result.take(indices)
 
     @Substitution(name="groupby")
     def ngroup(self, ascending=True):
@@ -2144,6 +2528,65 @@ class GroupBy(_GroupBy):
 
         return self._cython_transform("cummax", numeric_only=False)
 
+    def _shift_indexer(self, periods, exclude_nulls=False):
+        """
+        Positions of the values ``periods`` rows before each value within
+        its group, -1 where there is none.
+
+        Parameters
+        ----------
+        periods : int
+        exclude_nulls : bool, default False
+            Whether the rows without a group get -1 even when ``periods`` is
+            0.
+        """
+        labels, _, ngroups = self.grouper.group_info
+        indexer = np.empty(len(labels), dtype=np.int64)
+        libgroupby.group_shift_indexer(indexer, labels, ngroups, periods)
+        if exclude_nulls:
+            indexer[labels == -1] = -1
+        return indexer
+
+    def _transform_blocks(self, func, fallback):
+        """
+        Transform the values of the grouped object one block at a time.
+
+        Parameters
+        ----------
+        func : function
+            Called with the 2D values of a block, with a row for each of its
+            columns, and returning transformed values of the same shape.
+            Raises NotImplementedError for values that it cannot transform.
+        fallback : function
+            Called without arguments instead, when the values are not in 2D
+            blocks or ``func`` cannot transform some of them.
+
+        Returns
+        -------
+        Series or DataFrame
+            Indexed like the grouped object.
+        """
+        if self.axis != 0:
+            return fallback()
+
+        obj = self._obj_with_exclusions
+        try:
+            if isinstance(obj, Series):
+                if not isinstance(obj._values, np.ndarray):
+                    raise NotImplementedError
+                result = func(obj._values.reshape(1, -1))[0]
+                return self._wrap_transformed_output({self._selection_name: result})
+
+            blocks = []
+            for block in obj._data.blocks:
+                if block.is_extension:
+                    raise NotImplementedError
+                blocks.append(block.make_block(func(block.values)))
+        except NotImplementedError:
+            return fallback()
+
+        return DataFrame(BlockManager(blocks, obj._data.axes))
+
     def _get_cythonized_result(
         self,
         how,
@@ -2285,15 +2728,64 @@ class GroupBy(_GroupBy):
         if freq is not None or axis != 0 or not isna(fill_value):
             return self.apply(lambda x: x.shift(periods, freq, axis, fill_value))
 
-        return self._get_cythonized_result(
-            "group_shift_indexer",
-            self.grouper,
-            cython_dtype=np.int64,
-            needs_ngroups=True,
-            result_is_index=True,
-            periods=periods,
+        indexer = self._shift_indexer(periods)
+
+        def shift_slices():
+            output = collections.OrderedDict()
+            for name, obj in self._iterate_slices():
+                output[name] = algorithms.take_nd(obj._values, indexer)
+            return self._wrap_transformed_output(output)
+
+        return self._transform_blocks(
+            lambda values: algorithms.take_nd(values, indexer, axis=1),
+            fallback=shift_slices,
         )
 
+    @Substitution(name="groupby")
+    @Appender(_common_see_also)
+    def diff(self, periods=1, axis=0):
+        """
+        First discrete difference of each value with an earlier value of its
+        group.
+
+        Parameters
+        ----------
+        periods : int, default 1
+            Periods to shift for calculating difference, accepts negative
+            values.
+        axis : {0 or 'index', 1 or 'columns'}, default 0
+            Take difference over rows (0) or columns (1).
+
+        Returns
+        -------
+        Series or DataFrame
+            First differences within each group.
+        """
+
+        def fallback():
+            kwargs = {} if axis == 0 else {"axis": axis}
+            return self._make_wrapper("diff")(periods, **kwargs)
+
+        if axis != 0:
+            return fallback()
+
+        indexer = self._shift_indexer(periods, exclude_nulls=True)
+
+        def diff_values(values):
+            if values.dtype.kind == "i" or (
+                values.dtype.kind == "u" and values.dtype.itemsize < 8
+            ):
+                values = ensure_int64(values)
+                out = np.empty(values.shape, dtype=np.float64)
+            elif values.dtype in (np.float64, np.float32):
+                out = np.empty(values.shape, dtype=values.dtype)
+            else:
+                raise NotImplementedError
+            libgroupby.group_diff(out, values, indexer)
+            return out
+
+        return self._transform_blocks(diff_values, fallback=fallback)
+
     @Substitution(name="groupby")
     @Appender(_common_see_also)
     def pct_change(self, periods=1, fill_method="pad", limit=None, freq=None, axis=0):
@@ -2315,10 +2807,50 @@ class GroupBy(_GroupBy):
                     axis=axis,
                 )
             )
-        filled = getattr(self, fill_method)(limit=limit)
-        fill_grp = filled.groupby(self.grouper.labels)
-        shifted = fill_grp.shift(periods=periods, freq=freq)
-        return (filled / shifted) - 1
+        return self._pct_change(periods=periods, fill_method=fill_method, limit=limit)
+
+    def _pct_change(self, periods=1, fill_method="pad", limit=None):
+        """
+        Percentage changes within each group, with the values of each block
+        filled and compared in cython.
+        """
+
+        def fallback():
+            filled = getattr(self, fill_method)(limit=limit)
+            fill_grp = filled.groupby(self.grouper.labels)
+            shifted = fill_grp.shift(periods=periods)
+            return (filled / shifted) - 1
+
+        labels, _, _ = self.grouper.group_info
+        indexer = self._shift_indexer(periods, exclude_nulls=True)
+        if fill_method is not None:
+            direction = "ffill" if fill_method in ("pad", "ffill") else "bfill"
+            fill_limit = -1 if limit is None else limit
+
+        def pct_change_values(values):
+            if values.dtype.kind in "iu":
+                values = ensure_float64(values)
+            elif values.dtype not in (np.float64, np.float32):
+                raise NotImplementedError
+
+            if fill_method is not None:
+                fill_indexer = np.empty(values.shape, dtype=np.int64)
+                libgroupby.group_fillna_indexer(
+                    fill_indexer,
+                    labels,
+                    isna(values).view(np.uint8),
+                    direction,
+                    fill_limit,
+                )
+                values = _take_rows(values, fill_indexer)
+
+            out = np.empty(values.shape, dtype=values.dtype)
+            libgroupby.group_pct_change(out, values, indexer)
+            return out
+
+        if fill_method not in (None, "pad", "ffill", "backfill", "bfill"):
+            return fallback()
+        return self._transform_blocks(pct_change_values, fallback=fallback)
 
     @Substitution(name="groupby")
     @Substitution(see_also=_common_see_also)
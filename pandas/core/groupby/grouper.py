@@ -14,12 +14,16 @@ from pandas.core.dtypes.common import (
     ensure_categorical,
     is_categorical_dtype,
     is_datetime64_dtype,
+    is_datetime64tz_dtype,
+    is_extension_array_dtype,
     is_hashable,
     is_list_like,
+    is_object_dtype,
     is_scalar,
     is_timedelta64_dtype,
 )
 from pandas.core.dtypes.generic import ABCSeries
+from pandas.core.dtypes.missing import isna
 
 import pandas.core.algorithms as algorithms
 from pandas.core.arrays import Categorical, ExtensionArray
@@ -418,7 +422,11 @@ class Grouping:
                 labels = self.grouper.label_info
                 uniques = self.grouper.result_index
             else:
-                labels, uniques = algorithms.factorize(self.grouper, sort=self.sort)
+                presorted = _factorize_presorted(self.grouper)
+                if presorted is not None:
+                    labels, uniques = presorted
+                else:
+                    labels, uniques = algorithms.factorize(self.grouper, sort=self.sort)
                 uniques = Index(uniques, name=self.name)
             self._labels = labels
             self._group_index = uniques
@@ -428,6 +436,188 @@ class Grouping:
         return self.index.groupby(Categorical.from_codes(self.labels, self.group_index))
 
 
+def _factorize_presorted(values):
+    """
+    Factorize keys sorted in increasing order from the changes between runs.
+
+    Sorted keys, e.g. of data partitioned by time, have their groups in
+    contiguous runs, so the codes are the running count of the positions
+    where the key changes and the uniques are the keys at the start of each
+    run, found in one pass without hashing or sorting.
+
+    Returns
+    -------
+    tuple of (ndarray of codes, Index of uniques), or None if ``values`` is
+    not monotonically increasing, has missing values or is not backed by
+    a numpy array.
+    """
+    if not len(values) or (
+        is_extension_array_dtype(values) and not is_datetime64tz_dtype(values)
+    ):
+        return None
+
+    # object keys are compared as they are, without inferring their type
+    dtype = object if is_object_dtype(values) else None
+    index = Index(values, dtype=dtype, copy=False)
+    if isinstance(index, MultiIndex):
+        return None
+    arr = index._ndarray_values
+    if not index.is_monotonic_increasing:
+        return None
+
+    # is_monotonic_increasing is False on NaN, but not on a leading NaT
+    if index._can_hold_na and isna(index[0]):
+        return None
+
+    changes = arr[1:] != arr[:-1]
+    labels = np.empty(len(arr), dtype=np.int64)
+    labels[0] = 0
+    np.cumsum(changes, out=labels[1:])
+
+    starts = np.flatnonzero(np.concatenate([[True], changes]))
+    return labels, index.take(starts)
+
+
+class GroupPlan:
+    """
+    Group keys factorized once, to group objects by them many times.
+
+    Grouping factorizes the keys into group codes and, to split the data,
+    sorts these codes. A GroupPlan keeps the codes, the number of groups,
+    the result index and the sorter computed from ``obj`` and ``by``, so
+    that grouping ``obj``, or any object with the same axis, by the plan
+    reuses them instead of computing them again.
+
+    .. versionadded:: 0.25.1
+
+    Parameters
+    ----------
+    obj : Series or DataFrame
+        The object whose axis and columns the keys refer to.
+    by, axis, level, sort, observed
+        As for :meth:`DataFrame.groupby`. Groupers that reorder ``obj``,
+        e.g. :class:`Grouper` with a ``freq``, are not supported.
+
+    Notes
+    -----
+    The groups are sorted and observed as set by the plan. Grouping by a
+    plan with ``level``, or with a ``sort=False`` or ``observed=True`` that
+    the plan does not have, raises a ``ValueError``.
+
+    See Also
+    --------
+    DataFrame.groupby : Group a DataFrame, e.g. by a plan.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({'key': ['a', 'b', 'a'], 'x': [1, 2, 3]})
+    >>> plan = pd.GroupPlan(df, 'key')
+    >>> plan.ngroups
+    2
+    >>> df.groupby(plan).sum()
+         x
+    key
+    a    4
+    b    2
+
+    The plan groups any object with the same axis as ``df``:
+
+    >>> (df['x'] * 10).groupby(plan).mean()
+    key
+    a    20
+    b    20
+    Name: x, dtype: int64
+    """
+
+    def __init__(self, obj, by=None, axis=0, level=None, sort=True, observed=False):
+        if by is None and level is None:
+            raise TypeError("You have to supply one of 'by' and 'level'")
+        axis = obj._get_axis_number(axis)
+        grouper, exclusions, grouped = _get_grouper(
+            obj, by, axis=axis, level=level, sort=sort, observed=observed
+        )
+        if grouped is not obj:
+            raise NotImplementedError(
+                "GroupPlan does not support groupers which reorder the object"
+            )
+
+        self.axis = axis
+        self.sort = sort
+        self.observed = observed
+        self.grouper = grouper
+        self.exclusions = set(exclusions) if exclusions else set()
+        self._group_axis = obj._get_axis(axis)
+
+    def __repr__(self):
+        return "{klass}(ngroups={ngroups}, names={names})".format(
+            klass=type(self).__name__, ngroups=self.ngroups, names=self.grouper.names
+        )
+
+    @property
+    def codes(self):
+        """
+        The group of each element of the axis, -1 for missing keys.
+        """
+        return self.grouper.group_info[0]
+
+    @property
+    def ngroups(self):
+        """
+        The number of groups.
+        """
+        return self.grouper.ngroups
+
+    @property
+    def result_index(self):
+        """
+        The index of the results of aggregations.
+        """
+        return self.grouper.result_index
+
+    @property
+    def sorter(self):
+        """
+        The indexer sorting the axis by group, stably.
+        """
+        return self.grouper._sort_idx
+
+    def _get_grouper(self, obj, axis, level=None, sort=True, observed=False):
+        """
+        Return the grouper and the exclusions to group ``obj`` with.
+
+        The ``level``, ``sort`` and ``observed`` passed to groupby cannot
+        differ from those of the plan, except for the defaults of groupby.
+        """
+        if level is not None:
+            raise ValueError("level cannot be passed when grouping by a GroupPlan")
+        if not sort and self.sort:
+            raise ValueError("sort=False conflicts with the GroupPlan, which sorts")
+        if observed and not self.observed:
+            raise ValueError(
+                "observed=True conflicts with the GroupPlan, which has "
+                "observed=False"
+            )
+
+        axis = obj._get_axis_number(axis)
+        if axis != self.axis:
+            raise ValueError(
+                "the GroupPlan groups axis {plan}, not {axis}".format(
+                    plan=self.axis, axis=axis
+                )
+            )
+        group_axis = obj._get_axis(axis)
+        if not (group_axis is self._group_axis or group_axis.equals(self._group_axis)):
+            raise ValueError(
+                "the axis of the object differs from that of the GroupPlan"
+            )
+
+        if isinstance(obj, DataFrame):
+            exclusions = [name for name in self.exclusions if name in obj]
+        else:
+            exclusions = []
+        return self.grouper, exclusions, obj
+
+
 def _get_grouper(
     obj,
     key=None,
@@ -460,6 +650,10 @@ def _get_grouper(
     If validate, then check for key/level overlaps
 
     """
+    # a passed-in GroupPlan, reuse its grouper
+    if isinstance(key, GroupPlan):
+        return key._get_grouper(obj, axis, level=level, sort=sort, observed=observed)
+
     group_axis = obj._get_axis(axis)
 
     # validate that the passed single level is compatible with the passed
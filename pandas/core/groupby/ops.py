@@ -7,6 +7,7 @@ are contained *in* the SeriesGroupBy and DataFrameGroupBy objects.
 """
 
 import collections
+from functools import partial
 
 import numpy as np
 
@@ -44,12 +45,15 @@ from pandas.core.index import Index, MultiIndex, ensure_index
 from pandas.core.series import Series
 from pandas.core.sorting import (
     compress_group_index,
+    compress_group_rows,
     decons_obs_group_ids,
     get_flattened_iterator,
     get_group_index,
     get_group_index_sorter,
     get_indexer_dict,
+    is_int64_overflow_possible,
 )
+from pandas.core.util import parallel
 
 
 def generate_bins_generic(values, binner, closed):
@@ -166,7 +170,23 @@ class BaseGrouper:
 
     def _get_splitter(self, data, axis=0):
         comp_ids, _, ngroups = self.group_info
-        return get_splitter(data, comp_ids, ngroups, axis=axis)
+        return get_splitter(
+            data,
+            comp_ids,
+            ngroups,
+            axis=axis,
+            sort_idx=self._sort_idx,
+            presorted=self.is_monotonic,
+        )
+
+    @cache_readonly
+    def _sort_idx(self):
+        # Counting sort indexer, shared by the splitters of the data grouped
+        comp_ids, _, ngroups = self.group_info
+        if self.is_monotonic:
+            # the groups are already in runs, e.g. for sorted keys
+            return np.arange(len(comp_ids), dtype=np.int64)
+        return get_group_index_sorter(comp_ids, ngroups)
 
     def _get_grouper(self):
         """
@@ -228,8 +248,8 @@ class BaseGrouper:
 
             # If result_values is not None we're in the case that the
             # fast apply loop was broken prematurely but we have
-            # already the result for the first group which we can reuse.
-            elif i == 0:
+            # already the results for the first groups which we can reuse.
+            elif i < len(result_values):
                 continue
 
             # group might be modified
@@ -311,6 +331,14 @@ class BaseGrouper:
     def _get_compressed_labels(self):
         all_labels = [ping.labels for ping in self.groupings]
         if len(all_labels) > 1:
+            if is_int64_overflow_possible(self.shape):
+                # hash the labels of each row instead of compressing their
+                # offsets into the cartesian product in several passes
+                comp_ids, first = compress_group_rows(
+                    all_labels, self.shape, sort=self.sort
+                )
+                return comp_ids, np.arange(len(first), dtype=np.int64)
+
             group_index = get_group_index(all_labels, self.shape, sort=True, xnull=True)
             return compress_group_index(group_index, sort=self.sort)
 
@@ -362,14 +390,19 @@ class BaseGrouper:
             "min": "group_min",
             "max": "group_max",
             "mean": "group_mean",
+            "weighted_mean": "group_weighted_mean",
             "median": {"name": "group_median"},
             "var": "group_var",
+            "skew": "group_skew",
+            "kurt": "group_kurt",
             "first": {
                 "name": "group_nth",
                 "f": lambda func, a, b, c, d, e: func(a, b, c, d, 1, -1),
             },
             "last": "group_last",
             "ohlc": "group_ohlc",
+            "argmin": "group_argmin",
+            "argmax": "group_argmax",
         },
         "transform": {
             "cumprod": "group_cumprod",
@@ -525,6 +558,8 @@ class BaseGrouper:
 
         if how == "rank":
             out_dtype = "float"
+        elif how in ["argmin", "argmax"]:
+            out_dtype = "int64"
         else:
             if is_numeric:
                 out_dtype = "{kind}{itemsize}".format(
@@ -536,6 +571,8 @@ class BaseGrouper:
         labels, _, _ = self.group_info
 
         if kind == "aggregate":
+            if kwargs:
+                func = partial(func, **kwargs)
             result = _maybe_fill(
                 np.empty(out_shape, dtype=out_dtype), fill_value=np.nan
             )
@@ -591,14 +628,104 @@ class BaseGrouper:
 
         return result, names
 
-    def aggregate(self, values, how, axis=0, min_count=-1):
+    def aggregate(self, values, how, axis=0, min_count=-1, **kwargs):
         return self._cython_operation(
-            "aggregate", values, how, axis, min_count=min_count
+            "aggregate", values, how, axis, min_count=min_count, **kwargs
         )
 
     def transform(self, values, how, axis=0, **kwargs):
         return self._cython_operation("transform", values, how, axis, **kwargs)
 
+    def aggregate_reductions(self, values, hows):
+        """
+        Compute several reductions of 1-dim numeric values in one pass.
+
+        Parameters
+        ----------
+        values : ndarray
+        hows : set of str
+            Among "count", "add", "mean", "var", "min", "max", "first"
+            and "last".
+
+        Returns
+        -------
+        dict
+            The result of ``self.aggregate(values, how)`` for each how,
+            and the number of non-missing values of each group for "count".
+
+        Raises
+        ------
+        NotImplementedError
+            If the values are not real numbers in an ndarray.
+        """
+        unknown = set(hows) - set(base.cython_reductions.values())
+        assert not unknown, unknown
+
+        if (
+            not isinstance(values, np.ndarray)
+            or values.ndim != 1
+            or not is_numeric_dtype(values.dtype)
+            or needs_i8_conversion(values.dtype)
+            or is_complex_dtype(values.dtype)
+        ):
+            raise NotImplementedError(
+                "{} are not supported in cython reductions".format(values.dtype)
+            )
+
+        # the same conversions as _cython_operation
+        if is_integer_dtype(values) and not (values == iNaT).any():
+            values = ensure_int_or_float(values)
+            if values.dtype != np.int64:
+                raise NotImplementedError("uint64 values out of int64 bounds")
+        else:
+            values = ensure_float64(values)
+        values = values[:, None]
+
+        labels, _, ngroups = self.group_info
+        shape = (ngroups, 1)
+        nobs = np.empty(shape, dtype=np.int64)
+        sumx = np.empty(shape, dtype=np.float64)
+        ssqdm = np.empty(shape, dtype=np.float64)
+        extremes = [np.empty(shape, dtype=values.dtype) for _ in range(4)]
+        counts = np.zeros(ngroups, dtype=np.int64)
+
+        libgroupby.group_reductions(
+            nobs,
+            sumx,
+            ssqdm,
+            *extremes,
+            counts,
+            values,
+            labels,
+            compute_var="var" in hows,
+            compute_minmax="min" in hows or "max" in hows,
+            compute_firstlast="first" in hows or "last" in hows,
+        )
+
+        nobs = nobs[:, 0]
+        sumx = sumx[:, 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            results = {
+                "add": sumx,
+                "mean": np.where(nobs == 0, np.nan, sumx / nobs),
+                "var": np.where(nobs < 2, np.nan, ssqdm[:, 0] / (nobs - 1)),
+            }
+        for how, result in zip(["min", "max", "first", "last"], extremes):
+            result = result[:, 0]
+            if is_integer_dtype(result):
+                mask = result == iNaT
+                if mask.any():
+                    result = result.astype("float64")
+                    result[mask] = np.nan
+            results[how] = result
+
+        if self._filter_empty_groups and not counts.all():
+            results = {how: result[counts > 0] for how, result in results.items()}
+
+        # count is not filtered, like SeriesGroupBy.count
+        results["count"] = nobs
+        return {how: results[how] for how in hows}
+
     def _aggregate(
         self,
         result,
@@ -620,6 +747,21 @@ class BaseGrouper:
 
                 chunk = chunk.squeeze()
                 agg_func(result[:, :, i], counts, chunk, comp_ids, min_count)
+        elif is_numeric and result.shape[1] == values.shape[1]:
+            # ohlc has several result columns per column, run it as a whole
+            slices = parallel.split_columns(*values.shape)
+            # each range of columns counts the group sizes on its own
+            args_list = [
+                (
+                    result[:, slc],
+                    counts if i == 0 else np.zeros_like(counts),
+                    values[:, slc],
+                    comp_ids,
+                    min_count,
+                )
+                for i, slc in enumerate(slices)
+            ]
+            parallel.run(agg_func, args_list)
         else:
             agg_func(result, counts, values, comp_ids, min_count)
 
@@ -653,6 +795,14 @@ class BaseGrouper:
                     is_datetimelike,
                     **kwargs
                 )
+        elif is_numeric:
+            slices = parallel.split_columns(*values.shape)
+            parallel.run(
+                lambda result, values: transform_func(
+                    result, values, comp_ids, ngroups, is_datetimelike, **kwargs
+                ),
+                [(result[:, slc], values[:, slc]) for slc in slices],
+            )
         else:
             transform_func(result, values, comp_ids, ngroups, is_datetimelike, **kwargs)
 
@@ -674,9 +824,12 @@ class BaseGrouper:
 
         # avoids object / Series creation overhead
         dummy = obj._get_values(slice(None, 0))
-        indexer = get_group_index_sorter(group_index, ngroups)
-        obj = obj.take(indexer)
-        group_index = algorithms.take_nd(group_index, indexer, allow_fill=False)
+        if self.is_monotonic:
+            obj = obj.copy()
+        else:
+            indexer = self._sort_idx
+            obj = obj.take(indexer)
+            group_index = algorithms.take_nd(group_index, indexer, allow_fill=False)
         grouper = reduction.SeriesGrouper(obj, func, group_index, ngroups, dummy)
         result, counts = grouper.get_result()
         return result, counts
@@ -688,7 +841,7 @@ class BaseGrouper:
         counts = np.zeros(ngroups, dtype=int)
         result = None
 
-        splitter = get_splitter(obj, group_index, ngroups, axis=self.axis)
+        splitter = self._get_splitter(obj, axis=self.axis)
 
         for label, group in splitter:
             res = func(group)
@@ -878,21 +1031,27 @@ def _is_indexed_like(obj, axes):
 
 
 class DataSplitter:
-    def __init__(self, data, labels, ngroups, axis=0):
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None, presorted=False):
         self.data = data
         self.labels = ensure_int64(labels)
         self.ngroups = ngroups
 
         self.axis = axis
+        self._sort_idx = sort_idx
+        self.presorted = presorted
 
     @cache_readonly
     def slabels(self):
         # Sorted labels
+        if self.presorted:
+            return self.labels
         return algorithms.take_nd(self.labels, self.sort_idx, allow_fill=False)
 
     @cache_readonly
     def sort_idx(self):
         # Counting sort indexer
+        if self._sort_idx is not None:
+            return self._sort_idx
         return get_group_index_sorter(self.labels, self.ngroups)
 
     def __iter__(self):
@@ -915,6 +1074,10 @@ class DataSplitter:
             yield i, self._chop(sdata, slice(start, end))
 
     def _get_sorted_data(self):
+        if self.presorted:
+            # the groups are slices of the data already; copy it all the same
+            # so that the groups do not share memory with the data
+            return self.data.copy()
         return self.data.take(self.sort_idx, axis=self.axis)
 
     def _chop(self, sdata, slice_obj):
@@ -925,6 +1088,46 @@ class DataSplitter:
 
 
 class SeriesSplitter(DataSplitter):
+    def fast_apply(self, f, names):
+        # must return keys::list, values::list, mutated::bool
+        try:
+            starts, ends = lib.generate_slices(self.slabels, self.ngroups)
+        except Exception:
+            # fails when all -1
+            return [], True
+
+        sdata = self._get_sorted_data()
+        index = sdata.index
+        if (
+            not isinstance(sdata._values, np.ndarray)
+            or index._has_complex_internals
+            # the ndarray of the index is sliced in place, which only
+            # works when the index is backed by it directly
+            or getattr(index, "_index_data", None) is not index._data
+        ):
+            raise reduction.InvalidApply("Cannot slide the series internals")
+
+        # f is applied to a group of its own first, and to a view sliding
+        # over the other groups only if it returns a scalar without keeping
+        # a reference to the group
+        group = self._chop(sdata, slice(starts[0], ends[0]))
+        object.__setattr__(group, "name", names[0])
+        group_axes = _get_axes(group)
+        refcounts = reduction.series_refcounts(group)
+        piece = f(group)
+        group.index._reset_cache()
+        if (
+            piece is None
+            or not lib.is_scalar(piece)
+            or reduction.series_refcounts(group) != refcounts
+        ):
+            return [piece], not _is_indexed_like(piece, group_axes)
+
+        results, mutated = reduction.apply_series_axis0(
+            sdata, f, names[1:], starts[1:], ends[1:]
+        )
+        return [piece] + results, mutated
+
     def _chop(self, sdata, slice_obj):
         return sdata._get_values(slice_obj)
 
@@ -1,4 +1,5 @@
 from collections import defaultdict
+import copyreg
 from functools import partial
 import itertools
 import operator
@@ -32,6 +33,7 @@ from pandas.core.dtypes.generic import ABCExtensionArray, ABCSeries
 from pandas.core.dtypes.missing import isna
 
 import pandas.core.algorithms as algos
+from pandas.core.arrays.datetimelike import maybe_pickle_int64_view
 from pandas.core.base import PandasObject
 from pandas.core.index import Index, MultiIndex, ensure_index
 from pandas.core.indexers import maybe_convert_indices
@@ -261,7 +263,22 @@ class BlockManager(PandasObject):
         return algos.take_1d(ftypes, self._blknos, allow_fill=False)
 
     def __getstate__(self):
-        block_values = [b.values for b in self.blocks]
+        return self._get_state()
+
+    def __reduce_ex__(self, protocol):
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+        # datetime64 and timedelta64 block values are pickled as int64 views,
+        # so that all numpy block values can be sent out-of-band
+        return copyreg.__newobj__, (type(self),), self._get_state(protocol)
+
+    def _get_state(self, protocol=None):
+        if protocol is None:
+            block_values = [b.values for b in self.blocks]
+        else:
+            block_values = [
+                maybe_pickle_int64_view(b.values, protocol) for b in self.blocks
+            ]
         block_items = [self.items[b.mgr_locs.indexer] for b in self.blocks]
         axes_array = [ax for ax in self.axes]
 
@@ -269,8 +286,8 @@ class BlockManager(PandasObject):
             "0.14.1": {
                 "axes": axes_array,
                 "blocks": [
-                    dict(values=b.values, mgr_locs=b.mgr_locs.indexer)
-                    for b in self.blocks
+                    dict(values=values, mgr_locs=b.mgr_locs.indexer)
+                    for values, b in zip(block_values, self.blocks)
                 ],
             }
         }
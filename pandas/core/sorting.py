@@ -373,6 +373,52 @@ def compress_group_index(group_index, sort=True):
     return comp_ids, obs_group_ids
 
 
+def compress_group_rows(labels, shape, sort=True):
+    """
+    Number the distinct combinations of several label arrays by hashing the
+    labels of each location together.
+
+    Unlike get_group_index followed by compress_group_index, the labels are
+    not combined into flat int64 offsets first, so nothing has to be
+    compressed in several passes when their cartesian product does not fit
+    within int64 bounds.
+
+    Parameters
+    ----------
+    labels: sequence of arrays
+        Integers identifying levels at each location, -1 for nulls
+    shape: sequence of ints same length as labels
+        Number of unique levels at each location
+    sort: boolean
+        If the ranks of returned ids should match lexical ranks of labels
+
+    Returns
+    -------
+    tuple of (comp_ids, first)
+        The id of each location, -1 where any label is null, and the
+        location of the first occurrence of each id.
+    """
+    labels = [np.ascontiguousarray(lab, dtype=np.int64) for lab in labels]
+    comp_ids, first = hashtable.group_rows(labels)
+
+    if sort and len(first) > 0:
+        # rank the distinct rows only, there are no nulls among them
+        obs_ids = get_group_index(
+            [lab.take(first) for lab in labels], shape, sort=True, xnull=True
+        )
+        sorter = obs_ids.argsort()
+
+        reverse_indexer = np.empty(len(sorter), dtype=np.int64)
+        reverse_indexer.put(sorter, np.arange(len(sorter)))
+
+        mask = comp_ids < 0
+        comp_ids = algorithms.take_nd(reverse_indexer, comp_ids, allow_fill=False)
+        np.putmask(comp_ids, mask, -1)
+        first = first.take(sorter)
+
+    return comp_ids, first
+
+
 def _reorder_by_uniques(uniques, labels):
     # sorter is index where elements ought to go
     sorter = uniques.argsort()
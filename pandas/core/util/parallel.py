@@ -0,0 +1,92 @@
+"""
+Run cython kernels, which release the GIL, on ranges of columns in parallel
+threads.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from pandas._config import get_option
+
+# the minimum number of values that a thread is given to process
+_MIN_CHUNK_SIZE = 2 ** 16
+
+_THREAD_NAME_PREFIX = "pandas-compute"
+
+_lock = threading.Lock()
+_executor = None
+_executor_threads = 0
+
+
+def _get_executor():
+    """
+    Return the shared thread pool, of ``compute.num_threads`` threads.
+
+    The pool is replaced when the option changes. The previous pool is not
+    shut down, as other threads may still submit to it: its threads exit
+    once it is no longer referenced.
+    """
+    global _executor, _executor_threads
+
+    threads = max(get_option("compute.num_threads"), 1)
+    with _lock:
+        if _executor is None or _executor_threads != threads:
+            _executor = ThreadPoolExecutor(
+                max_workers=threads, thread_name_prefix=_THREAD_NAME_PREFIX
+            )
+            _executor_threads = threads
+        return _executor
+
+
+def split_columns(nrows, ncols, num_threads=None):
+    """
+    Split ``ncols`` columns of ``nrows`` rows into ranges to process in
+    parallel.
+
+    Parameters
+    ----------
+    nrows, ncols : int
+    num_threads : int, optional
+        Defaults to the ``compute.num_threads`` option.
+
+    Returns
+    -------
+    list of slice
+        A single slice over all the columns if there is a single thread, or
+        too little data to be worth splitting.
+    """
+    if num_threads is None:
+        num_threads = get_option("compute.num_threads")
+    if threading.current_thread().name.startswith(_THREAD_NAME_PREFIX):
+        # already running in parallel
+        num_threads = 1
+
+    nchunks = min(num_threads, ncols, nrows * ncols // _MIN_CHUNK_SIZE)
+    if nchunks <= 1:
+        return [slice(0, ncols)]
+
+    size, extra = divmod(ncols, nchunks)
+    slices = []
+    start = 0
+    for i in range(nchunks):
+        stop = start + size + (i < extra)
+        slices.append(slice(start, stop))
+        start = stop
+    return slices
+
+
+def run(func, args_list):
+    """
+    Call ``func(*args)`` for each ``args`` in ``args_list``, in parallel
+    threads if there are several.
+
+    Returns
+    -------
+    list
+        The results, in the order of ``args_list``.
+    """
+    if len(args_list) == 1:
+        return [func(*args_list[0])]
+
+    executor = _get_executor()
+    futures = [executor.submit(func, *args) for args in args_list]
+    return [future.result() for future in futures]
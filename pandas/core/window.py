@@ -10,6 +10,7 @@ import warnings
 
 import numpy as np
 
+from pandas._libs.tslibs import Timedelta
 import pandas._libs.window as libwindow
 from pandas.compat._optional import import_optional_dependency
 from pandas.compat.numpy import function as nv
@@ -17,11 +18,14 @@ from pandas.util._decorators import Appender, Substitution, cache_readonly
 
 from pandas.core.dtypes.common import (
     ensure_float64,
+    ensure_int64,
     is_bool,
+    is_datetime64_any_dtype,
     is_float_dtype,
     is_integer,
     is_integer_dtype,
     is_list_like,
+    is_number,
     is_scalar,
     is_timedelta64_dtype,
     needs_i8_conversion,
@@ -34,11 +38,15 @@ from pandas.core.dtypes.generic import (
     ABCSeries,
     ABCTimedeltaIndex,
 )
+from pandas.core.dtypes.missing import isna
 
 from pandas.core.base import DataError, PandasObject, SelectionMixin
 import pandas.core.common as com
 from pandas.core.generic import _shared_docs
 from pandas.core.groupby.base import GroupByMixin
+from pandas.core.ops import get_op_result_name
+from pandas.core.sorting import get_group_index_sorter
+from pandas.core.util import parallel
 
 _shared_docs = dict(**_shared_docs)
 _doc_template = """
@@ -54,6 +62,73 @@ _doc_template = """
 """
 
 
+class BaseIndexer:
+    """
+    Base class to define the bounds of custom rolling windows.
+
+    Subclasses implement :meth:`get_window_bounds`, and an instance is passed
+    as the ``window`` of :meth:`DataFrame.rolling` or :meth:`Series.rolling`.
+
+    .. versionadded:: 0.25.1
+
+    Parameters
+    ----------
+    index_array : ndarray, optional
+        An array the bounds can be computed from, e.g. the values of the index.
+    window_size : int, default 0
+        The size of the windows, for indexers that need one.
+    **kwargs
+        Other attributes set on the indexer.
+
+    Examples
+    --------
+    A window over the current and the next ``window_size - 1`` rows:
+
+    >>> class ForwardIndexer(pd.api.indexers.BaseIndexer):
+    ...     def get_window_bounds(self, num_values, min_periods, center, closed):
+    ...         start = np.arange(num_values, dtype=np.int64)
+    ...         end = np.minimum(start + self.window_size, num_values)
+    ...         return start, end
+    >>> s = pd.Series([1, 2, 3, 4, 5])
+    >>> s.rolling(ForwardIndexer(window_size=2), min_periods=1).sum()
+    0    3.0
+    1    5.0
+    2    7.0
+    3    9.0
+    4    5.0
+    dtype: float64
+    """
+
+    def __init__(self, index_array=None, window_size=0, **kwargs):
+        self.index_array = index_array
+        self.window_size = window_size
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def get_window_bounds(self, num_values, min_periods, center, closed):
+        """
+        Compute the bounds of the windows.
+
+        Parameters
+        ----------
+        num_values : int
+            The number of values that are rolled over.
+        min_periods : int or None
+            The ``min_periods`` passed to ``rolling``.
+        center : bool
+            The ``center`` passed to ``rolling``.
+        closed : str or None
+            The ``closed`` passed to ``rolling``.
+
+        Returns
+        -------
+        start, end : ndarray[int64]
+            The window at each position covers the values from ``start``
+            (included) to ``end`` (excluded). Both must be non-decreasing.
+        """
+        raise NotImplementedError
+
+
 class _Window(PandasObject, SelectionMixin):
     _attributes = [
         "window",
@@ -354,6 +429,153 @@ class _Window(PandasObject, SelectionMixin):
                 result = np.copy(result[tuple(lead_indexer)])
         return result
 
+    def _apply(
+        self, func, name=None, window=None, center=None, check_minp=None, **kwargs
+    ):
+        """
+        Rolling statistical measure using supplied function.
+
+        Designed to be used with passed-in Cython array-based functions.
+
+        Parameters
+        ----------
+        func : str/callable to apply
+            the name of a libwindow kernel, or a function called as
+            ``func(values, start, end, window, min_periods)`` on the 2D
+            (columns, rows) float64 values of a block and the window bounds
+        name : str, optional
+           name of this function
+        window : int/array, default to _get_window()
+        center : bool, default to self.center
+        check_minp : function, default to _use_window
+
+        Returns
+        -------
+        y : type of input
+        """
+        if center is None:
+            center = self.center
+        if window is None:
+            window = self._get_window()
+
+        if check_minp is None:
+            check_minp = _use_window
+
+        blocks, obj, index = self._create_blocks()
+        block_list = list(blocks)
+        index, indexi = self._get_index(index=index)
+
+        # if we have a string function name, wrap it
+        if isinstance(func, str):
+            cfunc = getattr(libwindow, func, None)
+            if cfunc is None:
+                raise ValueError(
+                    "we do not support this function "
+                    "in libwindow.{func}".format(func=func)
+                )
+
+            def func(values, start, end, win, minp):
+                return _roll_columns(cfunc, values, start, end, win, minp, **kwargs)
+
+        custom_window = isinstance(window, BaseIndexer)
+        min_periods, offset = self._get_min_periods_and_offset(
+            window, center, check_minp
+        )
+
+        # the window bounds only depend on the number of values rolled over,
+        # compute them once and share them between the blocks
+        bounds = {}
+
+        results = []
+        exclude = []
+        for i, b in enumerate(blocks):
+            try:
+                values = self._prep_values(b.values)
+
+            except (TypeError, NotImplementedError):
+                if isinstance(obj, ABCDataFrame):
+                    exclude.extend(b.columns)
+                    del block_list[i]
+                    continue
+                else:
+                    raise DataError("No numeric types to aggregate")
+
+            if values.size == 0:
+                results.append(values.copy())
+                continue
+
+            # roll over the rows of a (columns, rows) array
+            if values.ndim == 1:
+                block_values = values.reshape(1, -1)
+            elif self.axis == 0:
+                block_values = values.T
+            else:
+                block_values = values
+
+            if offset:
+                additional_nans = np.full((len(block_values), offset), np.NaN)
+                block_values = np.concatenate((block_values, additional_nans), axis=1)
+            block_values = np.ascontiguousarray(block_values)
+
+            nobs = block_values.shape[1]
+            if nobs not in bounds:
+                bounds[nobs] = self._get_window_bounds(
+                    nobs, window, min_periods, center, indexi
+                )
+            start, end, win, minp = bounds[nobs]
+
+            with np.errstate(all="ignore"):
+                result = func(block_values, start, end, win, minp)
+
+            if values.ndim == 1:
+                result = result[0]
+            elif self.axis == 0:
+                result = result.T
+
+            if center and not custom_window:
+                result = self._center_window(result, window)
+
+            results.append(result)
+
+        return self._wrap_results(results, block_list, obj, exclude)
+
+    def _get_min_periods_and_offset(self, window, center, check_minp):
+        """
+        Return the minimum number of periods of ``window`` and the number of
+        values its centered results are shifted by.
+        """
+        # a custom indexer gives the (centered) windows, which have no size
+        if isinstance(window, BaseIndexer):
+            return check_minp(self.min_periods, 0), 0
+        min_periods = check_minp(self.min_periods, window)
+        return min_periods, _offset(window, center) if center else 0
+
+    def _get_window_bounds(self, num_values, window, min_periods, center, index):
+        """
+        Return the bounds of the windows over ``num_values`` values.
+
+        Returns
+        -------
+        tuple of the start & end offsets of the windows (empty for fixed
+        windows), the largest window size and the minimum number of periods
+        """
+        if isinstance(window, BaseIndexer):
+            start, end = window.get_window_bounds(
+                num_values=num_values,
+                min_periods=self.min_periods,
+                center=center,
+                closed=self.closed,
+            )
+            start, end = _check_window_bounds(start, end, num_values)
+            return start, end, (end - start).max(), min_periods
+
+        # the kernels which need an observation in a window raise the
+        # minimum number of periods to 1 themselves
+        start, end, _, win, minp, _ = libwindow.get_window_indexer(
+            num_values, window, min_periods, index, self.closed, floor=0
+        )
+        return start, end, win, minp
+
     def aggregate(self, func, *args, **kwargs):
         result, how = self._aggregate(func, *args, **kwargs)
         if result is None:
@@ -486,7 +708,87 @@ class _Window(PandasObject, SelectionMixin):
     )
 
 
-class Window(_Window):
+class _OffsetWindowMixin:
+    """
+    Provide windows given as an offset over a datetimelike index or column.
+    """
+
+    @cache_readonly
+    def is_datetimelike(self):
+        return isinstance(
+            self._on, (ABCDatetimeIndex, ABCTimedeltaIndex, ABCPeriodIndex)
+        )
+
+    @cache_readonly
+    def _on(self):
+
+        if self.on is None:
+            return self.obj.index
+        elif isinstance(self.obj, ABCDataFrame) and self.on in self.obj.columns:
+            from pandas import Index
+
+            return Index(self.obj[self.on])
+        else:
+            raise ValueError(
+                "invalid on specified as {0}, "
+                "must be a column (if DataFrame) "
+                "or None".format(self.on)
+            )
+
+    def _is_offset_window(self):
+        return (self.obj.empty or self.is_datetimelike) and isinstance(
+            self.window, (str, ABCDateOffset, timedelta)
+        )
+
+    def _validate_offset_window(self):
+        """
+        Validate a window given as an offset, which then rolls over the
+        nanoseconds of the period ending at each row.
+        """
+        self._validate_monotonic()
+        freq = self._validate_freq()
+
+        # we don't allow center
+        if self.center:
+            raise NotImplementedError(
+                "center is not implemented "
+                "for datetimelike and offset "
+                "based windows"
+            )
+
+        # this will raise ValueError on non-fixed freqs
+        self.win_freq = self.window
+        self.window = freq.nanos
+
+        # min_periods must be an integer
+        if self.min_periods is None:
+            self.min_periods = 1
+
+    def _validate_monotonic(self):
+        """
+        Validate on is_monotonic.
+        """
+        if not self._on.is_monotonic:
+            formatted = self.on or "index"
+            raise ValueError("{0} must be " "monotonic".format(formatted))
+
+    def _validate_freq(self):
+        """
+        Validate & return window frequency.
+        """
+        from pandas.tseries.frequencies import to_offset
+
+        try:
+            return to_offset(self.window)
+        except (TypeError, ValueError):
+            raise ValueError(
+                "passed window {0} is not "
+                "compatible with a datetimelike "
+                "index".format(self.window)
+            )
+
+
+class Window(_OffsetWindowMixin, _Window):
     """
     Provide rolling window calculations.
 
@@ -494,7 +796,7 @@ class Window(_Window):
 
     Parameters
     ----------
-    window : int, or offset
+    window : int, offset, or BaseIndexer subclass
         Size of the moving window. This is the number of observations used for
         calculating the statistic. Each window will be a fixed size.
 
@@ -502,6 +804,13 @@ class Window(_Window):
         window will be a variable sized based on the observations included in
         the time-period. This is only valid for datetimelike indexes. This is
         new in 0.19.0
+
+        If a BaseIndexer subclass is passed, calculates the window boundaries
+        based on the defined ``get_window_bounds`` method. Additional rolling
+        keyword arguments, namely `min_periods`, `center`, and
+        `closed` will be passed to `get_window_bounds`.
+
+        .. versionadded:: 0.25.1
     min_periods : int, default None
         Minimum number of observations in window required to have a value
         (otherwise result is NA). For a window that is specified by an offset,
@@ -509,8 +818,10 @@ class Window(_Window):
         to the size of the window.
     center : bool, default False
         Set the labels at the center of the window.
-    win_type : str, default None
+    win_type : str or array-like, default None
         Provide a window type. If ``None``, all points are evenly weighted.
+        An array gives the weight of each row of the window, from the oldest
+        to the most recent.
         See the notes below for further information.
     on : str, optional
         For a DataFrame, a datetime-like column on which to calculate the rolling
@@ -566,6 +877,10 @@ class Window(_Window):
     different window types see `scipy.signal window functions
     <https://docs.scipy.org/doc/scipy/reference/signal.html#window-functions>`__.
 
+    With an offset ``window``, the weights are spread over the period of the
+    window and interpolated at the time of each row, and the ``std``, ``width``
+    and ``tau`` of the window types are given as fractions of the period.
+
     Examples
     --------
 
@@ -640,6 +955,10 @@ class Window(_Window):
     2013-01-01 09:00:06  4.0
     """
 
+    @property
+    def is_freq_type(self):
+        return self.win_freq is not None
+
     def validate(self):
         super().validate()
 
@@ -649,18 +968,34 @@ class Window(_Window):
         elif is_integer(window):
             if window <= 0:
                 raise ValueError("window must be > 0 ")
-            import_optional_dependency(
-                "scipy", extra="Scipy is required to generate window weight."
-            )
-            import scipy.signal as sig
-
-            if not isinstance(self.win_type, str):
-                raise ValueError("Invalid win_type {0}".format(self.win_type))
-            if getattr(sig, self.win_type, None) is None:
-                raise ValueError("Invalid win_type {0}".format(self.win_type))
+            self._validate_win_type()
+            if is_list_like(self.win_type) and len(self.win_type) != window:
+                raise ValueError(
+                    "win_type must have a weight for each row of the window"
+                )
+        elif self._is_offset_window():
+            self._validate_offset_window()
+            self._validate_win_type()
         else:
             raise ValueError("Invalid window {0}".format(window))
 
+    def _validate_win_type(self):
+        if is_list_like(self.win_type):
+            # custom weights
+            if not len(self.win_type):
+                raise ValueError("win_type must have at least one weight")
+            return
+
+        import_optional_dependency(
+            "scipy", extra="Scipy is required to generate window weight."
+        )
+        import scipy.signal as sig
+
+        if not isinstance(self.win_type, str):
+            raise ValueError("Invalid win_type {0}".format(self.win_type))
+        if getattr(sig, self.win_type, None) is None:
+            raise ValueError("Invalid win_type {0}".format(self.win_type))
+
     def _prep_window(self, **kwargs):
         """
         Provide validation for our window type, return the window
@@ -670,100 +1005,85 @@ class Window(_Window):
         window = self._get_window()
         if isinstance(window, (list, tuple, np.ndarray)):
             return com.asarray_tuplesafe(window).astype(float)
-        elif is_integer(window):
-            import scipy.signal as sig
-
-            # the below may pop from kwargs
-            def _validate_win_type(win_type, kwargs):
-                arg_map = {
-                    "kaiser": ["beta"],
-                    "gaussian": ["std"],
-                    "general_gaussian": ["power", "width"],
-                    "slepian": ["width"],
-                    "exponential": ["tau"],
-                }
-
-                if win_type in arg_map:
-                    win_args = _pop_args(win_type, arg_map[win_type], kwargs)
-                    if win_type == "exponential":
-                        # exponential window requires the first arg (center)
-                        # to be set to None (necessary for symmetric window)
-                        win_args.insert(0, None)
-
-                    return tuple([win_type] + win_args)
-
-                return win_type
-
-            def _pop_args(win_type, arg_names, kwargs):
-                msg = "%s window requires %%s" % win_type
-                all_args = []
-                for n in arg_names:
-                    if n not in kwargs:
-                        raise ValueError(msg % n)
-                    all_args.append(kwargs.pop(n))
-                return all_args
-
-            win_type = _validate_win_type(self.win_type, kwargs)
-            # GH #15662. `False` makes symmetric window, rather than periodic.
-            return sig.get_window(win_type, window, False).astype(float)
-
-    def _apply_window(self, mean=True, **kwargs):
+        elif is_list_like(self.win_type):
+            return com.asarray_tuplesafe(self.win_type).astype(float)
+        elif self.is_freq_type:
+            # the weights of an offset window are spread over its period
+            size = _OFFSET_WINDOW_POINTS
+        else:
+            size = window
+
+        # the below may pop from kwargs
+        def _validate_win_type(win_type, kwargs):
+            arg_map = {
+                "kaiser": ["beta"],
+                "gaussian": ["std"],
+                "general_gaussian": ["power", "width"],
+                "slepian": ["width"],
+                "exponential": ["tau"],
+            }
+
+            if win_type in arg_map:
+                win_args = _pop_args(win_type, arg_map[win_type], kwargs)
+                if win_type == "exponential":
+                    # exponential window requires the first arg (center)
+                    # to be set to None (necessary for symmetric window)
+                    win_args.insert(0, None)
+
+                return tuple([win_type] + win_args)
+
+            return win_type
+
+        def _pop_args(win_type, arg_names, kwargs):
+            msg = "%s window requires %%s" % win_type
+            all_args = []
+            for n in arg_names:
+                if n not in kwargs:
+                    raise ValueError(msg % n)
+                arg = kwargs.pop(n)
+                if self.is_freq_type and n in _OFFSET_WINDOW_WIDTHS.get(win_type, []):
+                    # a fraction of the period, in points of the weights
+                    arg = arg * (size - 1)
+                all_args.append(arg)
+            return all_args
+
+        win_type = _validate_win_type(self.win_type, kwargs)
+        return _get_window_weights(win_type, size)
+
+    def _apply_window(self, how="mean", ddof=1, **kwargs):
         """
         Applies a moving window of type ``window_type`` on the data.
 
         Parameters
         ----------
-        mean : bool, default True
-            If True computes weighted mean, else weighted sum
+        how : {'sum', 'mean', 'var', 'std'}, default 'mean'
+            The weighted aggregation of the values of each window.
+        ddof : int, default 1
+            Delta Degrees of Freedom of the variance.
 
         Returns
         -------
         y : same type as input argument
 
         """
-        window = self._prep_window(**kwargs)
-        center = self.center
-
-        blocks, obj, index = self._create_blocks()
-        block_list = list(blocks)
-
-        results = []
-        exclude = []
-        for i, b in enumerate(blocks):
-            try:
-                values = self._prep_values(b.values)
-
-            except (TypeError, NotImplementedError):
-                if isinstance(obj, ABCDataFrame):
-                    exclude.extend(b.columns)
-                    del block_list[i]
-                    continue
-                else:
-                    raise DataError("No numeric types to aggregate")
-
-            if values.size == 0:
-                results.append(values.copy())
-                continue
-
-            offset = _offset(window, center)
-            additional_nans = np.array([np.NaN] * offset)
-
-            def f(arg, *args, **kwargs):
-                minp = _use_window(self.min_periods, len(window))
-                return libwindow.roll_window(
-                    np.concatenate((arg, additional_nans)) if center else arg,
-                    window,
-                    minp,
-                    avg=mean,
-                )
-
-            result = np.apply_along_axis(f, self.axis, values)
-
-            if center:
-                result = self._center_window(result, window)
-            results.append(result)
+        weights = self._prep_window(**kwargs)
+        if self.is_freq_type:
+            window = self._get_window()
+            index = self._on.asi8
+        else:
+            window = len(weights)
+            index = None
 
-        return self._wrap_results(results, block_list, obj, exclude)
+        return self._apply(
+            "roll_weighted",
+            how,
+            window=window,
+            weights=weights,
+            index=index,
+            period=window,
+            how=how,
+            ddof=ddof,
+        )
 
     _agg_see_also_doc = dedent(
         """
@@ -831,13 +1151,69 @@ class Window(_Window):
     @Appender(_shared_docs["sum"])
     def sum(self, *args, **kwargs):
         nv.validate_window_func("sum", args, kwargs)
-        return self._apply_window(mean=False, **kwargs)
+        return self._apply_window(how="sum", **kwargs)
 
     @Substitution(name="window")
     @Appender(_shared_docs["mean"])
     def mean(self, *args, **kwargs):
         nv.validate_window_func("mean", args, kwargs)
-        return self._apply_window(mean=True, **kwargs)
+        return self._apply_window(how="mean", **kwargs)
+
+    def var(self, ddof=1, *args, **kwargs):
+        """
+        Calculate the weighted window variance.
+
+        .. versionadded:: 0.25.1
+
+        The values are weighted as reliability weights: the sum of the
+        squared deviations from the weighted mean, weighted, is divided by
+        the sum of the weights times ``(N - ddof) / N``, where ``N`` is the
+        number of values in the window.
+
+        Parameters
+        ----------
+        ddof : int, default 1
+            Delta Degrees of Freedom.
+        *args
+            For NumPy compatibility. No additional arguments are used.
+        **kwargs
+            The parameters of ``win_type``, such as ``std`` for ``gaussian``.
+
+        Returns
+        -------
+        Series or DataFrame
+            Returned object type is determined by the caller of the window
+            calculation.
+        """
+        nv.validate_window_func("var", args, kwargs)
+        return self._apply_window(how="var", ddof=ddof, **kwargs)
+
+    def std(self, ddof=1, *args, **kwargs):
+        """
+        Calculate the weighted window standard deviation.
+
+        .. versionadded:: 0.25.1
+
+        The square root of the weighted window variance, see
+        :meth:`Window.var`.
+
+        Parameters
+        ----------
+        ddof : int, default 1
+            Delta Degrees of Freedom.
+        *args
+            For NumPy compatibility. No additional arguments are used.
+        **kwargs
+            The parameters of ``win_type``, such as ``std`` for ``gaussian``.
+
+        Returns
+        -------
+        Series or DataFrame
+            Returned object type is determined by the caller of the window
+            calculation.
+        """
+        nv.validate_window_func("std", args, kwargs)
+        return self._apply_window(how="std", ddof=ddof, **kwargs)
 
 
 class _GroupByMixin(GroupByMixin):
@@ -865,122 +1241,68 @@ class _GroupByMixin(GroupByMixin):
         """
         Dispatch to apply; we are stripping all of the _apply kwargs and
         performing the original function call on the grouped object.
+
+        The function is called once on all the groups, sorted by group and
+        rolled over with windows which do not cross the boundaries of the
+        groups, unless the windows are centered or given by a custom indexer.
         """
 
         def f(x, name=name, *args):
-            x = self._shallow_copy(x)
-
             if isinstance(name, str):
                 return getattr(x, name)(*args, **kwargs)
 
             return x.apply(name, *args, **kwargs)
 
-        return self._groupby.apply(f)
-
+        if (
+            self.center
+            or self.axis != 0
+            or self._groupby.axis != 0
+            or isinstance(self.window, BaseIndexer)
+            or self._groupby._selected_obj.empty
+        ):
+            return self._groupby.apply(lambda x: f(self._shallow_copy(x)))
 
-class _Rolling(_Window):
-    @property
-    def _constructor(self):
-        return Rolling
+        return self._apply_sorted_groups(f)
 
-    def _apply(
-        self, func, name=None, window=None, center=None, check_minp=None, **kwargs
-    ):
+    def _apply_sorted_groups(self, f):
         """
-        Rolling statistical measure using supplied function.
-
-        Designed to be used with passed-in Cython array-based functions.
-
-        Parameters
-        ----------
-        func : str/callable to apply
-        name : str, optional
-           name of this function
-        window : int/array, default to _get_window()
-        center : bool, default to self.center
-        check_minp : function, default to _use_window
-
-        Returns
-        -------
-        y : type of input
+        Call f on a window over the rows of the object sorted by group, and
+        index the result by the group keys and the original index, as apply
+        would.
         """
-        if center is None:
-            center = self.center
-        if window is None:
-            window = self._get_window()
-
-        if check_minp is None:
-            check_minp = _use_window
-
-        blocks, obj, index = self._create_blocks()
-        block_list = list(blocks)
-        index, indexi = self._get_index(index=index)
-
-        results = []
-        exclude = []
-        for i, b in enumerate(blocks):
-            try:
-                values = self._prep_values(b.values)
-
-            except (TypeError, NotImplementedError):
-                if isinstance(obj, ABCDataFrame):
-                    exclude.extend(b.columns)
-                    del block_list[i]
-                    continue
-                else:
-                    raise DataError("No numeric types to aggregate")
-
-            if values.size == 0:
-                results.append(values.copy())
-                continue
+        from pandas import MultiIndex
 
-            # if we have a string function name, wrap it
-            if isinstance(func, str):
-                cfunc = getattr(libwindow, func, None)
-                if cfunc is None:
-                    raise ValueError(
-                        "we do not support this function "
-                        "in libwindow.{func}".format(func=func)
-                    )
-
-                def func(arg, window, min_periods=None, closed=None):
-                    minp = check_minp(min_periods, window)
-                    # ensure we are only rolling on floats
-                    arg = ensure_float64(arg)
-                    return cfunc(arg, window, minp, indexi, closed, **kwargs)
-
-            # calculation function
-            if center:
-                offset = _offset(window, center)
-                additional_nans = np.array([np.NaN] * offset)
-
-                def calc(x):
-                    return func(
-                        np.concatenate((x, additional_nans)),
-                        window,
-                        min_periods=self.min_periods,
-                        closed=self.closed,
-                    )
-
-            else:
-
-                def calc(x):
-                    return func(
-                        x, window, min_periods=self.min_periods, closed=self.closed
-                    )
-
-            with np.errstate(all="ignore"):
-                if values.ndim > 1:
-                    result = np.apply_along_axis(calc, self.axis, values)
-                else:
-                    result = calc(values)
+        grouper = self._groupby.grouper
+        ids, _, ngroups = grouper.group_info
+        sorter = get_group_index_sorter(ids, ngroups)
 
-            if center:
-                result = self._center_window(result, window)
+        # the rows with a missing key, which are in no group, sort first
+        sorter = sorter[(ids == -1).sum() :]
+        sorted_ids = ids.take(sorter)
+        group_starts = np.searchsorted(sorted_ids, np.arange(ngroups + 1)).astype(
+            np.int64
+        )
 
-            results.append(result)
+        obj = self._groupby._selected_obj.take(sorter)
+        x = self._shallow_copy(obj, obj_type=self._group_constructor)
+        x._group_starts = group_starts
+        result = f(x)
+
+        if self._groupby.group_keys:
+            keys = grouper.result_index.take(sorted_ids)
+            index = result.index
+            arrays = [keys.get_level_values(i) for i in range(keys.nlevels)]
+            arrays.extend(index.get_level_values(i) for i in range(index.nlevels))
+            result.index = MultiIndex.from_arrays(
+                arrays, names=list(grouper.names) + list(index.names)
+            )
+        return result
 
-        return self._wrap_results(results, block_list, obj, exclude)
+
+class _Rolling(_Window):
+    @property
+    def _constructor(self):
+        return Rolling
 
 
 class _Rolling_and_Expanding(_Rolling):
@@ -1070,8 +1392,26 @@ class _Rolling_and_Expanding(_Rolling):
         not passed. In the future `raw` will default to False.
 
         .. versionadded:: 0.23.0
-    *args, **kwargs
-        Arguments and keyword arguments to be passed into func.
+    args : tuple, default ()
+        Positional arguments to be passed into func.
+    kwargs : dict, default {}
+        Keyword arguments to be passed into func.
+    engine : {None, 'cython', 'numba'}, default None
+        * ``None`` : run the ``'numba'`` engine if func is compiled by
+          numba and ``raw=True``, and the ``'cython'`` engine otherwise.
+        * ``'cython'`` : call func on each window from cython.
+        * ``'numba'`` : run the loop over the windows, and func, in code
+          compiled by numba. func is compiled first if it is a Python
+          function. Requires ``raw=True`` and no ``kwargs``.
+
+        .. versionadded:: 0.25.1
+    engine_kwargs : dict, default None
+        The ``nopython``, ``nogil`` and ``parallel`` options of the
+        ``numba.jit`` compilation of the ``'numba'`` engine, by default
+        ``{'nopython': True, 'nogil': False, 'parallel': False}``. With
+        ``parallel=True``, the columns are rolled over in parallel.
+
+        .. versionadded:: 0.25.1
 
     Returns
     -------
@@ -1085,14 +1425,19 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def apply(self, func, raw=None, args=(), kwargs={}):
+    def apply(
+        self, func, raw=None, args=(), kwargs={}, engine=None, engine_kwargs=None
+    ):
         from pandas import Series
 
         # TODO: _level is unused?
         _level = kwargs.pop("_level", None)  # noqa
         window = self._get_window()
-        offset = _offset(window, self.center)
-        index, indexi = self._get_index()
+        if isinstance(window, BaseIndexer):
+            # the indexer gives the (centered) windows
+            offset, center = 0, self.center
+        else:
+            offset, center = _offset(window, self.center), False
 
         # TODO: default is for backward compat
         # change to False in the future
@@ -1108,15 +1453,54 @@ class _Rolling_and_Expanding(_Rolling):
             )
             raw = True
 
-        def f(arg, window, min_periods, closed):
-            minp = _use_window(min_periods, window)
+        if engine is None:
+            use_numba = raw and not kwargs and _is_numba_func(func)
+            engine = "numba" if use_numba else "cython"
+        if engine == "numba":
             if not raw:
-                arg = Series(arg, index=self.obj.index)
-            return libwindow.roll_generic(
-                arg, window, minp, indexi, closed, offset, func, raw, args, kwargs
-            )
+                raise ValueError("raw must be True with engine='numba'")
+            if kwargs:
+                raise ValueError(
+                    "func cannot take kwargs with engine='numba', pass them in args"
+                )
+            return self._apply_numba(func, args, engine_kwargs)
+        elif engine != "cython":
+            raise ValueError("engine must be either 'numba' or 'cython'")
+        elif engine_kwargs is not None:
+            raise ValueError("engine_kwargs are only supported with engine='numba'")
+
+        def f(values, start, end, win, minp):
+            # python functions are applied one column at a time
+            result = []
+            for arg in values:
+                if not raw:
+                    arg = Series(arg, index=self.obj.index)
+                result.append(
+                    libwindow.roll_generic(
+                        arg, start, end, win, minp, offset, func, raw, args, kwargs
+                    )
+                )
+            return np.array(result)
+
+        return self._apply(f, func, args=args, kwargs=kwargs, center=center, raw=raw)
+
+    def _apply_numba(self, func, args, engine_kwargs):
+        """
+        Apply func to each window in a loop compiled by numba, over all the
+        columns of a block.
+        """
+        roll_apply = _get_numba_apply_func(func, **(engine_kwargs or {}))
 
-        return self._apply(f, func, args=args, kwargs=kwargs, center=False, raw=raw)
+        def f(values, start, end, win, minp):
+            if not len(start):
+                # fixed windows
+                end = np.arange(1, values.shape[1] + 1, dtype=np.int64)
+                start = np.maximum(end - win, 0)
+            return roll_apply(values, start, end, minp, *args)
+
+        return self._apply(
+            f, func, args=args, raw=True, engine="numba", engine_kwargs=engine_kwargs,
+        )
 
     def sum(self, *args, **kwargs):
         nv.validate_window_func("sum", args, kwargs)
@@ -1222,6 +1606,193 @@ class _Rolling_and_Expanding(_Rolling):
     def median(self, **kwargs):
         return self._apply("roll_median_c", "median", **kwargs)
 
+    _shared_docs["rank"] = dedent(
+        """
+    Calculate the %(name)s rank of the last value of each window.
+
+    .. versionadded:: 0.25.1
+
+    Parameters
+    ----------
+    method : {'average', 'min', 'max'}, default 'average'
+        How to rank the values equal to the last value:
+
+            * average: average rank of the tied values.
+            * min: lowest rank of the tied values.
+            * max: highest rank of the tied values.
+    ascending : bool, default True
+        Whether the smallest value is ranked 1, otherwise the largest.
+    pct : bool, default False
+        Whether to divide the rank by the number of values in the window.
+    **kwargs
+        For compatibility with other %(name)s methods. Has no effect on
+        the result.
+
+    Returns
+    -------
+    Series or DataFrame
+        Returned object type is determined by the caller of the %(name)s
+        calculation. The rank is NaN where the last value is NaN.
+
+    See Also
+    --------
+    Series.rank : Rank of the values of a Series.
+    DataFrame.rank : Rank of the values of a DataFrame.
+
+    Examples
+    --------
+    >>> s = pd.Series([1, 4, 2, 3, 5, 3])
+    >>> s.rolling(3).rank()
+    0    NaN
+    1    NaN
+    2    2.0
+    3    2.0
+    4    3.0
+    5    1.5
+    dtype: float64
+
+    >>> s.rolling(3).rank(method="min", pct=True)
+    0         NaN
+    1         NaN
+    2    0.666667
+    3    0.666667
+    4    1.000000
+    5    0.333333
+    dtype: float64
+    """
+    )
+
+    def rank(self, method="average", ascending=True, pct=False, **kwargs):
+        return self._apply(
+            "roll_rank", "rank", method=method, ascending=ascending, pct=pct, **kwargs
+        )
+
+    _shared_docs["argmax"] = dedent(
+        """
+    Calculate the %(name)s position of the maximum.
+
+    The position of the maximum of each window is counted from the first
+    row of the window, and is the first of tied maxima. NaN are ignored.
+
+    .. versionadded:: 0.25.1
+
+    Parameters
+    ----------
+    **kwargs
+        For compatibility with other %(name)s methods. Has no effect on
+        the result.
+
+    Returns
+    -------
+    Series or DataFrame
+        Returned object type is determined by the caller of the %(name)s
+        calculation.
+
+    See Also
+    --------
+    Series.argmax : Position of the maximum of a Series.
+    DataFrame.idxmax : Label of the maximum of each column.
+
+    Examples
+    --------
+    >>> s = pd.Series([3, 1, 4, 1, 5])
+    >>> s.rolling(3).argmax()
+    0    NaN
+    1    NaN
+    2    2.0
+    3    1.0
+    4    2.0
+    dtype: float64
+    """
+    )
+
+    def argmax(self, **kwargs):
+        return self._apply("roll_argmax", "argmax", **kwargs)
+
+    _shared_docs["argmin"] = dedent(
+        """
+    Calculate the %(name)s position of the minimum.
+
+    The position of the minimum of each window is counted from the first
+    row of the window, and is the first of tied minima. NaN are ignored.
+
+    .. versionadded:: 0.25.1
+
+    Parameters
+    ----------
+    **kwargs
+        For compatibility with other %(name)s methods. Has no effect on
+        the result.
+
+    Returns
+    -------
+    Series or DataFrame
+        Returned object type is determined by the caller of the %(name)s
+        calculation.
+
+    See Also
+    --------
+    Series.argmin : Position of the minimum of a Series.
+    DataFrame.idxmin : Label of the minimum of each column.
+
+    Examples
+    --------
+    >>> s = pd.Series([3, 1, 4, 1, 5])
+    >>> s.rolling(3).argmin()
+    0    NaN
+    1    NaN
+    2    1.0
+    3    0.0
+    4    1.0
+    dtype: float64
+    """
+    )
+
+    def argmin(self, **kwargs):
+        return self._apply("roll_argmin", "argmin", **kwargs)
+
+    _shared_docs["nunique"] = dedent(
+        """
+    Calculate the %(name)s number of distinct values.
+
+    NaN are not counted.
+
+    .. versionadded:: 0.25.1
+
+    Parameters
+    ----------
+    **kwargs
+        For compatibility with other %(name)s methods. Has no effect on
+        the result.
+
+    Returns
+    -------
+    Series or DataFrame
+        Returned object type is determined by the caller of the %(name)s
+        calculation.
+
+    See Also
+    --------
+    Series.nunique : Number of distinct values of a Series.
+    DataFrame.nunique : Number of distinct values of each column.
+
+    Examples
+    --------
+    >>> s = pd.Series([1, 1, 2, np.nan, 2, 3])
+    >>> s.rolling(3, min_periods=1).nunique()
+    0    1.0
+    1    1.0
+    2    2.0
+    3    2.0
+    4    1.0
+    5    2.0
+    dtype: float64
+    """
+    )
+
+    def nunique(self, **kwargs):
+        return self._apply("roll_nunique", "nunique", **kwargs)
+
     _shared_docs["std"] = dedent(
         """
     Calculate %(name)s standard deviation.
@@ -1284,13 +1855,12 @@ class _Rolling_and_Expanding(_Rolling):
 
     def std(self, ddof=1, *args, **kwargs):
         nv.validate_window_func("std", args, kwargs)
-        window = self._get_window()
-        index, indexi = self._get_index()
 
-        def f(arg, *args, **kwargs):
-            minp = _require_min_periods(1)(self.min_periods, window)
+        def f(values, start, end, win, minp):
             return _zsqrt(
-                libwindow.roll_var(arg, window, minp, indexi, self.closed, ddof)
+                _roll_columns(
+                    libwindow.roll_var, values, start, end, win, minp, ddof=ddof
+                )
             )
 
         return self._apply(
@@ -1422,8 +1992,13 @@ class _Rolling_and_Expanding(_Rolling):
 
     Parameters
     ----------
-    quantile : float
-        Quantile to compute. 0 <= quantile <= 1.
+    quantile : float or list-like of float
+        Quantile to compute. 0 <= quantile <= 1. All the quantiles of a
+        list are computed in one pass over the windows.
+
+        .. versionchanged:: 0.25.1
+
+            Accepts a list of quantiles.
     interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
         .. versionadded:: 0.23.0
 
@@ -1444,7 +2019,9 @@ class _Rolling_and_Expanding(_Rolling):
     -------
     Series or DataFrame
         Returned object type is determined by the caller of the %(name)s
-        calculation.
+        calculation. For a list of quantiles, a Series gives a DataFrame with
+        a column per quantile, and a DataFrame gives a column per column and
+        quantile, with the quantiles as the inner level.
 
     See Also
     --------
@@ -1469,26 +2046,98 @@ class _Rolling_and_Expanding(_Rolling):
     2    2.5
     3    3.5
     dtype: float64
+
+    >>> s.rolling(2).quantile([.25, .75])
+       0.25  0.75
+    0   NaN   NaN
+    1  1.25  1.75
+    2  2.25  2.75
+    3  3.25  3.75
     """
     )
 
     def quantile(self, quantile, interpolation="linear", **kwargs):
-        window = self._get_window()
-        index, indexi = self._get_index()
+        if is_list_like(quantile):
+            return self._quantiles(quantile, interpolation, **kwargs)
+        if not is_number(quantile):
+            raise TypeError(
+                "quantile must be a number, not {}".format(type(quantile).__name__)
+            )
 
-        def f(arg, *args, **kwargs):
-            minp = _use_window(self.min_periods, window)
+        def f(values, start, end, win, minp):
             if quantile == 1.0:
-                return libwindow.roll_max(arg, window, minp, indexi, self.closed)
+                return _roll_columns(libwindow.roll_max, values, start, end, win, minp)
             elif quantile == 0.0:
-                return libwindow.roll_min(arg, window, minp, indexi, self.closed)
+                return _roll_columns(libwindow.roll_min, values, start, end, win, minp)
             else:
-                return libwindow.roll_quantile(
-                    arg, window, minp, indexi, self.closed, quantile, interpolation
-                )
+                return _roll_columns(
+                    libwindow.roll_quantile,
+                    values,
+                    start,
+                    end,
+                    win,
+                    minp,
+                    np.array([quantile], dtype=np.float64),
+                    interpolation,
+                )[:, 0]
 
         return self._apply(f, "quantile", quantile=quantile, **kwargs)
 
+    def _quantiles(self, quantiles, interpolation, **kwargs):
+        """
+        Compute several quantiles in one pass over the windows, as the columns
+        of the result, or under each column for a DataFrame.
+        """
+        from pandas import concat
+
+        quantiles = list(quantiles)
+        if not len(quantiles):
+            raise ValueError("quantile must not be empty")
+        if not all(is_number(q) for q in quantiles):
+            raise TypeError("quantile must be a list-like of numbers")
+        if isinstance(self, _GroupByMixin):
+            # each group computes its quantiles in one pass
+            return self._apply(
+                None,
+                "quantile",
+                quantile=quantiles,
+                interpolation=interpolation,
+                **kwargs
+            )
+
+        # roll_quantile computes all the quantiles of a block at once, the
+        # results of the other quantiles are kept to be wrapped in turn
+        block_results = []
+
+        def f(values, start, end, win, minp):
+            result = _roll_columns(
+                libwindow.roll_quantile,
+                values,
+                start,
+                end,
+                win,
+                minp,
+                np.array(quantiles, dtype=np.float64),
+                interpolation,
+            )
+            block_results.append(result)
+            return result[:, 0]
+
+        results = [self._apply(f, "quantile", **kwargs)]
+        for q in range(1, len(quantiles)):
+            stored = iter(block_results)
+            results.append(
+                self._apply(lambda *args: next(stored)[:, q], "quantile", **kwargs)
+            )
+
+        result = concat(results, axis=1, keys=quantiles)
+        if isinstance(results[0], ABCDataFrame):
+            # group the quantiles of each column
+            ncols = len(results[0].columns)
+            indexer = [q * ncols + i for i in range(ncols) for q in range(len(results))]
+            result = result.iloc[:, indexer].swaplevel(axis=1)
+        return result
+
     _shared_docs[
         "cov"
     ] = """
@@ -1509,11 +2158,17 @@ class _Rolling_and_Expanding(_Rolling):
         ddof : int, default 1
             Delta Degrees of Freedom.  The divisor used in calculations
             is ``N - ddof``, where ``N`` represents the number of elements.
+        as_array : bool, default False
+            Return the pairwise covariances of DataFrames as an ndarray of
+            shape (rows, columns of self, columns of other) instead of a
+            MultiIndexed DataFrame. Only valid when the output is pairwise.
+
+            .. versionadded:: 0.25.1
         **kwargs
             Keyword arguments to be passed into func.
     """
 
-    def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
+    def cov(self, other=None, pairwise=None, ddof=1, as_array=False, **kwargs):
         if other is None:
             other = self._selected_obj
             # only default unset
@@ -1527,19 +2182,15 @@ class _Rolling_and_Expanding(_Rolling):
             window = self._get_window(other)
 
         def _get_cov(X, Y):
-            # GH #12373 : rolling functions error on float32 data
-            # to avoid potential overflow, cast the data to float64
-            X = X.astype("float64")
-            Y = Y.astype("float64")
-            mean = lambda x: x.rolling(
-                window, self.min_periods, center=self.center
-            ).mean(**kwargs)
-            count = (X + Y).rolling(window=window, center=self.center).count(**kwargs)
-            bias_adj = count / (count - ddof)
-            return (mean(X * Y) - mean(X) * mean(Y)) * bias_adj
+            return self._roll_cov(X, Y, window, ddof=ddof)
 
         return _flex_binary_moment(
-            self._selected_obj, other._selected_obj, _get_cov, pairwise=bool(pairwise)
+            self._selected_obj,
+            other._selected_obj,
+            _series_moment(_get_cov),
+            pairwise=bool(pairwise),
+            f_frames=_get_cov,
+            as_array=as_array,
         )
 
     _shared_docs["corr"] = dedent(
@@ -1555,6 +2206,12 @@ class _Rolling_and_Expanding(_Rolling):
         DataFrame. If `other` is not specified, defaults to `True`,
         otherwise defaults to `False`.
         Not relevant for :class:`~pandas.Series`.
+    as_array : bool, default False
+        Return the pairwise correlations of DataFrames as an ndarray of
+        shape (rows, columns of self, columns of other) instead of a
+        MultiIndexed DataFrame. Only valid when the output is pairwise.
+
+        .. versionadded:: 0.25.1
     **kwargs
         Unused.
 
@@ -1653,79 +2310,93 @@ class _Rolling_and_Expanding(_Rolling):
     """
     )
 
-    def corr(self, other=None, pairwise=None, **kwargs):
+    def corr(self, other=None, pairwise=None, as_array=False, **kwargs):
         if other is None:
             other = self._selected_obj
             # only default unset
             pairwise = True if pairwise is None else pairwise
         other = self._shallow_copy(other)
-        window = self._get_window(other)
 
-        def _get_corr(a, b):
-            a = a.rolling(
-                window=window, min_periods=self.min_periods, center=self.center
-            )
-            b = b.rolling(
-                window=window, min_periods=self.min_periods, center=self.center
-            )
+        if self.is_freq_type:
+            window = self.win_freq
+        else:
+            window = self._get_window(other)
 
-            return a.cov(b, **kwargs) / (a.std(**kwargs) * b.std(**kwargs))
+        def _get_corr(X, Y):
+            return self._roll_cov(X, Y, window, corr=True)
 
         return _flex_binary_moment(
-            self._selected_obj, other._selected_obj, _get_corr, pairwise=bool(pairwise)
-        )
-
-
-class Rolling(_Rolling_and_Expanding):
-    @cache_readonly
-    def is_datetimelike(self):
-        return isinstance(
-            self._on, (ABCDatetimeIndex, ABCTimedeltaIndex, ABCPeriodIndex)
+            self._selected_obj,
+            other._selected_obj,
+            _series_moment(_get_corr),
+            pairwise=bool(pairwise),
+            f_frames=_get_corr,
+            as_array=as_array,
         )
 
-    @cache_readonly
-    def _on(self):
+    def _roll_cov(self, X, Y, window, ddof=1, corr=False):
+        """
+        Roll the covariance, or correlation, of every column of ``X`` with
+        every column of ``Y`` in one pass.
 
-        if self.on is None:
-            return self.obj.index
-        elif isinstance(self.obj, ABCDataFrame) and self.on in self.obj.columns:
-            from pandas import Index
+        Parameters
+        ----------
+        X, Y : Series or DataFrame
+            The values, sharing the same index.
+        window : int, offset or BaseIndexer
+            The window rolled over the index.
+        ddof : int, default 1
+            Delta Degrees of Freedom of the covariance.
+        corr : bool, default False
+            Return the correlation instead of the covariance.
 
-            return Index(self.obj[self.on])
-        else:
-            raise ValueError(
-                "invalid on specified as {0}, "
-                "must be a column (if DataFrame) "
-                "or None".format(self.on)
+        Returns
+        -------
+        ndarray of shape (columns of X, columns of Y, rows)
+        """
+        roller = X.rolling(window, self.min_periods, center=self.center)
+        window = roller._get_window()
+        min_periods, offset = roller._get_min_periods_and_offset(
+            window, self.center, _use_window
+        )
+        _, indexi = roller._get_index()
+
+        def _prep(values):
+            values = roller._prep_values(values)
+            values = values.reshape(-1, 1).T if values.ndim == 1 else values.T
+            if offset:
+                additional_nans = np.full((len(values), offset), np.NaN)
+                values = np.concatenate((values, additional_nans), axis=1)
+            return np.ascontiguousarray(values)
+
+        x = _prep(X.values)
+        y = x if Y is X else _prep(Y.values)
+        if not len(X):
+            return np.empty((len(x), len(y), 0))
+        start, end, win, minp = roller._get_window_bounds(
+            x.shape[1], window, min_periods, self.center, indexi
+        )
+        with np.errstate(all="ignore"):
+            result = libwindow.roll_cov(
+                x, y, start, end, win, minp, ddof=ddof, corr=corr, symmetric=y is x
             )
+        return result[:, :, offset:]
 
+
+class Rolling(_OffsetWindowMixin, _Rolling_and_Expanding):
     def validate(self):
         super().validate()
 
         # we allow rolling on a datetimelike index
-        if (self.obj.empty or self.is_datetimelike) and isinstance(
-            self.window, (str, ABCDateOffset, timedelta)
-        ):
-
-            self._validate_monotonic()
-            freq = self._validate_freq()
-
-            # we don't allow center
-            if self.center:
-                raise NotImplementedError(
-                    "center is not implemented "
-                    "for datetimelike and offset "
-                    "based windows"
-                )
-
-            # this will raise ValueError on non-fixed freqs
-            self.win_freq = self.window
-            self.window = freq.nanos
+        if self._is_offset_window():
+            self._validate_offset_window()
             self.win_type = "freq"
 
-            # min_periods must be an integer
-            if self.min_periods is None:
-                self.min_periods = 1
+        elif isinstance(self.window, BaseIndexer):
+            # the indexer gives the bounds of the windows
+            if self.min_periods is not None and self.min_periods < 0:
+                raise ValueError("min_periods must be >= 0")
+            return
 
         elif not is_integer(self.window):
             raise ValueError("window must be an integer")
@@ -1737,29 +2408,6 @@ class Rolling(_Rolling_and_Expanding):
                 "closed only implemented for datetimelike " "and offset based windows"
             )
 
-    def _validate_monotonic(self):
-        """
-        Validate on is_monotonic.
-        """
-        if not self._on.is_monotonic:
-            formatted = self.on or "index"
-            raise ValueError("{0} must be " "monotonic".format(formatted))
-
-    def _validate_freq(self):
-        """
-        Validate & return window frequency.
-        """
-        from pandas.tseries.frequencies import to_offset
-
-        try:
-            return to_offset(self.window)
-        except (TypeError, ValueError):
-            raise ValueError(
-                "passed window {0} is not "
-                "compatible with a datetimelike "
-                "index".format(self.window)
-            )
-
     _agg_see_also_doc = dedent(
         """
     See Also
@@ -1834,15 +2482,24 @@ class Rolling(_Rolling_and_Expanding):
     def count(self):
 
         # different impl for freq counting
-        if self.is_freq_type:
+        if self.is_freq_type or isinstance(self.window, BaseIndexer):
             return self._apply("roll_count", "count")
 
         return super().count()
 
     @Substitution(name="rolling")
     @Appender(_shared_docs["apply"])
-    def apply(self, func, raw=None, args=(), kwargs={}):
-        return super().apply(func, raw=raw, args=args, kwargs=kwargs)
+    def apply(
+        self, func, raw=None, args=(), kwargs={}, engine=None, engine_kwargs=None
+    ):
+        return super().apply(
+            func,
+            raw=raw,
+            args=args,
+            kwargs=kwargs,
+            engine=engine,
+            engine_kwargs=engine_kwargs,
+        )
 
     @Substitution(name="rolling")
     @Appender(_shared_docs["sum"])
@@ -1870,9 +2527,29 @@ class Rolling(_Rolling_and_Expanding):
         return super().mean(*args, **kwargs)
 
     @Substitution(name="rolling")
-    @Appender(_shared_docs["median"])
-    def median(self, **kwargs):
-        return super().median(**kwargs)
+    @Appender(_shared_docs["median"])
+    def median(self, **kwargs):
+        return super().median(**kwargs)
+
+    @Substitution(name="rolling")
+    @Appender(_shared_docs["rank"])
+    def rank(self, method="average", ascending=True, pct=False, **kwargs):
+        return super().rank(method=method, ascending=ascending, pct=pct, **kwargs)
+
+    @Substitution(name="rolling")
+    @Appender(_shared_docs["argmax"])
+    def argmax(self, **kwargs):
+        return super().argmax(**kwargs)
+
+    @Substitution(name="rolling")
+    @Appender(_shared_docs["argmin"])
+    def argmin(self, **kwargs):
+        return super().argmin(**kwargs)
+
+    @Substitution(name="rolling")
+    @Appender(_shared_docs["nunique"])
+    def nunique(self, **kwargs):
+        return super().nunique(**kwargs)
 
     @Substitution(name="rolling")
     @Appender(_shared_docs["std"])
@@ -1934,13 +2611,47 @@ class Rolling(_Rolling_and_Expanding):
     @Substitution(name="rolling")
     @Appender(_doc_template)
     @Appender(_shared_docs["cov"])
-    def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
-        return super().cov(other=other, pairwise=pairwise, ddof=ddof, **kwargs)
+    def cov(self, other=None, pairwise=None, ddof=1, as_array=False, **kwargs):
+        return super().cov(
+            other=other, pairwise=pairwise, ddof=ddof, as_array=as_array, **kwargs
+        )
 
     @Substitution(name="rolling")
     @Appender(_shared_docs["corr"])
-    def corr(self, other=None, pairwise=None, **kwargs):
-        return super().corr(other=other, pairwise=pairwise, **kwargs)
+    def corr(self, other=None, pairwise=None, as_array=False, **kwargs):
+        return super().corr(other=other, pairwise=pairwise, as_array=as_array, **kwargs)
+
+    def online(self):
+        """
+        Return an online version of this rolling window.
+
+        The online window gives the same results, and can then be moved to
+        rows appended to the data with :meth:`OnlineRolling.update`, rolling
+        only over the appended rows and the rows before them that still fall
+        in their windows instead of over the whole history.
+
+        .. versionadded:: 0.25.1
+
+        Returns
+        -------
+        OnlineRolling
+
+        Examples
+        --------
+        >>> s = pd.Series([1, 2, 3, 4])
+        >>> online = s.rolling(2).online()
+        >>> online.sum()
+        0    NaN
+        1    3.0
+        2    5.0
+        3    7.0
+        dtype: float64
+        >>> online.update(pd.Series([5, 6], index=[4, 5])).sum()
+        4     9.0
+        5    11.0
+        dtype: float64
+        """
+        return self._shallow_copy(obj_type=OnlineRolling)
 
 
 class RollingGroupby(_GroupByMixin, Rolling):
@@ -1955,6 +2666,10 @@ class RollingGroupby(_GroupByMixin, Rolling):
     def _constructor(self):
         return Rolling
 
+    @property
+    def _group_constructor(self):
+        return _GroupRolling
+
     def _gotitem(self, key, ndim, subset=None):
 
         # we are setting the index on the actual object
@@ -1974,6 +2689,79 @@ class RollingGroupby(_GroupByMixin, Rolling):
         """
         pass
 
+    def online(self):
+        raise NotImplementedError("online is not implemented for groupby rolling")
+
+
+class OnlineRolling(Rolling):
+    """
+    Rolling window that can be moved to rows appended to its data.
+
+    Returned by :meth:`Rolling.online`. The aggregations give the results at
+    the rows the window was last moved to, rolling over these rows and the
+    rows before them that still fall in their windows, which are the only
+    rows of the history it keeps.
+
+    .. versionadded:: 0.25.1
+    """
+
+    def __init__(self, obj, *args, **kwargs):
+        super().__init__(obj, *args, **kwargs)
+        if isinstance(self.window, BaseIndexer) or self.center or self.axis != 0:
+            raise NotImplementedError(
+                "online is only implemented for windows of past rows along axis 0"
+            )
+        # the number of rows of obj before the current rows
+        self._tail_length = 0
+
+    def update(self, new_rows):
+        """
+        Move the window to rows appended after the rows seen so far.
+
+        Parameters
+        ----------
+        new_rows : Series or DataFrame
+            The appended rows, with the same columns as the rows seen so far,
+            and later times for a time-based window.
+
+        Returns
+        -------
+        OnlineRolling
+            The window, whose aggregations now give the results at
+            ``new_rows``.
+        """
+        from pandas import concat
+
+        _check_new_rows(self.obj, new_rows)
+        tail = self._window_tail()
+        self.obj = concat([tail, new_rows])
+        self._tail_length = len(tail)
+        self._reset_cache()
+        if self.is_freq_type:
+            self._validate_monotonic()
+        return self
+
+    def _window_tail(self):
+        """
+        Return the last rows of obj that can be in the window of a later row.
+        """
+        if self.is_freq_type:
+            on = self._on.asi8
+            start = on.searchsorted(on[-1] - self.window) if len(on) else 0
+        else:
+            start = max(len(self.obj) - self.window + 1, 0)
+        return self.obj.iloc[start:]
+
+    def _wrap_results(self, results, blocks, obj, exclude=None):
+        result = super()._wrap_results(results, blocks, obj, exclude=exclude)
+        return result.iloc[self._tail_length :]
+
+    def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
+        raise NotImplementedError("cov is not implemented for online rolling")
+
+    def corr(self, other=None, pairwise=None, **kwargs):
+        raise NotImplementedError("corr is not implemented for online rolling")
+
 
 class Expanding(_Rolling_and_Expanding):
     """
@@ -2118,8 +2906,17 @@ class Expanding(_Rolling_and_Expanding):
 
     @Substitution(name="expanding")
     @Appender(_shared_docs["apply"])
-    def apply(self, func, raw=None, args=(), kwargs={}):
-        return super().apply(func, raw=raw, args=args, kwargs=kwargs)
+    def apply(
+        self, func, raw=None, args=(), kwargs={}, engine=None, engine_kwargs=None
+    ):
+        return super().apply(
+            func,
+            raw=raw,
+            args=args,
+            kwargs=kwargs,
+            engine=engine,
+            engine_kwargs=engine_kwargs,
+        )
 
     @Substitution(name="expanding")
     @Appender(_shared_docs["sum"])
@@ -2151,6 +2948,26 @@ class Expanding(_Rolling_and_Expanding):
     def median(self, **kwargs):
         return super().median(**kwargs)
 
+    @Substitution(name="expanding")
+    @Appender(_shared_docs["rank"])
+    def rank(self, method="average", ascending=True, pct=False, **kwargs):
+        return super().rank(method=method, ascending=ascending, pct=pct, **kwargs)
+
+    @Substitution(name="expanding")
+    @Appender(_shared_docs["argmax"])
+    def argmax(self, **kwargs):
+        return super().argmax(**kwargs)
+
+    @Substitution(name="expanding")
+    @Appender(_shared_docs["argmin"])
+    def argmin(self, **kwargs):
+        return super().argmin(**kwargs)
+
+    @Substitution(name="expanding")
+    @Appender(_shared_docs["nunique"])
+    def nunique(self, **kwargs):
+        return super().nunique(**kwargs)
+
     @Substitution(name="expanding")
     @Appender(_shared_docs["std"])
     def std(self, ddof=1, *args, **kwargs):
@@ -2211,13 +3028,15 @@ class Expanding(_Rolling_and_Expanding):
     @Substitution(name="expanding")
     @Appender(_doc_template)
     @Appender(_shared_docs["cov"])
-    def cov(self, other=None, pairwise=None, ddof=1, **kwargs):
-        return super().cov(other=other, pairwise=pairwise, ddof=ddof, **kwargs)
+    def cov(self, other=None, pairwise=None, ddof=1, as_array=False, **kwargs):
+        return super().cov(
+            other=other, pairwise=pairwise, ddof=ddof, as_array=as_array, **kwargs
+        )
 
     @Substitution(name="expanding")
     @Appender(_shared_docs["corr"])
-    def corr(self, other=None, pairwise=None, **kwargs):
-        return super().corr(other=other, pairwise=pairwise, **kwargs)
+    def corr(self, other=None, pairwise=None, as_array=False, **kwargs):
+        return super().corr(other=other, pairwise=pairwise, as_array=as_array, **kwargs)
 
 
 class ExpandingGroupby(_GroupByMixin, Expanding):
@@ -2232,6 +3051,44 @@ class ExpandingGroupby(_GroupByMixin, Expanding):
     def _constructor(self):
         return Expanding
 
+    @property
+    def _group_constructor(self):
+        return _GroupExpanding
+
+
+class _GroupWindowMixin:
+    """
+    Roll over the rows of groups which follow each other, starting at the
+    positions ``_group_starts``, with windows which only cover the rows of
+    their group.
+    """
+
+    _group_starts = None
+
+    def _get_window_bounds(self, num_values, window, min_periods, center, index):
+        if index is not None:
+            # the windows of a time span need the index of each group sorted
+            decreasing = np.diff(index) < 0
+            boundaries = self._group_starts[1:-1]
+            boundaries = boundaries[(boundaries > 0) & (boundaries < len(index))]
+            decreasing[boundaries - 1] = False
+            if decreasing.any():
+                raise ValueError(
+                    "each group of {0} must be monotonic".format(self.on or "index")
+                )
+
+        return libwindow.get_group_window_bounds(
+            self._group_starts, window, min_periods, index, self.closed
+        )
+
+
+class _GroupRolling(_GroupWindowMixin, Rolling):
+    pass
+
+
+class _GroupExpanding(_GroupWindowMixin, Expanding):
+    pass
+
 
 _bias_template = """
         Parameters
@@ -2276,9 +3133,12 @@ class EWM(_Rolling):
     span : float, optional
         Specify decay in terms of span,
         :math:`\alpha = 2 / (span + 1),\text{ for } span \geq 1`.
-    halflife : float, optional
+    halflife : float, str, timedelta, optional
         Specify decay in terms of half-life,
         :math:`\alpha = 1 - exp(log(0.5) / halflife),\text{for} halflife > 0`.
+
+        If ``times`` is specified, the time unit (str or timedelta) over which
+        the weight of an observation decays to half its value.
     alpha : float, optional
         Specify smoothing factor :math:`\alpha` directly,
         :math:`0 < \alpha \leq 1`.
@@ -2298,6 +3158,14 @@ class EWM(_Rolling):
     axis : {0 or 'index', 1 or 'columns'}, default 0
         The axis to use. The value 0 identifies the rows, and 1
         identifies the columns.
+    times : str, np.ndarray, Series, default None
+        Times of the observations, monotonically increasing and of
+        ``datetime64[ns]`` dtype, or the name of the column of the DataFrame
+        that holds them. The weights then decay with the time elapsed between
+        observations rather than with their number, which requires
+        ``halflife`` to be a timedelta and ``adjust=True``.
+
+        .. versionadded:: 0.25.1
 
     Returns
     -------
@@ -2355,8 +3223,20 @@ class EWM(_Rolling):
     2  1.615385
     3  1.615385
     4  3.670213
+
+    With ``times``, the weights halve every ``halflife`` of elapsed time.
+
+    >>> times = ['2020-01-01', '2020-01-03', '2020-01-10', '2020-01-15',
+    ...          '2020-01-17']
+    >>> df.ewm(halflife='4 days', times=pd.DatetimeIndex(times)).mean()
+              B
+    0  0.000000
+    1  0.585786
+    2  1.523889
+    3  1.523889
+    4  3.233686
     """
-    _attributes = ["com", "min_periods", "adjust", "ignore_na", "axis"]
+    _attributes = ["com", "halflife", "min_periods", "adjust", "ignore_na", "axis"]
 
     def __init__(
         self,
@@ -2369,15 +3249,37 @@ class EWM(_Rolling):
         adjust=True,
         ignore_na=False,
         axis=0,
+        times=None,
     ):
         self.obj = obj
-        self.com = _get_center_of_mass(com, span, halflife, alpha)
         self.min_periods = min_periods
         self.adjust = adjust
         self.ignore_na = ignore_na
         self.axis = axis
         self.on = None
 
+        if times is None:
+            self.com = _get_center_of_mass(com, span, halflife, alpha)
+            self.halflife = None
+            self.times = None
+            self._deltas = np.empty(0)
+        else:
+            self.com = None
+            self.halflife, self.times, self._deltas = _get_time_decay(
+                obj, times, com, span, halflife, alpha, adjust, axis
+            )
+
+    @property
+    def _com(self):
+        # with times, the weights halve every halflife: alpha is 0.5 and the
+        # kernels decay the weights by 0.5 ** (elapsed time / halflife)
+        return 1.0 if self.times is not None else self.com
+
+    def _shallow_copy(self, obj=None, obj_type=None, **kwargs):
+        # the times are not part of the repr, so not in _attributes
+        kwargs.setdefault("times", self.times)
+        return super()._shallow_copy(obj=obj, obj_type=obj_type, **kwargs)
+
     @property
     def _constructor(self):
         return EWM
@@ -2445,6 +3347,8 @@ class EWM(_Rolling):
         Parameters
         ----------
         func : str/callable to apply
+            the name of a libwindow ewm kernel, or a function called on the
+            2D (columns, rows) float64 values of a block
 
         Returns
         -------
@@ -2453,6 +3357,26 @@ class EWM(_Rolling):
         blocks, obj, index = self._create_blocks()
         block_list = list(blocks)
 
+        # if we have a string function name, wrap it
+        if isinstance(func, str):
+            cfunc = getattr(libwindow, func, None)
+            if cfunc is None:
+                raise ValueError(
+                    "we do not support this function "
+                    "in libwindow.{func}".format(func=func)
+                )
+
+            def func(values):
+                return _roll_columns(
+                    cfunc,
+                    values,
+                    self._com,
+                    int(self.adjust),
+                    int(self.ignore_na),
+                    int(self.min_periods),
+                    self._deltas,
+                )
+
         results = []
         exclude = []
         for i, b in enumerate(blocks):
@@ -2471,25 +3395,23 @@ class EWM(_Rolling):
                 results.append(values.copy())
                 continue
 
-            # if we have a string function name, wrap it
-            if isinstance(func, str):
-                cfunc = getattr(libwindow, func, None)
-                if cfunc is None:
-                    raise ValueError(
-                        "we do not support this function "
-                        "in libwindow.{func}".format(func=func)
-                    )
+            # the kernels run along the rows of a (columns, rows) array
+            if values.ndim == 1:
+                block_values = values.reshape(1, -1)
+            elif self.axis == 0:
+                block_values = values.T
+            else:
+                block_values = values
+            block_values = np.ascontiguousarray(block_values)
 
-                def func(arg):
-                    return cfunc(
-                        arg,
-                        self.com,
-                        int(self.adjust),
-                        int(self.ignore_na),
-                        int(self.min_periods),
-                    )
+            with np.errstate(all="ignore"):
+                result = func(block_values)
 
-            results.append(np.apply_along_axis(func, self.axis, values))
+            if values.ndim == 1:
+                result = result[0]
+            elif self.axis == 0:
+                result = result.T
+            results.append(result)
 
         return self._wrap_results(results, block_list, obj, exclude)
 
@@ -2528,19 +3450,27 @@ class EWM(_Rolling):
         """
         nv.validate_window_func("var", args, kwargs)
 
-        def f(arg):
-            return libwindow.ewmcov(
-                arg,
-                arg,
-                self.com,
-                int(self.adjust),
-                int(self.ignore_na),
-                int(self.min_periods),
-                int(bias),
-            )
+        def f(values):
+            return _roll_columns(self._ewmcov, values, bias=bias)
 
         return self._apply(f, **kwargs)
 
+    def _ewmcov(self, x, y=None, bias=False):
+        """
+        Call libwindow.ewmcov on the (columns, rows) arrays ``x`` and ``y``,
+        the variance of ``x`` if ``y`` is None.
+        """
+        return libwindow.ewmcov(
+            x,
+            x if y is None else y,
+            self._com,
+            int(self.adjust),
+            int(self.ignore_na),
+            int(self.min_periods),
+            int(bias),
+            self._deltas,
+        )
+
     @Substitution(name="ewm")
     @Appender(_doc_template)
     @Appender(_pairwise_template)
@@ -2557,16 +3487,12 @@ class EWM(_Rolling):
         def _get_cov(X, Y):
             X = self._shallow_copy(X)
             Y = self._shallow_copy(Y)
-            cov = libwindow.ewmcov(
-                X._prep_values(),
-                Y._prep_values(),
-                self.com,
-                int(self.adjust),
-                int(self.ignore_na),
-                int(self.min_periods),
-                int(bias),
+            cov = self._ewmcov(
+                X._prep_values().reshape(1, -1),
+                Y._prep_values().reshape(1, -1),
+                bias=bias,
             )
-            return X._wrap_result(cov)
+            return X._wrap_result(cov[0])
 
         return _flex_binary_moment(
             self._selected_obj, other._selected_obj, _get_cov, pairwise=bool(pairwise)
@@ -2589,36 +3515,236 @@ class EWM(_Rolling):
             X = self._shallow_copy(X)
             Y = self._shallow_copy(Y)
 
-            def _cov(x, y):
-                return libwindow.ewmcov(
-                    x,
-                    y,
-                    self.com,
-                    int(self.adjust),
-                    int(self.ignore_na),
-                    int(self.min_periods),
-                    1,
-                )
-
-            x_values = X._prep_values()
-            y_values = Y._prep_values()
+            x_values = X._prep_values().reshape(1, -1)
+            y_values = Y._prep_values().reshape(1, -1)
             with np.errstate(all="ignore"):
-                cov = _cov(x_values, y_values)
-                x_var = _cov(x_values, x_values)
-                y_var = _cov(y_values, y_values)
+                cov = self._ewmcov(x_values, y_values, bias=True)
+                x_var = self._ewmcov(x_values, bias=True)
+                y_var = self._ewmcov(y_values, bias=True)
                 corr = cov / _zsqrt(x_var * y_var)
-            return X._wrap_result(corr)
+            return X._wrap_result(corr[0])
 
         return _flex_binary_moment(
             self._selected_obj, other._selected_obj, _get_corr, pairwise=bool(pairwise)
         )
 
+    def online(self):
+        """
+        Return an online version of this exponentially weighted window.
+
+        The online window gives the same results, and can then be moved to
+        rows appended to the data with :meth:`OnlineEWM.update`, continuing
+        from the weighted moments at the last row seen instead of
+        recomputing them over the whole history.
+
+        .. versionadded:: 0.25.1
+
+        Returns
+        -------
+        OnlineEWM
+
+        Examples
+        --------
+        >>> s = pd.Series([1.0, 2.0, 3.0])
+        >>> online = s.ewm(com=0.5).online()
+        >>> online.mean()
+        0    1.000000
+        1    1.750000
+        2    2.615385
+        dtype: float64
+        >>> online.update(pd.Series([4.0, 5.0], index=[3, 4])).mean()
+        3    3.550000
+        4    4.520661
+        dtype: float64
+        """
+        return self._shallow_copy(obj_type=OnlineEWM)
+
+
+class OnlineEWM(EWM):
+    """
+    Exponentially weighted window that can be moved to rows appended to its
+    data.
+
+    Returned by :meth:`EWM.online`. The aggregations give the results at the
+    rows the window was last moved to, continuing from the state of the
+    weighted moments of each column after the rows before them, which are
+    not kept.
+
+    .. versionadded:: 0.25.1
+    """
+
+    def __init__(self, obj, **kwargs):
+        super().__init__(obj, **kwargs)
+        if self.axis != 0:
+            raise NotImplementedError("online is only implemented along axis 0")
+        # the libwindow.ewmcov state of each column after the rows before the
+        # current rows, None before the first update
+        self._state = None
+        self._last_time = None
+
+    def update(self, new_rows, times=None):
+        """
+        Move the window to rows appended after the rows seen so far.
+
+        Parameters
+        ----------
+        new_rows : Series or DataFrame
+            The appended rows, with the same columns as the rows seen so far.
+        times : str, np.ndarray, Series, default None
+            The times of ``new_rows``, later than the times seen so far. Must
+            be passed if and only if the window was created with ``times``.
+
+        Returns
+        -------
+        OnlineEWM
+            The window, whose aggregations now give the results at
+            ``new_rows``.
+        """
+        _check_new_rows(self.obj, new_rows)
+        if self.times is None and times is not None:
+            raise ValueError("times can only be passed if the ewm has times")
+        if self.times is not None:
+            if times is None:
+                raise ValueError("times must be passed if the ewm has times")
+            _, times, deltas = _get_time_decay(
+                new_rows, times, None, None, self.halflife, None, self.adjust, 0
+            )
+            if len(self.times):
+                self._last_time = self.times[-1]
+            if len(times) and self._last_time is not None:
+                elapsed = times[0] - self._last_time
+                if elapsed < np.timedelta64(0):
+                    raise ValueError("times must be monotonically increasing")
+                deltas[0] = elapsed.astype(np.int64) / float(self.halflife.value)
+
+        # move the state past the current rows
+        values = self._online_values()
+        state = self._online_state(len(values), 7)
+        libwindow.ewmcov(
+            values,
+            values,
+            self._com,
+            int(self.adjust),
+            int(self.ignore_na),
+            int(self.min_periods),
+            0,
+            self._deltas,
+            state,
+        )
+        self._state = state
+
+        self.obj = new_rows
+        if self.times is not None:
+            self.times, self._deltas = times, deltas
+        self._reset_cache()
+        return self
+
+    def _online_values(self):
+        """
+        Return the float64 (columns, rows) values of the numeric columns.
+        """
+        obj = self._selected_obj
+        if isinstance(obj, ABCDataFrame):
+            obj = obj._get_numeric_data()
+        try:
+            values = self._prep_values(obj.values)
+        except (TypeError, NotImplementedError):
+            raise DataError("No numeric types to aggregate")
+        if values.ndim == 1:
+            return values.reshape(1, -1)
+        return np.ascontiguousarray(values.T)
+
+    def _online_state(self, ncols, size):
+        """
+        Return a copy of the first ``size`` elements of the state of each
+        column, NaN before the first update.
+        """
+        if self._state is None:
+            return np.full((ncols, size), np.nan)
+        return self._state[:, :size].copy()
+
+    def _wrap_online_result(self, result):
+        obj = self._selected_obj
+        if obj.ndim == 1:
+            return obj._constructor(result[0], index=obj.index, name=obj.name)
+        columns = obj._get_numeric_data().columns
+        return obj._constructor(result.T, index=obj.index, columns=columns)
+
+    @Substitution(name="ewm")
+    @Appender(_doc_template)
+    def mean(self, *args, **kwargs):
+        """
+        Exponential weighted moving average.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            Arguments and keyword arguments to be passed into func.
+        """
+        nv.validate_window_func("mean", args, kwargs)
+        values = self._online_values()
+        result = libwindow.ewma(
+            values,
+            self._com,
+            int(self.adjust),
+            int(self.ignore_na),
+            int(self.min_periods),
+            self._deltas,
+            self._online_state(len(values), 3),
+        )
+        return self._wrap_online_result(result)
+
+    @Substitution(name="ewm")
+    @Appender(_doc_template)
+    @Appender(_bias_template)
+    def var(self, bias=False, *args, **kwargs):
+        """
+        Exponential weighted moving variance.
+        """
+        nv.validate_window_func("var", args, kwargs)
+        values = self._online_values()
+        result = libwindow.ewmcov(
+            values,
+            values,
+            self._com,
+            int(self.adjust),
+            int(self.ignore_na),
+            int(self.min_periods),
+            int(bias),
+            self._deltas,
+            self._online_state(len(values), 7),
+        )
+        return self._wrap_online_result(result)
+
+    def cov(self, other=None, pairwise=None, bias=False, **kwargs):
+        raise NotImplementedError("cov is not implemented for online ewm")
+
+    def corr(self, other=None, pairwise=None, **kwargs):
+        raise NotImplementedError("corr is not implemented for online ewm")
+
 
 # Helper Funcs
 
 
-def _flex_binary_moment(arg1, arg2, f, pairwise=False):
+def _flex_binary_moment(arg1, arg2, f, pairwise=False, f_frames=None, as_array=False):
+    """
+    Apply the binary moment ``f`` of two Series to the matching, or all
+    pairs of, columns of ``arg1`` and ``arg2``.
 
+    Parameters
+    ----------
+    arg1, arg2 : ndarray, Series or DataFrame
+    f : callable
+        Called as ``f(X, Y)`` on two Series with the same index.
+    pairwise : bool, default False
+    f_frames : callable, optional
+        Called as ``f_frames(X, Y)`` on two DataFrames with the same index to
+        compute the pairwise results of all their columns in one pass, as a
+        (columns of X, columns of Y, rows) array.
+    as_array : bool, default False
+        Return the pairwise results of two DataFrames as a (rows, columns
+        of arg1, columns of arg2) array instead of a MultiIndexed DataFrame.
+    """
     if not (
         isinstance(arg1, (np.ndarray, ABCSeries, ABCDataFrame))
         and isinstance(arg2, (np.ndarray, ABCSeries, ABCDataFrame))
@@ -2627,6 +3753,14 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
             "arguments to moment function must be of type "
             "np.ndarray/Series/DataFrame"
         )
+    if as_array and not (
+        pairwise is True
+        and isinstance(arg1, ABCDataFrame)
+        and isinstance(arg2, ABCDataFrame)
+    ):
+        raise ValueError(
+            "as_array is only supported for the pairwise results of DataFrames"
+        )
 
     if isinstance(arg1, (np.ndarray, ABCSeries)) and isinstance(
         arg2, (np.ndarray, ABCSeries)
@@ -2670,21 +3804,36 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
                             results[col] = f(X[col], Y[col])
                     return DataFrame(results, index=X.index, columns=res_columns)
             elif pairwise is True:
-                results = defaultdict(dict)
-                for i, k1 in enumerate(arg1.columns):
-                    for j, k2 in enumerate(arg2.columns):
-                        if j < i and arg2 is arg1:
-                            # Symmetric case
-                            results[i][j] = results[j][i]
-                        else:
-                            results[i][j] = f(
-                                *_prep_binary(arg1.iloc[:, i], arg2.iloc[:, j])
-                            )
-
                 from pandas import MultiIndex, concat
 
                 result_index = arg1.index.union(arg2.index)
-                if len(result_index):
+                if (
+                    f_frames is not None
+                    and len(result_index)
+                    and arg1.index.equals(arg2.index)
+                    and (arg2.columns.nlevels == 1 or as_array)
+                ):
+                    # all the pairs at once, (columns of arg1, columns of arg2,
+                    # rows) reordered to the rows of the result
+                    values = f_frames(arg1, arg2).transpose(2, 0, 1)
+                    if as_array:
+                        return values
+                    result = DataFrame(
+                        values.transpose(0, 2, 1).reshape(-1, len(arg1.columns)),
+                        index=MultiIndex.from_product([result_index, arg2.columns]),
+                        columns=arg1.columns,
+                    )
+                elif len(result_index):
+                    results = defaultdict(dict)
+                    for i, k1 in enumerate(arg1.columns):
+                        for j, k2 in enumerate(arg2.columns):
+                            if j < i and arg2 is arg1:
+                                # Symmetric case
+                                results[i][j] = results[j][i]
+                            else:
+                                results[i][j] = f(
+                                    *_prep_binary(arg1.iloc[:, i], arg2.iloc[:, j])
+                                )
 
                     # construct result frame
                     result = concat(
@@ -2725,6 +3874,13 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
                         dtype="float64",
                     )
 
+                if as_array:
+                    if not len(result_index):
+                        return np.empty((0, len(arg1.columns), len(arg2.columns)))
+                    return result.values.reshape(
+                        len(result_index), -1, len(arg1.columns)
+                    ).transpose(0, 2, 1)
+
                 # reset our index names to arg1 names
                 # reset our column names to arg2 names
                 # careful not to mutate the original names
@@ -2748,7 +3904,22 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
         return _flex_binary_moment(arg2, arg1, f)
 
 
+def _series_moment(f):
+    """
+    Wrap the binary moment ``f`` of two frames, returning a (columns of X,
+    columns of Y, rows) array, into the binary moment of two Series.
+    """
+    from pandas import Series
+
+    def _f(X, Y):
+        return Series(f(X, Y)[0, 0], index=X.index, name=get_op_result_name(X, Y))
+
+    return _f
+
+
 def _get_center_of_mass(comass, span, halflife, alpha):
+    if isinstance(halflife, (str, timedelta, np.timedelta64)):
+        raise ValueError("halflife can only be a timedelta if times is passed")
     valid_count = com.count_not_none(comass, span, halflife, alpha)
     if valid_count > 1:
         raise ValueError("comass, span, halflife, and alpha " "are mutually exclusive")
@@ -2776,6 +3947,54 @@ def _get_center_of_mass(comass, span, halflife, alpha):
     return float(comass)
 
 
+def _get_time_decay(obj, times, comass, span, halflife, alpha, adjust, axis):
+    """
+    Validate the ``times`` of an ewm and return the halflife as a Timedelta,
+    the times as a datetime64[ns] array and the number of halflifes elapsed
+    since the previous observation at each observation.
+    """
+    if com.count_not_none(comass, span, alpha) > 0:
+        raise ValueError("comass, span, and alpha cannot be passed with times")
+    if not adjust:
+        raise NotImplementedError("times is not supported with adjust=False")
+    if not isinstance(halflife, (str, timedelta, np.timedelta64)):
+        raise ValueError("halflife must be a timedelta when times is passed")
+    halflife = Timedelta(halflife)
+    if halflife <= Timedelta(0):
+        raise ValueError("halflife must satisfy: halflife > 0")
+
+    if isinstance(times, str):
+        if not isinstance(obj, ABCDataFrame):
+            raise ValueError("times can only be a column name for a DataFrame")
+        times = obj[times]
+    if not is_datetime64_any_dtype(times):
+        raise ValueError("times must be datetime64[ns] dtype")
+    times = np.asarray(times, dtype="M8[ns]")
+    if len(times) != obj.shape[axis]:
+        raise ValueError("times must be the same length as the object")
+    if isna(times).any():
+        raise ValueError("times must not contain NaT")
+
+    times_i8 = times.view(np.int64)
+    deltas = np.diff(times_i8, prepend=times_i8[:1])
+    if (deltas < 0).any():
+        raise ValueError("times must be monotonically increasing")
+    return halflife, times, deltas / float(halflife.value)
+
+
+def _check_new_rows(obj, new_rows):
+    """
+    Check that the rows an online window is moved to match its data.
+    """
+    if isinstance(obj, ABCDataFrame):
+        if not isinstance(new_rows, ABCDataFrame):
+            raise TypeError("new_rows must be a DataFrame")
+        if not new_rows.columns.equals(obj.columns):
+            raise ValueError("new_rows must have the same columns as the data")
+    elif not isinstance(new_rows, ABCSeries):
+        raise TypeError("new_rows must be a Series")
+
+
 def _offset(window, center):
     if not is_integer(window):
         window = len(window)
@@ -2803,6 +4022,141 @@ def _use_window(minp, window):
         return minp
 
 
+def _check_window_bounds(start, end, num_values):
+    """
+    Check the bounds of custom windows, which the kernels index with.
+    """
+    start = ensure_int64(start)
+    end = ensure_int64(end)
+    if len(start) != num_values or len(end) != num_values:
+        raise ValueError(
+            "start ({start}) and end ({end}) bounds must be the same length "
+            "as the object ({num_values})".format(
+                start=len(start), end=len(end), num_values=num_values
+            )
+        )
+    if (start < 0).any() or (start > end).any() or (end > num_values).any():
+        raise ValueError(
+            "window bounds must satisfy 0 <= start <= end <= {num_values}".format(
+                num_values=num_values
+            )
+        )
+    if (np.diff(start) < 0).any() or (np.diff(end) < 0).any():
+        raise ValueError("start and end bounds must be non-decreasing")
+    return start, end
+
+
+def _roll_columns(kernel, values, *args, **kwargs):
+    """
+    Call a libwindow kernel on the (columns, rows) array ``values``, on
+    ranges of its columns in parallel threads.
+    """
+    slices = parallel.split_columns(values.shape[1], values.shape[0])
+    results = parallel.run(
+        lambda slc: kernel(values[slc], *args, **kwargs), [(slc,) for slc in slices]
+    )
+    if len(results) == 1:
+        return results[0]
+    return np.concatenate(results)
+
+
+# the number of weights of a win_type spread over the period of an offset window,
+# whose widths are fractions of the period
+_OFFSET_WINDOW_POINTS = 1001
+_OFFSET_WINDOW_WIDTHS = {
+    "gaussian": ["std"],
+    "general_gaussian": ["width"],
+    "exponential": ["tau"],
+}
+
+_window_weights_cache = {}
+
+
+def _get_window_weights(win_type, size):
+    """
+    Return the weights of the ``win_type`` window of ``size`` points, which
+    are computed by scipy once for each window type and size.
+    """
+    key = (win_type, size)
+    try:
+        return _window_weights_cache[key]
+    except KeyError:
+        pass
+
+    import scipy.signal as sig
+
+    # GH #15662. `False` makes symmetric window, rather than periodic.
+    weights = sig.get_window(win_type, size, False).astype(float)
+    weights.flags.writeable = False
+    if len(_window_weights_cache) >= 128:
+        _window_weights_cache.clear()
+    _window_weights_cache[key] = weights
+    return weights
+
+
+_numba_apply_cache = {}
+
+
+def _is_numba_func(func):
+    """
+    Return whether ``func`` is compiled by numba, so that it can be called
+    from nopython code. numba is only imported for the objects it defines.
+    """
+    if not type(func).__module__.startswith("numba."):
+        return False
+
+    numba = import_optional_dependency(
+        "numba", raise_on_missing=False, on_version="warn"
+    )
+    if numba is None:
+        return False
+
+    from numba.core.ccallback import CFunc
+    from numba.core.dispatcher import Dispatcher
+
+    return isinstance(func, (Dispatcher, CFunc))
+
+
+def _get_numba_apply_func(func, nopython=True, nogil=False, parallel=False):
+    """
+    Return a numba function applying ``func`` to the windows over the rows
+    of a 2D (columns, rows) array, which is compiled once for each function
+    and options. ``func`` is compiled first if it is a Python function.
+    """
+    key = (func, nopython, nogil, parallel)
+    try:
+        return _numba_apply_cache[key]
+    except KeyError:
+        pass
+
+    numba = import_optional_dependency(
+        "numba", extra="numba is required to apply a function with engine='numba'."
+    )
+    if _is_numba_func(func):
+        numba_func = func
+    else:
+        numba_func = numba.jit(nopython=nopython, nogil=nogil)(func)
+
+    @numba.jit(nopython=nopython, nogil=nogil, parallel=parallel)
+    def roll_apply(values, start, end, minp, *args):
+        K, N = values.shape
+        output = np.empty((K, N))
+        for k in numba.prange(K):
+            for i in range(N):
+                window = values[k, start[i] : end[i]]
+                nobs = np.isfinite(window).sum()
+                if len(window) and nobs >= minp:
+                    output[k, i] = numba_func(window, *args)
+                else:
+                    output[k, i] = np.nan
+        return output
+
+    if len(_numba_apply_cache) >= 128:
+        _numba_apply_cache.clear()
+    _numba_apply_cache[key] = roll_apply
+    return roll_apply
+
+
 def _zsqrt(x):
     with np.errstate(all="ignore"):
         result = np.sqrt(x)
@@ -2,6 +2,7 @@
 
 import bz2
 import codecs
+from collections import deque
 import csv
 import gzip
 from http.client import HTTPException  # noqa
@@ -10,6 +11,8 @@ import lzma
 import mmap
 import os
 import pathlib
+import queue
+import sys
 from urllib.error import URLError  # noqa
 from urllib.parse import (  # noqa
     urlencode,
@@ -22,6 +25,7 @@ from urllib.parse import (  # noqa
 from urllib.request import pathname2url, urlopen
 import zipfile
 
+from pandas._config import get_option
 from pandas.errors import (  # noqa
     AbstractMethodError,
     DtypeWarning,
@@ -167,7 +171,7 @@ def is_gcs_url(url):
 
 
 def get_filepath_or_buffer(
-    filepath_or_buffer, encoding=None, compression=None, mode=None
+    filepath_or_buffer, encoding=None, compression=None, mode=None, prefetch=False
 ):
     """
     If the filepath_or_buffer is a url, translate and return the buffer.
@@ -180,6 +184,10 @@ def get_filepath_or_buffer(
     compression : {{'gzip', 'bz2', 'zip', 'xz', None}}, optional
     encoding : the encoding to use to decode bytes, default is 'utf-8'
     mode : str, optional
+    prefetch : boolean, default False
+        Whether the caller reads the returned buffer sequentially, in which
+        case it is read ahead on a background thread if the
+        ``io.prefetch_blocks`` option is set, see PrefetchReader.
 
     Returns
     -------
@@ -196,6 +204,11 @@ def get_filepath_or_buffer(
         if content_encoding == "gzip":
             # Override compression based on Content-Encoding header
             compression = "gzip"
+        # zip needs a seekable file, so it is not read ahead
+        if prefetch and compression != "zip":
+            reader, _ = _maybe_prefetch(req, True)
+            if reader is not req:
+                return reader, encoding, compression, True
         reader = BytesIO(req.read())
         req.close()
         return reader, encoding, compression, True
@@ -203,25 +216,30 @@ def get_filepath_or_buffer(
     if is_s3_url(filepath_or_buffer):
         from pandas.io import s3
 
-        return s3.get_filepath_or_buffer(
+        result = s3.get_filepath_or_buffer(
             filepath_or_buffer, encoding=encoding, compression=compression, mode=mode
         )
-
-    if is_gcs_url(filepath_or_buffer):
+    elif is_gcs_url(filepath_or_buffer):
         from pandas.io import gcs
 
-        return gcs.get_filepath_or_buffer(
+        result = gcs.get_filepath_or_buffer(
             filepath_or_buffer, encoding=encoding, compression=compression, mode=mode
         )
-
-    if isinstance(filepath_or_buffer, (str, bytes, mmap.mmap)):
+    elif isinstance(filepath_or_buffer, (str, bytes, mmap.mmap)):
         return _expand_user(filepath_or_buffer), None, compression, False
-
-    if not is_file_like(filepath_or_buffer):
+    elif not is_file_like(filepath_or_buffer):
         msg = "Invalid file path or buffer object type: {_type}"
         raise ValueError(msg.format(_type=type(filepath_or_buffer)))
+    else:
+        result = filepath_or_buffer, None, compression, False
 
-    return filepath_or_buffer, None, compression, False
+    if prefetch and result[2] != "zip":
+        filepath_or_buffer, encoding, compression, should_close = result
+        filepath_or_buffer, should_close = _maybe_prefetch(
+            filepath_or_buffer, should_close
+        )
+        result = filepath_or_buffer, encoding, compression, should_close
+    return result
 
 
 def file_path_to_url(path):
@@ -297,7 +315,13 @@ def _infer_compression(filepath_or_buffer, compression):
 
 
 def _get_handle(
-    path_or_buf, mode, encoding=None, compression=None, memory_map=False, is_text=True
+    path_or_buf,
+    mode,
+    encoding=None,
+    compression=None,
+    memory_map=False,
+    is_text=True,
+    compression_threads=None,
 ):
     """
     Get file handle for given path/buffer and mode.
@@ -318,6 +342,10 @@ def _get_handle(
     is_text : boolean, default True
         whether file/buffer is in text format (csv, json, etc.), or in binary
         mode (pickle, etc.)
+    compression_threads : int, optional
+        When writing with 'gzip', 'bz2' or 'xz' compression, the number of
+        threads compressing the output in parallel, see
+        ParallelCompressedWriter. By default compress in the calling thread.
 
     Returns
     -------
@@ -345,8 +373,19 @@ def _get_handle(
 
     if compression:
 
+        # Parallel Compression
+        if (
+            compression_threads is not None
+            and compression_threads > 1
+            and compression in ParallelCompressedWriter.compressors
+            and "w" in mode
+        ):
+            f = ParallelCompressedWriter(
+                path_or_buf, compression, threads=compression_threads
+            )
+
         # GZ Compression
-        if compression == "gzip":
+        elif compression == "gzip":
             if is_path:
                 f = gzip.open(path_or_buf, mode)
             else:
@@ -404,7 +443,11 @@ def _get_handle(
         handles.append(f)
 
     # Convert BytesIO or file objects passed with an encoding
-    if is_text and (compression or isinstance(f, need_text_wrapping)):
+    if is_text and (
+        compression
+        or isinstance(f, need_text_wrapping)
+        or (isinstance(f, PrefetchReader) and f.binary)
+    ):
         from io import TextIOWrapper
 
         f = TextIOWrapper(f, encoding=encoding, newline="")
@@ -448,6 +491,285 @@ class BytesZipFile(zipfile.ZipFile, BytesIO):  # type: ignore
         return self.fp is None
 
 
+class ParallelCompressedWriter:
+    """
+    Binary file-like object compressing its output in parallel.
+
+    The data written is cut into blocks of ``block_size`` bytes, and each
+    block is compressed as an independent gzip member, bz2 stream or xz
+    stream by a pool of threads (the compressors release the GIL). The
+    compressed blocks are written in order, so the result is a valid
+    multi-member file that the standard decompressors read as a whole. At
+    most ``2 * threads`` blocks are in flight at once.
+
+    Parameters
+    ----------
+    path_or_buf : str or file handle
+        Path or binary buffer to write the compressed data to.
+    compression : {'gzip', 'bz2', 'xz'}
+    threads : int
+        Number of compressing threads.
+    block_size : int, default 4 MiB
+        Number of uncompressed bytes per block.
+    """
+
+    compressors = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+    def __init__(self, path_or_buf, compression, threads, block_size=2 ** 22):
+        from concurrent.futures import ThreadPoolExecutor
+
+        if isinstance(path_or_buf, str):
+            self.fileobj = open(path_or_buf, "wb")
+            self._close_fileobj = True
+        else:
+            self.fileobj = path_or_buf
+            self._close_fileobj = False
+
+        self.compress = self.compressors[compression]
+        self.threads = threads
+        self.block_size = block_size
+        self.closed = False
+
+        self._buffer = bytearray()
+        self._pending = deque()
+        self._blocks = 0
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        with memoryview(data) as view, view.cast("B") as view:
+            nbytes = view.nbytes
+            pos = 0
+            while pos < nbytes:
+                size = min(self.block_size - len(self._buffer), nbytes - pos)
+                self._buffer += view[pos : pos + size]
+                pos += size
+                if len(self._buffer) >= self.block_size:
+                    self._submit()
+        return nbytes
+
+    def _submit(self):
+        self._pending.append(self._executor.submit(self.compress, self._buffer))
+        self._buffer = bytearray()
+        self._blocks += 1
+        while len(self._pending) > 2 * self.threads:
+            self.fileobj.write(self._pending.popleft().result())
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            # an empty input is still written as one (empty) block
+            if self._buffer or not self._blocks:
+                self._submit()
+            while self._pending:
+                self.fileobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown()
+            if self._close_fileobj:
+                self.fileobj.close()
+            self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class PrefetchReader(BaseIterator):
+    """
+    File-like object reading ahead of its consumer on a background thread.
+
+    ``handle`` is read in blocks of ``block_size`` by a background thread,
+    which keeps up to ``blocks`` blocks queued, so that slow (e.g. network)
+    reads overlap with the processing of the data already read. Only
+    sequential reading is supported.
+
+    Parameters
+    ----------
+    handle : file-like
+        Readable handle, in binary or text mode.
+    blocks : int, default 4
+        Maximum number of blocks read ahead.
+    block_size : int, default 1 MiB
+        Number of bytes, or characters in text mode, per read of ``handle``.
+    close_handle : bool, default True
+        Whether closing the reader closes ``handle`` as well.
+    """
+
+    def __init__(self, handle, blocks=4, block_size=2 ** 20, close_handle=True):
+        import threading
+
+        self.handle = handle
+        self.block_size = block_size
+        self.closed = False
+
+        self._close_handle = close_handle
+        # set from the first block, as the handle may be bytes or text
+        self._empty = None
+        self._newline = None
+        self._block = ()
+        self._pos = 0
+        self._eof = False
+        # raised again by every read once the background thread failed
+        self._error = None
+        self._queue = queue.Queue(maxsize=blocks)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._prefetch,
+            args=(handle, block_size, self._queue, self._stop),
+            daemon=True,
+        )
+        self._thread.start()
+
+    @staticmethod
+    def _prefetch(handle, block_size, read_ahead, stop):
+        # does not reference the reader, so that an unclosed reader can be
+        # garbage collected, which stops the thread
+        def put(item):
+            # wait for room in the queue, unless the reader is closed
+            while not stop.is_set():
+                try:
+                    read_ahead.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            while True:
+                block = handle.read(block_size)
+                if not put(block) or not block:
+                    return
+        except Exception as err:
+            # raised in the consumer when it gets there
+            put(err)
+
+    def _next_block(self):
+        if self._error is not None:
+            raise self._error
+        if self._eof:
+            return False
+        block = self._queue.get()
+        if isinstance(block, Exception):
+            self._error = block
+            raise block
+        if self._empty is None:
+            self._empty = block[:0]
+            self._newline = b"\n" if isinstance(block, bytes) else "\n"
+        if not block:
+            self._eof = True
+            return False
+        self._block = block
+        self._pos = 0
+        return True
+
+    @property
+    def binary(self):
+        """Whether the handle reads bytes, waits for the first block."""
+        if self._empty is None:
+            self._next_block()
+        return isinstance(self._empty, bytes)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def writable(self):
+        return False
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = sys.maxsize
+        if self._empty is None:
+            self._next_block()
+        chunks = []
+        while size > 0:
+            if self._pos >= len(self._block) and not self._next_block():
+                break
+            chunk = self._block[self._pos : self._pos + size]
+            self._pos += len(chunk)
+            size -= len(chunk)
+            chunks.append(chunk)
+        return self._empty.join(chunks)
+
+    read1 = read
+
+    def readline(self):
+        if self._empty is None:
+            self._next_block()
+        chunks = []
+        while True:
+            if self._pos >= len(self._block) and not self._next_block():
+                break
+            end = self._block.find(self._newline, self._pos)
+            if end == -1:
+                chunks.append(self._block[self._pos :])
+                self._pos = len(self._block)
+            else:
+                chunks.append(self._block[self._pos : end + 1])
+                self._pos = end + 1
+                break
+        return self._empty.join(chunks)
+
+    def __next__(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self.closed:
+            return
+        self._stop.set()
+        self._thread.join()
+        if self._close_handle:
+            self.handle.close()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self._stop.set()
+
+
+def _maybe_prefetch(filepath_or_buffer, should_close):
+    """
+    Wrap a readable handle in a PrefetchReader if the
+    ``io.prefetch_blocks`` option is set.
+
+    Returns the (possibly wrapped) handle and whether it should be closed.
+    Only the handles opened by pandas, which it closes, are read ahead:
+    handles passed by the user are left as they are, as reading ahead
+    would move them past the data parsed. Objects that are not file
+    iterators are left as they are too, for the checks the parsers do on
+    them.
+    """
+    blocks = get_option("io.prefetch_blocks")
+    if blocks <= 0 or not should_close or not (
+        hasattr(filepath_or_buffer, "read")
+        and callable(filepath_or_buffer.read)
+        and hasattr(filepath_or_buffer, "__next__")
+    ):
+        return filepath_or_buffer, should_close
+    return PrefetchReader(filepath_or_buffer, blocks), True
+
+
 class MMapWrapper(BaseIterator):
     """
     Wrapper for the Python's mmap class so that it can be properly read in
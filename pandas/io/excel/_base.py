@@ -612,6 +612,10 @@ class ExcelWriter(metaclass=abc.ABCMeta):
     # - Optional:
     #   - ``__init__(self, path, engine=None, **kwargs)`` --> always called
     #     with path as first argument.
+    #   - ``write_only`` and ``write_rows(self, rows, sheet_name=None,
+    #     startrow=0, startcol=0, freeze_panes=None)`` --> writers that must
+    #     receive their output in row order set ``write_only`` to True and
+    #     are passed rows of cells rather than individual cells.
 
     # You also need to register the class with ``register_writer()``.
     # Technically, ExcelWriter implementations don't need to subclass
@@ -640,6 +644,7 @@ class ExcelWriter(metaclass=abc.ABCMeta):
     book = None
     curr_sheet = None
     path = None
+    write_only = False
 
     @property
     @abc.abstractmethod
@@ -673,6 +678,40 @@ class ExcelWriter(metaclass=abc.ABCMeta):
         """
         pass
 
+    def write_rows(
+        self, rows, sheet_name=None, startrow=0, startcol=0, freeze_panes=None
+    ):
+        """
+        Write given formatted rows into an Excel sheet, in row order
+
+        Parameters
+        ----------
+        rows : generator
+            ExcelRow objects, each holding a run of consecutive cells in one
+            row of the Excel sheet. None values are left empty.
+        sheet_name : string, default None
+            Name of Excel sheet, if None, then use self.cur_sheet
+        startrow : upper left cell row to dump data frame
+        startcol : upper left cell column to dump data frame
+        freeze_panes: integer tuple of length 2
+            contains the bottom-most row and right-most column to freeze
+        """
+        from pandas.io.formats.excel import ExcelCell
+
+        cells = (
+            ExcelCell(row.row, row.col + i, val, row.style)
+            for row in rows
+            for i, val in enumerate(row.vals)
+            if val is not None
+        )
+        self.write_cells(
+            cells,
+            sheet_name,
+            startrow=startrow,
+            startcol=startcol,
+            freeze_panes=freeze_panes,
+        )
+
     @abc.abstractmethod
     def save(self):
         """
@@ -1,3 +1,5 @@
+from itertools import groupby
+from operator import attrgetter
 from typing import List
 
 import numpy as np
@@ -14,13 +16,22 @@ class _OpenpyxlWriter(ExcelWriter):
     engine = "openpyxl"
     supported_extensions = (".xlsx", ".xlsm")
 
-    def __init__(self, path, engine=None, mode="w", **engine_kwargs):
+    def __init__(self, path, engine=None, mode="w", write_only=False, **engine_kwargs):
         # Use the openpyxl module as the Excel writer.
         from openpyxl.workbook import Workbook
 
         super().__init__(path, mode=mode, **engine_kwargs)
 
-        if self.mode == "a":  # Load from existing workbook
+        if write_only and self.mode == "a":
+            raise ValueError("Append mode is not supported in write-only mode!")
+
+        # a write-only workbook streams each row to disk as it is appended
+        self.write_only = write_only
+        self._next_row = {}
+
+        if self.write_only:
+            self.book = Workbook(write_only=True)
+        elif self.mode == "a":  # Load from existing workbook
             from openpyxl import load_workbook
 
             book = load_workbook(self.path)
@@ -389,6 +400,81 @@ class _OpenpyxlWriter(ExcelWriter):
 
         return Protection(**protection_dict)
 
+    def write_rows(
+        self, rows, sheet_name=None, startrow=0, startcol=0, freeze_panes=None
+    ):
+        if not self.write_only:
+            return super().write_rows(
+                rows,
+                sheet_name,
+                startrow=startrow,
+                startcol=startcol,
+                freeze_panes=freeze_panes,
+            )
+
+        # Write the frame rows by appending them to a write-only worksheet.
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+
+        sheet_name = self._get_sheet_name(sheet_name)
+
+        if sheet_name in self.sheets:
+            wks = self.sheets[sheet_name]
+        else:
+            wks = self.book.create_sheet(title=sheet_name)
+            self.sheets[sheet_name] = wks
+            self._next_row[sheet_name] = 0
+
+            # panes can only be frozen before the first row is written
+            if _validate_freeze_panes(freeze_panes):
+                wks.freeze_panes = "{col}{row}".format(
+                    col=get_column_letter(freeze_panes[1] + 1), row=freeze_panes[0] + 1,
+                )
+
+        # keyed on the id of the style dict, which is shared by all the rows
+        # it applies to; the dict itself is kept alive alongside the kwargs
+        _style_cache = {}
+
+        for rownum, row_group in groupby(rows, key=attrgetter("row")):
+            rownum += startrow
+            next_row = self._next_row[sheet_name]
+            if rownum < next_row:
+                raise ValueError(
+                    "Rows of a write-only sheet must be written in order, "
+                    "row {row} has already been written".format(row=rownum)
+                )
+            for _ in range(rownum - next_row):
+                wks.append([])
+
+            values = []
+            for row in row_group:
+                style_kwargs = {}
+                if row.style:
+                    cached = _style_cache.get(id(row.style))
+                    if cached is None:
+                        cached = (row.style, self._convert_to_style_kwargs(row.style))
+                        _style_cache[id(row.style)] = cached
+                    style_kwargs = cached[1]
+
+                colnum = startcol + row.col
+                if len(values) < colnum + len(row.vals):
+                    values.extend([None] * (colnum + len(row.vals) - len(values)))
+
+                for i, val in enumerate(row.vals):
+                    if val is None:
+                        continue
+                    val, fmt = self._value_with_fmt(val)
+                    if fmt or style_kwargs:
+                        val = WriteOnlyCell(wks, value=val)
+                        if fmt:
+                            val.number_format = fmt
+                        for k, v in style_kwargs.items():
+                            setattr(val, k, v)
+                    values[colnum + i] = val
+
+            wks.append(values)
+            self._next_row[sheet_name] = rownum + 1
+
     def write_cells(
         self, cells, sheet_name=None, startrow=0, startcol=0, freeze_panes=None
     ):
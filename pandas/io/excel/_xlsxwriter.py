@@ -186,6 +186,9 @@ class _XlsxWriter(ExcelWriter):
         )
 
         self.book = xlsxwriter.Workbook(path, **engine_kwargs)
+        # in constant_memory mode xlsxwriter flushes each row to disk as soon
+        # as a later row is written, so cells must be written row by row
+        self.write_only = self.book.constant_memory
 
     def save(self):
         """
@@ -194,10 +197,7 @@ class _XlsxWriter(ExcelWriter):
 
         return self.book.close()
 
-    def write_cells(
-        self, cells, sheet_name=None, startrow=0, startcol=0, freeze_panes=None
-    ):
-        # Write the frame cells using xlsxwriter.
+    def _get_worksheet(self, sheet_name, freeze_panes):
         sheet_name = self._get_sheet_name(sheet_name)
 
         if sheet_name in self.sheets:
@@ -206,11 +206,56 @@ class _XlsxWriter(ExcelWriter):
             wks = self.book.add_worksheet(sheet_name)
             self.sheets[sheet_name] = wks
 
-        style_dict = {"null": None}
-
         if _validate_freeze_panes(freeze_panes):
             wks.freeze_panes(*(freeze_panes))
 
+        return wks
+
+    def write_rows(
+        self, rows, sheet_name=None, startrow=0, startcol=0, freeze_panes=None
+    ):
+        # Write the frame rows using xlsxwriter, converting each distinct
+        # row style only once.
+        wks = self._get_worksheet(sheet_name, freeze_panes)
+
+        # keyed on the id of the style dict, which is shared by all the rows
+        # it applies to; the dict itself is kept alive alongside the format
+        style_dict = {}
+
+        for row in rows:
+            rownum = startrow + row.row
+            colnum = startcol + row.col
+            for i, val in enumerate(row.vals):
+                if val is None:
+                    continue
+                val, fmt = self._value_with_fmt(val)
+
+                stylekey = (id(row.style), fmt)
+                if stylekey in style_dict:
+                    style = style_dict[stylekey][1]
+                else:
+                    if row.style is None and fmt is None:
+                        style = None
+                    else:
+                        style = self.book.add_format(
+                            _XlsxStyler.convert(row.style, fmt)
+                        )
+                    style_dict[stylekey] = (row.style, style)
+
+                if type(val) in (int, float):
+                    # skip the type dispatch of Worksheet.write
+                    wks.write_number(rownum, colnum + i, val, style)
+                else:
+                    wks.write(rownum, colnum + i, val, style)
+
+    def write_cells(
+        self, cells, sheet_name=None, startrow=0, startcol=0, freeze_panes=None
+    ):
+        # Write the frame cells using xlsxwriter.
+        wks = self._get_worksheet(sheet_name, freeze_panes)
+
+        style_dict = {"null": None}
+
         for cell in cells:
             val, fmt = self._value_with_fmt(cell.val)
 
@@ -9,7 +9,7 @@ import warnings
 import numpy as np
 
 from pandas.core.dtypes import missing
-from pandas.core.dtypes.common import is_float, is_scalar
+from pandas.core.dtypes.common import is_float, is_float_dtype, is_scalar
 from pandas.core.dtypes.generic import ABCMultiIndex, ABCPeriodIndex
 
 from pandas import Index
@@ -33,6 +33,24 @@ class ExcelCell:
         self.mergeend = mergeend
 
 
+class ExcelRow:
+    """
+    A run of consecutive cells in a single sheet row sharing one style.
+
+    Used by write-only ExcelWriters, which must receive their output in row
+    order. Cells whose value is None are left empty.
+    """
+
+    __fields__ = ("row", "col", "vals", "style")
+    __slots__ = __fields__
+
+    def __init__(self, row, col, vals, style=None):
+        self.row = row
+        self.col = col
+        self.vals = vals
+        self.style = style
+
+
 class CSSToExcelConverter:
     """A callable for converting CSS declarations to ExcelWriter styles
 
@@ -360,6 +378,8 @@ class ExcelFormatter:
 
     max_rows = 2 ** 20
     max_cols = 2 ** 14
+    # number of rows formatted at a time by get_formatted_rows
+    chunksize = 10000
 
     def __init__(
         self,
@@ -548,12 +568,12 @@ class ExcelFormatter:
         else:
             return self._format_regular_rows()
 
-    def _format_regular_rows(self):
+    def _format_regular_labels(self):
         has_aliases = isinstance(self.header, (tuple, list, np.ndarray, Index))
         if has_aliases or self.header:
             self.rowcounter += 1
 
-        # output index and index_label?
+        # output index_label?
         if self.index:
             # check aliases
             # if list only take first as this is not a MultiIndex
@@ -573,10 +593,20 @@ class ExcelFormatter:
             if index_label and self.header is not False:
                 yield ExcelCell(self.rowcounter - 1, 0, index_label, self.header_style)
 
+    def _regular_index_values(self):
+        index_values = self.df.index
+        if isinstance(self.df.index, ABCPeriodIndex):
+            index_values = self.df.index.to_timestamp()
+        return index_values
+
+    def _format_regular_rows(self):
+        for cell in self._format_regular_labels():
+            yield cell
+
+        # output index?
+        if self.index:
             # write index_values
-            index_values = self.df.index
-            if isinstance(self.df.index, ABCPeriodIndex):
-                index_values = self.df.index.to_timestamp()
+            index_values = self._regular_index_values()
 
             for idx, idxval in enumerate(index_values):
                 yield ExcelCell(self.rowcounter + idx, 0, idxval, self.header_style)
@@ -588,13 +618,11 @@ class ExcelFormatter:
         for cell in self._generate_body(coloffset):
             yield cell
 
-    def _format_hierarchical_rows(self):
+    def _format_hierarchical_labels(self):
         has_aliases = isinstance(self.header, (tuple, list, np.ndarray, Index))
         if has_aliases or self.header:
             self.rowcounter += 1
 
-        gcolidx = 0
-
         if self.index:
             index_labels = self.df.index.names
             # check for aliases
@@ -616,6 +644,13 @@ class ExcelFormatter:
                 for cidx, name in enumerate(index_labels):
                     yield ExcelCell(self.rowcounter - 1, cidx, name, self.header_style)
 
+    def _format_hierarchical_rows(self):
+        for cell in self._format_hierarchical_labels():
+            yield cell
+
+        gcolidx = 0
+
+        if self.index:
             if self.merge_cells:
                 # Format hierarchical rows as merged cells.
                 level_strs = self.df.index.format(
@@ -687,6 +722,105 @@ class ExcelFormatter:
             cell.val = self._format_value(cell.val)
             yield cell
 
+    def _format_values(self, values):
+        """
+        Format a 1-D sequence of values, vectorizing the common float case.
+        """
+        if is_float_dtype(values) and self.float_format is None:
+            arr = np.asarray(values)
+            result = arr.astype(object)
+            result[np.isnan(arr)] = self.na_rep
+            result[np.isposinf(arr)] = self.inf_rep
+            result[np.isneginf(arr)] = "-{inf}".format(inf=self.inf_rep)
+            return result.tolist()
+        return [self._format_value(val) for val in values]
+
+    def _hierarchical_index_columns(self):
+        """
+        Return a list of (values, is_start) pairs, one per index level.
+
+        When merging cells, ``is_start`` marks the first row of each span;
+        the remaining rows of a span are left empty. Otherwise it is None.
+        """
+        index = self.df.index
+        if not self.merge_cells:
+            return [
+                (index.get_level_values(level), None) for level in range(index.nlevels)
+            ]
+
+        is_start = np.zeros(len(index), dtype=bool)
+        is_start[:1] = True
+        columns = []
+        for levels, level_codes in zip(index.levels, index.codes):
+            level_codes = np.asarray(level_codes)
+            is_start[1:] |= level_codes[1:] != level_codes[:-1]
+            values = levels.take(
+                level_codes, allow_fill=levels._can_hold_na, fill_value=True
+            )
+            columns.append((values, is_start.copy()))
+        return columns
+
+    def get_formatted_rows(self):
+        """
+        Yield ExcelRows in sheet row order, for write-only ExcelWriters.
+
+        The body is formatted ``chunksize`` rows at a time, so memory use
+        does not grow with the length of the frame. Write-only writers
+        cannot merge cells, so merged header and index values are written
+        once, in the first cell of their span.
+        """
+        header_style = self.header_style
+
+        if isinstance(self.df.index, ABCMultiIndex):
+            labels = self._format_hierarchical_labels()
+        else:
+            labels = self._format_regular_labels()
+
+        cells = list(itertools.chain(self._format_header(), labels))
+        cells.sort(key=lambda cell: (cell.row, cell.col))
+        for cell in cells:
+            yield ExcelRow(
+                cell.row, cell.col, [self._format_value(cell.val)], header_style
+            )
+
+        index_columns = []
+        if self.index:
+            if isinstance(self.df.index, ABCMultiIndex):
+                index_columns = self._hierarchical_index_columns()
+            else:
+                index_columns = [(self._regular_index_values(), None)]
+        coloffset = len(index_columns)
+
+        series_list = [self.df.iloc[:, colidx] for colidx in range(len(self.columns))]
+        nrows = len(self.df)
+
+        for start in range(0, nrows, self.chunksize):
+            end = min(start + self.chunksize, nrows)
+
+            index_chunk = []
+            for values, is_start in index_columns:
+                formatted = self._format_values(values[start:end])
+                if is_start is not None:
+                    formatted = [
+                        val if keep else None
+                        for val, keep in zip(formatted, is_start[start:end])
+                    ]
+                index_chunk.append(formatted)
+            body_chunk = [
+                self._format_values(series.iloc[start:end]) for series in series_list
+            ]
+
+            index_rows = zip(*index_chunk) if index_chunk else itertools.repeat(())
+            body_rows = zip(*body_chunk) if body_chunk else itertools.repeat(())
+            for i, index_vals, body_vals in zip(
+                range(start, end), index_rows, body_rows
+            ):
+                row = self.rowcounter + i
+                if index_vals:
+                    yield ExcelRow(row, 0, index_vals, header_style)
+                if body_vals:
+                    yield ExcelRow(row, coloffset, body_vals)
+
     def write(
         self,
         writer,
@@ -730,13 +864,25 @@ class ExcelFormatter:
             writer = ExcelWriter(_stringify_path(writer), engine=engine)
             need_save = True
 
-        formatted_cells = self.get_formatted_cells()
-        writer.write_cells(
-            formatted_cells,
-            sheet_name,
-            startrow=startrow,
-            startcol=startcol,
-            freeze_panes=freeze_panes,
-        )
+        if writer.write_only and self.styler is not None:
+            raise ValueError("A Styler cannot be written with a write-only ExcelWriter")
+
+        if writer.write_only:
+            writer.write_rows(
+                self.get_formatted_rows(),
+                sheet_name,
+                startrow=startrow,
+                startcol=startcol,
+                freeze_panes=freeze_panes,
+            )
+        else:
+            formatted_cells = self.get_formatted_cells()
+            writer.write_cells(
+                formatted_cells,
+                sheet_name,
+                startrow=startrow,
+                startcol=startcol,
+                freeze_panes=freeze_panes,
+            )
         if need_save:
             writer.save()
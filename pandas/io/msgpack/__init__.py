@@ -12,8 +12,8 @@ class ExtType(namedtuple("ExtType", "code data")):
     def __new__(cls, code, data):
         if not isinstance(code, int):
             raise TypeError("code must be int")
-        if not isinstance(data, bytes):
-            raise TypeError("data must be bytes")
+        if not isinstance(data, (bytes, memoryview)):
+            raise TypeError("data must be bytes or memoryview")
         if not 0 <= code <= 127:
             raise ValueError("code must be 0~127")
         return super().__new__(cls, code, data)
@@ -22,7 +22,12 @@ class ExtType(namedtuple("ExtType", "code data")):
 import os  # noqa
 
 from pandas.io.msgpack._packer import Packer  # noqa
-from pandas.io.msgpack._unpacker import unpack, unpackb, Unpacker  # noqa
+from pandas.io.msgpack._unpacker import (  # noqa
+    unpack,
+    unpack_buffer,
+    unpackb,
+    Unpacker,
+)
 
 
 def pack(o, stream, **kwargs):
@@ -6,6 +6,7 @@ from cpython cimport (
     PyDict_CheckExact, PyDict_Check,
     PyTuple_Check, PyList_Check,
     PyCallable_Check,
+    PyBUF_SIMPLE, PyObject_GetBuffer, PyBuffer_Release, Py_buffer,
     PyUnicode_Check, PyBytes_Check,
     PyBytes_AsString,
     PyBytes_FromStringAndSize,
@@ -43,6 +44,10 @@ cdef extern from "../../src/msgpack/pack.h":
 
 cdef int DEFAULT_RECURSE_LIMIT=511
 
+# ext data at least this large is written straight to the stream by
+# Packer.dump rather than being copied into the internal buffer
+cdef size_t STREAM_EXT_THRESHOLD = 64 * 1024
+
 
 cdef class Packer:
     """
@@ -73,10 +78,14 @@ cdef class Packer:
     :param bool use_bin_type:
         Use bin type introduced in msgpack spec 2.0 for bytes.
         It also enable str8 type for unicode.
+
+    The data of an `ExtType` can be `bytes` or any C-contiguous object
+    supporting the buffer protocol, e.g. a memoryview on an ndarray.
     """
     cdef:
         msgpack_packer pk
         object _default
+        object _write
         object _bencoding
         object _berrors
         char *encoding
@@ -135,6 +144,7 @@ cdef class Packer:
             dict d
             size_t L
             int default_used = 0
+            Py_buffer view
 
         if nest_limit < 0:
             raise PackValueError("recursion limit exceeded.")
@@ -213,12 +223,22 @@ cdef class Packer:
             elif isinstance(o, ExtType):
                 # This should be before Tuple because ExtType is namedtuple.
                 longval = o.code
-                rawval = o.data
-                L = len(o.data)
-                if L > (2**32) - 1:
-                    raise ValueError("EXT data is too large")
-                ret = msgpack_pack_ext(&self.pk, longval, L)
-                ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+                PyObject_GetBuffer(o.data, &view, PyBUF_SIMPLE)
+                try:
+                    L = view.len
+                    if L > (2**32) - 1:
+                        raise ValueError("EXT data is too large")
+                    ret = msgpack_pack_ext(&self.pk, longval, L)
+                    if ret == 0:
+                        if (self._write is not None and
+                                L >= STREAM_EXT_THRESHOLD):
+                            self._flush()
+                            self._write(o.data)
+                        else:
+                            ret = msgpack_pack_raw_body(
+                                &self.pk, <char*>view.buf, L)
+                finally:
+                    PyBuffer_Release(&view)
             elif PyTuple_Check(o) or PyList_Check(o):
                 L = len(o)
                 if L > (2**32) - 1:
@@ -248,6 +268,31 @@ cdef class Packer:
             self.pk.length = 0
             return buf
 
+    def dump(self, object obj, object stream):
+        """
+        Pack `obj` and write it to `stream`.
+
+        Large ext type data are handed to ``stream.write`` as they are
+        rather than being copied into the internal buffer first.
+        """
+        cdef int ret
+        self._write = stream.write
+        try:
+            ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
+            if ret == -1:
+                raise MemoryError
+            elif ret:  # should not happen.
+                raise TypeError
+            self._flush()
+        finally:
+            self._write = None
+            self.pk.length = 0
+
+    cdef _flush(self):
+        if self.pk.length:
+            self._write(PyBytes_FromStringAndSize(self.pk.buf, self.pk.length))
+            self.pk.length = 0
+
     def pack_ext_type(self, typecode, data):
         msgpack_pack_ext(&self.pk, typecode, len(data))
         msgpack_pack_raw_body(&self.pk, data, len(data))
@@ -29,6 +29,7 @@ cdef extern from "../../src/msgpack/unpack.h":
         bint has_pairs_hook  # call object_hook with k-v pairs
         PyObject* list_hook
         PyObject* ext_hook
+        PyObject* ext_buffer
         char *encoding
         char *unicode_errors
         Py_ssize_t max_str_len
@@ -61,6 +62,7 @@ cdef inline init_ctx(unpack_context *ctx,
     unpack_init(ctx)
     ctx.user.use_list = use_list
     ctx.user.object_hook = ctx.user.list_hook = <PyObject*>NULL
+    ctx.user.ext_buffer = <PyObject*>NULL
     ctx.user.max_str_len = max_str_len
     ctx.user.max_bin_len = max_bin_len
     ctx.user.max_array_len = max_array_len
@@ -163,6 +165,74 @@ def unpackb(object packed, object object_hook=None, object list_hook=None,
         raise UnpackValueError("Unpack failed: error = {ret}".format(ret=ret))
 
 
+def unpack_buffer(object packed, object object_hook=None,
+                  object list_hook=None, bint use_list=1, encoding=None,
+                  unicode_errors="strict", object_pairs_hook=None,
+                  ext_hook=ExtType,
+                  Py_ssize_t max_str_len=2147483647,  # 2**32-1
+                  Py_ssize_t max_bin_len=2147483647,
+                  Py_ssize_t max_array_len=2147483647,
+                  Py_ssize_t max_map_len=2147483647,
+                  Py_ssize_t max_ext_len=2147483647):
+    """
+    Iterate over the objects packed one after another in `packed`.
+
+    `packed` can be any object supporting the buffer protocol, e.g. `bytes`
+    or `mmap.mmap`. Unlike :func:`unpackb`, the data of ext types are not
+    copied: `ext_hook` receives a memoryview on `packed`, which keeps
+    `packed` alive (and, for a memory map, open) while it is referenced.
+
+    See :class:`Unpacker` for options.
+    """
+    cdef:
+        unpack_context ctx
+        size_t off = 0
+        int ret
+
+        char* buf
+        Py_ssize_t buf_len
+        char* cenc = NULL
+        char* cerr = NULL
+        Py_buffer view
+
+    # a memoryview rather than `packed` itself, as not every buffer (mmap)
+    # supports slicing into a view
+    packed = memoryview(packed)
+
+    if encoding is not None:
+        if isinstance(encoding, unicode):
+            encoding = encoding.encode('ascii')
+        cenc = PyBytes_AsString(encoding)
+
+    if unicode_errors is not None:
+        if isinstance(unicode_errors, unicode):
+            unicode_errors = unicode_errors.encode('ascii')
+        cerr = PyBytes_AsString(unicode_errors)
+
+    init_ctx(&ctx, object_hook, object_pairs_hook, list_hook, ext_hook,
+             use_list, cenc, cerr,
+             max_str_len, max_bin_len, max_array_len, max_map_len, max_ext_len)
+    ctx.user.ext_buffer = <PyObject*>packed
+
+    PyObject_GetBuffer(packed, &view, PyBUF_SIMPLE)
+    try:
+        buf = <char*>view.buf
+        buf_len = view.len
+        while <Py_ssize_t> off < buf_len:
+            ret = unpack_construct(&ctx, buf, buf_len, &off)
+            if ret == 1:
+                obj = unpack_data(&ctx)
+                unpack_init(&ctx)
+                yield obj
+            elif ret == 0:
+                raise OutOfData("Unpack failed: incomplete input")
+            else:
+                raise UnpackValueError(
+                    "Unpack failed: error = {ret}".format(ret=ret))
+    finally:
+        PyBuffer_Release(&view)
+
+
 def unpack(object stream, object object_hook=None, object list_hook=None,
            bint use_list=1, encoding=None, unicode_errors="strict",
            object_pairs_hook=None,
@@ -40,6 +40,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from datetime import date, datetime, timedelta
 from io import BytesIO
+import mmap
 import os
 import warnings
 
@@ -88,7 +89,12 @@ from pandas.core.internals import BlockManager, _safe_reshape, make_block
 from pandas.core.sparse.api import SparseDataFrame, SparseSeries
 
 from pandas.io.common import _stringify_path, get_filepath_or_buffer
-from pandas.io.msgpack import ExtType, Packer as _Packer, Unpacker as _Unpacker
+from pandas.io.msgpack import (
+    ExtType,
+    Packer as _Packer,
+    Unpacker as _Unpacker,
+    unpack_buffer as _unpack_buffer,
+)
 
 # until we can pass this into our conversion functions,
 # this is pretty hacky
@@ -135,7 +141,7 @@ def to_msgpack(path_or_buf, *args, **kwargs):
 
     def writer(fh):
         for a in args:
-            fh.write(pack(a, **kwargs))
+            Packer(**kwargs).dump(a, fh)
 
     path_or_buf = _stringify_path(path_or_buf)
     if isinstance(path_or_buf, str):
@@ -153,7 +159,7 @@ def to_msgpack(path_or_buf, *args, **kwargs):
         writer(path_or_buf)
 
 
-def read_msgpack(path_or_buf, encoding="utf-8", iterator=False, **kwargs):
+def read_msgpack(path_or_buf, encoding="utf-8", iterator=False, copy=True, **kwargs):
     """
     Load msgpack pandas object from the specified
     file path.
@@ -180,6 +186,13 @@ def read_msgpack(path_or_buf, encoding="utf-8", iterator=False, **kwargs):
     encoding : Encoding for decoding msgpack str type
     iterator : boolean, if True, return an iterator to the unpacker
                (default is False)
+    copy : bool, default True
+        If False, uncompressed numeric data are not copied out of the input
+        but returned as views on it: on a memory map of the file for a
+        file path, or on the bytes otherwise. Data viewing ``bytes`` are
+        read-only; writing to data viewing a file does not modify the file.
+
+        .. versionadded:: 0.25.1
 
     Returns
     -------
@@ -201,8 +214,13 @@ def read_msgpack(path_or_buf, encoding="utf-8", iterator=False, **kwargs):
 
     path_or_buf, _, _, should_close = get_filepath_or_buffer(path_or_buf)
     if iterator:
+        if not copy:
+            raise ValueError("copy=False is not supported with iterator=True")
         return Iterator(path_or_buf)
 
+    if not copy:
+        return _read_msgpack_views(path_or_buf, should_close, encoding, **kwargs)
+
     def read(fh):
         unpacked_obj = list(unpack(fh, encoding=encoding, **kwargs))
         if len(unpacked_obj) == 1:
@@ -240,6 +258,39 @@ def read_msgpack(path_or_buf, encoding="utf-8", iterator=False, **kwargs):
     raise ValueError("path_or_buf needs to be a string file path or file-like")
 
 
+def _read_msgpack_views(path_or_buf, should_close, encoding, **kwargs):
+    """
+    read_msgpack without copying numeric data out of the input buffer
+    """
+    if isinstance(path_or_buf, str):
+        try:
+            with open(path_or_buf, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size:
+                    # copy-on-write, so the data can be modified in memory
+                    buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_COPY)
+                else:
+                    buf = b""
+        except FileNotFoundError:
+            msg = "File b'{}' does not exist".format(path_or_buf)
+            raise FileNotFoundError(msg)
+    elif isinstance(path_or_buf, bytes):
+        buf = path_or_buf
+    elif hasattr(path_or_buf, "read") and callable(path_or_buf.read):
+        buf = path_or_buf.read()
+        if should_close:
+            try:
+                path_or_buf.close()
+            except IOError:
+                pass
+    else:
+        raise ValueError("path_or_buf needs to be a string file path or file-like")
+
+    unpacked_obj = list(unpack_buffer(buf, encoding=encoding, **kwargs))
+    if len(unpacked_obj) == 1:
+        return unpacked_obj[0]
+    return unpacked_obj
+
+
 dtype_dict = {
     21: np.dtype("M8[ns]"),
     "datetime64[ns]": np.dtype("M8[ns]"),
@@ -318,8 +369,8 @@ def convert(values):
         v = v.tostring()
         return ExtType(0, blosc.compress(v, typesize=dtype.itemsize))
 
-    # ndarray (on original dtype)
-    return ExtType(0, v.tostring())
+    # ndarray (on original dtype), packed straight from its buffer
+    return ExtType(0, memoryview(v))
 
 
 def unconvert(values, dtype, compress=None):
@@ -376,6 +427,10 @@ def unconvert(values, dtype, compress=None):
                 )
                 # fall through to copying `np.fromstring`
 
+    if isinstance(values, memoryview):
+        # read without copying, see read_msgpack(copy=False)
+        return np.frombuffer(values, dtype=dtype)
+
     # Copy the bytes into a numpy array.
     buf = np.frombuffer(values, dtype=dtype)
     buf = buf.copy()  # required to not mutate the original data
@@ -797,6 +852,33 @@ def unpack(
     )
 
 
+def unpack_buffer(
+    packed,
+    object_hook=decode,
+    list_hook=None,
+    use_list=False,
+    encoding="utf-8",
+    unicode_errors="strict",
+    object_pairs_hook=None,
+    ext_hook=ExtType,
+):
+    """
+    Unpack the objects in a buffer, return an iterator
+    Note: numeric data are views on the buffer rather than copies
+    """
+
+    return _unpack_buffer(
+        packed,
+        object_hook=object_hook,
+        list_hook=list_hook,
+        use_list=use_list,
+        encoding=encoding,
+        unicode_errors=unicode_errors,
+        object_pairs_hook=object_pairs_hook,
+        ext_hook=ext_hook,
+    )
+
+
 class Packer(_Packer):
     def __init__(
         self,
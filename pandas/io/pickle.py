@@ -1,16 +1,23 @@
 """ pickle compat """
 from io import BytesIO
 import pickle
+import struct
 import warnings
 
 from numpy.lib.format import read_array
 
-from pandas.compat import pickle_compat as pc
+from pandas.compat import PY38, pickle_compat as pc
 
 from pandas.io.common import _get_handle, _stringify_path
 
 
-def to_pickle(obj, path, compression="infer", protocol=pickle.HIGHEST_PROTOCOL):
+def to_pickle(
+    obj,
+    path,
+    compression="infer",
+    protocol=pickle.HIGHEST_PROTOCOL,
+    compression_threads=None,
+):
     """
     Pickle (serialize) object to file.
 
@@ -36,6 +43,13 @@ def to_pickle(obj, path, compression="infer", protocol=pickle.HIGHEST_PROTOCOL):
 
         .. [1] https://docs.python.org/3/library/pickle.html
         .. versionadded:: 0.21.0
+    compression_threads : int, optional
+        Number of threads compressing the output in parallel, for 'gzip',
+        'bz2' and 'xz' compression. The output is then written as a sequence
+        of independently compressed blocks, which any reader of the format
+        decompresses as a whole. By default compress in a single thread.
+
+        .. versionadded:: 0.25.1
 
     See Also
     --------
@@ -69,11 +83,19 @@ def to_pickle(obj, path, compression="infer", protocol=pickle.HIGHEST_PROTOCOL):
     >>> os.remove("./dummy.pkl")
     """
     path = _stringify_path(path)
-    f, fh = _get_handle(path, "wb", compression=compression, is_text=False)
+    f, fh = _get_handle(
+        path,
+        "wb",
+        compression=compression,
+        is_text=False,
+        compression_threads=compression_threads,
+    )
     if protocol < 0:
         protocol = pickle.HIGHEST_PROTOCOL
     try:
-        f.write(pickle.dumps(obj, protocol=protocol))
+        # write the pickle to the (compressed) handle as it is produced,
+        # rather than building the whole pickle in memory first
+        pickle.dump(obj, f, protocol=protocol)
     finally:
         f.close()
         for _f in fh:
@@ -164,6 +186,150 @@ def read_pickle(path, compression="infer"):
             _f.close()
 
 
+# layout of a shared memory block written by to_shared_memory: a header
+# holding the length of the pickle and the number of out-of-band buffers, the
+# (offset, length) of each buffer, the pickle itself and finally the buffers,
+# each aligned to a cache line
+_SHM_HEADER = struct.Struct("<QQ")
+_SHM_BUFFER = struct.Struct("<QQ")
+_SHM_ALIGNMENT = 64
+
+
+def _align(offset):
+    return -(-offset // _SHM_ALIGNMENT) * _SHM_ALIGNMENT
+
+
+def to_shared_memory(obj, name=None):
+    """
+    Pickle (serialize) object into a new shared memory block.
+
+    The object is pickled with protocol 5, so that array data (the values of
+    blocks, categorical codes, the data and mask of an IntegerArray, ...) is
+    copied once, straight into the shared memory block, rather than being
+    serialized into the pickle itself.
+
+    .. versionadded:: 0.25.1
+
+    Parameters
+    ----------
+    obj : any object
+        Any python object.
+    name : str, optional
+        Name of the shared memory block to create. By default a unique name
+        is generated.
+
+    Returns
+    -------
+    multiprocessing.shared_memory.SharedMemory
+        The new shared memory block. The caller is responsible for closing
+        and unlinking it once it is no longer needed.
+
+    See Also
+    --------
+    read_shared_memory : Load a pickled object from a shared memory block.
+
+    Notes
+    -----
+    Requires Python 3.8 or newer.
+
+    Examples
+    --------
+    >>> from pandas.io.pickle import to_shared_memory, read_shared_memory
+    >>> original_df = pd.DataFrame({"foo": range(5), "bar": range(5, 10)})
+    >>> shm = to_shared_memory(original_df)
+
+    In another process, the block can be attached to by name
+
+    >>> from multiprocessing.shared_memory import SharedMemory
+    >>> other = SharedMemory(shm.name)
+    >>> read_shared_memory(other).equals(original_df)
+    True
+
+    Objects read from a block must be released before it is closed
+
+    >>> other.close()
+    >>> shm.close()
+    >>> shm.unlink()
+    """
+    if not PY38:
+        raise NotImplementedError("to_shared_memory requires Python 3.8 or newer")
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    buffers = [buf.raw() for buf in buffers]
+
+    offsets = []
+    offset = _align(_SHM_HEADER.size + _SHM_BUFFER.size * len(buffers) + len(data))
+    for buf in buffers:
+        offsets.append(offset)
+        offset = _align(offset + buf.nbytes)
+
+    shm = SharedMemory(name=name, create=True, size=offset)
+    try:
+        _SHM_HEADER.pack_into(shm.buf, 0, len(data), len(buffers))
+        pos = _SHM_HEADER.size
+        for buf, start in zip(buffers, offsets):
+            _SHM_BUFFER.pack_into(shm.buf, pos, start, buf.nbytes)
+            pos += _SHM_BUFFER.size
+        shm.buf[pos : pos + len(data)] = data
+        for buf, start in zip(buffers, offsets):
+            shm.buf[start : start + buf.nbytes] = buf
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+
+    return shm
+
+
+def read_shared_memory(shm):
+    """
+    Load pickled pandas object (or any object) from a shared memory block.
+
+    Array data is not copied: the arrays of the returned object are views on
+    the shared memory block, which must therefore remain open for as long as
+    the object is in use.
+
+    .. warning::
+
+       Loading pickled data received from untrusted sources can be
+       unsafe. See `here <https://docs.python.org/3/library/pickle.html>`__.
+
+    .. versionadded:: 0.25.1
+
+    Parameters
+    ----------
+    shm : multiprocessing.shared_memory.SharedMemory
+        Shared memory block written by :func:`to_shared_memory`.
+
+    Returns
+    -------
+    unpickled : same type as object stored in the block
+
+    See Also
+    --------
+    to_shared_memory : Pickle an object into a new shared memory block.
+
+    Notes
+    -----
+    Requires Python 3.8 or newer.
+    """
+    if not PY38:
+        raise NotImplementedError("read_shared_memory requires Python 3.8 or newer")
+
+    length, nbuffers = _SHM_HEADER.unpack_from(shm.buf, 0)
+    pos = _SHM_HEADER.size
+    buffers = []
+    for _ in range(nbuffers):
+        start, nbytes = _SHM_BUFFER.unpack_from(shm.buf, pos)
+        buffers.append(shm.buf[start : start + nbytes])
+        pos += _SHM_BUFFER.size
+
+    return pickle.loads(shm.buf[pos : pos + length], buffers=buffers)
+
+
 # compat with sparse pickle / unpickle
 
 
@@ -57,6 +57,7 @@ class TestPDApi(Base):
         "ExcelWriter",
         "Float64Index",
         "Grouper",
+        "GroupPlan",
         "HDFStore",
         "Index",
         "Int64Index",
@@ -216,7 +217,7 @@ class TestPDApi(Base):
 
 class TestApi(Base):
 
-    allowed = ["types", "extensions"]
+    allowed = ["types", "extensions", "indexers"]
 
     def test_api(self):
 
@@ -236,3 +236,37 @@ def test_cython_with_timestamp_and_nat(op, data):
 
     result = df.groupby("a").aggregate(op)
     tm.assert_frame_equal(expected, result)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1.5, np.nan, -2.0, 4.0, np.nan, 7.25, 0.5],
+        [3, -1, 4, 1, -5, 9, 2],
+        [True, False, True, True, False, False, True],
+        np.array([1, 2, 3, 4, 5, 6, 7], dtype="float32"),
+    ],
+)
+@pytest.mark.parametrize("observed", [True, False])
+def test_cython_agg_multiple_reductions(values, observed):
+    # several reductions of a column are computed in one pass
+    funcs = ["count", "sum", "mean", "std", "var", "min", "max", "first", "last"]
+    key = pd.Categorical(list("aabbaab"), categories=list("abc"))
+    df = DataFrame({"key": key, "x": values, "y": values[::-1]})
+    grouped = df.groupby("key", observed=observed)
+
+    result = grouped.agg(funcs)
+    expected = pd.concat(
+        [
+            pd.concat([getattr(grouped[col], func)() for func in funcs], axis=1)
+            for col in ["x", "y"]
+        ],
+        keys=["x", "y"],
+        axis=1,
+    )
+    expected.columns = pd.MultiIndex.from_product([["x", "y"], funcs])
+    tm.assert_frame_equal(result, expected)
+
+    result = grouped["x"].agg([np.sum, np.mean, max])
+    expected = grouped["x"].agg(["sum", "mean", "max"])
+    tm.assert_frame_equal(result, expected)
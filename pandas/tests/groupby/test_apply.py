@@ -114,6 +114,102 @@ def test_fast_apply():
     assert not mutated
 
 
+def test_fast_apply_series():
+    # a function returning scalars is applied to a view sliding over the
+    # sorted series
+    N = 1000
+    labels = np.random.randint(0, 200, size=N)
+    s = Series(np.random.randn(N), index=np.arange(N) * 2)
+
+    g = s.groupby(labels)
+    grouper = g.grouper
+
+    splitter = grouper._get_splitter(g._selected_obj, axis=g.axis)
+    group_keys = grouper._get_group_keys()
+
+    values, mutated = splitter.fast_apply(lambda x: x.index[-1], group_keys)
+
+    expected = [x.index[-1] for _, x in g]
+    assert values == expected
+
+
+def test_apply_series_keeps_groups():
+    # the groups, or their index or values, kept by the function are not
+    # changed by the next groups
+    s = Series([1.0, 2.0, 3.0, 4.0, 5.0], index=list("abcde"))
+    key = [1, 1, 2, 2, 3]
+    expected = [s.iloc[:2].rename(1), s.iloc[2:4].rename(2), s.iloc[4:].rename(3)]
+
+    kept = []
+    s.groupby(key).apply(lambda x: kept.append(x))
+    assert len(kept) == 3
+    for result, group in zip(kept, expected):
+        tm.assert_series_equal(result, group)
+
+    kept = []
+    result = s.groupby(key).apply(lambda x: kept.append(x.index) or x.sum())
+    tm.assert_series_equal(result, Series([3.0, 7.0, 5.0], index=[1, 2, 3]))
+    assert len(kept) == 3
+    for result, group in zip(kept, expected):
+        tm.assert_index_equal(result, group.index)
+
+    kept = []
+    s.groupby(key).apply(lambda x: kept.append(x.values) or len(x))
+    assert [list(values) for values in kept] == [[1.0, 2.0], [3.0, 4.0], [5.0]]
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        Index([4, 8, 4, 1, 8, 2, 3]),
+        Index(list("abcdaef")),
+        pd.RangeIndex(7),
+        pd.date_range("2019-01-01", periods=7),
+        MultiIndex.from_arrays([range(7), range(7)]),
+    ],
+)
+def test_apply_series_scalar(index):
+    s = Series([1.0, np.nan, 3.0, 4.0, 5.0, 6.0, 7.0], index=index)
+    key = [1, 2, 2, 1, 3, 1, 2]
+
+    def f(x):
+        # the group is a Series like any other
+        return (x.name, tuple(x.index), x.index.is_unique, x.sum(), len(x))
+
+    result = s.groupby(key).apply(f)
+    expected = Series(
+        [f(s.iloc[[0, 3, 5]].rename(1)), f(s.iloc[[1, 2, 6]].rename(2))]
+        + [f(s.iloc[[4]].rename(3))],
+        index=Index([1, 2, 3]),
+    )
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda x: x.values,
+        lambda x: x.head(1),
+        lambda x: setattr(x, "index", range(len(x))) or x.index[-1],
+        lambda x: x.fillna(0, inplace=True) or x.sum(),
+    ],
+    ids=["values", "head", "set_index", "inplace"],
+)
+def test_apply_series_falls_back(func):
+    # functions that return views of the groups or modify them are applied
+    # to a new Series for each group
+    s = Series([1.0, np.nan, 3.0, 4.0, 5.0])
+    key = [1, 1, 2, 3, 3]
+
+    result = s.groupby(key).apply(func)
+    expected = s.groupby(key).apply(lambda x: func(x.copy()))
+    if result.dtype == object:
+        for res, exp in zip(result, expected):
+            tm.assert_almost_equal(res, exp)
+    else:
+        tm.assert_series_equal(result, expected)
+
+
 @pytest.mark.parametrize(
     "df, group_names",
     [
@@ -11,6 +11,7 @@ from pandas.errors import UnsupportedFunctionCall
 import pandas as pd
 from pandas import DataFrame, Index, MultiIndex, Series, Timestamp, date_range, isna
 import pandas.core.nanops as nanops
+from pandas.core.util import parallel
 from pandas.util import _test_decorators as td, testing as tm
 
 
@@ -467,6 +468,71 @@ def test_idxmin_idxmax_returns_int_types(func, values):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("func", ["idxmin", "idxmax"])
+@pytest.mark.parametrize("skipna", [True, False])
+def test_idxmin_idxmax_missing_values(func, skipna):
+    df = pd.DataFrame(
+        {
+            "key": ["a", "a", "a", "b", "b", "c", "c"],
+            "floats": [1.0, np.nan, 3.0, np.nan, np.nan, 2.0, 2.0],
+            "dates": pd.to_datetime(
+                ["2019", "NaT", "2018", "2017", "2016", "2015", "NaT"]
+            ),
+            "ints": [3, 1, 3, 2, 5, 7, 7],
+        },
+        index=list("pqrstuv"),
+    )
+    grouped = df.groupby("key")
+
+    result = getattr(grouped, func)(skipna=skipna)
+    expected = pd.DataFrame(
+        {
+            col: grouped[col].apply(lambda x: getattr(x, func)(skipna=skipna))
+            for col in ["floats", "dates", "ints"]
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+    result = getattr(grouped["floats"], func)(skipna=skipna)
+    tm.assert_series_equal(result, expected["floats"])
+
+
+@pytest.mark.parametrize("func", ["idxmin", "idxmax"])
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([3, 9, 5, 2 ** 63, 2 ** 63 + 1, 2 ** 63 - 1], dtype="uint64"),
+        np.array([1 + 2j, 3 - 1j, 2 + 0j, 1j, -1j, 0j]),
+    ],
+)
+def test_idxmin_idxmax_uint64_complex(func, values):
+    df = pd.DataFrame({"key": [1, 1, 1, 2, 2, 2], "v": values}, index=list("pqrstu"))
+    grouped = df.groupby("key")
+
+    result = getattr(grouped["v"], func)()
+    expected = grouped["v"].apply(lambda x: getattr(x, func)())
+    tm.assert_series_equal(result, expected)
+
+    result = getattr(grouped, func)()
+    tm.assert_frame_equal(result, expected.to_frame())
+
+
+def test_idxmin_idxmax_falls_back_to_apply():
+    # object values and the other axis are applied to each group
+    df = pd.DataFrame({"key": [1, 1, 2], "a": [1, 5, 2], "b": [4, 2, 6]})
+    grouped = df.groupby("key")
+
+    result = grouped.idxmax(axis=1)
+    expected = grouped.apply(lambda x: x.idxmax(axis=1))
+    tm.assert_series_equal(result, expected)
+
+    # object columns are dropped as nuisance columns
+    df["c"] = ["x", "y", "z"]
+    result = df.groupby("key").idxmax()
+    expected = grouped.idxmax()
+    tm.assert_frame_equal(result, expected)
+
+
 def test_fill_consistency():
 
     # GH9221
@@ -552,6 +618,8 @@ def scipy_sem(*args, **kwargs):
         ("last", lambda x: x.iloc[-1]),
         ("count", np.size),
         pytest.param("sem", scipy_sem, marks=td.skip_if_no_scipy),
+        ("skew", Series.skew),
+        ("kurt", Series.kurt),
     ],
 )
 def test_ops_general(op, targop):
@@ -563,6 +631,71 @@ def test_ops_general(op, targop):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("op", ["skew", "kurt"])
+def test_skew_kurt(op):
+    np.random.seed(1234)
+    df = DataFrame(
+        {
+            "key": np.random.randint(0, 20, 300),
+            "floats": np.random.randn(300),
+            "missing": np.random.choice([np.nan, 1.0, 2.5, 7.0], 300),
+            "ints": np.random.randint(0, 5, 300),
+        }
+    )
+    # too few values, or no deviations from the mean
+    df.loc[df.key == 3, "missing"] = np.nan
+    df.loc[df.key == 4, "ints"] = 2
+
+    result = getattr(df.groupby("key"), op)()
+    expected = df.groupby("key").apply(lambda x: getattr(x.drop(columns="key"), op)())
+    tm.assert_frame_equal(result, expected)
+
+    result = getattr(df.groupby("key")["missing"], op)()
+    tm.assert_series_equal(result, expected["missing"])
+
+    result = getattr(df.groupby("key"), op)(skipna=False)
+    expected = df.groupby("key").apply(
+        lambda x: getattr(x.drop(columns="key"), op)(skipna=False)
+    )
+    tm.assert_frame_equal(result, expected)
+
+    # a large mean does not swamp the deviations from it
+    result = getattr((df["floats"] + 1e9).groupby(df["key"]), op)()
+    expected = getattr(df["floats"].groupby(df["key"]), op)()
+    tm.assert_series_equal(result, expected)
+
+
+def test_weighted_mean():
+    df = DataFrame(
+        {
+            "key": ["a", "a", "a", "b", "b", "c"],
+            "x": [1.0, 2.0, np.nan, 4.0, 5.0, 6.0],
+            "y": [1, 2, 3, 4, 5, 6],
+            "w": [1.0, 3.0, 2.0, np.nan, 1.0, 0.0],
+        }
+    )
+    grouped = df.groupby("key")
+    index = Index(["a", "b", "c"], name="key")
+
+    result = grouped.weighted_mean("w")
+    expected = DataFrame(
+        {"x": [7 / 4, 5.0, np.nan], "y": [13 / 6, 5.0, np.nan]}, index=index
+    )
+    tm.assert_frame_equal(result, expected)
+
+    result = grouped["x"].weighted_mean(df["w"])
+    tm.assert_series_equal(result, expected["x"])
+
+    # a Series is aligned, other weights are taken in order
+    weights = Series([1, 1, 1, 1, 3, 1], index=df.index[::-1])
+    result = grouped[["x", "y"]].weighted_mean(weights)
+    expected = grouped[["x", "y"]].weighted_mean(np.array([1, 3, 1, 1, 1, 1]))
+    tm.assert_frame_equal(result, expected)
+
+    with pytest.raises(ValueError, match="same length"):
+        grouped.weighted_mean([1, 2])
+
+
 def test_max_nan_bug():
     raw = """,Date,app,File
 -04-23,2013-04-23 00:00:00,,log080001.log
@@ -971,6 +1104,21 @@ def test_nunique():
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("n_values", [3, 1000])
+@pytest.mark.parametrize("dropna", [True, False])
+def test_nunique_many_values(n_values, dropna):
+    # few values are marked in a table of all the (group, value) pairs,
+    # many in a hash table
+    np.random.seed(1234)
+    s = Series(np.random.randint(0, n_values, 1000).astype(float))
+    s[::7] = np.nan
+    key = np.random.randint(0, 20, 1000)
+
+    result = s.groupby(key).nunique(dropna=dropna)
+    expected = s.groupby(key).apply(Series.nunique, dropna=dropna)
+    tm.assert_series_equal(result, expected)
+
+
 def test_nunique_with_object():
     # GH 11077
     data = pd.DataFrame(
@@ -1238,6 +1386,62 @@ def test_quantile(interpolation, a_vals, b_vals, q):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("interpolation", ["linear", "lower", "midpoint"])
+def test_quantile_array(interpolation):
+    # several quantiles are computed together, within each group
+    df = DataFrame(
+        {
+            "key": ["a", "b", "a", "b", "a", "b", "a"],
+            "A": [1.0, 5.0, np.nan, 2.0, 4.0, 8.0, 3.0],
+            "B": [4, 3, 2, 1, 7, 6, 5],
+        }
+    )
+    q = [0.1, 0.5, 0.8]
+    result = df.groupby("key").quantile(q, interpolation=interpolation)
+
+    expected = pd.concat(
+        [
+            df[df.key == key][["A", "B"]].quantile(q, interpolation=interpolation)
+            for key in ["a", "b"]
+        ],
+        keys=["a", "b"],
+    )
+    expected.index.names = ["key", None]
+    tm.assert_frame_equal(result, expected)
+
+    result = df.groupby("key")["A"].quantile(q, interpolation=interpolation)
+    tm.assert_series_equal(result, expected["A"])
+
+
+def test_quantile_array_level_names():
+    # the levels are reordered by position, whatever their names
+    df = DataFrame({0: [1, 1, 2, 2, 2], 1: [0, 0, 0, 1, 1], "x": np.arange(5.0)})
+    q = [0.5, 1.0]
+    for keys in [[1, 0], [0, 0]]:
+        grouped = df.groupby([df[key] for key in keys])["x"]
+        result = grouped.quantile(q)
+        expected = grouped.apply(lambda x: x.quantile(q))
+        tm.assert_series_equal(result, expected)
+
+
+def test_quantile_missing_group_values():
+    # rows without a group are excluded
+    df = DataFrame({"key": ["a", "a", "b", np.nan, "b"], "val": [1.0, 2, 3, 100, 5]})
+    result = df.groupby("key").quantile([0.5, 1])
+    expected = DataFrame(
+        {"val": [1.5, 2.0, 4.0, 5.0]},
+        index=MultiIndex.from_product([["a", "b"], [0.5, 1.0]], names=["key", None]),
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("q", [-0.1, 1.1, [0.5, 2]])
+def test_quantile_out_of_bounds_q_raises(q):
+    df = DataFrame({"key": ["a", "b"], "val": [1.0, 2.0]})
+    with pytest.raises(ValueError, match="q must be between 0 and 1"):
+        df.groupby("key").quantile(q)
+
+
 def test_quantile_raises():
     df = pd.DataFrame(
         [["foo", "a"], ["foo", "b"], ["foo", "c"]], columns=["key", "val"]
@@ -1333,3 +1537,39 @@ def test_groupby_mean_no_overflow():
         }
     )
     assert df.groupby("user")["connections"].mean()["A"] == 3689348814740003840
+
+
+@pytest.mark.parametrize(
+    "how",
+    [
+        "sum",
+        "prod",
+        "min",
+        "max",
+        "mean",
+        "median",
+        "var",
+        "first",
+        "last",
+        "ohlc",
+        "cumsum",
+        "cummin",
+    ],
+)
+def test_num_threads(how, monkeypatch):
+    # the columns of each block are split between the threads
+    monkeypatch.setattr(parallel, "_MIN_CHUNK_SIZE", 1)
+
+    df = DataFrame(np.random.randn(100, 7))
+    df[[1, 4]] = df[[1, 4]].mask(df[[1, 4]] > 0.5)
+    df["ints"] = np.arange(100)
+    df["dates"] = date_range("2000", periods=100)
+    df["ints2"] = df["ints"] * 2
+    if how == "ohlc":
+        df = df.drop(columns="dates")
+    key = np.arange(100) % 7
+
+    expected = getattr(df.groupby(key), how)()
+    with pd.option_context("compute.num_threads", 3):
+        result = getattr(df.groupby(key), how)()
+    tm.assert_frame_equal(result, expected)
@@ -1860,3 +1860,53 @@ def test_groupby_groups_in_BaseGrouper():
     result = df.groupby(["beta", pd.Grouper(level="alpha")])
     expected = df.groupby(["beta", "alpha"])
     assert result.groups == expected.groups
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        [1, 1, 2, 5, 5, 5],
+        [0.5, 0.5, 1.5, 1.5, 2.0, 3.0],
+        list("aabbbc"),
+        pd.date_range("2000", periods=3, tz="US/Eastern").repeat(2),
+        [np.nan, 1.0, 1.0, 2.0, 2.0, 3.0],
+        pd.DatetimeIndex([pd.NaT, "2000", "2000", "2001", "2001", "2002"]),
+        [3, 3, 2, 2, 1, 1],
+    ],
+)
+@pytest.mark.parametrize("sort", [True, False])
+def test_groupby_presorted_keys(keys, sort, monkeypatch):
+    # keys sorted in increasing order are factorized from their runs
+    from pandas.core.groupby import grouper
+
+    df = DataFrame({"key": keys, "x": np.arange(6.0), "y": list("abcdef")})
+    key = df["key"]
+
+    def results():
+        grouped = df.groupby(key, sort=sort)
+        return [
+            grouped.sum(),
+            grouped.x.agg(lambda x: x.iloc[-1]),
+            grouped.apply(lambda g: g.x.max()),
+            grouped.cumcount(),
+            grouped.y.first(),
+            [(name, g) for name, g in grouped],
+        ]
+
+    result = results()
+    monkeypatch.setattr(grouper, "_factorize_presorted", lambda values: None)
+    expected = results()
+
+    for res, exp in zip(result[:-1], expected[:-1]):
+        tm.assert_equal(res, exp)
+    for (res_name, res), (exp_name, exp) in zip(result[-1], expected[-1]):
+        assert res_name == exp_name
+        tm.assert_frame_equal(res, exp)
+
+
+def test_groupby_presorted_groups_do_not_share_memory():
+    df = DataFrame({"key": [1, 1, 2], "x": [1.0, 2.0, 3.0]})
+    expected = df.copy()
+    for _, group in df.groupby("key"):
+        group.values[:] = 0
+    tm.assert_frame_equal(df, expected)
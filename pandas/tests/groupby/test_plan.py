@@ -0,0 +1,80 @@
+""" test grouping by a GroupPlan """
+
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import DataFrame, Index, Series, date_range
+import pandas.util.testing as tm
+
+
+class TestGroupPlan:
+    @pytest.fixture
+    def df(self):
+        return DataFrame(
+            {"key": list("abab"), "k2": [1, 1, 2, 1], "x": [1.0, 2.0, 3.0, 4.0]}
+        )
+
+    @pytest.mark.parametrize("by", ["key", ["key", "k2"]])
+    @pytest.mark.parametrize("sort", [True, False])
+    def test_plan_matches_keys(self, df, by, sort):
+        plan = pd.GroupPlan(df, by, sort=sort)
+        for func in ["sum", "mean", "cumsum", "cumcount", "size"]:
+            result = getattr(df.groupby(plan), func)()
+            expected = getattr(df.groupby(by, sort=sort), func)()
+            tm.assert_equal(result, expected)
+
+        result = df.groupby(plan).apply(lambda g: g.x.max())
+        expected = df.groupby(by, sort=sort).apply(lambda g: g.x.max())
+        tm.assert_series_equal(result, expected)
+
+        result = df.groupby(plan, as_index=False).x.sum()
+        expected = df.groupby(by, sort=sort, as_index=False).x.sum()
+        tm.assert_frame_equal(result, expected)
+
+    def test_plan_reused(self, df):
+        plan = pd.GroupPlan(df, "key")
+        assert plan.ngroups == 2
+        tm.assert_numpy_array_equal(plan.codes, np.array([0, 1, 0, 1], dtype="int64"))
+        tm.assert_index_equal(plan.result_index, Index(["a", "b"], name="key"))
+
+        other = DataFrame({"y": [1, 2, 3, 4]})
+        result = other.groupby(plan).sum()
+        expected = DataFrame({"y": [4, 6]}, index=Index(["a", "b"], name="key"))
+        tm.assert_frame_equal(result, expected)
+
+        result = (df["x"] * 2).groupby(plan).sum()
+        expected = Series([8.0, 12.0], index=expected.index, name="x")
+        tm.assert_series_equal(result, expected)
+
+    def test_plan_axis_mismatch(self, df):
+        plan = pd.GroupPlan(df, "key")
+        msg = "the axis of the object differs from that of the GroupPlan"
+        with pytest.raises(ValueError, match=msg):
+            df.iloc[:2].groupby(plan)
+        with pytest.raises(ValueError, match="axis"):
+            df.groupby(plan, axis=1)
+
+    def test_plan_invalid(self, df):
+        with pytest.raises(TypeError, match="You have to supply one of"):
+            pd.GroupPlan(df)
+
+        df.index = date_range("2000-01-01", periods=4, freq="D")
+        with pytest.raises(NotImplementedError):
+            pd.GroupPlan(df, pd.Grouper(freq="2D"))
+
+    def test_plan_conflicting_arguments(self, df):
+        plan = pd.GroupPlan(df, "key")
+        with pytest.raises(ValueError, match="sort=False conflicts"):
+            df.groupby(plan, sort=False)
+        with pytest.raises(ValueError, match="observed=True conflicts"):
+            df.groupby(plan, observed=True)
+        with pytest.raises(ValueError, match="level cannot be passed"):
+            df.groupby(plan, level=0)
+
+        # the defaults of groupby leave the settings of the plan
+        plan = pd.GroupPlan(df, "key", sort=False, observed=True)
+        grouped = df.groupby(plan, sort=True, observed=False)
+        assert not grouped.sort
+        assert grouped.observed
+        tm.assert_frame_equal(grouped.sum(), df.groupby("key", sort=False).sum())
@@ -1001,3 +1001,73 @@ def test_ffill_not_in_axis(func, key, val):
     expected = df
 
     assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("periods", [1, 2, -1, 0])
+@pytest.mark.parametrize("dtype", ["int64", "int32", "float32", "float64"])
+def test_diff(periods, dtype):
+    df = DataFrame(
+        {
+            "key": ["a", "b", "a", "a", "b", np.nan, "b", "a"],
+            "A": np.array([1, 4, 9, 16, 25, 36, 49, 64], dtype=dtype),
+            "B": np.array([3, 1, 4, 1, 5, 9, 2, 6], dtype=dtype),
+        }
+    )
+    grouped = df.groupby("key")
+
+    result = grouped.diff(periods)
+    expected = grouped.apply(lambda x: x[["A", "B"]].diff(periods))
+    tm.assert_frame_equal(result, expected)
+
+    result = grouped["A"].diff(periods)
+    expected = grouped["A"].apply(lambda x: x.diff(periods))
+    tm.assert_series_equal(result, expected)
+
+
+def test_diff_falls_back_to_apply():
+    # non-numeric columns are differenced group by group
+    df = DataFrame(
+        {
+            "key": ["a", "b", "a", "b"],
+            "A": date_range("2019", periods=4),
+            "B": [1.0, 2.0, 4.0, 8.0],
+        }
+    )
+    result = df.groupby("key").diff()
+    expected = DataFrame(
+        {
+            "A": pd.to_timedelta([np.nan, np.nan, "2D", "2D"]),
+            "B": [np.nan, np.nan, 3.0, 6.0],
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_pct_change_missing_keys():
+    # rows without a group are not compared with each other
+    df = DataFrame({"key": ["a", np.nan, "a", np.nan], "vals": [1.0, 2.0, 3.0, 4.0]})
+    result = df.groupby("key")["vals"].pct_change()
+    expected = Series([np.nan, np.nan, 2.0, np.nan], name="vals")
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("method", ["ffill", "bfill"])
+@pytest.mark.parametrize("limit", [None, 1])
+def test_fillna_method(method, limit):
+    df = DataFrame(
+        {
+            "key": ["a", "b", "a", "b", "a", "b", "a"],
+            "A": [1.0, np.nan, np.nan, 2.0, np.nan, np.nan, 3.0],
+            "B": ["x", np.nan, np.nan, "y", np.nan, "z", np.nan],
+            "C": pd.date_range("2019", periods=7, tz="US/Eastern"),
+        }
+    )
+    df.loc[[1, 2, 4], "C"] = pd.NaT
+    grouped = df.groupby("key")
+
+    result = grouped.fillna(method=method, limit=limit)
+    expected = grouped.apply(lambda x: x.fillna(method=method, limit=limit))
+    tm.assert_frame_equal(result, expected.drop(columns="key"))
+
+    result = getattr(grouped, method)(limit=limit)
+    tm.assert_frame_equal(result, expected.drop(columns="key"))
@@ -9,7 +9,14 @@ from itertools import product
 import numpy as np
 import pytest
 
-from pandas import DataFrame, MultiIndex, Series, date_range
+from pandas import (
+    Categorical,
+    CategoricalIndex,
+    DataFrame,
+    MultiIndex,
+    Series,
+    date_range,
+)
 from pandas.util import testing as tm
 
 
@@ -78,3 +85,43 @@ def test_series_groupby_value_counts(df, keys, bins, n, m):
         # have to sort on index because of unstable sort on values
         left, right = map(rebuild_index, (left, right))  # xref GH9212
         tm.assert_series_equal(left.sort_index(), right.sort_index())
+
+
+@pytest.mark.parametrize("n_values", [3, 100])
+def test_series_groupby_value_counts_many_values(n_values):
+    # few values are counted in a table of all the (group, value) pairs,
+    # many in a hash table
+    np.random.seed(1234)
+    df = DataFrame(
+        {
+            "key": np.random.randint(0, 10, 200),
+            "value": np.random.randint(0, n_values, 200).astype(float),
+        }
+    )
+    df.loc[::7, "value"] = np.nan
+
+    for normalize, sort, ascending, dropna in product((False, True), repeat=4):
+        kwargs = dict(
+            normalize=normalize, sort=sort, ascending=ascending, dropna=dropna
+        )
+        left = df.groupby("key")["value"].value_counts(**kwargs)
+        right = df.groupby("key")["value"].apply(Series.value_counts, **kwargs)
+        right.index.names = ["key", "value"]
+        tm.assert_series_equal(left.sort_index(), right.sort_index())
+
+
+def test_series_groupby_value_counts_unobserved_categories():
+    df = DataFrame(
+        {
+            "key": Categorical(["a", "a", "b"], categories=["a", "b", "c"]),
+            "value": [1, 1, 2],
+        }
+    )
+    result = df.groupby("key")["value"].value_counts()
+    index = MultiIndex(
+        levels=[CategoricalIndex(["a", "b", "c"]), [1, 2]],
+        codes=[[0, 1], [0, 1]],
+        names=["key", "value"],
+    )
+    expected = Series([2, 1], index=index, name="value")
+    tm.assert_series_equal(result, expected)
@@ -19,12 +19,13 @@ AGG_FUNCTIONS = [
     "median",
     "mean",
     "skew",
+    "kurt",
     "mad",
     "std",
     "var",
     "sem",
 ]
-AGG_FUNCTIONS_WITH_SKIPNA = ["skew", "mad"]
+AGG_FUNCTIONS_WITH_SKIPNA = ["skew", "kurt", "mad"]
 
 df_whitelist = [
     "quantile",
@@ -35,6 +36,7 @@ df_whitelist = [
     "idxmin",
     "tshift",
     "skew",
+    "kurt",
     "plot",
     "hist",
     "dtypes",
@@ -59,6 +61,7 @@ s_whitelist = [
     "idxmin",
     "tshift",
     "skew",
+    "kurt",
     "plot",
     "hist",
     "dtype",
@@ -296,6 +299,8 @@ def test_tab_completion(mframe):
         "all",
         "shift",
         "skew",
+        "kurt",
+        "weighted_mean",
         "take",
         "tshift",
         "pct_change",
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
-from pandas import DataFrame
+from pandas import DataFrame, MultiIndex, date_range, read_excel
+import pandas.util.testing as tm
 from pandas.util.testing import ensure_clean
 
 from pandas.io.excel import ExcelWriter, _OpenpyxlWriter
@@ -101,3 +103,61 @@ def test_write_append_mode(ext, mode, expected):
 
         for index, cell_value in enumerate(expected):
             assert wb2.worksheets[index]["A1"].value == cell_value
+
+
+def test_write_only_append_mode_raises(ext):
+    msg = "Append mode is not supported in write-only mode!"
+
+    with ensure_clean(ext) as f:
+        with pytest.raises(ValueError, match=msg):
+            ExcelWriter(f, engine="openpyxl", mode="a", write_only=True)
+
+
+@pytest.mark.parametrize("merge_cells", [True, False])
+def test_write_only_matches_default_writer(ext, merge_cells):
+    index = MultiIndex.from_product([["a", "b"], [1, 2, 3]], names=["x", "y"])
+    df = DataFrame(
+        {
+            "A": [1.5, np.nan, np.inf, -np.inf, 0.0, 2.5],
+            "B": date_range("2019-01-01", periods=6),
+            "C": list("uvwxyz"),
+        },
+        index=index,
+    )
+
+    with ensure_clean(ext) as expected_path, ensure_clean(ext) as path:
+        with ExcelWriter(expected_path, engine="openpyxl") as writer:
+            df.to_excel(writer, "first", merge_cells=merge_cells)
+            df.to_excel(writer, "second", startrow=2, merge_cells=merge_cells)
+
+        with ExcelWriter(path, engine="openpyxl", write_only=True) as writer:
+            assert writer.write_only
+            df.to_excel(writer, "first", merge_cells=merge_cells)
+            df.to_excel(writer, "second", startrow=2, merge_cells=merge_cells)
+
+        for sheet_name in ["first", "second"]:
+            expected = read_excel(expected_path, sheet_name, header=None)
+            result = read_excel(path, sheet_name, header=None)
+            tm.assert_frame_equal(result, expected)
+
+
+def test_write_only_rows_out_of_order_raises(ext):
+    df = DataFrame({"A": [1, 2]})
+
+    with ensure_clean(ext) as f:
+        with ExcelWriter(f, engine="openpyxl", write_only=True) as writer:
+            df.to_excel(writer, "Sheet1")
+            msg = "Rows of a write-only sheet must be written in order"
+            with pytest.raises(ValueError, match=msg):
+                df.to_excel(writer, "Sheet1")
+
+
+def test_write_only_styler_raises(ext):
+    pytest.importorskip("jinja2")
+    styler = DataFrame({"A": [1, 2]}).style.highlight_max()
+
+    with ensure_clean(ext) as f:
+        with ExcelWriter(f, engine="openpyxl", write_only=True) as writer:
+            msg = "A Styler cannot be written with a write-only ExcelWriter"
+            with pytest.raises(ValueError, match=msg):
+                styler.to_excel(writer, "Sheet1")
@@ -1,8 +1,10 @@
 import warnings
 
+import numpy as np
 import pytest
 
-from pandas import DataFrame
+from pandas import DataFrame, MultiIndex, date_range, read_excel
+import pandas.util.testing as tm
 from pandas.util.testing import ensure_clean
 
 from pandas.io.excel import ExcelWriter
@@ -62,3 +64,34 @@ def test_write_append_mode_raises(ext):
     with ensure_clean(ext) as f:
         with pytest.raises(ValueError, match=msg):
             ExcelWriter(f, engine="xlsxwriter", mode="a")
+
+
+@pytest.mark.parametrize("merge_cells", [True, False])
+def test_constant_memory_matches_default_writer(ext, merge_cells):
+    pytest.importorskip("xlrd")
+
+    index = MultiIndex.from_product([["a", "b"], [1, 2, 3]], names=["x", "y"])
+    df = DataFrame(
+        {
+            "A": [1.5, np.nan, np.inf, -np.inf, 0.0, 2.5],
+            "B": date_range("2019-01-01", periods=6),
+            "C": list("uvwxyz"),
+        },
+        index=index,
+    )
+
+    with ensure_clean(ext) as expected_path, ensure_clean(ext) as path:
+        with ExcelWriter(expected_path, engine="xlsxwriter") as writer:
+            df.to_excel(writer, "first", merge_cells=merge_cells)
+            df.to_excel(writer, "second", startrow=2, merge_cells=merge_cells)
+
+        options = {"constant_memory": True}
+        with ExcelWriter(path, engine="xlsxwriter", options=options) as writer:
+            assert writer.write_only
+            df.to_excel(writer, "first", merge_cells=merge_cells)
+            df.to_excel(writer, "second", startrow=2, merge_cells=merge_cells)
+
+        for sheet_name in ["first", "second"]:
+            expected = read_excel(expected_path, sheet_name, header=None)
+            result = read_excel(path, sheet_name, header=None)
+            tm.assert_frame_equal(result, expected)
@@ -1,4 +1,5 @@
 import array
+from io import BytesIO
 
 import pandas.io.msgpack as msgpack
 from pandas.io.msgpack import ExtType
@@ -61,3 +62,30 @@ def test_extension_type():
     s = msgpack.packb(obj, default=default)
     obj2 = msgpack.unpackb(s, ext_hook=ext_hook)
     assert obj == obj2
+
+
+def test_pack_ext_type_buffer():
+    # any contiguous buffer can be packed as ext type data
+    data = array.array("d", [1.1, 2.2, 3.3])
+    expected = msgpack.packb(ExtType(42, tobytes(data)))
+    assert msgpack.packb(ExtType(42, memoryview(data))) == expected
+
+
+def test_packer_dump():
+    obj = [42, ExtType(42, b"A" * 10), ExtType(42, memoryview(b"B" * 2 ** 20))]
+    buf = BytesIO()
+    msgpack.Packer().dump(obj, buf)
+    assert buf.getvalue() == msgpack.packb(obj)
+
+
+def test_unpack_buffer():
+    objs = [42, b"hello", ExtType(42, b"ABC")]
+    packed = b"".join(msgpack.packb(obj) for obj in objs)
+
+    result = list(msgpack.unpack_buffer(packed))
+    assert result == objs
+
+    # ext type data are views on the packed buffer
+    data = result[2].data
+    assert isinstance(data, memoryview)
+    assert data.obj is packed
@@ -1,10 +1,15 @@
 """
 Tests for the pandas.io.common functionalities
 """
-from io import StringIO
+import bz2
+import gzip
+from io import BytesIO, StringIO
+import lzma
 import mmap
 import os
+import time
 
+import numpy as np
 import pytest
 
 from pandas.compat import is_platform_windows
@@ -353,3 +358,153 @@ class TestMMapWrapper:
             df.to_csv(path)
             with pytest.raises(ValueError, match="Unknown engine"):
                 pd.read_csv(path, engine="pyt")
+
+
+class TestParallelCompressedWriter:
+    @pytest.mark.parametrize(
+        "compression,decompress",
+        [("gzip", gzip.decompress), ("bz2", bz2.decompress), ("xz", lzma.decompress)],
+    )
+    @pytest.mark.parametrize("size", [0, 10, 1000, 4096])
+    def test_round_trip(self, compression, decompress, size):
+        data = os.urandom(size // 2) + bytes(size - size // 2)
+        buf = BytesIO()
+
+        with icom.ParallelCompressedWriter(
+            buf, compression, threads=2, block_size=100
+        ) as writer:
+            # writes smaller and larger than a block
+            writer.write(data[:7])
+            writer.write(data[7:])
+
+        assert not buf.closed
+        assert decompress(buf.getvalue()) == data
+
+    def test_get_handle(self):
+        data = np.arange(10000).tobytes()
+
+        with tm.ensure_clean() as path:
+            f, handles = icom._get_handle(
+                path, "wb", compression="gzip", is_text=False, compression_threads=2
+            )
+            assert isinstance(f, icom.ParallelCompressedWriter)
+            f.write(data)
+            for handle in handles:
+                handle.close()
+
+            with gzip.open(path, "rb") as fh:
+                assert fh.read() == data
+
+
+class SlowReader:
+    """A file-like whose reads take time, like a remote file."""
+
+    def __init__(self, data, delay=0.01):
+        self.buf = BytesIO(data) if isinstance(data, bytes) else StringIO(data)
+        self.delay = delay
+        self.reads = 0
+        self.closed = False
+
+    def read(self, size=-1):
+        time.sleep(self.delay)
+        self.reads += 1
+        return self.buf.read(size)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.buf)
+
+    def close(self):
+        self.closed = True
+
+
+class TestPrefetchReader:
+    @pytest.mark.parametrize("data", [b"a\nbc\n\ndef", "a\nbc\n\ndef", b""])
+    def test_read(self, data):
+        with icom.PrefetchReader(SlowReader(data), blocks=2, block_size=3) as reader:
+            assert reader.read(0) == data[:0]
+            assert reader.read(1) == data[:1]
+            assert reader.read(4) == data[1:5]
+            assert reader.read() == data[5:]
+            assert reader.read() == data[:0]
+
+    @pytest.mark.parametrize("data", [b"a\nbc\n\ndef", "a\nbc\n\ndef\n"])
+    def test_readline(self, data):
+        lines = data.splitlines(keepends=True)
+        with icom.PrefetchReader(SlowReader(data), blocks=2, block_size=3) as reader:
+            assert reader.readline() == lines[0]
+            assert list(reader) == lines[1:]
+            assert reader.readline() == data[:0]
+
+    def test_reads_ahead(self):
+        handle = SlowReader(b"x" * 100, delay=0)
+        reader = icom.PrefetchReader(handle, blocks=2, block_size=10)
+
+        # the blocks read ahead, plus one waiting for room in the queue
+        for _ in range(100):
+            if handle.reads == 3:
+                break
+            time.sleep(0.01)
+        time.sleep(0.05)
+        assert handle.reads == 3
+
+        assert reader.read(25) == b"x" * 25
+        reader.close()
+        assert handle.closed
+
+    def test_close_handle(self):
+        handle = SlowReader(b"x" * 100)
+        reader = icom.PrefetchReader(handle, close_handle=False)
+        reader.close()
+        assert reader.closed
+        assert not handle.closed
+
+    def test_error(self):
+        class Failing(SlowReader):
+            def read(self, size=-1):
+                raise OSError("connection reset")
+
+        with icom.PrefetchReader(Failing(b"")) as reader:
+            with pytest.raises(OSError, match="connection reset"):
+                reader.read()
+            # the error is raised again by the next reads
+            with pytest.raises(OSError, match="connection reset"):
+                reader.read()
+            with pytest.raises(OSError, match="connection reset"):
+                reader.readline()
+
+    @pytest.mark.parametrize("engine", ["c", "python"])
+    @pytest.mark.parametrize("binary", [True, False])
+    def test_read_csv(self, engine, binary):
+        expected = pd.DataFrame({"a": range(1000), "b": ["x", "y"] * 500})
+        data = expected.to_csv(index=False)
+        handle = SlowReader(data.encode() if binary else data, delay=0.001)
+
+        reader = icom.PrefetchReader(handle, blocks=2)
+        result = pd.read_csv(reader, engine=engine)
+        tm.assert_frame_equal(result, expected)
+
+    def test_user_handle_not_prefetched(self):
+        # reading ahead would move the handle past the data parsed
+        handle = SlowReader(b"a\n1\n2\n")
+        with pd.option_context("io.prefetch_blocks", 2):
+            result = icom.get_filepath_or_buffer(handle, prefetch=True)
+            assert result[0] is handle
+            assert icom._maybe_prefetch(handle, False) == (handle, False)
+
+            reader, should_close = icom._maybe_prefetch(handle, True)
+            assert isinstance(reader, icom.PrefetchReader)
+            assert should_close
+            reader.close()
+
+    def test_read_csv_zip(self):
+        # zip needs a seekable file, it is not read ahead
+        expected = pd.DataFrame({"a": range(10)})
+        with tm.ensure_clean("test.zip") as path:
+            expected.to_csv(path, index=False, compression="zip")
+            with open(path, "rb") as handle:
+                with pd.option_context("io.prefetch_blocks", 2):
+                    result = pd.read_csv(handle, compression="zip")
+        tm.assert_frame_equal(result, expected)
@@ -555,6 +555,36 @@ class TestNDFrame(TestPackers):
             for i, packed in enumerate(read_msgpack(path, iterator=True)):
                 check_arbitrary(packed, packed_items[i])
 
+    def test_no_copy(self):
+        packed_items = [self.frame["mixed"], self.frame["float"], None]
+
+        with ensure_clean(self.path) as path:
+            to_msgpack(path, *packed_items)
+            result = read_msgpack(path, copy=False)
+            check_arbitrary(result, packed_items)
+
+            # numeric data are copy-on-write views on the file
+            frame = result[1]
+            assert not frame._data.blocks[0].values.flags.owndata
+            frame.iloc[0, 0] = 100.0
+            assert read_msgpack(path)[1].iloc[0, 0] == 0.0
+            del result, frame
+
+        packed = to_msgpack(None, *packed_items)
+        result = read_msgpack(packed, copy=False)
+        check_arbitrary(result, packed_items)
+        assert not result[1]._data.blocks[0].values.flags.writeable
+
+        result = read_msgpack(BytesIO(packed), copy=False)
+        check_arbitrary(result, packed_items)
+
+    def test_no_copy_iterator_raises(self):
+        msg = "copy=False is not supported with iterator=True"
+        with pytest.raises(ValueError, match=msg):
+            read_msgpack(
+                to_msgpack(None, self.frame["float"]), iterator=True, copy=False
+            )
+
     def tests_datetimeindex_freq_issue(self):
 
         # GH 5947
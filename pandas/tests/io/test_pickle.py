@@ -20,14 +20,17 @@ import shutil
 from warnings import catch_warnings, simplefilter
 import zipfile
 
+import numpy as np
 import pytest
 
-from pandas.compat import is_platform_little_endian
+from pandas.compat import PY38, is_platform_little_endian
 
 import pandas as pd
 from pandas import Index
 import pandas.util.testing as tm
 
+from pandas.io.pickle import read_shared_memory, to_shared_memory
+
 from pandas.tseries.offsets import Day, MonthEnd
 
 
@@ -300,6 +303,28 @@ class TestCompression:
 
             tm.assert_frame_equal(df, df2)
 
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+    def test_write_compression_threads(self, compression, get_random_path):
+        base = get_random_path
+        path1 = base + ".compressed"
+        path2 = base + ".raw"
+
+        with tm.ensure_clean(path1) as p1, tm.ensure_clean(path2) as p2:
+            df = tm.makeDataFrame()
+
+            # write to compressed file in parallel
+            df.to_pickle(p1, compression=compression, compression_threads=2)
+
+            # decompress
+            with tm.decompress_file(p1, compression=compression) as f:
+                with open(p2, "wb") as fh:
+                    fh.write(f.read())
+
+            # read decompressed file
+            df2 = pd.read_pickle(p2, compression=None)
+
+            tm.assert_frame_equal(df, df2)
+
     @pytest.mark.parametrize("compression", ["", "None", "bad", "7z"])
     def test_write_explicit_bad(self, compression, get_random_path):
         with pytest.raises(ValueError, match="Unrecognized compression type"):
@@ -392,3 +417,64 @@ class TestProtocol:
             df.to_pickle(path, protocol=protocol)
             df2 = pd.read_pickle(path)
             tm.assert_frame_equal(df, df2)
+
+
+# ---------------------
+# test out-of-band buffers
+# ---------------------
+
+
+@pytest.fixture
+def out_of_band_frame():
+    return pd.DataFrame(
+        {
+            "float": np.arange(1000, dtype="float64"),
+            "int": np.arange(1000, dtype="int64"),
+            "cat": pd.Categorical(list("abcd") * 250),
+            "Int64": pd.array([1, None, 3, 4] * 250, dtype="Int64"),
+            "tz": pd.date_range("2019-01-01", periods=1000, tz="US/Eastern"),
+            "timedelta": pd.timedelta_range("1s", periods=1000),
+        }
+    )
+
+
+@pytest.mark.skipif(not PY38, reason="requires pickle protocol 5")
+class TestOutOfBand:
+    def test_block_values_out_of_band(self, out_of_band_frame):
+        df = out_of_band_frame
+        buffers = []
+        data = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+
+        # the data of each block travels out-of-band: float and int values,
+        # categorical codes, IntegerArray data and mask, datetime and
+        # timedelta values
+        nbytes = sum(buf.raw().nbytes for buf in buffers)
+        assert nbytes == 1000 * (8 + 8 + 1 + 8 + 1 + 8 + 8)
+
+        result = pickle.loads(data, buffers=buffers)
+        tm.assert_frame_equal(result, df)
+
+    def test_shared_memory_round_trip(self, out_of_band_frame):
+        df = out_of_band_frame
+        shm = to_shared_memory(df)
+        try:
+            result = read_shared_memory(shm)
+            tm.assert_frame_equal(result, df)
+
+            # the result is a view on the shared memory block
+            result.iloc[0, 0] = 100.0
+            assert read_shared_memory(shm).iloc[0, 0] == 100.0
+            del result
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_shared_memory_name(self):
+        s = pd.Series(np.arange(10.0))
+        shm = to_shared_memory(s, name="pandas_test_shm")
+        try:
+            assert shm.name == "pandas_test_shm"
+            tm.assert_series_equal(read_shared_memory(shm), s)
+        finally:
+            shm.close()
+            shm.unlink()
@@ -7,8 +7,11 @@ from numpy import nan
 import pytest
 
 from pandas import DataFrame, MultiIndex, Series, array, concat, merge
+from pandas._libs.hashtable import unique_label_indices
 from pandas.core import common as com
 from pandas.core.sorting import (
+    compress_group_index,
+    compress_group_rows,
     decons_group_index,
     get_group_index,
     is_int64_overflow_possible,
@@ -102,6 +105,38 @@ class TestSorting:
         assert_frame_equal(gr.mean(), aggr(np.mean))
         assert_frame_equal(gr.median(), aggr(np.median))
 
+    @pytest.mark.parametrize("sort", [True, False])
+    def test_compress_group_rows(self, sort):
+        # few distinct labels, so that many rows are equal
+        labels = [np.random.randint(-1, 4, 1000) for _ in range(6)]
+        shape = [4] * 6
+
+        comp_ids, first = compress_group_rows(labels, shape, sort=sort)
+
+        group_index = get_group_index(labels, shape, sort=True, xnull=True)
+        expected, _ = compress_group_index(group_index, sort=sort)
+        tm.assert_numpy_array_equal(comp_ids, expected)
+        tm.assert_numpy_array_equal(first, unique_label_indices(expected))
+
+    @pytest.mark.parametrize("sort", [True, False])
+    def test_int64_overflow_groupby_missing_keys(self, sort):
+        arr = np.random.randint(0, 1 << 16, (1000, 8)).astype(float)
+        arr = np.vstack((arr, arr[::-3]))
+        arr[::7, 2] = np.nan
+        df = DataFrame(arr, columns=list("abcdefgh"))
+        df["values"] = np.random.randn(len(df))
+
+        gr = df.groupby(list("abcdefgh"), sort=sort)
+        assert is_int64_overflow_possible(gr.grouper.shape)
+        result = gr["values"].sum()
+
+        keys = [tuple(row) for row in arr if not np.isnan(row).any()]
+        expected_keys = sorted(set(keys)) if sort else list(dict.fromkeys(keys))
+        assert result.index.tolist() == expected_keys
+        for key, value in result.items():
+            mask = (arr == key).all(axis=1)
+            assert np.isclose(value, df["values"][mask].sum())
+
     def test_lexsort_indexer(self):
         keys = [[nan] * 5 + list(range(100)) + [nan] * 5]
         # orders=True, na_position='last'
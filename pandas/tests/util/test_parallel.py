@@ -0,0 +1,66 @@
+import threading
+
+import pytest
+
+import pandas as pd
+from pandas.core.util import parallel
+
+
+@pytest.mark.parametrize(
+    "nrows,ncols,num_threads,expected",
+    [
+        (10 ** 6, 10, 1, [slice(0, 10)]),
+        (10, 10, 4, [slice(0, 10)]),
+        (10 ** 6, 1, 4, [slice(0, 1)]),
+        (10 ** 6, 10, 4, [slice(0, 3), slice(3, 6), slice(6, 8), slice(8, 10)]),
+        (10 ** 6, 3, 4, [slice(0, 1), slice(1, 2), slice(2, 3)]),
+        (2 ** 15, 5, 4, [slice(0, 3), slice(3, 5)]),
+    ],
+)
+def test_split_columns(nrows, ncols, num_threads, expected):
+    assert parallel.split_columns(nrows, ncols, num_threads) == expected
+
+
+def test_split_columns_option():
+    assert len(parallel.split_columns(10 ** 6, 10)) == 1
+    with pd.option_context("compute.num_threads", 2):
+        assert len(parallel.split_columns(10 ** 6, 10)) == 2
+
+
+def test_run():
+    def func(i, j):
+        return i * j, threading.current_thread().name
+
+    results = parallel.run(func, [(i, 2) for i in range(5)])
+    assert [result for result, _ in results] == [0, 2, 4, 6, 8]
+
+    # not split again when already in parallel
+    def split(i):
+        return parallel.split_columns(10 ** 6, 10, 4)
+
+    assert parallel.run(split, [(0,), (1,)]) == [[slice(0, 10)]] * 2
+
+
+def test_run_concurrently():
+    # threads running with different numbers of ranges, and changing the
+    # number of threads, share the pools safely
+    def func(i):
+        return i
+
+    def target(n):
+        try:
+            for _ in range(50):
+                with pd.option_context("compute.num_threads", n):
+                    assert parallel.run(func, [(i,) for i in range(n)]) == list(
+                        range(n)
+                    )
+        except Exception as err:
+            errors.append(err)
+
+    errors = []
+    threads = [threading.Thread(target=target, args=(n,)) for n in range(2, 10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from pandas import DataFrame, Series
+from pandas.api.indexers import BaseIndexer
+import pandas.util.testing as tm
+
+
+class ForwardIndexer(BaseIndexer):
+    def get_window_bounds(self, num_values, min_periods, center, closed):
+        start = np.arange(num_values, dtype=np.int64)
+        end = np.minimum(start + self.window_size, num_values)
+        return start, end
+
+
+def _forward_expected(values, window_size, func):
+    # reference result computed window by window
+    return [
+        func(values[i : i + window_size])
+        if len(values[i : i + window_size])
+        else np.nan
+        for i in range(len(values))
+    ]
+
+
+def test_base_indexer_not_implemented():
+    s = Series(range(5))
+    with pytest.raises(NotImplementedError):
+        s.rolling(BaseIndexer(window_size=2)).sum()
+
+
+def test_base_indexer_sets_kwargs():
+    indexer = BaseIndexer(window_size=3, use_expanding=True)
+    assert indexer.window_size == 3
+    assert indexer.use_expanding is True
+    assert indexer.index_array is None
+
+
+@pytest.mark.parametrize(
+    "method, func",
+    [
+        ("sum", np.sum),
+        ("mean", np.mean),
+        ("max", np.max),
+        ("min", np.min),
+        ("median", np.median),
+        ("std", lambda x: np.std(x, ddof=1) if len(x) > 1 else np.nan),
+        ("var", lambda x: np.var(x, ddof=1) if len(x) > 1 else np.nan),
+        ("count", len),
+    ],
+)
+@pytest.mark.parametrize("constructor", [Series, DataFrame])
+def test_forward_indexer(method, func, constructor):
+    values = np.array([3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0])
+    obj = constructor(values)
+    result = getattr(
+        obj.rolling(ForwardIndexer(window_size=3), min_periods=1), method
+    )()
+    expected = constructor(_forward_expected(values, 3, func), dtype=np.float64)
+    tm.assert_equal(result, expected)
+
+
+@pytest.mark.parametrize("raw", [True, False])
+def test_forward_indexer_apply(raw):
+    values = np.arange(6, dtype=np.float64)
+    s = Series(values)
+    result = s.rolling(ForwardIndexer(window_size=2), min_periods=1).apply(
+        lambda x: np.asarray(x)[0] * 10 + len(x), raw=raw
+    )
+    expected = Series([2.0, 12.0, 22.0, 32.0, 42.0, 51.0])
+    tm.assert_series_equal(result, expected)
+
+
+def test_forward_indexer_min_periods():
+    s = Series(np.arange(5, dtype=np.float64))
+    result = s.rolling(ForwardIndexer(window_size=3), min_periods=3).sum()
+    expected = Series([3.0, 6.0, 9.0, np.nan, np.nan])
+    tm.assert_series_equal(result, expected)
+
+
+def test_indexer_receives_arguments():
+    received = {}
+
+    class RecordingIndexer(BaseIndexer):
+        def get_window_bounds(self, num_values, min_periods, center, closed):
+            received.update(
+                num_values=num_values,
+                min_periods=min_periods,
+                center=center,
+                closed=closed,
+            )
+            start = np.zeros(num_values, dtype=np.int64)
+            end = np.arange(1, num_values + 1, dtype=np.int64)
+            return start, end
+
+    s = Series(np.arange(4, dtype=np.float64))
+    result = s.rolling(RecordingIndexer(), min_periods=2, closed="both").sum()
+    tm.assert_series_equal(result, s.expanding(2).sum())
+    assert received == {
+        "num_values": 4,
+        "min_periods": 2,
+        "center": False,
+        "closed": "both",
+    }
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        ([0, 0, 0], [1, 2]),
+        ([0, 0, -1], [1, 2, 3]),
+        ([0, 0, 0], [1, 2, 4]),
+        ([0, 2, 1], [1, 2, 3]),
+        ([0, 0, 0], [1, 3, 2]),
+        ([1, 0, 0], [0, 2, 3]),
+    ],
+)
+def test_invalid_bounds_raise(start, end):
+    class BadIndexer(BaseIndexer):
+        def get_window_bounds(self, num_values, min_periods, center, closed):
+            return np.array(start), np.array(end)
+
+    s = Series(np.arange(3, dtype=np.float64))
+    with pytest.raises(ValueError):
+        s.rolling(BadIndexer()).sum()
+
+
+def test_negative_min_periods_raises():
+    with pytest.raises(ValueError, match="min_periods must be >= 0"):
+        Series(range(3)).rolling(ForwardIndexer(window_size=2), min_periods=-1)
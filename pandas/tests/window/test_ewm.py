@@ -1,11 +1,15 @@
+from datetime import timedelta
+
 import numpy as np
 import pytest
 
 from pandas.errors import UnsupportedFunctionCall
 
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, Timedelta, date_range, option_context, to_datetime
+from pandas.core.util import parallel
 import pandas.core.window as rwindow
 from pandas.tests.window.common import Base
+import pandas.util.testing as tm
 
 
 class TestEWM(Base):
@@ -68,3 +72,110 @@ class TestEWM(Base):
             getattr(e, method)(1, 2, 3)
         with pytest.raises(UnsupportedFunctionCall, match=msg):
             getattr(e, method)(dtype=np.float64)
+
+
+def _time_decayed_mean(values, times, halflife):
+    # every observation weighted by 0.5 ** (its age / halflife)
+    ages = np.asarray(times).view("i8") / halflife.value
+    result = []
+    for i in range(len(values)):
+        mask = ~np.isnan(values[: i + 1])
+        weights = 0.5 ** (ages[i] - ages[: i + 1][mask])
+        result.append((weights * values[: i + 1][mask]).sum() / weights.sum())
+    return result
+
+
+@pytest.mark.parametrize("halflife", ["23 days", timedelta(days=23)])
+def test_ewma_with_times(halflife):
+    times = to_datetime(
+        ["2020-01-01", "2020-01-10", "2020-02-23", "2020-03-01", "2020-03-02"]
+    )
+    values = np.array([0.0, 1.0, np.nan, 2.0, 4.0])
+    df = DataFrame({"A": values, "B": values[::-1]})
+
+    result = df.ewm(halflife=halflife, times=times).mean()
+    expected = DataFrame(
+        {
+            "A": _time_decayed_mean(values, times, Timedelta("23 days")),
+            "B": _time_decayed_mean(values[::-1], times, Timedelta("23 days")),
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_ewma_with_times_column():
+    times = to_datetime(["2020-01-01", "2020-01-02", "2020-01-05"])
+    df = DataFrame({"A": [1.0, 2.0, 3.0], "time": times})
+
+    result = df.ewm(halflife="1 day", times="time").mean()
+    expected = df[["A"]].ewm(halflife="1 day", times=times).mean()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("method", ["mean", "var", "std", "cov", "corr"])
+def test_ewm_regular_times_match_halflife(method):
+    # observations one halflife apart decay like a halflife of 1
+    s = Series(np.random.randn(50))
+    s[[3, 10, 11]] = np.nan
+    times = date_range("2000-01-01", periods=50, freq="D")
+
+    result = getattr(s.ewm(halflife="1 day", times=times), method)()
+    expected = getattr(s.ewm(halflife=1), method)()
+    tm.assert_series_equal(result, expected)
+
+
+def test_ewm_with_times_repr():
+    times = date_range("2000-01-01", periods=3, freq="s")
+    e = Series([1.0, 2.0, 3.0]).ewm(halflife="2s", times=times)
+    assert repr(e) == (
+        "EWM [halflife=0 days 00:00:02,min_periods=0,adjust=True,"
+        "ignore_na=False,axis=0]"
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"halflife": 2}, "halflife must be a timedelta"),
+        ({"halflife": "-1 day"}, "halflife must satisfy"),
+        ({"halflife": "1 day", "com": 0.5}, "cannot be passed with times"),
+        ({"halflife": "1 day", "times_length": 2}, "times must be the same length"),
+        ({"halflife": "1 day", "times_reversed": True}, "monotonically increasing"),
+        ({"halflife": "1 day", "times_type": "int"}, "datetime64"),
+    ],
+)
+def test_ewm_with_times_invalid(kwargs, msg):
+    times = date_range("2000-01-01", periods=3, freq="D")
+    if kwargs.pop("times_length", None):
+        times = times[:2]
+    if kwargs.pop("times_reversed", None):
+        times = times[::-1]
+    if kwargs.pop("times_type", None):
+        times = np.arange(3)
+    with pytest.raises(ValueError, match=msg):
+        Series([1.0, 2.0, 3.0]).ewm(times=times, **kwargs)
+
+
+def test_ewm_with_times_not_adjusted():
+    times = date_range("2000-01-01", periods=3, freq="D")
+    with pytest.raises(NotImplementedError, match="adjust=False"):
+        Series([1.0, 2.0, 3.0]).ewm(halflife="1 day", times=times, adjust=False)
+
+
+def test_ewm_timedelta_halflife_requires_times():
+    with pytest.raises(ValueError, match="only be a timedelta if times"):
+        Series([1.0, 2.0, 3.0]).ewm(halflife="1 day")
+
+
+def test_ewm_frame_columns_in_parallel(monkeypatch):
+    monkeypatch.setattr(parallel, "_MIN_CHUNK_SIZE", 1)
+    df = DataFrame(np.random.randn(20, 6))
+    df.iloc[::4, 2] = np.nan
+
+    for method in ["mean", "var", "std"]:
+        expected = getattr(df.ewm(com=2.0), method)()
+        with option_context("compute.num_threads", 3):
+            result = getattr(df.ewm(com=2.0), method)()
+        tm.assert_frame_equal(result, expected)
+        for col in df.columns:
+            tm.assert_series_equal(result[col], getattr(df[col].ewm(com=2.0), method)())
@@ -98,6 +98,20 @@ class TestExpanding(Base):
         with pytest.raises(NotImplementedError):
             iter(obj.expanding(2))
 
+    @pytest.mark.parametrize(
+        "func,expected",
+        [
+            ("rank", [1.0, 1.0, 3.0, np.nan, 2.5, 5.0]),
+            ("argmax", [0.0, 0.0, 2.0, 2.0, 2.0, 5.0]),
+            ("argmin", [0.0, 1.0, 1.0, 1.0, 1.0, 1.0]),
+            ("nunique", [1.0, 2.0, 3.0, 3.0, 3.0, 4.0]),
+        ],
+    )
+    def test_expanding_rank_argmax_nunique(self, func, expected):
+        ser = Series([2.0, 1.0, 3.0, np.nan, 2.0, 4.0])
+        result = getattr(ser.expanding(), func)()
+        tm.assert_series_equal(result, Series(expected))
+
     def test_expanding_axis(self, axis_frame):
         # see gh-23372.
         df = DataFrame(np.ones((10, 20)))
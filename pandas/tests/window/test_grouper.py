@@ -58,7 +58,19 @@ class TestGrouperGrouping:
         g = self.frame.groupby("A")
         r = g.rolling(window=4)
 
-        for f in ["sum", "mean", "min", "max", "count", "kurt", "skew"]:
+        for f in [
+            "sum",
+            "mean",
+            "min",
+            "max",
+            "count",
+            "kurt",
+            "skew",
+            "rank",
+            "argmax",
+            "argmin",
+            "nunique",
+        ]:
 
             result = getattr(r, f)()
             expected = g.apply(lambda x: getattr(x.rolling(4), f)())
@@ -130,7 +142,19 @@ class TestGrouperGrouping:
         g = self.frame.groupby("A")
         r = g.expanding()
 
-        for f in ["sum", "mean", "min", "max", "count", "kurt", "skew"]:
+        for f in [
+            "sum",
+            "mean",
+            "min",
+            "max",
+            "count",
+            "kurt",
+            "skew",
+            "rank",
+            "argmax",
+            "argmin",
+            "nunique",
+        ]:
 
             result = getattr(r, f)()
             expected = g.apply(lambda x: getattr(x.expanding(), f)())
@@ -174,3 +198,63 @@ class TestGrouperGrouping:
         result = r.apply(lambda x: x.sum(), raw=raw)
         expected = g.apply(lambda x: x.expanding().apply(lambda y: y.sum(), raw=raw))
         tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize("sort", [True, False])
+    @pytest.mark.parametrize("window", [3, "3s"])
+    @pytest.mark.parametrize("func", ["sum", "mean", "max", "std", "median"])
+    def test_rolling_interleaved_groups(self, sort, window, func):
+        # the groups are rolled over at once, sorted by group, with windows
+        # which do not cross the boundaries of the groups
+        df = DataFrame(
+            {
+                "A": [2, 1, np.nan, 2, 1, 1, 3, 2, np.nan, 1],
+                "B": [1.0, 2.0, 3.0, np.nan, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+            },
+            index=pd.date_range("2000", periods=10, freq="s"),
+        )
+        g = df.groupby("A", sort=sort)
+
+        result = getattr(g.rolling(window, min_periods=1), func)()
+        expected = g.apply(lambda x: getattr(x.rolling(window, min_periods=1), func)())
+        tm.assert_frame_equal(result, expected)
+
+        result = getattr(g.B.expanding(), func)()
+        expected = g.B.apply(lambda x: getattr(x.expanding(), func)())
+        tm.assert_series_equal(result, expected)
+
+    def test_rolling_multiple_keys_no_group_keys(self):
+        df = DataFrame(
+            {"A": [1, 2, 1, 2, 1, 2], "B": [1, 1, 2, 2, 1, 1], "C": np.arange(6.0)}
+        )
+        g = df.groupby(["A", "B"])
+        result = g.rolling(2, min_periods=1).sum()
+        expected = g.apply(lambda x: x.rolling(2, min_periods=1).sum())
+        tm.assert_frame_equal(result, expected)
+
+        g = df.groupby("A", group_keys=False)
+        result = g.rolling(2).sum()
+        expected = g.apply(lambda x: x.rolling(2).sum())
+        tm.assert_frame_equal(result, expected)
+
+    def test_rolling_center(self):
+        # centered windows are still rolled over one group at a time
+        g = self.frame.groupby("A")
+        result = g.rolling(3, center=True).mean()
+        expected = g.apply(lambda x: x.rolling(3, center=True).mean())
+        tm.assert_frame_equal(result, expected)
+
+    def test_rolling_time_group_not_monotonic(self):
+        df = DataFrame(
+            {"A": [1, 1, 2, 2], "B": np.arange(4.0)},
+            index=pd.to_datetime(
+                ["2000-01-02", "2000-01-03", "2000-01-01", "2000-01-02"]
+            ),
+        )
+        g = df.groupby("A")
+        result = g.rolling("2D").sum()
+        expected = g.apply(lambda x: x.rolling("2D").sum())
+        tm.assert_frame_equal(result, expected)
+
+        df.index = df.index[[1, 0, 2, 3]]
+        with pytest.raises(ValueError, match="each group of index must be monotonic"):
+            df.groupby("A").rolling("2D").sum()
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+import pandas.util._test_decorators as td
+
+from pandas import DataFrame, Series, date_range
+import pandas.core.window as rwindow
+import pandas.util.testing as tm
+
+
+def f(x, a=0.0):
+    return np.nanmean(x) + a
+
+
+@pytest.fixture(
+    params=[
+        lambda obj: obj.rolling(4),
+        lambda obj: obj.rolling(4, min_periods=1),
+        lambda obj: obj.rolling(5, center=True, min_periods=0),
+        lambda obj: obj.rolling("3s"),
+        lambda obj: obj.expanding(min_periods=2),
+    ]
+)
+def roll(request):
+    return request.param
+
+
+@pytest.fixture
+def frame():
+    df = DataFrame(
+        np.random.RandomState(0).randn(30, 3),
+        index=date_range("2000", periods=30, freq="s"),
+    )
+    df.iloc[[2, 3, 10], 0] = np.nan
+    return df
+
+
+@td.skip_if_no("numba", "0.49.0")
+class TestNumba:
+    @pytest.mark.parametrize("jit", [False, True])
+    def test_numba_vs_cython(self, frame, roll, jit):
+        import numba
+
+        func = numba.jit(nopython=True)(f) if jit else f
+        for obj in [frame, frame[0]]:
+            result = roll(obj).apply(func, raw=True, args=(1.0,), engine="numba")
+            expected = roll(obj).apply(f, raw=True, args=(1.0,), engine="cython")
+            tm.assert_equal(result, expected)
+
+    def test_numba_func_detected(self, frame, roll):
+        import numba
+
+        func = numba.jit(nopython=True)(f)
+        result = roll(frame).apply(func, raw=True)
+        expected = roll(frame).apply(f, raw=True)
+        tm.assert_frame_equal(result, expected)
+        assert any(key[0] is func for key in rwindow._numba_apply_cache)
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_engine_kwargs(self, frame, parallel):
+        engine_kwargs = {"nopython": True, "nogil": True, "parallel": parallel}
+        result = frame.rolling(4).apply(
+            f, raw=True, engine="numba", engine_kwargs=engine_kwargs
+        )
+        expected = frame.rolling(4).apply(f, raw=True)
+        tm.assert_frame_equal(result, expected)
+        assert (f, True, True, parallel) in rwindow._numba_apply_cache
+
+    def test_groupby(self, frame):
+        g = frame.assign(key=np.arange(30) % 3).groupby("key")
+        result = g.rolling(3).apply(f, raw=True, engine="numba")
+        expected = g.rolling(3).apply(f, raw=True)
+        tm.assert_frame_equal(result, expected)
+
+
+@td.skip_if_installed("numba")
+def test_numba_not_installed():
+    with pytest.raises(ImportError, match="numba"):
+        Series(range(5)).rolling(2).apply(f, raw=True, engine="numba")
+
+
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"raw": False, "engine": "numba"}, "raw must be True"),
+        ({"raw": True, "engine": "numba", "kwargs": {"a": 1}}, "cannot take kwargs"),
+        ({"raw": True, "engine": "foo"}, "engine must be"),
+        ({"raw": True, "engine": "cython", "engine_kwargs": {}}, "engine_kwargs"),
+    ],
+)
+def test_invalid_engine(kwargs, msg):
+    with pytest.raises(ValueError, match=msg):
+        Series(range(5)).rolling(2).apply(f, **kwargs)
+
+
+def test_python_func_not_detected():
+    # python functions run on the cython engine unless asked otherwise
+    s = Series(range(5), dtype=float)
+    result = s.rolling(2).apply(f, raw=True)
+    expected = s.rolling(2).mean()
+    tm.assert_series_equal(result, expected)
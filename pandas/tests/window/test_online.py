@@ -0,0 +1,180 @@
+import numpy as np
+import pytest
+
+from pandas import DataFrame, Series, Timestamp, concat, date_range, to_timedelta
+import pandas.util.testing as tm
+
+BATCHES = [(0, 10), (10, 37), (37, 37), (37, 80), (80, 100)]
+
+
+def _online_results(online, obj, method, batches=BATCHES, times=None, **kwargs):
+    # the results of an online window moved through the batches of obj
+    results = []
+    for i, (start, stop) in enumerate(batches):
+        if i:
+            update_kwargs = {} if times is None else {"times": times[start:stop]}
+            online.update(obj.iloc[start:stop], **update_kwargs)
+        results.append(getattr(online, method)(**kwargs))
+    return concat(results)
+
+
+@pytest.fixture
+def frame():
+    df = DataFrame(np.random.randn(100, 3), columns=list("abc"))
+    df.iloc[::7, 1] = np.nan
+    df.iloc[20:30, 2] = np.nan
+    return df
+
+
+@pytest.fixture
+def times():
+    seconds = np.cumsum(np.random.randint(0, 100, 100))
+    return Timestamp("2000-01-01") + to_timedelta(seconds, unit="s")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"com": 3},
+        {"span": 5, "ignore_na": True, "min_periods": 3},
+        {"alpha": 0.3, "adjust": False},
+        {"halflife": 2},
+    ],
+)
+@pytest.mark.parametrize(
+    "method, method_kwargs",
+    [("mean", {}), ("var", {}), ("var", {"bias": True}), ("std", {})],
+)
+def test_online_ewm(frame, kwargs, method, method_kwargs):
+    frame["nuisance"] = "x"
+    expected = getattr(frame.ewm(**kwargs), method)(**method_kwargs)
+
+    online = frame.iloc[:10].ewm(**kwargs).online()
+    result = _online_results(online, frame, method, **method_kwargs)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_online_ewm_series(frame):
+    s = frame["b"]
+    expected = s.ewm(com=2).mean()
+
+    online = s.iloc[:10].ewm(com=2).online()
+    result = _online_results(online, s, "mean")
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("method", ["mean", "var"])
+def test_online_ewm_with_times(frame, times, method):
+    expected = getattr(frame.ewm(halflife="1min", times=times), method)()
+
+    online = frame.iloc[:10].ewm(halflife="1min", times=times[:10]).online()
+    result = _online_results(online, frame, method, times=times)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_online_ewm_times_validation(times):
+    s = Series(np.arange(4, dtype=np.float64))
+    online = s.ewm(halflife="1min", times=times[:4]).online()
+    with pytest.raises(ValueError, match="times must be passed"):
+        online.update(s)
+    with pytest.raises(ValueError, match="monotonically increasing"):
+        online.update(s, times=times[:4])
+
+    online = s.ewm(com=1).online()
+    with pytest.raises(ValueError, match="times can only be passed"):
+        online.update(s, times=times[:4])
+
+
+@pytest.mark.parametrize(
+    "window, kwargs",
+    [
+        (5, {}),
+        (5, {"min_periods": 1}),
+        (1, {}),
+        ("3min", {}),
+        ("3min", {"closed": "both"}),
+        ("3min", {"closed": "neither"}),
+    ],
+)
+@pytest.mark.parametrize(
+    "method", ["sum", "mean", "var", "std", "min", "max", "median", "count"]
+)
+def test_online_rolling(frame, times, window, kwargs, method):
+    frame = frame.set_index(times)
+    expected = getattr(frame.rolling(window, **kwargs), method)()
+
+    online = frame.iloc[:10].rolling(window, **kwargs).online()
+    result = _online_results(online, frame, method)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_online_rolling_apply(frame):
+    s = frame["a"]
+    expected = s.rolling(4).apply(np.ptp, raw=True)
+
+    online = s.iloc[:10].rolling(4).online()
+    result = _online_results(online, s, "apply", func=np.ptp, raw=True)
+    tm.assert_series_equal(result, expected)
+
+
+def test_online_rolling_on_column(frame, times):
+    frame["time"] = times
+    expected = frame.rolling("2min", on="time").sum()
+
+    online = frame.iloc[:10].rolling("2min", on="time").online()
+    result = _online_results(online, frame, "sum")
+    tm.assert_frame_equal(result, expected)
+
+
+def test_online_rolling_keeps_window_tail():
+    s = Series(np.arange(100, dtype=np.float64))
+    online = s.rolling(3).online()
+    online.update(Series([100.0, 101.0], index=[100, 101]))
+    assert len(online.obj) == 4
+
+    index = date_range("2000-01-01", periods=100, freq="s")
+    s = Series(np.arange(100, dtype=np.float64), index=index)
+    online = s.rolling("3s").online()
+    online.update(Series([100.0], index=[index[-1] + index.freq]))
+    assert len(online.obj) == 5
+
+
+def test_online_rolling_not_monotonic(times):
+    s = Series(np.arange(10, dtype=np.float64), index=times[:10])
+    online = s.rolling("1min").online()
+    with pytest.raises(ValueError, match="index must be monotonic"):
+        online.update(s)
+
+
+@pytest.mark.parametrize("kwargs", [{"center": True}, {"axis": 1}])
+def test_online_rolling_not_implemented(kwargs):
+    with pytest.raises(NotImplementedError, match="online is only implemented"):
+        DataFrame(np.ones((3, 3))).rolling(2, **kwargs).online()
+
+
+@pytest.mark.parametrize("method", ["cov", "corr"])
+@pytest.mark.parametrize("window", ["rolling", "ewm"])
+def test_online_binary_not_implemented(method, window):
+    args = (2,) if window == "rolling" else ()
+    kwargs = {"com": 1} if window == "ewm" else {}
+    online = getattr(Series([1.0, 2.0]), window)(*args, **kwargs).online()
+    with pytest.raises(NotImplementedError, match=method):
+        getattr(online, method)()
+
+
+@pytest.mark.parametrize("window", ["rolling", "ewm"])
+def test_online_update_checks_new_rows(window):
+    args = (2,) if window == "rolling" else ()
+    kwargs = {"com": 1} if window == "ewm" else {}
+    df = DataFrame({"a": [1.0, 2.0]})
+    online = getattr(df, window)(*args, **kwargs).online()
+    with pytest.raises(TypeError, match="must be a DataFrame"):
+        online.update(df["a"])
+    with pytest.raises(ValueError, match="same columns"):
+        online.update(df.rename(columns={"a": "b"}))
+
+
+def test_online_groupby_rolling_not_implemented():
+    df = DataFrame({"key": [1, 1, 2], "a": [1.0, 2.0, 3.0]})
+    with pytest.raises(NotImplementedError, match="groupby rolling"):
+        df.groupby("key").rolling(2).online()
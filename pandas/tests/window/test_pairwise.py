@@ -1,7 +1,9 @@
 import warnings
 
+import numpy as np
 import pytest
 
+import pandas as pd
 from pandas import DataFrame, Series
 from pandas.core.sorting import safe_sort
 import pandas.util.testing as tm
@@ -181,3 +183,67 @@ class TestPairwise:
         for i, result in enumerate(results):
             if i > 0:
                 self.compare(result, results[0])
+
+    @pytest.mark.parametrize(
+        "dispatch", [("rolling", 5, 2), ("rolling", "3D", None), ("expanding", 3)]
+    )
+    @pytest.mark.parametrize("name", ["cov", "corr"])
+    def test_pairwise_matches_pairs(self, dispatch, name):
+        # the columns are rolled over in one pass, each pair on the rows where
+        # both of its columns are observed
+        df = DataFrame(
+            np.random.RandomState(0).randn(20, 3),
+            index=pd.date_range("2000", periods=20),
+            columns=["a", "b", "c"],
+        )
+        df.iloc[[2, 7, 8], 0] = np.nan
+        df.iloc[[3, 8], 1] = np.nan
+        df.iloc[10:16, 2] = 1.0
+        method, *args = dispatch
+
+        result = getattr(getattr(df, method)(*args), name)()
+        for a in df:
+            for b in df:
+                expected = getattr(getattr(df[a], method)(*args), name)(df[b])
+                tm.assert_series_equal(
+                    result.xs(b, level=1)[a], expected, check_names=False
+                )
+
+    @pytest.mark.parametrize("name", ["cov", "corr"])
+    def test_pairwise_as_array(self, name):
+        df = self.df1s[0].astype("float64")
+        result = getattr(df.rolling(3), name)(self.df2, pairwise=True, as_array=True)
+        expected = getattr(df.rolling(3), name)(self.df2, pairwise=True)
+
+        assert result.shape == (4, 2, 3)
+        for i, a in enumerate(df.columns):
+            for j, b in enumerate(self.df2.columns):
+                tm.assert_numpy_array_equal(
+                    result[:, i, j], expected.xs(b, level=1)[a].values
+                )
+
+        result = getattr(df.rolling(3), name)(as_array=True)
+        assert result.shape == (4, 2, 2)
+
+    @pytest.mark.parametrize(
+        "f",
+        [
+            lambda x: x.rolling(3).cov(x.iloc[:, 0], as_array=True),
+            lambda x: x.rolling(3).corr(pairwise=False, as_array=True),
+            lambda x: x.iloc[:, 0].expanding().cov(as_array=True),
+        ],
+    )
+    def test_as_array_not_pairwise(self, f):
+        msg = "as_array is only supported for the pairwise results of DataFrames"
+        with pytest.raises(ValueError, match=msg):
+            f(self.df1s[0])
+
+    def test_corr_offset_window(self):
+        s1 = Series(
+            np.random.RandomState(0).randn(8),
+            index=pd.date_range("2000", periods=8, freq="s"),
+        )
+        s2 = s1 ** 2
+        result = s1.rolling("3s").corr(s2)
+        expected = s1.rolling(3, min_periods=1).corr(s2)
+        tm.assert_series_equal(result, expected)
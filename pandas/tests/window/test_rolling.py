@@ -254,6 +254,128 @@ class TestRolling(Base):
         result = roll.quantile(0.1)
         tm.assert_series_equal(result, expected)
 
+    @pytest.mark.parametrize("window", [1, 3, 50, 1000])
+    @pytest.mark.parametrize(
+        "interpolation", ["linear", "lower", "higher", "midpoint", "nearest"]
+    )
+    def test_median_quantile_percentile(self, window, interpolation):
+        # the windows ranked in chunks match np.percentile, with NaN
+        # and windows longer than the chunks
+        values = np.random.RandomState(0).randn(2000)
+        values[::7] = np.nan
+        values[100:160] = np.nan
+        ser = pd.Series(values)
+
+        result = ser.rolling(window, min_periods=1).quantile(
+            [0, 0.1, 0.5, 1], interpolation=interpolation
+        )
+        for q in [0, 0.1, 0.5, 1]:
+            expected = ser.rolling(window, min_periods=1).apply(
+                lambda x: np.percentile(
+                    x[~np.isnan(x)], q * 100, interpolation=interpolation
+                ),
+                raw=True,
+            )
+            tm.assert_series_equal(result[q], expected, check_names=False)
+
+        expected = ser.rolling(window, min_periods=1).apply(
+            lambda x: np.median(x[~np.isnan(x)]), raw=True
+        )
+        tm.assert_series_equal(ser.rolling(window, min_periods=1).median(), expected)
+
+    def test_quantile_list_series(self):
+        ser = pd.Series(np.arange(5, dtype=np.float64))
+        result = ser.rolling(3).quantile([0.25, 0.5])
+        expected = DataFrame({q: ser.rolling(3).quantile(q) for q in [0.25, 0.5]})
+        tm.assert_frame_equal(result, expected)
+
+    def test_quantile_list_frame(self):
+        df = DataFrame(np.random.RandomState(1).randn(20, 2), columns=["A", "B"])
+        result = df.rolling(4, min_periods=2).quantile([0.1, 0.9])
+        expected = DataFrame(
+            {
+                (col, q): df[col].rolling(4, min_periods=2).quantile(q)
+                for col in ["A", "B"]
+                for q in [0.1, 0.9]
+            }
+        )
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "quantile,exc",
+        [([], ValueError), ([0.5, 1.5], ValueError), ([0.5, "a"], TypeError)],
+    )
+    def test_quantile_list_invalid(self, quantile, exc):
+        ser = pd.Series(np.arange(5, dtype=np.float64))
+        with pytest.raises(exc):
+            ser.rolling(3).quantile(quantile)
+
+    @pytest.mark.parametrize("window", [1, 3, 50, "5s"])
+    @pytest.mark.parametrize("method", ["average", "min", "max"])
+    @pytest.mark.parametrize("ascending", [True, False])
+    @pytest.mark.parametrize("pct", [True, False])
+    def test_rank(self, window, method, ascending, pct):
+        # ties, NaN and windows longer than the chunks of ranked values
+        values = np.random.RandomState(0).randint(0, 5, 1000).astype(np.float64)
+        values[::9] = np.nan
+        ser = Series(values, index=pd.date_range("2000", periods=1000, freq="s"))
+
+        result = ser.rolling(window, min_periods=1).rank(
+            method=method, ascending=ascending, pct=pct
+        )
+        expected = ser.rolling(window, min_periods=1).apply(
+            lambda x: Series(x)
+            .rank(method=method, ascending=ascending, pct=pct)
+            .iloc[-1],
+            raw=True,
+        )
+        tm.assert_series_equal(result, expected)
+
+    def test_rank_invalid_method(self):
+        with pytest.raises(ValueError, match="method 'dense' is not supported"):
+            Series(np.arange(5.0)).rolling(3).rank(method="dense")
+
+    @pytest.mark.parametrize("window", [1, 3, 50, "5s"])
+    @pytest.mark.parametrize("func", ["argmax", "argmin"])
+    def test_argmax_argmin(self, window, func):
+        # the first of tied values, counted from the start of the window
+        values = np.random.RandomState(0).randint(0, 5, 1000).astype(np.float64)
+        values[::9] = np.nan
+        ser = Series(values, index=pd.date_range("2000", periods=1000, freq="s"))
+
+        result = getattr(ser.rolling(window, min_periods=1), func)()
+        expected = ser.rolling(window, min_periods=1).apply(
+            lambda x: getattr(np, "nan" + func)(x), raw=True
+        )
+        tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize("window", [1, 3, 50, "5s"])
+    def test_nunique(self, window):
+        values = np.random.RandomState(0).randint(0, 5, 1000).astype(np.float64)
+        values[::9] = np.nan
+        ser = Series(values, index=pd.date_range("2000", periods=1000, freq="s"))
+
+        result = ser.rolling(window, min_periods=1).nunique()
+        expected = ser.rolling(window, min_periods=1).apply(
+            lambda x: len(np.unique(x[~np.isnan(x)])), raw=True
+        )
+        tm.assert_series_equal(result, expected)
+
+    @pytest.mark.parametrize("func", ["rank", "argmax", "argmin", "nunique"])
+    def test_rank_argmax_nunique_frame(self, func):
+        df = DataFrame(
+            {
+                "A": [1, 1, 2, 2, 1, 2, 1, 1],
+                "B": [3.0, 1.0, 3.0, np.nan, 2.0, 2.0, 1.0, 5.0],
+                "C": [1.0, 1.0, 2.0, 0.0, 2.0, 1.0, np.nan, 1.0],
+            }
+        )
+        result = getattr(df.rolling(3), func)()
+        expected = DataFrame(
+            {col: getattr(df[col].rolling(3), func)() for col in df.columns}
+        )
+        tm.assert_frame_equal(result, expected)
+
     def test_missing_minp_zero(self):
         # https://github.com/pandas-dev/pandas/pull/18921
         # minp=0
@@ -1,7 +1,16 @@
 import numpy as np
 import pytest
 
-from pandas import DataFrame, Index, Series, Timestamp, date_range, to_datetime
+from pandas import (
+    DataFrame,
+    Index,
+    Series,
+    Timestamp,
+    date_range,
+    option_context,
+    to_datetime,
+)
+from pandas.core.util import parallel
 import pandas.util.testing as tm
 
 import pandas.tseries.offsets as offsets
@@ -690,3 +699,27 @@ class TestRollingTS:
 
         expected2 = ss.rolling(3, min_periods=1).cov()
         tm.assert_series_equal(result, expected2)
+
+    @pytest.mark.parametrize(
+        "method",
+        ["count", "sum", "mean", "var", "std", "skew", "kurt", "median", "min", "max"],
+    )
+    def test_frame_columns_share_window_bounds(self, method, monkeypatch):
+        # the columns of a block are rolled together over the same bounds,
+        # and split between the threads
+        monkeypatch.setattr(parallel, "_MIN_CHUNK_SIZE", 1)
+
+        idx = date_range("2017-01-01", periods=300, freq="7s")
+        df = DataFrame(np.random.randn(300, 5), index=idx)
+        df.iloc[::7, 1] = np.nan
+        df[5] = np.arange(300)
+
+        expected = DataFrame(
+            {c: getattr(df[c].rolling("1min", min_periods=2), method)() for c in df}
+        )
+        result = getattr(df.rolling("1min", min_periods=2), method)()
+        tm.assert_frame_equal(result, expected)
+
+        with option_context("compute.num_threads", 3):
+            result = getattr(df.rolling("1min", min_periods=2), method)()
+        tm.assert_frame_equal(result, expected)
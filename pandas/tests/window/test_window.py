@@ -5,9 +5,10 @@ from pandas.errors import UnsupportedFunctionCall
 import pandas.util._test_decorators as td
 
 import pandas as pd
-from pandas import Series
+from pandas import DataFrame, Series
 import pandas.core.window as rwindow
 from pandas.tests.window.common import Base
+import pandas.util.testing as tm
 
 
 @pytest.mark.filterwarnings("ignore:can't resolve package:ImportWarning")
@@ -47,7 +48,7 @@ class TestWindow(Base):
         c = o.rolling
         c(win_type=win_types, window=2)
 
-    @pytest.mark.parametrize("method", ["sum", "mean"])
+    @pytest.mark.parametrize("method", ["sum", "mean", "var", "std"])
     def test_numpy_compat(self, method):
         # see gh-12811
         w = rwindow.Window(Series([2, 4, 6]), window=[0, 2])
@@ -60,7 +61,7 @@ class TestWindow(Base):
             getattr(w, method)(dtype=np.float64)
 
     @td.skip_if_no_scipy
-    @pytest.mark.parametrize("arg", ["median", "var", "std", "kurt", "skew"])
+    @pytest.mark.parametrize("arg", ["median", "kurt", "skew"])
     def test_agg_function_support(self, arg):
         df = pd.DataFrame({"A": np.arange(5)})
         roll = df.rolling(2, win_type="triang")
@@ -74,3 +75,92 @@ class TestWindow(Base):
 
         with pytest.raises(AttributeError, match=msg):
             roll.agg({"A": arg})
+
+    @pytest.mark.parametrize("method", ["sum", "mean", "var", "std"])
+    @pytest.mark.parametrize("min_periods", [None, 1])
+    def test_custom_weights(self, method, min_periods):
+        weights = np.array([1.0, 2.0, 3.0, 2.0])
+        s = Series(np.random.RandomState(0).randn(12))
+        s[[2, 7]] = np.nan
+        result = getattr(
+            s.rolling(4, win_type=weights, min_periods=min_periods), method
+        )()
+
+        expected = []
+        for i in range(len(s)):
+            values = s.values[max(i - 3, 0) : i + 1]
+            w = weights[4 - len(values) :][~np.isnan(values)]
+            values = values[~np.isnan(values)]
+            nobs = len(values)
+            if nobs < max(min_periods or 4, 2 if method in ["var", "std"] else 1):
+                expected.append(np.nan)
+            elif method == "sum":
+                expected.append((w * values).sum())
+            elif method == "mean":
+                expected.append((w * values).sum() / w.sum())
+            else:
+                mean = (w * values).sum() / w.sum()
+                var = (w * (values - mean) ** 2).sum() / w.sum() * nobs / (nobs - 1)
+                expected.append(var if method == "var" else np.sqrt(var))
+        tm.assert_series_equal(result, Series(expected))
+
+    @pytest.mark.parametrize("method", ["sum", "mean", "var", "std"])
+    def test_uniform_weights(self, method):
+        df = DataFrame(np.random.RandomState(0).randn(20, 2))
+        df.iloc[[3, 4], 0] = np.nan
+        for kwargs in [{}, {"min_periods": 1}, {"center": True}]:
+            result = getattr(df.rolling(3, win_type=[1, 1, 1], **kwargs), method)()
+            expected = getattr(df.rolling(3, **kwargs), method)()
+            tm.assert_frame_equal(result, expected)
+
+    def test_offset_window(self):
+        s = Series(
+            [1.0, 2.0, 3.0, 4.0, 5.0],
+            index=pd.Timestamp("2000") + pd.to_timedelta([0, 1, 3, 4, 8], unit="s"),
+        )
+        for method in ["sum", "mean", "var", "std"]:
+            result = getattr(s.rolling("4s", win_type=[1.0, 1.0]), method)()
+            expected = getattr(s.rolling("4s"), method)()
+            tm.assert_series_equal(result, expected)
+
+        # the weights are interpolated at the position of each row in the
+        # period ending at the row
+        result = s.rolling("4s", win_type=[0.0, 1.0]).mean()
+        expected = Series([1.0, 2.75 / 1.75, 4.25 / 1.75, 3.375, 5.0], index=s.index)
+        tm.assert_series_equal(result, expected)
+
+        with pytest.raises(NotImplementedError, match="center is not implemented"):
+            s.rolling("4s", win_type=[1.0, 1.0], center=True)
+
+    @pytest.mark.parametrize(
+        "win_type", [[1.0, 2.0], [], np.array([1.0, 2.0, 3.0, 4.0])]
+    )
+    def test_custom_weights_invalid(self, win_type):
+        with pytest.raises(ValueError, match="win_type must have"):
+            Series(range(5)).rolling(3, win_type=win_type)
+
+    @td.skip_if_no_scipy
+    @pytest.mark.parametrize("method", ["var", "std"])
+    def test_boxcar_var_std(self, method):
+        s = Series(np.random.RandomState(0).randn(20))
+        result = getattr(s.rolling(5, win_type="boxcar"), method)(ddof=0)
+        expected = getattr(s.rolling(5), method)(ddof=0)
+        tm.assert_series_equal(result, expected)
+
+    @td.skip_if_no_scipy
+    def test_offset_window_win_type(self):
+        import scipy.signal as sig
+
+        s = Series(
+            np.random.RandomState(0).randn(20),
+            index=pd.date_range("2000", periods=20, freq="s"),
+        )
+        result = s.rolling("5s", win_type="gaussian").mean(std=0.25)
+        expected = s.rolling("5s", win_type=sig.gaussian(1001, 250.0)).mean()
+        tm.assert_series_equal(result, expected)
+
+    @td.skip_if_no_scipy
+    def test_window_weights_cached(self):
+        weights = rwindow._get_window_weights("triang", 5)
+        assert rwindow._get_window_weights("triang", 5) is weights
+        assert not weights.flags.writeable